@@ -21,6 +21,7 @@ from app.core.config import settings  # noqa: E402
 
 # Import every model module so Base.metadata knows about all tables
 from app.infrastructure.persistence.models import (  # noqa: E402, F401
+    cache,
     interview,
     resume,
     security,
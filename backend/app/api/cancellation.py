@@ -0,0 +1,94 @@
+"""
+Tie LLM-backed work to the lifetime of its HTTP request.
+
+Without this, closing the browser tab during ``/interview/start`` leaves
+the request's coroutine calling the provider — and retrying it — for up
+to ``LLM_TIMEOUT`` seconds per attempt.  ``run_cancellable`` runs the work
+as a task under a request deadline (``LLM_REQUEST_DEADLINE``, see
+``app/core/deadline.py``) and cancels it when
+
+* the client disconnects (reason ``client_disconnect``), or
+* the deadline passes (reason ``deadline`` → 504).
+
+Cancellation propagates through the use case into the provider await, so
+the HTTP call to the provider is aborted and no retry starts; telemetry
+counts the call as cancelled and the provider time reclaimed.
+
+Requests carrying an ``Idempotency-Key`` are not cancelled on disconnect:
+the client is expected to retry, and the retry is answered from the
+finished first request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+import structlog
+from fastapi import HTTPException, Request, status
+
+from app.core import deadline
+from app.core.config import settings
+from app.core.metrics import metrics
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+_DISCONNECT_POLL_INTERVAL = 0.5  # seconds
+
+requests_cancelled = metrics.counter(
+    "http_requests_cancelled_total",
+    "LLM-backed requests whose work was cancelled (client_disconnect / deadline)",
+)
+
+
+async def _until_disconnected(request: Request) -> None:
+    while not await request.is_disconnected():
+        await asyncio.sleep(_DISCONNECT_POLL_INTERVAL)
+
+
+async def run_cancellable(
+    request: Request,
+    work: Callable[[], Awaitable[T]],
+    *,
+    endpoint: str,
+    cancel_on_disconnect: bool = True,
+    timeout: float | None = None,
+) -> T:
+    """Await *work()*, cancelling it on client disconnect or deadline expiry."""
+    with deadline.deadline_scope(timeout if timeout is not None else settings.LLM_REQUEST_DEADLINE):
+        # The task copies the current context, deadline included.
+        task = asyncio.ensure_future(work())
+        watcher = (
+            asyncio.ensure_future(_until_disconnected(request)) if cancel_on_disconnect else None
+        )
+        waiting = {task} if watcher is None else {task, watcher}
+        try:
+            done, _ = await asyncio.wait(
+                waiting, timeout=deadline.remaining(), return_when=asyncio.FIRST_COMPLETED
+            )
+        except BaseException:  # the request itself was cancelled (e.g. server shutdown)
+            for pending in waiting:
+                pending.cancel()
+            raise
+        if watcher is not None:
+            watcher.cancel()
+        if task in done:
+            return task.result()
+
+    reason = deadline.DISCONNECT if watcher in done else deadline.DEADLINE
+    task.cancel(msg=reason)
+    with contextlib.suppress(asyncio.CancelledError, Exception):
+        await task  # let the work unwind (and telemetry record it) before answering
+    requests_cancelled.inc(endpoint=endpoint, reason=reason)
+    logger.info("request_work_cancelled", endpoint=endpoint, reason=reason)
+    if reason == deadline.DISCONNECT:
+        # Nobody is listening any more; nginx's "client closed request".
+        raise HTTPException(status_code=499, detail="Client closed request.")
+    raise HTTPException(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        detail="The AI took too long to respond. Please try again.",
+    )
@@ -40,9 +40,11 @@ from app.application.use_cases.resume import (
     UpdateResumeUseCase,
     UploadResumeUseCase,
 )
+from app.core.config import settings
 from app.core.security import verify_token
 from app.db.session import get_db
-from app.domain.interfaces.llm_provider import ILLMProvider
+from app.domain.interfaces.llm_provider import IAsyncLLMProvider
+from app.domain.interfaces.question_pool import IQuestionPool
 
 # ── Repository interfaces ───────────────────────────────────────────────────
 from app.domain.interfaces.repositories import (
@@ -51,8 +53,9 @@ from app.domain.interfaces.repositories import (
     IResumeRepository,
     IUserRepository,
 )
+from app.domain.interfaces.task_queue import ICompletionQueue, IEvaluationQueue
 from app.domain.value_objects.enums import UserRole
-from app.infrastructure.llm.factory import get_llm_provider
+from app.infrastructure.llm.registry import get_shared_async_llm_provider
 
 # ── Concrete repositories ──────────────────────────────────────────────────
 from app.infrastructure.persistence.repositories import (
@@ -153,8 +156,8 @@ async def get_interview_repo(db: AsyncSession = Depends(get_db)) -> IInterviewRe
     return InterviewRepository(db)
 
 
-def get_llm() -> ILLMProvider:
-    return get_llm_provider()
+def get_llm() -> IAsyncLLMProvider:
+    return get_shared_async_llm_provider()
 
 
 # =====================================================================
@@ -224,18 +227,49 @@ async def get_reset_password_confirm_uc(
 # =====================================================================
 
 
+def get_question_pool() -> IQuestionPool | None:
+    if not settings.QUESTION_POOL_ENABLED:
+        return None
+    from app.infrastructure.cache.question_pool import question_pool
+
+    return question_pool
+
+
 async def get_start_interview_uc(
     interview_repo: IInterviewRepository = Depends(get_interview_repo),
     resume_repo: IResumeRepository = Depends(get_resume_repo),
-    llm: ILLMProvider = Depends(get_llm),
+    llm: IAsyncLLMProvider = Depends(get_llm),
+    question_pool: IQuestionPool | None = Depends(get_question_pool),
 ) -> StartInterviewUseCase:
-    return StartInterviewUseCase(interview_repo, resume_repo, llm)
+    return StartInterviewUseCase(interview_repo, resume_repo, llm, question_pool)
+
+
+def build_start_interview_uc(
+    db: AsyncSession, llm: IAsyncLLMProvider, question_pool: IQuestionPool | None
+) -> StartInterviewUseCase:
+    """``StartInterviewUseCase`` on a session the caller opens and closes."""
+    return StartInterviewUseCase(InterviewRepository(db), ResumeRepository(db), llm, question_pool)
+
+
+def get_evaluation_queue() -> IEvaluationQueue | None:
+    if not settings.INTERVIEW_INCREMENTAL_EVALUATION:
+        return None
+    from app.infrastructure.tasks.interview_tasks import CeleryEvaluationQueue
+
+    return CeleryEvaluationQueue()
+
+
+def get_completion_queue() -> ICompletionQueue:
+    from app.infrastructure.tasks.interview_tasks import CeleryCompletionQueue
+
+    return CeleryCompletionQueue()
 
 
 async def get_submit_answer_uc(
     interview_repo: IInterviewRepository = Depends(get_interview_repo),
+    evaluation_queue: IEvaluationQueue | None = Depends(get_evaluation_queue),
 ) -> SubmitAnswerUseCase:
-    return SubmitAnswerUseCase(interview_repo)
+    return SubmitAnswerUseCase(interview_repo, evaluation_queue)
 
 
 async def get_next_question_uc(
@@ -246,9 +280,17 @@ async def get_next_question_uc(
 
 async def get_complete_interview_uc(
     interview_repo: IInterviewRepository = Depends(get_interview_repo),
-    llm: ILLMProvider = Depends(get_llm),
+    llm: IAsyncLLMProvider = Depends(get_llm),
 ) -> CompleteInterviewUseCase:
-    return CompleteInterviewUseCase(interview_repo, llm)
+    return CompleteInterviewUseCase(
+        interview_repo,
+        llm,
+        summarize_with_llm=settings.INTERVIEW_SUMMARY_LLM_ENABLED,
+        prescore=settings.INTERVIEW_PRESCORE_ENABLED,
+        batch_size=settings.INTERVIEW_EVAL_BATCH_SIZE,
+        batch_concurrency=settings.INTERVIEW_EVAL_BATCH_CONCURRENCY,
+        batch_retries=settings.INTERVIEW_EVAL_BATCH_RETRIES,
+    )
 
 
 async def get_session_uc(
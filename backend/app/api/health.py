@@ -42,8 +42,9 @@ async def ready() -> dict:
     """Readiness probe — returns 200 only when the application can serve
     traffic (database + Redis reachable). Returns 503 otherwise.
 
-    Also provides informational checks for Celery and LLM provider
-    (these are non-blocking — degraded but still "ready").
+    Also provides informational checks for Celery, the LLM provider and
+    the per-provider circuit breakers (these are non-blocking — degraded
+    but still "ready").
     """
     checks: dict = {}
 
@@ -81,14 +82,20 @@ async def ready() -> dict:
 
     # ── LLM provider availability (informational) ──────────────────────
     try:
-        from app.infrastructure.llm.factory import get_llm_provider
+        from app.infrastructure.llm.registry import get_shared_llm_provider
 
-        get_llm_provider()  # verify provider is available
+        get_shared_llm_provider()  # verify provider is available
         checks["llm_provider"] = "ok"
     except Exception as exc:
         logger.warning("readiness_llm_check_failed", error=str(exc))
         checks["llm_provider"] = "unavailable"
 
+    # ── LLM circuit breakers (informational) ───────────────────────────
+    if checks.get("redis") == "ok":
+        from app.infrastructure.llm.circuit_breaker import circuit_states
+
+        checks["llm_circuits"] = await circuit_states()
+
     # Critical checks: database + redis
     critical_ok = checks.get("database") == "ok" and checks.get("redis") == "ok"
     overall = "ready" if critical_ok else "not_ready"
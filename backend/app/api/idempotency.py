@@ -0,0 +1,124 @@
+"""
+``Idempotency-Key`` support for LLM-backed POST endpoints.
+
+Usage inside an endpoint::
+
+    return await run_idempotent(
+        idempotency_key,
+        user_id=current_user.id,
+        scope="interview.start",
+        fingerprint=request_fingerprint(body.model_dump()),
+        status_code=200,
+        handler=lambda: _start(...),   # returns the response model
+    )
+
+Without a header (or with ``IDEMPOTENCY_ENABLED`` off) the handler simply
+runs.  Otherwise the first request runs it and stores the response;
+retries get the stored response back with ``Idempotent-Replayed: true``.
+A retry arriving while the first request is still running waits for it
+(409 if it takes longer than ``IDEMPOTENCY_WAIT_TIMEOUT``); reusing a key
+for a different request is a 422.  Only successful responses are stored —
+an error releases the key so the client can retry.  See
+``app/infrastructure/cache/idempotency.py`` for the records.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import Annotated, Any
+
+import structlog
+from fastapi import Header, HTTPException, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.infrastructure.cache.idempotency import (
+    DONE,
+    idempotency_store,
+    idempotency_total,
+    record_key,
+)
+
+logger = structlog.get_logger(__name__)
+
+IdempotencyKey = Annotated[
+    str | None,
+    Header(
+        alias="Idempotency-Key",
+        max_length=255,
+        description="Client-chosen key (e.g. a UUID); retries with the same key "
+        "replay the first response instead of running the request again.",
+    ),
+]
+
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+def _replay(record: dict[str, Any]) -> JSONResponse:
+    return JSONResponse(
+        content=record["body"],
+        status_code=record["status_code"],
+        headers={REPLAYED_HEADER: "true"},
+    )
+
+
+def _mismatch() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        detail="Idempotency-Key was already used for a different request.",
+    )
+
+
+async def run_idempotent(
+    idempotency_key: str | None,
+    *,
+    user_id: uuid.UUID,
+    scope: str,
+    fingerprint: str,
+    status_code: int,
+    handler: Callable[[], Awaitable[BaseModel]],
+) -> BaseModel | JSONResponse:
+    """Run *handler* at most once per key; replay its response to retries."""
+    if not idempotency_key or not settings.IDEMPOTENCY_ENABLED:
+        return await handler()
+
+    key = record_key(user_id, scope, idempotency_key)
+    deadline = time.monotonic() + settings.IDEMPOTENCY_WAIT_TIMEOUT
+    waited = False
+    while (claimed := await idempotency_store.claim(key, fingerprint)) is False:
+        record = await idempotency_store.get(key)
+        # No record: the first request failed and released the key (the next
+        # claim takes over), or it could not be read — either way, wait a tick.
+        if record is not None and record["fingerprint"] != fingerprint:
+            idempotency_total.inc(scope=scope, outcome="mismatch")
+            raise _mismatch()
+        if record is not None and record["state"] == DONE:
+            idempotency_total.inc(scope=scope, outcome="waited" if waited else "replayed")
+            logger.info("idempotent_replay", scope=scope, waited=waited)
+            return _replay(record)
+        if time.monotonic() >= deadline:
+            idempotency_total.inc(scope=scope, outcome="in_progress")
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="A request with this Idempotency-Key is still in progress.",
+                headers={"Retry-After": "5"},
+            )
+        waited = True
+        await asyncio.sleep(settings.IDEMPOTENCY_POLL_INTERVAL)
+
+    if claimed is None:
+        idempotency_total.inc(scope=scope, outcome="unavailable")
+        return await handler()
+
+    idempotency_total.inc(scope=scope, outcome="new")
+    try:
+        result = await handler()
+    except BaseException:
+        await idempotency_store.release(key)
+        raise
+    await idempotency_store.save(key, fingerprint, status_code, result.model_dump(mode="json"))
+    return result
@@ -0,0 +1,34 @@
+"""
+Operational metrics endpoint — /metrics.
+
+Mounted directly on the app (no /api/v1 prefix), like the health probes,
+so scrapers can poll it without API versioning.  Returns JSON.
+"""
+
+from __future__ import annotations
+
+from fastapi import APIRouter
+
+from app.core.metrics import metrics as registry
+from app.infrastructure.cache.resume_parse_cache import resume_parse_cache
+
+router = APIRouter(tags=["health"])
+
+
+@router.get(
+    "/metrics",
+    summary="Operational metrics",
+    response_description="Cache counters and other runtime metrics.",
+)
+async def metrics() -> dict:
+    """Return runtime metrics.
+
+    - ``resume_parse_cache`` — hits (Redis / Postgres tier), misses, hit rate;
+      shared across API processes and workers
+    - ``counters`` / ``histograms`` — this process's in-memory registry
+      (e.g. ``llm_rate_limit_wait_seconds``)
+    """
+    return {
+        "resume_parse_cache": await resume_parse_cache.astats(),
+        **registry.snapshot(),
+    }
@@ -1,12 +1,17 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from starlette.concurrency import run_in_threadpool
 
-from app.api.deps import get_complete_interview_uc, get_current_user
+from app.api.cancellation import run_cancellable
+from app.api.deps import get_complete_interview_uc, get_completion_queue, get_current_user
+from app.api.idempotency import IdempotencyKey, run_idempotent
 from app.application.use_cases.interview import CompleteInterviewUseCase
 from app.domain.exceptions import EntityNotFoundError, InterviewError
+from app.domain.interfaces.task_queue import ICompletionQueue
+from app.infrastructure.cache.idempotency import request_fingerprint
 from app.models.user import User
-from app.schemas.interview import QuestionFeedback, SummaryOut
+from app.schemas.interview import CompletionJobOut, QuestionFeedback, SummaryOut
 
 router = APIRouter()
 
@@ -19,9 +24,11 @@ router = APIRouter()
     response_description="Final score, AI-generated performance summary, strengths and weaknesses.",
 )
 async def complete_interview(
+    request: Request,
     session_id: UUID,
     current_user: User = Depends(get_current_user),
     use_case: CompleteInterviewUseCase = Depends(get_complete_interview_uc),
+    idempotency_key: IdempotencyKey = None,
 ):
     """Mark an interview session as complete and generate the final summary.
 
@@ -32,24 +39,112 @@ async def complete_interview(
         - **strengths / weaknesses**: bullet-point lists
         - **question_feedback**: per-question score and feedback
 
+    With an ``Idempotency-Key`` header, a retry returns the first summary
+    instead of evaluating the transcript again.  Without one, evaluation is
+    cancelled when the client disconnects.  Long transcripts are better
+    served by ``POST /complete/job``.
+
+    Raises:
+        404: Session not found or not owned by the user.
+        409: A request with the same Idempotency-Key is still running.
+        504: Evaluation did not finish within ``LLM_REQUEST_DEADLINE``.
+    """
+
+    async def complete() -> SummaryOut:
+        try:
+            result = await run_cancellable(
+                request,
+                lambda: use_case.execute(current_user.id, session_id),
+                endpoint="interview.complete",
+                cancel_on_disconnect=idempotency_key is None,
+            )
+        except EntityNotFoundError as e:
+            raise HTTPException(
+                status_code=404, detail="Session not found or not owned by user"
+            ) from e
+        except InterviewError as e:
+            raise HTTPException(status_code=500, detail=str(e.message)) from e
+        return SummaryOut(
+            session_id=result.session_id,
+            final_score=result.final_score,
+            feedback_summary=result.feedback_summary,
+            question_feedback=[
+                QuestionFeedback(**fb) if isinstance(fb, dict) else fb
+                for fb in result.question_feedback
+            ],
+            score_breakdown=result.score_breakdown,
+            strengths=result.strengths,
+            weaknesses=result.weaknesses,
+        )
+
+    return await run_idempotent(
+        idempotency_key,
+        user_id=current_user.id,
+        scope="interview.complete",
+        fingerprint=request_fingerprint(session_id),
+        status_code=200,
+        handler=complete,
+    )
+
+
+@router.post(
+    "/{session_id}/complete/job",
+    response_model=CompletionJobOut,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Complete an interview session in the background",
+    response_description="Accepted — task ID to poll for progress and the final summary.",
+)
+async def complete_interview_job(
+    session_id: UUID,
+    current_user: User = Depends(get_current_user),
+    use_case: CompleteInterviewUseCase = Depends(get_complete_interview_uc),
+    queue: ICompletionQueue = Depends(get_completion_queue),
+    idempotency_key: IdempotencyKey = None,
+):
+    """Job variant of ``POST /complete`` for long evaluations.
+
+    The session is checked right away; evaluation then runs on a Celery
+    worker, so neither an API worker nor the client's connection is held
+    for the LLM call.  Poll ``GET /tasks/{task_id}``:
+    - **PROGRESS**: ``progress`` = ``{"stage": "evaluating" | "summarizing",
+      "done": n, "total": m}``
+    - **SUCCESS**: ``result`` = the ``SummaryOut`` of ``POST /complete``
+    - **FAILURE**: ``error`` explains why the session could not be completed
+
     Raises:
+        400: Not every question has been answered.
         404: Session not found or not owned by the user.
+        409: A request with the same Idempotency-Key is still running.
+        503: The background queue is unavailable — use ``POST /complete``.
     """
-    try:
-        result = await use_case.execute(current_user.id, session_id)
-    except EntityNotFoundError as e:
-        raise HTTPException(status_code=404, detail="Session not found or not owned by user") from e
-    except InterviewError as e:
-        raise HTTPException(status_code=500, detail=str(e.message)) from e
-    return SummaryOut(
-        session_id=result.session_id,
-        final_score=result.final_score,
-        feedback_summary=result.feedback_summary,
-        question_feedback=[
-            QuestionFeedback(**fb) if isinstance(fb, dict) else fb
-            for fb in result.question_feedback
-        ],
-        score_breakdown=result.score_breakdown,
-        strengths=result.strengths,
-        weaknesses=result.weaknesses,
+
+    async def enqueue() -> CompletionJobOut:
+        try:
+            await use_case.validate(current_user.id, session_id)
+        except EntityNotFoundError as e:
+            raise HTTPException(
+                status_code=404, detail="Session not found or not owned by user"
+            ) from e
+        except InterviewError as e:
+            raise HTTPException(status_code=400, detail=str(e.message)) from e
+
+        task_id = await run_in_threadpool(
+            queue.enqueue_interview_completion, current_user.id, session_id
+        )
+        if task_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Background evaluation unavailable. Please use POST /complete.",
+            )
+        return CompletionJobOut(
+            session_id=session_id, task_id=task_id, status_url=f"/api/v1/tasks/{task_id}"
+        )
+
+    return await run_idempotent(
+        idempotency_key,
+        user_id=current_user.id,
+        scope="interview.complete_job",
+        fingerprint=request_fingerprint(session_id),
+        status_code=status.HTTP_202_ACCEPTED,
+        handler=enqueue,
     )
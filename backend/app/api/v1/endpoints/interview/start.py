@@ -1,14 +1,58 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+import json
+import time
+from collections.abc import AsyncGenerator, AsyncIterator
 
-from app.api.deps import get_current_user, get_start_interview_uc
+import structlog
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.api.cancellation import requests_cancelled, run_cancellable
+from app.api.deps import (
+    build_start_interview_uc,
+    get_current_user,
+    get_llm,
+    get_question_pool,
+    get_start_interview_uc,
+)
+from app.api.idempotency import IdempotencyKey, run_idempotent
 from app.application.dto.interview import StartInterviewInput
 from app.application.use_cases.interview import StartInterviewUseCase
+from app.core import deadline
+from app.core.config import settings
+from app.db.session import get_session_factory
+from app.domain.entities.interview import InterviewQuestionEntity, InterviewSessionEntity
 from app.domain.exceptions import EntityNotFoundError, InterviewError
+from app.domain.interfaces.llm_provider import IAsyncLLMProvider
+from app.domain.interfaces.question_pool import IQuestionPool
+from app.infrastructure.cache.idempotency import request_fingerprint
 from app.models.user import User
-from app.schemas.interview import InterviewSessionInDB, InterviewStartRequest
+from app.schemas.interview import InterviewSessionInDB, InterviewStartRequest, QuestionOut
+
+logger = structlog.get_logger(__name__)
 
 router = APIRouter()
 
+_NO_RESUME = "No resume found. Please upload a resume first."
+_GENERATION_UNAVAILABLE = (
+    "AI question generation temporarily unavailable. Please try again in a few seconds."
+)
+_TOO_SLOW = "The AI took too long to respond. Please try again."
+_STREAM_ENDPOINT = "interview.start.stream"
+
+
+def _to_input(body: InterviewStartRequest | None, user: User) -> StartInterviewInput:
+    if body is None:
+        body = InterviewStartRequest()
+    return StartInterviewInput(
+        user_id=user.id,
+        resume_id=body.resume_id,
+        question_count=body.question_count,
+        difficulty=body.difficulty,
+        focus_areas=body.focus_areas,
+    )
+
 
 @router.post(
     "",
@@ -17,9 +61,11 @@ router = APIRouter()
     response_description="The newly created interview session with generated questions.",
 )
 async def start_interview_session(
+    request: Request,
     body: InterviewStartRequest = None,
     current_user: User = Depends(get_current_user),
     use_case: StartInterviewUseCase = Depends(get_start_interview_uc),
+    idempotency_key: IdempotencyKey = None,
 ):
     """Create a new interview session linked to the user's resume.
 
@@ -29,33 +75,161 @@ async def start_interview_session(
     - **difficulty**: easy | medium | hard | mixed (default: mixed)
     - **focus_areas**: list of focus topics (optional)
 
+    With an ``Idempotency-Key`` header, a retry returns the session created
+    by the first request instead of starting another one.  Without one,
+    generation is cancelled when the client disconnects.
+
     Raises:
         404: No resume found — upload one first.
-        500: Question generation failed.
+        409: A request with the same Idempotency-Key is still running.
+        503: Question generation failed.
+        504: Generation did not finish within ``LLM_REQUEST_DEADLINE``.
     """
-    if body is None:
-        body = InterviewStartRequest()
+    dto = _to_input(body, current_user)
+
+    async def start() -> InterviewSessionInDB:
+        try:
+            session = await run_cancellable(
+                request,
+                lambda: use_case.execute(dto),
+                endpoint="interview.start",
+                cancel_on_disconnect=idempotency_key is None,
+            )
+        except EntityNotFoundError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=_NO_RESUME) from e
+        except InterviewError as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=_GENERATION_UNAVAILABLE
+            ) from e
+        return InterviewSessionInDB.model_validate(session)
 
-    dto = StartInterviewInput(
+    return await run_idempotent(
+        idempotency_key,
         user_id=current_user.id,
-        resume_id=body.resume_id,
-        question_count=body.question_count,
-        difficulty=body.difficulty,
-        focus_areas=body.focus_areas,
+        scope="interview.start",
+        fingerprint=request_fingerprint(
+            dto.resume_id, dto.question_count, dto.difficulty, dto.focus_areas
+        ),
+        status_code=status.HTTP_200_OK,
+        handler=start,
+    )
+
+
+def _sse(event: str, data: str) -> str:
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+@router.post(
+    "/stream",
+    summary="Start an interview session (streamed)",
+    response_description="Server-sent events: the session, then each question as it is generated.",
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def start_interview_session_stream(
+    body: InterviewStartRequest = None,
+    current_user: User = Depends(get_current_user),
+    llm: IAsyncLLMProvider = Depends(get_llm),
+    question_pool: IQuestionPool | None = Depends(get_question_pool),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+):
+    """Streaming variant of ``POST /start`` — the first question arrives
+    while the rest are still being generated.
+
+    Same request body.  The response is ``text/event-stream``:
+    - ``session``: the new session (``InterviewSessionInDB``, no questions yet)
+    - ``question``: one per question, in order (``QuestionOut``); each is
+      persisted before it is sent, so it can be answered right away
+    - ``done``: ``{"question_count": n}``
+    - ``error``: ``{"detail": ...}`` if generation fails part-way or runs
+      past ``LLM_REQUEST_DEADLINE``; questions already sent stay on the
+      session
+
+    Raises:
+        404: No resume found — upload one first.
+        504: The session could not be created within ``LLM_REQUEST_DEADLINE``.
+    """
+    # The body streams after FastAPI has closed the request's DB session,
+    # so generation gets a session of its own, closed with the stream.
+    db = session_factory()
+    use_case = build_start_interview_uc(db, llm, question_pool)
+    events = use_case.stream(_to_input(body, current_user))
+    expires_at = time.monotonic() + settings.LLM_REQUEST_DEADLINE
+    try:
+        session = await _next_event(events, expires_at)
+    except BaseException as e:
+        await events.aclose()
+        await db.close()
+        if isinstance(e, EntityNotFoundError):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=_NO_RESUME) from e
+        if isinstance(e, TimeoutError):
+            _count_deadline()
+            raise HTTPException(
+                status_code=status.HTTP_504_GATEWAY_TIMEOUT, detail=_TOO_SLOW
+            ) from e
+        raise
+
+    return StreamingResponse(
+        _stream_events(session, events, db, expires_at),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
+
+async def _next_event(
+    events: AsyncIterator[InterviewSessionEntity | InterviewQuestionEntity], expires_at: float
+) -> InterviewSessionEntity | InterviewQuestionEntity:
+    """The next item of *events*, under the stream's deadline.
+
+    The deadline scope only spans this one step — a scope held open across
+    the generator's ``yield`` would leak into whoever iterates it.
+
+    Raises:
+        StopAsyncIteration: *events* is exhausted.
+        TimeoutError: *expires_at* passed first; the pending step is cancelled.
+    """
+    left = max(expires_at - time.monotonic(), 0.001)
+    with deadline.deadline_scope(left):
+        async with asyncio.timeout(left):
+            return await anext(events)
+
+
+def _count_deadline() -> None:
+    requests_cancelled.inc(endpoint=_STREAM_ENDPOINT, reason=deadline.DEADLINE)
+    logger.info("request_work_cancelled", endpoint=_STREAM_ENDPOINT, reason=deadline.DEADLINE)
+
+
+async def _stream_events(
+    session: InterviewSessionEntity,
+    questions: AsyncGenerator[InterviewSessionEntity | InterviewQuestionEntity, None],
+    db: AsyncSession,
+    expires_at: float,
+) -> AsyncIterator[str]:
+    yield _sse("session", InterviewSessionInDB.model_validate(session).model_dump_json())
+    count = 0
     try:
-        session = await use_case.execute(dto)
-    except EntityNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="No resume found. Please upload a resume first.",
-        ) from e
-    except InterviewError as e:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=(
-                "AI question generation temporarily unavailable. Please try again in a few seconds."
-            ),
-        ) from e
-    return session
+        while True:
+            try:
+                question = await _next_event(questions, expires_at)
+            except StopAsyncIteration:
+                break
+            count += 1
+            out = QuestionOut(
+                question_id=question.id,
+                question_text=question.question_text,
+                category=question.category,
+                difficulty=question.difficulty,
+                order_index=question.order_index,
+            )
+            yield _sse("question", out.model_dump_json())
+    except InterviewError:
+        logger.warning("interview_stream_failed", session_id=str(session.id), sent=count)
+        yield _sse("error", json.dumps({"detail": _GENERATION_UNAVAILABLE}))
+        return
+    except TimeoutError:
+        _count_deadline()
+        yield _sse("error", json.dumps({"detail": _TOO_SLOW}))
+        return
+    finally:
+        await questions.aclose()
+        await db.close()
+    yield _sse("done", json.dumps({"question_count": count}))
@@ -1,3 +1,4 @@
+import hashlib
 import os
 import uuid
 
@@ -5,10 +6,12 @@ import structlog
 from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile, status
 
 from app.api.deps import get_current_user, get_upload_resume_uc
+from app.api.idempotency import IdempotencyKey, run_idempotent
 from app.application.dto.resume import ResumeUploadInput
 from app.application.use_cases.resume import UploadResumeUseCase
 from app.core.config import settings
 from app.core.middleware import limiter
+from app.infrastructure.cache.idempotency import request_fingerprint
 from app.schemas.resume import FileType, ResumeStatus, ResumeUploadResponse
 from app.utils.file_handler import save_upload_file, validate_file
 
@@ -17,15 +20,28 @@ router = APIRouter()
 logger = structlog.get_logger(__name__)
 
 
+def _file_digest(file: UploadFile) -> str:
+    """SHA-256 of the upload's content; leaves the file at position 0."""
+    digest = hashlib.sha256()
+    file.file.seek(0)
+    for chunk in iter(lambda: file.file.read(1 << 16), b""):
+        digest.update(chunk)
+    file.file.seek(0)
+    return digest.hexdigest()
+
+
 def _dispatch_celery_task(file_path: str, user_id: str, resume_id: str) -> str | None:
     """Try to dispatch Celery task; return task_id or None if broker unavailable."""
     try:
         from app.infrastructure.tasks.resume_tasks import parse_resume_task
-
-        task = parse_resume_task.delay(
-            file_path=file_path,
-            user_id=user_id,
-            resume_id=resume_id,
+        from app.infrastructure.tasks.task_owners import record_owner
+
+        task_id = str(uuid.uuid4())
+        if not record_owner(task_id, user_id):  # unpollable — parse in-process instead
+            return None
+        task = parse_resume_task.apply_async(
+            kwargs={"file_path": file_path, "user_id": user_id, "resume_id": resume_id},
+            task_id=task_id,
         )
         return task.id
     except Exception as exc:
@@ -42,9 +58,9 @@ async def _sync_parse_fallback(file_path: str, resume_id: str) -> None:
     from sqlalchemy import create_engine, select
     from sqlalchemy.orm import sessionmaker
 
-    from app.infrastructure.llm.factory import get_llm_provider
+    from app.infrastructure.llm.registry import get_shared_llm_provider
     from app.infrastructure.persistence.models.resume import Resume as ResumeModel
-    from app.services.resume_parser import _extract_text
+    from app.services.resume_parser import _extract_text, parse_resume_text
 
     logger.info("sync_parse_fallback_started", resume_id=resume_id)
 
@@ -57,10 +73,7 @@ async def _sync_parse_fallback(file_path: str, resume_id: str) -> None:
 
     try:
         text = _extract_text(file_path)
-        provider = get_llm_provider()
-        parsed = provider.parse_resume(text)
-        if not parsed:
-            parsed = {}
+        parsed = parse_resume_text(get_shared_llm_provider(), text, db)
 
         result = db.execute(select(ResumeModel).where(ResumeModel.id == resume_uuid))
         resume = result.scalars().first()
@@ -118,6 +131,7 @@ async def upload_resume(
     file: UploadFile = File(...),
     current_user=Depends(get_current_user),
     use_case: UploadResumeUseCase = Depends(get_upload_resume_uc),
+    idempotency_key: IdempotencyKey = None,
 ):
     """
     Upload a resume file.
@@ -131,6 +145,9 @@ async def upload_resume(
 
     Returns **202 Accepted** with the resume ID and Celery task ID so
     the client can poll ``GET /tasks/{task_id}`` for progress.
+
+    With an ``Idempotency-Key`` header, a retried upload of the same file
+    returns the first response instead of storing and parsing it again.
     """
 
     # 1. Validate file type & size
@@ -142,9 +159,26 @@ async def upload_resume(
         logger.exception("validation_error")
         raise HTTPException(status_code=400, detail=str(e)) from e
 
-    # 2. Save file with unique name
     if not file.filename:
         raise HTTPException(status_code=400, detail="Uploaded file must have a filename.")
+
+    # Hashing the upload is only needed to detect a reused key.
+    fingerprint = request_fingerprint(file.filename, _file_digest(file)) if idempotency_key else ""
+    return await run_idempotent(
+        idempotency_key,
+        user_id=current_user.id,
+        scope="resume.upload",
+        fingerprint=fingerprint,
+        status_code=status.HTTP_202_ACCEPTED,
+        handler=lambda: _accept_upload(file, current_user, use_case),
+    )
+
+
+async def _accept_upload(
+    file: UploadFile, current_user, use_case: UploadResumeUseCase
+) -> ResumeUploadResponse:
+    """Steps 2–5 of ``upload_resume`` — everything a retry must not repeat."""
+    # 2. Save file with unique name
     file_ext = file.filename.rsplit(".", 1)[-1].upper()
     unique_name = f"{uuid.uuid4()}.{file.filename.split('.')[-1]}"
     upload_path = os.path.join(settings.UPLOAD_DIR, unique_name)
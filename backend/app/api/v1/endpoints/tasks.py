@@ -2,24 +2,30 @@
 Task status polling endpoint.
 
 Clients use ``GET /api/v1/tasks/{task_id}`` to check the progress of
-background jobs dispatched by the resume upload (or any future Celery task).
+background jobs dispatched by the resume upload and the interview
+completion job (``POST /interview/{id}/complete/job``).  Only the user who
+dispatched a task may poll it (see ``task_owners``); anyone else gets 404.
 """
 
 from __future__ import annotations
 
 from typing import Any
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
 
+from app.api.deps import get_current_user
 from app.infrastructure.tasks.celery_app import celery_app
+from app.infrastructure.tasks.task_owners import get_owner
+from app.models.user import User
 
 router = APIRouter()
 
 
 class TaskStatusResponse(BaseModel):
     task_id: str
-    status: str  # PENDING | STARTED | SUCCESS | FAILURE | RETRY | REVOKED
+    status: str  # PENDING | STARTED | PROGRESS | SUCCESS | FAILURE | RETRY | REVOKED
+    progress: dict[str, Any] | None = None
     result: Any | None = None
     error: str | None = None
 
@@ -30,18 +36,24 @@ class TaskStatusResponse(BaseModel):
     summary="Poll task status",
     response_description="Current status, result, or error of the background task.",
 )
-async def get_task_status(task_id: str):
+async def get_task_status(task_id: str, current_user: User = Depends(get_current_user)):
     """
     Poll the status of a Celery background task.
 
     Status values:
     - **PENDING**: Task is waiting in the queue (or task ID is unknown).
     - **STARTED**: Worker has picked up the task.
+    - **PROGRESS**: Task is running — ``progress`` describes how far it is.
     - **SUCCESS**: Task completed successfully — ``result`` contains output.
     - **FAILURE**: Task failed — ``error`` contains the exception message.
     - **RETRY**: Task failed and is being retried.
     - **REVOKED**: Task was cancelled.
+
+    Returns 404 for unknown tasks and for tasks dispatched by another user.
     """
+    if await get_owner(task_id) != str(current_user.id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+
     result = celery_app.AsyncResult(task_id)
 
     response = TaskStatusResponse(
@@ -49,7 +61,9 @@ async def get_task_status(task_id: str):
         status=result.status,
     )
 
-    if result.successful():
+    if result.status == "PROGRESS" and isinstance(result.info, dict):
+        response.progress = result.info
+    elif result.successful():
         response.result = result.result
     elif result.failed():
         response.error = str(result.result)
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import asyncio
 import uuid
+from collections.abc import AsyncIterator, Callable
 from datetime import UTC, datetime
 from typing import Any
 
@@ -20,6 +21,19 @@ from app.application.dto.interview import (
     StartInterviewInput,
     SubmitAnswerInput,
 )
+from app.application.use_cases.interview.evaluation import (
+    batched,
+    build_batch_prompt,
+    build_summary_prompt,
+    build_transcript_prompt,
+    local_summary,
+    overall_score,
+    parse_answer_feedback,
+    prompt_ids,
+    score_breakdown,
+)
+from app.application.use_cases.interview.prescore import prescore
+from app.application.use_cases.interview.prompts import QUESTIONS
 from app.domain.entities.interview import (
     InterviewQuestionEntity,
     InterviewSessionEntity,
@@ -28,15 +42,20 @@ from app.domain.exceptions import (
     EntityNotFoundError,
     InterviewError,
 )
-from app.domain.interfaces.llm_provider import ILLMProvider
+from app.domain.interfaces.llm_provider import IAsyncLLMProvider
+from app.domain.interfaces.question_pool import IQuestionPool
 from app.domain.interfaces.repositories import (
     IInterviewRepository,
     IResumeRepository,
     IUserRepository,
 )
+from app.domain.interfaces.task_queue import IEvaluationQueue
 
 logger = structlog.get_logger(__name__)
 
+# ``(stage, done, total)`` — see ``CompleteInterviewUseCase``.
+ProgressCallback = Callable[[str, int, int], None]
+
 
 # ── Helpers ─────────────────────────────────────────────────────────────────
 
@@ -57,20 +76,107 @@ async def _get_owned_session(
 
 
 class StartInterviewUseCase:
-    """Create a new interview session and generate AI questions."""
+    """Create a new interview session and generate AI questions.
+
+    With a question pool, questions pre-generated for the resume are used
+    when available (no LLM call); every draw — hit or miss — schedules a
+    refill of that preset.  Interviews with focus areas always generate live.
+    ``stream`` is the incremental variant behind the SSE start endpoint.
+    """
 
     def __init__(
         self,
         interview_repo: IInterviewRepository,
         resume_repo: IResumeRepository,
-        llm_provider: ILLMProvider,
+        llm_provider: IAsyncLLMProvider,
+        question_pool: IQuestionPool | None = None,
     ) -> None:
         self._interview_repo = interview_repo
         self._resume_repo = resume_repo
         self._llm_provider = llm_provider
+        self._question_pool = question_pool
 
     async def execute(self, dto: StartInterviewInput) -> InterviewSessionEntity:
-        # 1. Get specified resume or latest
+        resume = await self._get_resume(dto)
+        saved_session = await self._create_session(dto, resume)
+
+        # Take questions from the pool or generate them via LLM (async
+        # provider — no worker thread is held while we wait)
+        resume_context = self.build_resume_context(resume)
+        raw_questions = await self._draw_from_pool(dto, resume, resume_context)
+        if raw_questions is None:
+            prompt = self._prompt_for(dto, resume_context)
+            try:
+                raw_questions = await self._llm_provider.generate_questions(prompt)
+                logger.info(
+                    "questions_generated",
+                    session_id=str(saved_session.id),
+                    count=len(raw_questions),
+                )
+            except Exception as e:
+                logger.error("llm_call_failed", session_id=str(saved_session.id), error=str(e))
+                raise InterviewError("Failed to generate questions") from e
+
+        # Persist questions with metadata (batch — single transaction)
+        await self._interview_repo.add_questions_batch(
+            [
+                self._question_entity(dto, saved_session.id, idx, q_data)
+                for idx, q_data in enumerate(raw_questions)
+            ]
+        )
+
+        # Return the session (with questions attached)
+        return await self._interview_repo.get_session_by_id(saved_session.id)  # type: ignore
+
+    async def stream(
+        self, dto: StartInterviewInput
+    ) -> AsyncIterator[InterviewSessionEntity | InterviewQuestionEntity]:
+        """Like ``execute``, but yields as it goes.
+
+        The first item is the saved session (without questions), followed
+        by each question as soon as it has been generated and persisted, so
+        the candidate can start on question 1 while the rest are still being
+        written.  Resume lookup errors are raised before anything is yielded.
+
+        Raises:
+            InterviewError: generation failed.  Questions yielded before the
+                failure stay persisted on the session.
+        """
+        resume = await self._get_resume(dto)
+        saved_session = await self._create_session(dto, resume)
+        yield saved_session
+
+        resume_context = self.build_resume_context(resume)
+        raw_questions = await self._draw_from_pool(dto, resume, resume_context)
+        if raw_questions is not None:
+            for idx, q_data in enumerate(raw_questions):
+                yield await self._interview_repo.add_question(
+                    self._question_entity(dto, saved_session.id, idx, q_data)
+                )
+            return
+
+        prompt = self._prompt_for(dto, resume_context)
+        count = 0
+        try:
+            async for q_data in self._llm_provider.stream_questions(prompt):
+                question = await self._interview_repo.add_question(
+                    self._question_entity(dto, saved_session.id, count, q_data)
+                )
+                count += 1
+                yield question
+        except Exception as e:
+            logger.error(
+                "llm_call_failed", session_id=str(saved_session.id), streamed=count, error=str(e)
+            )
+            raise InterviewError("Failed to generate questions") from e
+        if not count:
+            raise InterviewError("Failed to generate questions")
+        logger.info("questions_streamed", session_id=str(saved_session.id), count=count)
+
+    # ── Private helpers ────────────────────────────────────────────────
+
+    async def _get_resume(self, dto: StartInterviewInput):
+        """The requested resume, or the user's latest.  Raises if there is none."""
         if dto.resume_id:
             resume = await self._resume_repo.get_by_id(dto.resume_id)
             if not resume or resume.user_id != dto.user_id:
@@ -79,73 +185,69 @@ class StartInterviewUseCase:
             resume = await self._resume_repo.get_latest_by_user_id(dto.user_id)
         if not resume:
             raise EntityNotFoundError("Resume")
+        return resume
+
+    async def _create_session(self, dto: StartInterviewInput, resume) -> InterviewSessionEntity:
+        return await self._interview_repo.create_session(
+            InterviewSessionEntity(
+                user_id=dto.user_id,
+                resume_id=resume.id,
+                started_at=datetime.now(UTC),
+                difficulty=dto.difficulty,
+                question_count=dto.question_count,
+                focus_areas=dto.focus_areas,
+            )
+        )
 
-        # 2. Create session entity with config
-        session_entity = InterviewSessionEntity(
-            user_id=dto.user_id,
-            resume_id=resume.id,
-            started_at=datetime.now(UTC),
-            difficulty=dto.difficulty,
-            question_count=dto.question_count,
-            focus_areas=dto.focus_areas,
+    async def _draw_from_pool(
+        self, dto: StartInterviewInput, resume, resume_context: dict
+    ) -> list[Any] | None:
+        """Pre-generated questions for the resume, or None (no pool, focus areas, miss)."""
+        pool = None if dto.focus_areas else self._question_pool
+        if pool is None:
+            return None
+        version = QUESTIONS.version_id
+        raw_questions = await pool.draw(
+            resume.id, dto.difficulty, resume_context, version, dto.question_count
+        )
+        refill_prompt = self.build_prompt(
+            resume_context, question_count=pool.set_size, difficulty=dto.difficulty
         )
-        saved_session = await self._interview_repo.create_session(session_entity)
+        pool.request_refill(resume.id, dto.difficulty, resume_context, version, refill_prompt)
+        return raw_questions
 
-        # 3. Build resume context & generate questions via LLM
-        #    Run the synchronous/blocking LLM call in a thread so we
-        #    don't freeze the async event loop.
-        resume_context = self._build_resume_context(resume)
-        prompt = self._build_prompt(
+    def _prompt_for(self, dto: StartInterviewInput, resume_context: dict) -> dict:
+        return self.build_prompt(
             resume_context,
             question_count=dto.question_count,
             difficulty=dto.difficulty,
             focus_areas=dto.focus_areas,
         )
-        try:
-            raw_questions = await asyncio.to_thread(self._llm_provider.generate_questions, prompt)
-            logger.info(
-                "questions_generated",
-                session_id=str(saved_session.id),
-                count=len(raw_questions),
-            )
-        except Exception as e:
-            logger.error("llm_call_failed", session_id=str(saved_session.id), error=str(e))
-            raise InterviewError("Failed to generate questions") from e
-
-        # 4. Persist questions with metadata (batch — single transaction)
-        q_entities: list[InterviewQuestionEntity] = []
-        for idx, q_data in enumerate(raw_questions):
-            # Support both dict (with metadata) and plain string from LLM
-            if isinstance(q_data, dict):
-                q_text = q_data.get("question", str(q_data))
-                q_category = q_data.get("type", "general")
-                q_difficulty = q_data.get(
-                    "difficulty", dto.difficulty if dto.difficulty != "mixed" else "medium"
-                )
-            else:
-                q_text = str(q_data)
-                q_category = "general"
-                q_difficulty = dto.difficulty if dto.difficulty != "mixed" else "medium"
-
-            q_entities.append(
-                InterviewQuestionEntity(
-                    session_id=saved_session.id,
-                    question_text=q_text,
-                    category=q_category,
-                    difficulty=q_difficulty,
-                    order_index=idx,
-                )
-            )
-
-        await self._interview_repo.add_questions_batch(q_entities)
 
-        # Return the session (with questions attached)
-        return await self._interview_repo.get_session_by_id(saved_session.id)  # type: ignore
-
-    # ── Private helpers ────────────────────────────────────────────────
+    @staticmethod
+    def _question_entity(
+        dto: StartInterviewInput, session_id: uuid.UUID, idx: int, q_data: Any
+    ) -> InterviewQuestionEntity:
+        # Support both dict (with metadata) and plain string from LLM
+        default_difficulty = dto.difficulty if dto.difficulty != "mixed" else "medium"
+        if isinstance(q_data, dict):
+            q_text = q_data.get("question", str(q_data))
+            q_category = q_data.get("type", "general")
+            q_difficulty = q_data.get("difficulty", default_difficulty)
+        else:
+            q_text = str(q_data)
+            q_category = "general"
+            q_difficulty = default_difficulty
+        return InterviewQuestionEntity(
+            session_id=session_id,
+            question_text=q_text,
+            category=q_category,
+            difficulty=q_difficulty,
+            order_index=idx,
+        )
 
     @staticmethod
-    def _build_resume_context(resume) -> dict:
+    def build_resume_context(resume) -> dict:
         experience = (resume.analysis or {}).get("experience", [])
         projects = [
             {"description": exp.get("description", "No description available")}
@@ -159,7 +261,7 @@ class StartInterviewUseCase:
         }
 
     @staticmethod
-    def _build_prompt(
+    def build_prompt(
         ctx: dict,
         *,
         question_count: int = 12,
@@ -172,64 +274,43 @@ class StartInterviewUseCase:
         projects = (ctx.get("projects") or [])[:4]
         project_details = "\n".join(f"  - {p['description']}" for p in projects)
 
-        difficulty_instruction = ""
+        # Only per-call data here — the guidelines and output format are the
+        # template's static prefix (see ``prompts.py``).
+        lines = [
+            "Candidate Profile:",
+            f"- Target Role: {ctx.get('inferred_role') or 'Software Engineer'}",
+            f"- Years of Experience: {ctx.get('years_of_experience') or 'Unknown'}",
+            f"- Key Skills: {', '.join(skills[:15]) if skills else 'Not specified'}",
+        ]
+        if project_details:
+            lines.append(f"- Notable Projects:\n{project_details}")
         if difficulty == "mixed":
-            difficulty_instruction = (
-                "Use a mix of easy, medium, and hard questions. "
-                "Distribute roughly: 30% easy, 40% medium, 30% hard.\n"
-            )
+            lines.append("Difficulty: mixed.")
         else:
-            difficulty_instruction = (
-                f"All questions should be at **{difficulty}** difficulty level.\n"
-            )
-
-        focus_instruction = ""
+            lines.append(f"Difficulty: all questions at **{difficulty}** difficulty level.")
         if focus_areas:
-            focus_instruction = f"Focus the questions on these areas: {', '.join(focus_areas)}.\n"
-
-        system_prompt = (
-            "You are an expert technical interviewer conducting a real interview. "
-            "Generate precise, focused interview questions that test a candidate's "
-            "actual skills and experience. Always respond with valid JSON only."
-        )
-        user_prompt = (
-            f"Candidate Profile:\n"
-            f"- Target Role: {ctx.get('inferred_role') or 'Software Engineer'}\n"
-            f"- Years of Experience: {ctx.get('years_of_experience') or 'Unknown'}\n"
-            f"- Key Skills: {', '.join(skills[:15]) if skills else 'Not specified'}\n"
-        )
-        if project_details:
-            user_prompt += f"- Notable Projects:\n{project_details}\n"
-
-        user_prompt += (
-            f"\n{difficulty_instruction}"
-            f"{focus_instruction}"
-            "\nQUESTION GUIDELINES:\n"
-            "- Keep questions concise and direct (1-2 sentences max).\n"
-            "- Only scenario-based or system_design questions may be longer (up to 3-4 sentences) "
-            "to set up proper context.\n"
-            "- Ask about specific technologies from the candidate's skill set.\n"
-            "- Include questions referencing their actual project experience.\n"
-            "- Avoid generic filler questions — every question should be purposeful.\n"
-            "- Mix question types: technical, behavioral, project-based, system_design, and coding.\n"
-            "\nOUTPUT FORMAT:\n"
-            'Return a JSON object with a "questions" array. Each element:\n'
-            '  { "type": "technical|behavioral|project|system_design|coding", '
-            '"question": "<concise question text>", "difficulty": "easy|medium|hard" }\n'
-            f"\nTotal questions: {question_count}\n"
-            "No additional text, no markdown, no code fences — ONLY the JSON object."
-        )
-        return {"system_prompt": system_prompt, "user_prompt": user_prompt}
+            lines.append(f"Focus areas: {', '.join(focus_areas)}.")
+        lines.append(f"Total questions: {question_count}")
+        return QUESTIONS.render("\n".join(lines))
 
 
 # ── Submit Answer ───────────────────────────────────────────────────────────
 
 
 class SubmitAnswerUseCase:
-    """Submit an answer and return the next unanswered question (or None)."""
+    """Submit an answer and return the next unanswered question (or None).
 
-    def __init__(self, interview_repo: IInterviewRepository) -> None:
+    When an evaluation queue is given, the answer is scored in the
+    background right away so completion only has to summarize.
+    """
+
+    def __init__(
+        self,
+        interview_repo: IInterviewRepository,
+        evaluation_queue: IEvaluationQueue | None = None,
+    ) -> None:
         self._interview_repo = interview_repo
+        self._evaluation_queue = evaluation_queue
 
     async def execute(self, dto: SubmitAnswerInput) -> QuestionResult | None:
         _session = await _get_owned_session(self._interview_repo, dto.user_id, dto.session_id)
@@ -239,12 +320,18 @@ class SubmitAnswerUseCase:
         if not question:
             raise EntityNotFoundError("InterviewQuestion", str(dto.question_id))
 
-        # Record answer
+        # Record answer (a changed answer invalidates any earlier evaluation)
+        if question.answer_text != dto.answer_text:
+            question.evaluation_score = None
+            question.feedback_comment = None
         question.answer_text = dto.answer_text
         if dto.time_taken_seconds is not None:
             question.time_taken_seconds = dto.time_taken_seconds
         await self._interview_repo.update_question(question)
 
+        if self._evaluation_queue is not None and not question.is_evaluated():
+            self._evaluation_queue.enqueue_answer_evaluation(dto.session_id, question.id)
+
         # Return next unanswered
         next_q = await self._interview_repo.get_next_unanswered_question(dto.session_id)
         if not next_q:
@@ -286,17 +373,68 @@ class GetNextQuestionUseCase:
 
 
 class CompleteInterviewUseCase:
-    """Evaluate all answers and finalize the interview session."""
+    """Evaluate all answers and finalize the interview session.
+
+    Answers already scored in the background (see ``SubmitAnswerUseCase``)
+    are not re-evaluated: when every answer has a score only a small summary
+    call is made — or none, with ``summarize_with_llm=False`` — and the
+    overall score and ``score_breakdown`` are computed locally.
+
+    With ``prescore`` trivially weak answers (blank, "I don't know", a few
+    words — see ``prescore.py``) get a deterministic score and canned
+    feedback locally; only the substantive ones are sent to the model.
+
+    Answers still unscored are evaluated either in batches of ``batch_size``
+    (run concurrently, at most ``batch_concurrency`` at a time, each retried
+    on its own up to ``batch_retries`` times) before that same summary step,
+    or — with ``batch_size=0`` — in one full-transcript call.
+
+    ``on_progress`` is called with ``(stage, done, total)`` as the work
+    advances: ``("evaluating", answers scored, answers to score)`` and
+    ``("summarizing", n, n)``.  The background completion job publishes
+    these as task progress.
+    """
 
     def __init__(
         self,
         interview_repo: IInterviewRepository,
-        llm_provider: ILLMProvider,
+        llm_provider: IAsyncLLMProvider,
+        *,
+        summarize_with_llm: bool = True,
+        prescore: bool = True,
+        batch_size: int = 0,
+        batch_concurrency: int = 4,
+        batch_retries: int = 1,
+        on_progress: ProgressCallback | None = None,
     ) -> None:
         self._interview_repo = interview_repo
         self._llm_provider = llm_provider
+        self._summarize_with_llm = summarize_with_llm
+        self._prescore = prescore
+        self._batch_size = batch_size
+        self._batch_concurrency = max(batch_concurrency, 1)
+        self._batch_retries = max(batch_retries, 0)
+        self._on_progress = on_progress
 
     async def execute(self, user_id: uuid.UUID, session_id: uuid.UUID) -> InterviewSummaryResult:
+        session, questions = await self._load(user_id, session_id)
+
+        pending = [q for q in questions if not q.is_evaluated()]
+        prescored = await self._prescore_trivial(session, pending) if self._prescore else set()
+        pending = [q for q in pending if q.id not in prescored]
+        if pending and self._batch_size > 0:
+            await self._evaluate_batches(session, pending)
+        elif pending:
+            return await self._evaluate_transcript(session, questions, pending)
+        return await self._summarize_scored(session, questions)
+
+    async def validate(self, user_id: uuid.UUID, session_id: uuid.UUID) -> None:
+        """Raise the errors ``execute`` would raise before any LLM call."""
+        await self._load(user_id, session_id)
+
+    async def _load(
+        self, user_id: uuid.UUID, session_id: uuid.UUID
+    ) -> tuple[InterviewSessionEntity, list[InterviewQuestionEntity]]:
         session = await _get_owned_session(self._interview_repo, user_id, session_id)
 
         questions = await self._interview_repo.get_questions_by_session_id(session_id)
@@ -306,39 +444,193 @@ class CompleteInterviewUseCase:
         unanswered = [q for q in questions if not q.is_answered()]
         if unanswered:
             raise InterviewError("All questions must be answered before completing the interview.")
+        return session, questions
 
-        # Build LLM prompt
-        qa_pairs = [
-            {
-                "question_id": str(q.id),
-                "question": q.question_text,
-                "answer": q.answer_text,
-                "category": q.category,
-            }
-            for q in questions
-        ]
-        prompt = {
-            "system_prompt": (
-                "You are an expert technical interviewer. Evaluate the following interview session. "
-                "For each question, provide a score (0-1) and brief feedback. Then, summarize the "
-                "candidate's strengths and weaknesses and provide an overall confidence score (0-1). "
-                "Always respond with valid JSON only."
-            ),
-            "user_prompt": (
-                f"Session Q&A: {qa_pairs}\n"
-                "OUTPUT FORMAT (JSON): "
-                '{"summary": "<string>", "confidence_score": <float>, '
-                '"strengths": ["<string>", ...], '
-                '"weaknesses": ["<string>", ...], '
-                '"score_breakdown": {"technical": <float>, "behavioral": <float>, '
-                '"project": <float>, "overall": <float>}, '
-                '"questions_feedback": [{"question_id": "<string>", "evaluation_score": <float>, '
-                '"feedback_comment": "<string>"}]}'
-            ),
-        }
+    def _progress(self, stage: str, done: int, total: int) -> None:
+        if self._on_progress is None:
+            return
+        try:
+            self._on_progress(stage, done, total)
+        except Exception as e:  # progress is informational — never fail the evaluation
+            logger.warning("interview_progress_report_failed", stage=stage, error=str(e))
 
+    async def _prescore_trivial(
+        self,
+        session: InterviewSessionEntity,
+        pending: list[InterviewQuestionEntity],
+    ) -> set[uuid.UUID]:
+        """Score the trivially weak answers of *pending* locally; returns their ids."""
+        reasons: dict[str, int] = {}
+        for q in pending:
+            grade = prescore(q.question_text, q.answer_text)
+            if grade is None:
+                continue
+            q.evaluation_score, q.feedback_comment = grade.score, grade.feedback
+            await self._interview_repo.update_question(q)
+            reasons[grade.reason] = reasons.get(grade.reason, 0) + 1
+        if reasons:
+            logger.info(
+                "interview_answers_prescored",
+                session_id=str(session.id),
+                prescored=sum(reasons.values()),
+                pending=len(pending),
+                reasons=reasons,
+            )
+        return {q.id for q in pending if q.is_evaluated()}
+
+    # ── Batched path: score unscored answers concurrently ──────────────
+
+    async def _evaluate_batches(
+        self,
+        session: InterviewSessionEntity,
+        pending: list[InterviewQuestionEntity],
+    ) -> None:
+        """Score *pending* in concurrent batches and persist every score received.
+
+        Scores are streamed: each answer's score is kept as soon as the model
+        has produced it, so a batch whose response breaks off midway only
+        retries its unscored answers.  Raises ``InterviewError`` if a batch
+        is still incomplete after its retries; every score received is kept,
+        so completing again only redoes the missing answers.
+        """
+        semaphore = asyncio.Semaphore(self._batch_concurrency)
+
+        async def _run(
+            batch: list[InterviewQuestionEntity], scored: dict[str, tuple[float, str]]
+        ) -> None:
+            async with semaphore:
+                for attempt in range(1, self._batch_retries + 1):
+                    try:
+                        return await self._score_batch(batch, scored)
+                    except Exception as e:
+                        logger.warning(
+                            "interview_batch_evaluation_retry",
+                            session_id=str(session.id),
+                            batch_size=len(batch),
+                            scored=sum(str(q.id) in scored for q in batch),
+                            attempt=attempt,
+                            error=str(e),
+                        )
+                await self._score_batch(batch, scored)
+
+        async def _run_and_report(
+            batch: list[InterviewQuestionEntity], scored: dict[str, tuple[float, str]]
+        ) -> None:
+            try:
+                await _run(batch, scored)
+            finally:
+                self._progress("evaluating", len(scored), len(pending))
+
+        batches = batched(pending, self._batch_size)
+        scored: dict[str, tuple[float, str]] = {}
+        self._progress("evaluating", 0, len(pending))
+        results = await asyncio.gather(
+            *(_run_and_report(b, scored) for b in batches), return_exceptions=True
+        )
+
+        # Persist sequentially — the repository's DB session is not concurrency-safe.
+        for q in pending:
+            if str(q.id) in scored:
+                q.evaluation_score, q.feedback_comment = scored[str(q.id)]
+                await self._interview_repo.update_question(q)
+
+        failed = [r for r in results if isinstance(r, BaseException)]
+        logger.info(
+            "interview_batches_evaluated",
+            session_id=str(session.id),
+            batches=len(batches),
+            failed=len(failed),
+            scored=len(scored),
+        )
+        if failed:
+            raise InterviewError(
+                f"LLM evaluation failed for {len(failed)} of {len(batches)} batches: {failed[0]}"
+            ) from failed[0]
+
+    # ── Incremental path: every answer already scored ──────────────────
+
+    async def _summarize_scored(
+        self,
+        session: InterviewSessionEntity,
+        questions: list[InterviewQuestionEntity],
+    ) -> InterviewSummaryResult:
+        summary_data = local_summary(questions)
+        self._progress("summarizing", len(questions), len(questions))
+        if self._summarize_with_llm:
+            try:
+                llm_response = await self._llm_provider.generate_feedback(
+                    build_summary_prompt(questions)
+                )
+                if llm_response.get("summary"):
+                    summary_data = llm_response
+            except Exception as e:
+                # Scores are final already — a locally written summary beats failing.
+                logger.warning(
+                    "interview_summary_llm_failed", session_id=str(session.id), error=str(e)
+                )
+
+        final_score = overall_score(questions)
+        breakdown = score_breakdown(questions)
+        session.complete(
+            score=final_score, summary=summary_data["summary"], score_breakdown=breakdown
+        )
+        await self._interview_repo.update_session(session)
+        logger.info("interview_completed_incrementally", session_id=str(session.id))
+
+        return InterviewSummaryResult(
+            session_id=session.id,
+            final_score=final_score,
+            feedback_summary=summary_data["summary"],
+            question_feedback=[
+                {
+                    "question_id": str(q.id),
+                    "evaluation_score": q.evaluation_score,
+                    "feedback_comment": q.feedback_comment,
+                }
+                for q in questions
+            ],
+            score_breakdown=breakdown,
+            strengths=summary_data.get("strengths"),
+            weaknesses=summary_data.get("weaknesses"),
+        )
+
+    async def _score_batch(
+        self,
+        batch: list[InterviewQuestionEntity],
+        scored: dict[str, tuple[float, str]],
+    ) -> None:
+        """Stream scores for the still-unscored answers of *batch* into *scored*.
+
+        Raises ``ValueError`` unless every answer of the batch ends up scored.
+        """
+        todo = [q for q in batch if str(q.id) not in scored]
+        by_prompt_id = prompt_ids(todo)
+        async for item in self._llm_provider.stream_feedback(build_batch_prompt(todo)):
+            question = by_prompt_id.get(str(item.get("question_id")))
+            if question is None:
+                continue
+            try:
+                scored[str(question.id)] = parse_answer_feedback(item)
+            except (TypeError, ValueError):
+                continue
+        missing = sum(str(q.id) not in scored for q in todo)
+        if missing:
+            raise ValueError(f"batch evaluation missing {missing} of {len(todo)} answers")
+
+    # ── Full path: evaluate the whole transcript in one call ───────────
+
+    async def _evaluate_transcript(
+        self,
+        session: InterviewSessionEntity,
+        questions: list[InterviewQuestionEntity],
+        evaluated: list[InterviewQuestionEntity],
+    ) -> InterviewSummaryResult:
+        """Score *evaluated* — the still-unscored answers — and summarize in one call."""
+        prompt = build_transcript_prompt(evaluated)
+
+        self._progress("evaluating", 0, len(evaluated))
         try:
-            llm_response = await asyncio.to_thread(self._llm_provider.generate_feedback, prompt)
+            llm_response = await self._llm_provider.generate_feedback(prompt)
         except Exception as e:
             raise InterviewError(f"LLM evaluation failed: {e}") from e
 
@@ -347,30 +639,51 @@ class CompleteInterviewUseCase:
         questions_feedback = llm_response.get("questions_feedback", [])
         strengths = llm_response.get("strengths")
         weaknesses = llm_response.get("weaknesses")
-        score_breakdown = llm_response.get("score_breakdown")
 
         if summary is None or confidence_score is None or not questions_feedback:
             raise InterviewError("LLM response missing required fields.")
 
-        # Update session
-        session.complete(score=confidence_score, summary=summary, score_breakdown=score_breakdown)
-        await self._interview_repo.update_session(session)
-
-        # Update question feedback
+        # Update question feedback (the response refers to prompt ids)
+        by_prompt_id = prompt_ids(evaluated)
         for fb in questions_feedback:
-            qid = fb.get("question_id")
-            matched = next((q for q in questions if str(q.id) == str(qid)), None)
+            matched = by_prompt_id.get(str(fb.get("question_id")))
             if matched:
                 matched.evaluation_score = fb.get("evaluation_score")
                 matched.feedback_comment = fb.get("feedback_comment")
                 await self._interview_repo.update_question(matched)
 
+        # The model's overall score covers the answers it saw; the ones scored
+        # earlier (prescored, or by background evaluation) keep their scores.
+        evaluated_ids = {q.id for q in evaluated}
+        scored = [q for q in questions if q.id not in evaluated_ids]
+        if scored:
+            confidence_score = round(
+                (
+                    float(confidence_score) * len(evaluated)
+                    + sum(q.evaluation_score or 0.0 for q in scored)
+                )
+                / len(questions),
+                4,
+            )
+
+        # Update session; the breakdown is computed from the scores, not asked for
+        breakdown = score_breakdown(questions)
+        session.complete(score=confidence_score, summary=summary, score_breakdown=breakdown)
+        await self._interview_repo.update_session(session)
+
         return InterviewSummaryResult(
             session_id=session.id,
             final_score=confidence_score,
             feedback_summary=summary,
-            question_feedback=questions_feedback,
-            score_breakdown=score_breakdown,
+            question_feedback=[
+                {
+                    "question_id": str(q.id),
+                    "evaluation_score": q.evaluation_score,
+                    "feedback_comment": q.feedback_comment,
+                }
+                for q in questions
+            ],
+            score_breakdown=breakdown,
             strengths=strengths,
             weaknesses=weaknesses,
         )
@@ -0,0 +1,152 @@
+"""
+Interview answer evaluation — prompts and local scoring shared by the
+per-answer background task and ``CompleteInterviewUseCase``.
+
+Answers are evaluated one at a time as they are submitted (see
+``app/infrastructure/tasks/interview_tasks.py``), so by the time the
+candidate finishes, completion usually only needs a short summary over the
+already-scored answers; any left unscored are evaluated in small batches.
+The aggregate numbers — overall score and per category breakdown — are
+computed locally from the per-question scores.
+
+The prompt texts live in ``prompts.py``; the builders here only format the
+per-call data.  Answers are sent as a compact pipe-separated table keyed by
+ordinal ids ("1", "2", …) rather than a repr of dicts with UUIDs: column
+names are not repeated per row and the model echoes a one or two character
+id instead of a 36-character UUID per answer.  ``prompt_ids`` maps the ids
+back to the questions.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from typing import Any
+
+from app.application.use_cases.interview.prompts import (
+    ANSWER_EVALUATION,
+    BATCH_EVALUATION,
+    SUMMARY,
+    TRANSCRIPT_EVALUATION,
+)
+from app.domain.entities.interview import InterviewQuestionEntity
+
+# Question categories reported in ``score_breakdown`` (the rest count towards
+# "overall" only).
+BREAKDOWN_CATEGORIES = ("technical", "behavioral", "project")
+
+
+def build_answer_prompt(question_text: str, answer_text: str, category: str) -> dict[str, str]:
+    """Prompt that scores a single answer."""
+    return ANSWER_EVALUATION.render(
+        f"Question ({category}): {question_text}\nAnswer: {answer_text}"
+    )
+
+
+def parse_answer_feedback(response: dict[str, Any]) -> tuple[float, str]:
+    """Validate a per-answer evaluation; raises ``ValueError`` when unusable."""
+    score = response.get("evaluation_score")
+    comment = response.get("feedback_comment")
+    if score is None or not comment:
+        raise ValueError("answer evaluation missing evaluation_score / feedback_comment")
+    return min(max(float(score), 0.0), 1.0), str(comment)
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _cell(value: Any) -> str:
+    """One table cell: whitespace collapsed to single spaces, pipes escaped."""
+    text = "" if value is None else str(value)
+    return _WHITESPACE_RE.sub(" ", text).strip().replace("|", "\\|")
+
+
+def _table(header: tuple[str, ...], rows: Iterable[tuple[Any, ...]]) -> str:
+    lines = [" | ".join(header)]
+    lines.extend(" | ".join(_cell(value) for value in row) for row in rows)
+    return "\n".join(lines)
+
+
+def prompt_ids(questions: list[InterviewQuestionEntity]) -> dict[str, InterviewQuestionEntity]:
+    """Ordinal prompt id ("1", "2", …) → question, in prompt order."""
+    return {str(i): q for i, q in enumerate(questions, 1)}
+
+
+def encode_answers(questions: list[InterviewQuestionEntity]) -> str:
+    """``id | category | question | answer`` table of *questions*."""
+    return _table(
+        ("id", "category", "question", "answer"),
+        (
+            (prompt_id, q.category, q.question_text, q.answer_text)
+            for prompt_id, q in prompt_ids(questions).items()
+        ),
+    )
+
+
+def build_batch_prompt(questions: list[InterviewQuestionEntity]) -> dict[str, str]:
+    """Prompt that scores a batch of answers (no session summary)."""
+    return BATCH_EVALUATION.render(encode_answers(questions))
+
+
+def build_transcript_prompt(questions: list[InterviewQuestionEntity]) -> dict[str, str]:
+    """Prompt that scores a whole session and summarizes it in one call."""
+    return TRANSCRIPT_EVALUATION.render(encode_answers(questions))
+
+
+def batched(
+    questions: list[InterviewQuestionEntity], size: int
+) -> list[list[InterviewQuestionEntity]]:
+    """Split *questions* into consecutive batches of at most *size*."""
+    return [questions[i : i + size] for i in range(0, len(questions), max(size, 1))]
+
+
+def build_summary_prompt(questions: list[InterviewQuestionEntity]) -> dict[str, str]:
+    """Prompt that summarizes an interview whose answers are all scored.
+
+    Only the per-question scores and feedback are sent — not the answers —
+    so the call stays small regardless of how verbose the candidate was.
+    """
+    return SUMMARY.render(
+        _table(
+            ("category", "score", "question", "feedback"),
+            (
+                (q.category, q.evaluation_score, q.question_text, q.feedback_comment)
+                for q in questions
+            ),
+        )
+    )
+
+
+def overall_score(questions: list[InterviewQuestionEntity]) -> float:
+    """Mean evaluation score over the evaluated questions (0.0 when none)."""
+    scores = [q.evaluation_score for q in questions if q.evaluation_score is not None]
+    return round(sum(scores) / len(scores), 4) if scores else 0.0
+
+
+def score_breakdown(questions: list[InterviewQuestionEntity]) -> dict[str, float]:
+    """Mean score per category plus ``overall``; categories without answers are omitted."""
+    breakdown: dict[str, float] = {}
+    for category in BREAKDOWN_CATEGORIES:
+        in_category = [q for q in questions if q.category == category]
+        if any(q.evaluation_score is not None for q in in_category):
+            breakdown[category] = overall_score(in_category)
+    breakdown["overall"] = overall_score(questions)
+    return breakdown
+
+
+def local_summary(questions: list[InterviewQuestionEntity]) -> dict[str, Any]:
+    """Summary built from the scores alone, used when no summary call is made."""
+    ranked = sorted(
+        (q for q in questions if q.evaluation_score is not None),
+        key=lambda q: q.evaluation_score or 0.0,
+    )
+    strengths = [q.feedback_comment for q in reversed(ranked[-3:]) if q.feedback_comment]
+    weaknesses = [q.feedback_comment for q in ranked[:3] if q.feedback_comment]
+    return {
+        "summary": (
+            f"Answered {len(questions)} questions with an average score of "
+            f"{overall_score(questions):.2f}."
+        ),
+        "strengths": strengths,
+        "weaknesses": weaknesses,
+    }
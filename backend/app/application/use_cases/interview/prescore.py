@@ -0,0 +1,117 @@
+"""
+Local rubric pre-scoring of interview answers.
+
+Empty, "I don't know", one-word and similarly trivial answers need no
+model to grade them, yet each one used to cost a feedback call (or rows
+of a batch prompt and the output tokens of their feedback).  ``prescore``
+recognizes them with a few deterministic checks over the answer text and
+returns a fixed score with feedback from a canned library; only the
+answers it passes on (``None``) go to the LLM.
+
+The checks only ever fire on clearly weak answers:
+
+* ``blank``       nothing but whitespace / punctuation
+* ``non_answer``  "I don't know", "pass", "no idea", …
+* ``too_short``   fewer than ``MIN_WORDS`` words
+* ``restated``    no keyword beyond those of the question
+
+Whether a short answer is on topic is left to the model: a terse but
+correct answer ("RDB snapshots and AOF logs.") shares no keyword with its
+question ("How does Redis persistence work?") either.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+MIN_WORDS = 4
+
+_WORD_RE = re.compile(r"[a-z0-9][a-z0-9+#.'-]*")
+# Compared on this many leading characters (plural "s" dropped), so "indexes"
+# covers "indexing".
+_STEM = 5
+
+_NON_ANSWERS = frozenset(
+    {
+        "dont know", "i dont know", "i do not know", "idk", "no idea", "i have no idea",
+        "not sure", "im not sure", "i am not sure", "no clue", "pass", "skip", "next",
+        "n a", "none", "nothing", "no answer", "no comment", "i forgot", "i dont remember",
+        "sorry", "sorry i dont know", "i cant answer this", "i dont have an answer",
+    }
+)  # fmt: skip
+
+# Only words of three letters or more become keywords.
+_STOPWORDS = frozenset(
+    {
+        "about", "above", "after", "again", "all", "also", "and", "any", "are", "because",
+        "been", "before", "being", "between", "both", "but", "can", "could", "describe",
+        "did", "does", "doing", "done", "each", "either", "example", "explain", "few", "for",
+        "from", "give", "had", "has", "have", "having", "how", "into", "its", "just", "more",
+        "most", "nor", "not", "once", "only", "other", "our", "out", "over", "own", "same",
+        "should", "some", "such", "tell", "than", "that", "the", "their", "them", "then",
+        "there", "these", "they", "this", "those", "through", "time", "too", "under",
+        "until", "very", "walk", "was", "were", "what", "when", "where", "which", "while",
+        "who", "whom", "why", "will", "with", "would", "you", "your",
+    }
+)  # fmt: skip
+
+FEEDBACK: dict[str, str] = {
+    "blank": "No answer was given. Attempt every question — partial reasoning still earns credit.",
+    "non_answer": (
+        "The candidate did not attempt the question. Even when unsure, reason out loud "
+        "about what you do know or how you would find out."
+    ),
+    "too_short": (
+        "The answer is too brief to show understanding. Explain the reasoning behind it "
+        "and support it with a concrete example."
+    ),
+    "restated": (
+        "The answer only restates the question. Address it directly with specifics, "
+        "trade-offs or an example from your experience."
+    ),
+}
+
+SCORES: dict[str, float] = {
+    "blank": 0.0,
+    "non_answer": 0.0,
+    "too_short": 0.1,
+    "restated": 0.1,
+}
+
+
+@dataclass(frozen=True)
+class Prescore:
+    """Deterministic grade of a trivially weak answer."""
+
+    reason: str
+    score: float
+    feedback: str
+
+
+def _words(text: str) -> list[str]:
+    return _WORD_RE.findall(text.lower().replace("’", "'"))
+
+
+def keywords(text: str) -> set[str]:
+    """Stems of the content words of *text* (stopwords and short words dropped)."""
+    stripped = (w.strip(".'-") for w in _words(text))
+    return {w.rstrip("s")[:_STEM] for w in stripped if len(w) >= 3 and w not in _STOPWORDS}
+
+
+def _grade(reason: str) -> Prescore:
+    return Prescore(reason, SCORES[reason], FEEDBACK[reason])
+
+
+def prescore(question_text: str, answer_text: str | None) -> Prescore | None:
+    """Grade *answer_text* locally if it is trivially weak, else ``None``."""
+    words = _words(answer_text or "")
+    if not words:
+        return _grade("blank")
+    if " ".join(w.replace("'", "").strip(".") for w in words) in _NON_ANSWERS:
+        return _grade("non_answer")
+    if len(words) < MIN_WORDS:
+        return _grade("too_short")
+    if keywords(answer_text or "") <= keywords(question_text):
+        return _grade("restated")
+    return None
@@ -0,0 +1,182 @@
+"""
+Prompt templates for the interview LLM calls — one versioned registry.
+
+OpenAI and Gemini both cache the longest prompt *prefix* they have seen
+recently and bill / serve it faster on the next call.  A prompt that opens
+with candidate data has no prefix in common with the previous call, so
+every template here is laid out static-first::
+
+    system_prompt   role                                   (static)
+    user_prompt     guidelines + OUTPUT FORMAT             (static)
+                    INPUT:
+                    <per-call data>                        (variable)
+
+``render`` only ever appends the data after the ``INPUT:`` marker, so all
+calls of one template version share everything up to it.
+
+Each template carries a version id (``questions-v2``); bump ``version``
+whenever its static text changes.  Caches keyed on a prompt's output (the
+question pool) include the id, and the rendered prompt carries it as
+``prompt_version`` so telemetry can report prompt vs cached tokens per
+template (``llm_prompt_tokens_total``) — the provider-side hit rate.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+INPUT_MARKER = "INPUT:"
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    """Static parts of one prompt; ``render`` appends the per-call data."""
+
+    name: str
+    version: int
+    system: str
+    instructions: str  # guidelines + output format, sent before the data
+
+    @property
+    def version_id(self) -> str:
+        return f"{self.name}-v{self.version}"
+
+    def render(self, data: str) -> dict[str, str]:
+        """``{system_prompt, user_prompt, prompt_version}`` with *data* last."""
+        return {
+            "system_prompt": self.system,
+            "user_prompt": f"{self.instructions}\n\n{INPUT_MARKER}\n{data}",
+            "prompt_version": self.version_id,
+        }
+
+
+PROMPTS: dict[str, PromptTemplate] = {}
+
+
+def register(template: PromptTemplate) -> PromptTemplate:
+    """Add *template* to ``PROMPTS``; names are unique."""
+    if template.name in PROMPTS:
+        raise ValueError(f"prompt template {template.name!r} is already registered")
+    PROMPTS[template.name] = template
+    return template
+
+
+def get_prompt(name: str) -> PromptTemplate:
+    return PROMPTS[name]
+
+
+# ── Templates ───────────────────────────────────────────────────────────────
+
+_INTERVIEWER = "You are an expert technical interviewer."
+_JSON_ONLY = "Always respond with valid JSON only."
+# Layout of ``evaluation.encode_answers``.
+_ANSWER_TABLE = (
+    "The input is a table with one answer per row: id | category | question | answer. "
+    "Refer to each answer by its id."
+)
+
+QUESTIONS = register(
+    PromptTemplate(
+        name="questions",
+        version=2,
+        system=(
+            f"{_INTERVIEWER} You are conducting a real interview. "
+            "Generate precise, focused interview questions that test a candidate's "
+            f"actual skills and experience. {_JSON_ONLY}"
+        ),
+        instructions=(
+            "QUESTION GUIDELINES:\n"
+            "- Keep questions concise and direct (1-2 sentences max).\n"
+            "- Only scenario-based or system_design questions may be longer (up to 3-4 "
+            "sentences) to set up proper context.\n"
+            "- Ask about specific technologies from the candidate's skill set.\n"
+            "- Include questions referencing their actual project experience.\n"
+            "- Avoid generic filler questions — every question should be purposeful.\n"
+            "- Mix question types: technical, behavioral, project-based, system_design, "
+            "and coding.\n"
+            "- Difficulty: follow the difficulty line of the input. For a mixed interview "
+            "distribute roughly 30% easy, 40% medium, 30% hard.\n"
+            "- If the input lists focus areas, focus the questions on them.\n"
+            "- Generate exactly the number of questions given as 'Total questions'.\n"
+            "\nOUTPUT FORMAT:\n"
+            'Return a JSON object with a "questions" array. Each element:\n'
+            '  { "type": "technical|behavioral|project|system_design|coding", '
+            '"question": "<concise question text>", "difficulty": "easy|medium|hard" }\n'
+            "No additional text, no markdown, no code fences — ONLY the JSON object."
+        ),
+    )
+)
+
+ANSWER_EVALUATION = register(
+    PromptTemplate(
+        name="answer-evaluation",
+        version=2,
+        system=(
+            f"{_INTERVIEWER} Evaluate the candidate's answer to one interview question. "
+            "Give a score (0-1) and one or two sentences of specific, constructive "
+            f"feedback. {_JSON_ONLY}"
+        ),
+        instructions=(
+            'OUTPUT FORMAT (JSON): {"evaluation_score": <float>, "feedback_comment": "<string>"}'
+        ),
+    )
+)
+
+BATCH_EVALUATION = register(
+    PromptTemplate(
+        name="batch-evaluation",
+        version=3,
+        system=(
+            f"{_INTERVIEWER} Evaluate each of the following interview answers "
+            "independently. For each question, provide a score (0-1) and brief feedback. "
+            f"{_JSON_ONLY}"
+        ),
+        instructions=(
+            f"{_ANSWER_TABLE}\n"
+            "OUTPUT FORMAT (JSON): "
+            '{"questions_feedback": [{"question_id": "<id>", "evaluation_score": <float>, '
+            '"feedback_comment": "<string>"}]}'
+        ),
+    )
+)
+
+SUMMARY = register(
+    PromptTemplate(
+        name="summary",
+        version=3,
+        system=(
+            f"{_INTERVIEWER} The answers of an interview session have already been scored "
+            "individually. Summarize the candidate's overall performance and list their "
+            f"main strengths and weaknesses. {_JSON_ONLY}"
+        ),
+        instructions=(
+            "The input is a table with one scored answer per row: "
+            "category | score | question | feedback.\n"
+            "OUTPUT FORMAT (JSON): "
+            '{"summary": "<string>", "strengths": ["<string>", ...], '
+            '"weaknesses": ["<string>", ...]}'
+        ),
+    )
+)
+
+TRANSCRIPT_EVALUATION = register(
+    PromptTemplate(
+        name="transcript-evaluation",
+        version=3,
+        system=(
+            f"{_INTERVIEWER} Evaluate the following interview session. For each question, "
+            "provide a score (0-1) and brief feedback. Then, summarize the candidate's "
+            "strengths and weaknesses and provide an overall confidence score (0-1). "
+            f"{_JSON_ONLY}"
+        ),
+        instructions=(
+            f"{_ANSWER_TABLE}\n"
+            "OUTPUT FORMAT (JSON): "
+            '{"summary": "<string>", "confidence_score": <float>, '
+            '"strengths": ["<string>", ...], '
+            '"weaknesses": ["<string>", ...], '
+            '"questions_feedback": [{"question_id": "<id>", "evaluation_score": <float>, '
+            '"feedback_comment": "<string>"}]}'
+        ),
+    )
+)
@@ -118,6 +118,25 @@ class Settings(BaseSettings):
     INTERVIEW_DEFAULT_QUESTION_COUNT: int = 12
     INTERVIEW_MAX_QUESTION_COUNT: int = 30
     INTERVIEW_MIN_QUESTION_COUNT: int = 5
+    # Score each answer in a Celery task as it is submitted
+    INTERVIEW_INCREMENTAL_EVALUATION: bool = True
+    # When every answer is already scored, write the completion summary with
+    # one small LLM call (False = compose it locally from the scores)
+    INTERVIEW_SUMMARY_LLM_ENABLED: bool = True
+    # Score trivially weak answers (blank, "I don't know", a few words) locally
+    # with canned feedback instead of sending them to the LLM
+    INTERVIEW_PRESCORE_ENABLED: bool = True
+    # Answers still unscored at completion are evaluated in concurrent batches
+    # of this size (0 = one full-transcript call); each batch retried alone
+    INTERVIEW_EVAL_BATCH_SIZE: int = 6
+    INTERVIEW_EVAL_BATCH_CONCURRENCY: int = 4
+    INTERVIEW_EVAL_BATCH_RETRIES: int = 1
+
+    # ── Interview question pools (pre-generated per analyzed resume) ─────
+    QUESTION_POOL_ENABLED: bool = True
+    QUESTION_POOL_SIZE: int = 2  # question sets kept per resume + difficulty
+    QUESTION_POOL_SET_SIZE: int = 12  # questions per set (larger requests generate live)
+    QUESTION_POOL_TTL: int = 60 * 60 * 24 * 7  # 7 days
 
     # ── LLM — OpenAI (Primary) ────────────────────────────────────────────
     OPENAI_API_KEY: str = ""
@@ -131,6 +150,109 @@ class Settings(BaseSettings):
     LLM_PRIMARY_PROVIDER: str = "openai"  # "openai" | "gemini"
     LLM_TIMEOUT: int = 180  # seconds per LLM call (GPT-5 can be slow)
     LLM_MAX_RETRIES: int = 3
+    # Total LLM time an interactive request may use (start / complete) —
+    # keep below the reverse proxy's read timeout; 0 = no deadline.
+    LLM_REQUEST_DEADLINE: int = 120
+    # Ask providers for schema-constrained JSON (OpenAI json_schema, Gemini
+    # response schema) where the output shape is fixed; off = plain JSON mode.
+    LLM_STRUCTURED_OUTPUT_ENABLED: bool = True
+
+    # ── LLM — HTTP connection pool (one per process, see llm/registry.py) ─
+    LLM_HTTP_MAX_CONNECTIONS: int = 100  # concurrent sockets per provider
+    LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20  # idle sockets kept warm
+    LLM_HTTP_KEEPALIVE_EXPIRY: float = 30.0  # seconds before an idle socket is dropped
+    LLM_HTTP_CONNECT_TIMEOUT: float = 10.0  # seconds (TCP + TLS handshake)
+
+    # ── LLM — Hedged requests (opt-in, see llm/hedging.py) ───────────────
+    LLM_HEDGING_ENABLED: bool = False
+    LLM_HEDGE_DEFAULT_DELAY: float = 20.0  # seconds, until enough latencies are observed
+    LLM_HEDGE_PERCENTILE: float = 0.95  # primary latency percentile that triggers the hedge
+    LLM_HEDGE_MIN_SAMPLES: int = 20  # observations per method before the learned delay is used
+    LLM_HEDGE_WINDOW: int = 200  # most recent latencies kept per method
+    LLM_HEDGE_MAX_WORKERS: int = 16  # threads per sync composite, abandoned losers included
+
+    # ── LLM — Adaptive routing (opt-in, see llm/routing.py) ──────────────
+    # Replaces the fixed primary/fallback pair (and hedging) with a router
+    # over LLM_PROVIDERS that prefers the candidate with the lowest EWMA
+    # latency + LLM_ROUTER_ERROR_PENALTY * error rate per method.
+    LLM_ROUTING_ENABLED: bool = False
+    # "provider:model" specs (JSON in env), e.g. ["openai:gpt-5-2025-08-07",
+    # "gemini:gemini-2.0-flash"]; empty = OPENAI_MODEL / GEMINI_MODEL in
+    # LLM_PRIMARY_PROVIDER order
+    LLM_PROVIDERS: list[str] = []
+    LLM_ROUTER_EWMA_ALPHA: float = 0.2  # weight of the newest observation
+    LLM_ROUTER_ERROR_PENALTY: float = 60.0  # seconds added per unit of error rate
+    LLM_ROUTER_MIN_SAMPLES: int = 3  # observations per method before a candidate is scored
+    LLM_ROUTER_EXPLORE_RATE: float = 0.05  # share of calls sent to a random other candidate
+    # Fast models tried first for small cheap calls (same spec format)
+    LLM_ROUTER_FAST_PROVIDERS: list[str] = []
+    LLM_ROUTER_FAST_METHODS: list[str] = ["generate_completion"]
+    LLM_ROUTER_FAST_MAX_PROMPT_CHARS: int = 4000
+
+    # ── LLM — Single-flight (identical concurrent calls share one request) ─
+    LLM_SINGLE_FLIGHT_ENABLED: bool = True
+    LLM_SINGLE_FLIGHT_LOCK_TTL: int = 600  # seconds a leader's Redis lock outlives a dead worker
+    LLM_SINGLE_FLIGHT_RESULT_TTL: int = 30  # seconds waiting workers can collect the result
+    LLM_SINGLE_FLIGHT_POLL_INTERVAL: float = 0.25  # seconds between result checks
+
+    # ── LLM — Circuit breaker (state shared via Redis) ───────────────────
+    LLM_BREAKER_ENABLED: bool = True
+    LLM_BREAKER_FAILURE_THRESHOLD: int = 5  # consecutive failures that open the circuit
+    LLM_BREAKER_FAILURE_WINDOW: int = 120  # seconds a failure streak is remembered
+    LLM_BREAKER_RECOVERY_TIMEOUT: float = 60.0  # seconds open before a half-open probe
+
+    # ── LLM — Outbound rate limits (Redis token buckets, 0 = unlimited) ──
+    LLM_RATE_LIMIT_ENABLED: bool = True
+    LLM_RATE_LIMIT_MAX_WAIT: float = 20.0  # seconds a call may queue before dispatching anyway
+    OPENAI_RPM: int = 500  # requests per minute, per model
+    OPENAI_TPM: int = 500_000  # tokens per minute, per model
+    GEMINI_RPM: int = 60
+    GEMINI_TPM: int = 1_000_000
+
+    # ── LLM — Telemetry (latency / token / cost metrics per call) ─────────
+    LLM_TELEMETRY_ENABLED: bool = True
+    # USD per 1M tokens as [input, output], keyed by model name (JSON in env)
+    LLM_PRICING_PER_1M_TOKENS: dict[str, list[float]] = {
+        "gpt-5-2025-08-07": [1.25, 10.0],
+        "gemini-2.0-flash": [0.10, 0.40],
+    }
+
+    # ── LLM — Provider mode (fake / cassettes for offline load testing) ──
+    # "live" = real providers; "fake" = synthetic responses (llm/fake_provider.py);
+    # "record" = live, successful responses appended to LLM_CASSETTE_PATH;
+    # "replay" = recorded responses served offline (synthetic on a miss)
+    LLM_PROVIDER_MODE: str = "live"
+    LLM_CASSETTE_PATH: str = "llm_cassette.jsonl"
+    # Per chain position (JSON in env): lognormal latency median / sigma in
+    # seconds, share of failed calls, share of HTTP attempts answered with 429
+    LLM_FAKE_PROFILES: dict[str, dict[str, float]] = {
+        "primary": {"latency_median": 1.0, "latency_sigma": 0.5, "error_rate": 0.0},
+        "fallback": {"latency_median": 1.0, "latency_sigma": 0.5, "error_rate": 0.0},
+    }
+    LLM_FAKE_SEED: int | None = None  # fixed seed = reproducible latencies and faults
+
+    # ── Resume text compaction (before the parse_resume LLM call) ────────
+    RESUME_COMPACTION_ENABLED: bool = True
+    RESUME_TOKEN_BUDGET: int = 6000  # estimated tokens; 0 = no limit
+    # Extract contact details and skills locally; the LLM only gets the rest
+    RESUME_FASTPATH_ENABLED: bool = True
+    # Long resumes: one focused parse per section (summary / experience /
+    # education / skills), run concurrently and cached per section
+    RESUME_SECTION_PARSE_ENABLED: bool = True
+    RESUME_SECTION_PARSE_MIN_TOKENS: int = 1500  # estimated; shorter text stays one call
+    RESUME_SECTION_PARSE_CONCURRENCY: int = 4
+    RESUME_SECTION_PARSE_RETRIES: int = 1  # extra attempts of a failed section on its own
+
+    # ── Resume parse cache (Redis, Postgres fallback) ────────────────────
+    RESUME_PARSE_CACHE_ENABLED: bool = True
+    RESUME_PARSE_CACHE_TTL: int = 30 * 24 * 3600  # seconds kept in Redis (30 days)
+
+    # ── Idempotency keys (POST /interview/start, /complete, /resume/) ────
+    IDEMPOTENCY_ENABLED: bool = True
+    IDEMPOTENCY_TTL: int = 24 * 3600  # seconds a stored response is replayed
+    IDEMPOTENCY_LOCK_TTL: int = 300  # seconds an in-flight claim lives if its worker dies
+    IDEMPOTENCY_WAIT_TIMEOUT: float = 90.0  # seconds a duplicate waits for the first request
+    IDEMPOTENCY_POLL_INTERVAL: float = 0.25
 
     # ── Legacy alias (used by existing services until migration) ──────────
     @property
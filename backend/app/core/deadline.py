@@ -0,0 +1,67 @@
+"""
+Request deadlines, carried in a context variable.
+
+An interactive request (e.g. ``POST /interview/start``) sets a deadline at
+the endpoint; everything awaited underneath — use cases, provider
+wrappers, SDK retries — runs in the same context and can read the time
+left without any plumbing through the port signatures::
+
+    with deadline_scope(120):
+        ...
+        left = remaining()          # seconds, or None without a deadline
+        if not allows(backoff):     # would sleeping *backoff* overrun it?
+            raise ...
+
+Nested scopes only ever tighten the deadline.  Background work (Celery
+tasks) runs without one.
+
+``DISCONNECT`` / ``DEADLINE`` are the messages a request's work is
+cancelled with (``task.cancel(msg=...)``) so lower layers can tell why.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+DISCONNECT = "client_disconnect"
+DEADLINE = "deadline"
+
+_deadline: ContextVar[float | None] = ContextVar("request_deadline", default=None)
+
+
+@contextmanager
+def deadline_scope(seconds: float | None) -> Iterator[None]:
+    """Run the block with a deadline *seconds* from now (None / 0 = no new limit)."""
+    if not seconds:
+        yield
+        return
+    current = _deadline.get()
+    deadline = time.monotonic() + seconds
+    token = _deadline.set(deadline if current is None else min(current, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> float | None:
+    """Seconds left before the current deadline (never negative); None without one."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0.0)
+
+
+def allows(seconds: float) -> bool:
+    """True if *seconds* more work (e.g. a retry back-off) still fits the deadline."""
+    left = remaining()
+    return left is None or seconds < left
+
+
+def cap_timeout(timeout: float) -> float:
+    """*timeout*, shortened to the time left before the deadline."""
+    left = remaining()
+    return timeout if left is None else min(timeout, max(left, 0.001))
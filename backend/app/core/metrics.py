@@ -0,0 +1,177 @@
+"""
+In-process metrics registry — counters and histograms with labels.
+
+Lightweight and dependency-free: values live in this process only and are
+exported as JSON by ``GET /metrics`` (see ``app/api/metrics.py``).  Each
+API worker and Celery worker process keeps its own registry.
+
+Usage::
+
+    from app.core.metrics import metrics
+
+    wait = metrics.histogram("llm_rate_limit_wait_seconds", "Queue wait before dispatch")
+    wait.observe(0.42, provider="openai", model="gpt-5")
+
+    metrics.counter("llm_calls_total", "LLM calls").inc(provider="openai")
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from typing import Any
+
+# Seconds — spans sub-second cache hits to multi-minute LLM calls.
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    20.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+)
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+def _label_key(labels: dict[str, Any]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _label_str(key: LabelKey) -> str:
+    return ",".join(f"{k}={v}" for k, v in key) or "_"
+
+
+class Counter:
+    """Monotonic counter per label set."""
+
+    def __init__(self, name: str, description: str) -> None:
+        self.name = name
+        self.description = description
+        self._values: dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: Any) -> float:
+        with self._lock:
+            return self._values.get(_label_key(labels), 0)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {_label_str(k): v for k, v in self._values.items()}
+
+
+class _Series:
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self, n_buckets: int) -> None:
+        self.counts = [0] * (n_buckets + 1)  # last slot is +Inf
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+
+class Histogram:
+    """Fixed-bucket histogram per label set with interpolated quantiles."""
+
+    def __init__(
+        self, name: str, description: str, buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> None:
+        self.name = name
+        self.description = description
+        self._buckets = tuple(sorted(buckets))
+        self._series: dict[LabelKey, _Series] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = _label_key(labels)
+        idx = bisect.bisect_left(self._buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series(len(self._buckets))
+            series.counts[idx] += 1
+            series.count += 1
+            series.total += value
+            series.max = max(series.max, value)
+
+    def quantile(self, q: float, **labels: Any) -> float | None:
+        with self._lock:
+            series = self._series.get(_label_key(labels))
+            return self._quantile(series, q) if series else None
+
+    def _quantile(self, series: _Series, q: float) -> float:
+        """Linear interpolation inside the bucket holding the q-th observation."""
+        rank = q * series.count
+        seen = 0
+        for i, n in enumerate(series.counts):
+            if n and seen + n >= rank:
+                lower = self._buckets[i - 1] if i > 0 else 0.0
+                upper = self._buckets[i] if i < len(self._buckets) else series.max
+                return min(lower + (upper - lower) * (rank - seen) / n, series.max)
+            seen += n
+        return series.max
+
+    def snapshot(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        with self._lock:
+            for key, s in self._series.items():
+                out[_label_str(key)] = {
+                    "count": s.count,
+                    "sum": round(s.total, 6),
+                    "avg": round(s.total / s.count, 6) if s.count else None,
+                    "max": round(s.max, 6),
+                    "p50": round(self._quantile(s, 0.5), 6),
+                    "p95": round(self._quantile(s, 0.95), 6),
+                    "p99": round(self._quantile(s, 0.99), 6),
+                }
+        return out
+
+
+class MetricsRegistry:
+    """Get-or-create registry so modules can declare metrics at import time."""
+
+    def __init__(self) -> None:
+        self._counters: dict[str, Counter] = {}
+        self._histograms: dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, description: str = "") -> Counter:
+        with self._lock:
+            if name not in self._counters:
+                self._counters[name] = Counter(name, description)
+            return self._counters[name]
+
+    def histogram(
+        self, name: str, description: str = "", buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        with self._lock:
+            if name not in self._histograms:
+                self._histograms[name] = Histogram(name, description, buckets)
+            return self._histograms[name]
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = dict(self._histograms)
+        return {
+            "counters": {name: c.snapshot() for name, c in counters.items()},
+            "histograms": {name: h.snapshot() for name, h in histograms.items()},
+        }
+
+
+metrics = MetricsRegistry()
@@ -39,3 +39,9 @@ async def get_db() -> AsyncSession:  # type: ignore[misc]
             yield session
         finally:
             await session.close()
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """FastAPI dependency — the session factory, for work that outlives the
+    request (a streamed body runs after ``get_db`` has closed its session)."""
+    return AsyncSessionLocal
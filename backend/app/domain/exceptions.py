@@ -145,10 +145,16 @@ class InterviewSessionNotFoundError(EntityNotFoundError):
 
 
 class LLMProviderError(DomainError):
-    """All LLM providers failed (primary + fallback)."""
+    """All LLM providers failed (primary + fallback).
 
-    def __init__(self, message: str = "LLM provider unavailable"):
+    ``kind`` names the failure when the raiser knows it (``"timeout"``,
+    ``"rate_limit"``, ``"parse"``, …); ``None`` leaves it to be read from the
+    chained cause.
+    """
+
+    def __init__(self, message: str = "LLM provider unavailable", kind: str | None = None):
         super().__init__(message=message, code="LLM_PROVIDER_ERROR")
+        self.kind = kind
 
 
 # ---------------------------------------------------------------------------
@@ -2,18 +2,24 @@
 
 from app.domain.interfaces.email_service import IEmailService
 from app.domain.interfaces.file_storage import IFileStorage
-from app.domain.interfaces.llm_provider import ILLMProvider
+from app.domain.interfaces.llm_provider import IAsyncLLMProvider, ILLMProvider
+from app.domain.interfaces.question_pool import IQuestionPool
 from app.domain.interfaces.repositories import (
     IInterviewRepository,
     IResumeRepository,
     IUserRepository,
 )
+from app.domain.interfaces.task_queue import ICompletionQueue, IEvaluationQueue
 
 __all__ = [
     "IUserRepository",
     "IResumeRepository",
     "IInterviewRepository",
     "ILLMProvider",
+    "IAsyncLLMProvider",
     "IFileStorage",
     "IEmailService",
+    "IEvaluationQueue",
+    "ICompletionQueue",
+    "IQuestionPool",
 ]
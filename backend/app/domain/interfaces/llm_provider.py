@@ -1,12 +1,28 @@
 """
-LLM Provider interface — abstract contract for language model integrations.
+LLM Provider interfaces — abstract contracts for language model integrations.
 
-Concrete implementations: OpenAIProvider, GeminiProvider (Phase 3).
+Two flavours of the same contract:
+
+* ``ILLMProvider`` — blocking calls, used by Celery workers and legacy services.
+* ``IAsyncLLMProvider`` — coroutine-based calls, used by the async use cases so
+  in-flight LLM requests do not occupy a thread each.
+
+Concrete implementations: OpenAIProvider, GeminiProvider and their
+``Async*`` counterparts.
+
+``stream_questions`` / ``stream_feedback`` yield results while the model is
+still generating; their default implementations buffer the non-streaming
+call, so every provider supports them.
+
+Prompt dicts may also carry ``prompt_version`` — the id of the template
+they were rendered from.  Providers ignore it; telemetry reports token
+usage per template with it.
 """
 
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterator
 from typing import Any
 
 
@@ -19,6 +35,11 @@ class ILLMProvider(ABC):
         """Human-readable provider name (e.g. 'OpenAI', 'Gemini')."""
         ...
 
+    @property
+    def model_name(self) -> str:
+        """Model identifier used for cache keys (defaults to ``provider_name``)."""
+        return self.provider_name
+
     @abstractmethod
     def generate_questions(self, prompts: dict[str, str]) -> list[dict[str, str] | str]:
         """
@@ -71,3 +92,75 @@ class ILLMProvider(ABC):
             Structured resume data (skills, experience, education, etc.).
         """
         ...
+
+    def stream_questions(self, prompts: dict[str, str]) -> Iterator[dict[str, str] | str]:
+        """
+        Yield the questions of ``generate_questions`` one by one, each as
+        soon as the model has finished it.
+        """
+        yield from self.generate_questions(prompts)
+
+    def stream_feedback(self, prompts: dict[str, str]) -> Iterator[dict[str, Any]]:
+        """
+        Yield the ``questions_feedback`` entries of a batch evaluation one by
+        one, each as soon as the model has finished it.
+        """
+        feedback = self.generate_feedback(prompts).get("questions_feedback")
+        if isinstance(feedback, list):
+            yield from (item for item in feedback if isinstance(item, dict))
+
+    def close(self) -> None:  # noqa: B027 — optional hook
+        """Release pooled connections held by the provider (if any)."""
+
+
+class IAsyncLLMProvider(ABC):
+    """Async port for LLM interactions — same contract as ``ILLMProvider``."""
+
+    @property
+    @abstractmethod
+    def provider_name(self) -> str:
+        """Human-readable provider name (e.g. 'OpenAI', 'Gemini')."""
+        ...
+
+    @property
+    def model_name(self) -> str:
+        """Model identifier used for cache keys (defaults to ``provider_name``)."""
+        return self.provider_name
+
+    @abstractmethod
+    async def generate_questions(self, prompts: dict[str, str]) -> list[dict[str, str] | str]:
+        """Async variant of ``ILLMProvider.generate_questions``."""
+        ...
+
+    @abstractmethod
+    async def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        """Async variant of ``ILLMProvider.generate_feedback``."""
+        ...
+
+    @abstractmethod
+    async def generate_completion(self, prompt: str) -> str:
+        """Async variant of ``ILLMProvider.generate_completion``."""
+        ...
+
+    @abstractmethod
+    async def parse_resume(self, text: str) -> dict[str, Any]:
+        """Async variant of ``ILLMProvider.parse_resume``."""
+        ...
+
+    async def stream_questions(
+        self, prompts: dict[str, str]
+    ) -> AsyncIterator[dict[str, str] | str]:
+        """Async variant of ``ILLMProvider.stream_questions``."""
+        for item in await self.generate_questions(prompts):
+            yield item
+
+    async def stream_feedback(self, prompts: dict[str, str]) -> AsyncIterator[dict[str, Any]]:
+        """Async variant of ``ILLMProvider.stream_feedback``."""
+        feedback = (await self.generate_feedback(prompts)).get("questions_feedback")
+        if isinstance(feedback, list):
+            for item in feedback:
+                if isinstance(item, dict):
+                    yield item
+
+    async def aclose(self) -> None:  # noqa: B027 — optional hook
+        """Release pooled connections held by the provider (if any)."""
@@ -0,0 +1,69 @@
+"""
+Question pool interface — abstract contract for pre-generated interview questions.
+
+Concrete implementation: ``RedisQuestionPool`` (``app/infrastructure/cache``).
+"""
+
+from __future__ import annotations
+
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class IQuestionPool(ABC):
+    """Port for drawing pre-generated question sets for a resume.
+
+    Pools are keyed by resume, difficulty preset, the resume context and the
+    version of the question prompt, so sets generated from another context
+    or an older prompt are never returned.
+    """
+
+    @property
+    @abstractmethod
+    def set_size(self) -> int:
+        """Number of questions in each pooled set."""
+        ...
+
+    @abstractmethod
+    async def draw(
+        self,
+        resume_id: uuid.UUID,
+        difficulty: str,
+        resume_context: dict[str, Any],
+        prompt_version: str,
+        count: int,
+    ) -> list[Any] | None:
+        """
+        Take one pre-generated question set out of the pool.
+
+        Args:
+            resume_id: The resume the questions were generated for.
+            difficulty: Difficulty preset (``easy`` / ``medium`` / ``hard`` / ``mixed``).
+            resume_context: The context the questions would be generated from.
+            prompt_version: Version of the question-generation prompt.
+            count: Number of questions wanted.
+
+        Returns:
+            ``count`` raw questions (as returned by ``generate_questions``),
+            or None on a miss.  Never raises.
+        """
+        ...
+
+    @abstractmethod
+    def request_refill(
+        self,
+        resume_id: uuid.UUID,
+        difficulty: str,
+        resume_context: dict[str, Any],
+        prompt_version: str,
+        prompts: dict[str, str],
+    ) -> None:
+        """
+        Schedule a background top-up of one preset's pool.  Never raises.
+
+        Args:
+            prompts: The ``generate_questions`` prompt for one set of
+                ``set_size`` questions; every refilled set is generated from it.
+        """
+        ...
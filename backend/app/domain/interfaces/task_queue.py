@@ -0,0 +1,46 @@
+"""
+Task queue interface — abstract contract for dispatching background work.
+
+Concrete implementations: ``CeleryEvaluationQueue`` / ``CeleryCompletionQueue``
+(``app/infrastructure/tasks``).
+"""
+
+from __future__ import annotations
+
+import uuid
+from abc import ABC, abstractmethod
+
+
+class IEvaluationQueue(ABC):
+    """Port for scheduling background evaluation of interview answers."""
+
+    @abstractmethod
+    def enqueue_answer_evaluation(
+        self, session_id: uuid.UUID, question_id: uuid.UUID
+    ) -> str | None:
+        """
+        Schedule evaluation of one submitted answer.
+
+        Must not raise: when the queue is unavailable the answer simply stays
+        unscored and is evaluated when the interview is completed.
+
+        Returns:
+            The background task id, or None if nothing was dispatched.
+        """
+        ...
+
+
+class ICompletionQueue(ABC):
+    """Port for running interview completion as a background job."""
+
+    @abstractmethod
+    def enqueue_interview_completion(self, user_id: uuid.UUID, session_id: uuid.UUID) -> str | None:
+        """
+        Schedule evaluation and finalization of an interview session.
+
+        Blocks until the job is handed to the queue.  Must not raise.
+
+        Returns:
+            The job id to poll, or None if the queue is unavailable.
+        """
+        ...
@@ -0,0 +1,104 @@
+"""
+Idempotency-key records for retried POST requests.
+
+Flaky mobile clients retry ``POST /interview/start``, ``/complete`` and
+``/resume/`` — each retry would create another session, re-evaluate the
+transcript or re-parse the upload.  A client that sends an
+``Idempotency-Key`` header gets one record per (user, endpoint, key)::
+
+    idempotency:<user_id>:<scope>:<key>
+
+* The first request *claims* the key (``SET NX``, ``IDEMPOTENCY_LOCK_TTL``)
+  with a ``pending`` record, runs, and replaces it with its response
+  (kept ``IDEMPOTENCY_TTL`` seconds).  A failed request releases the key
+  so the client can retry.
+* A duplicate that finds the response replays it; one that finds the
+  request still pending waits for it (``IDEMPOTENCY_WAIT_TIMEOUT``).
+
+Each record carries a fingerprint of the request, so reusing a key for a
+different request is detected.  Every Redis failure degrades to "no
+record" — the request then simply runs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import uuid
+from typing import Any
+
+import structlog
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.infrastructure.cache.redis_client import get_redis
+
+logger = structlog.get_logger(__name__)
+
+_KEY_PREFIX = "idempotency:"
+
+PENDING = "pending"
+DONE = "done"
+
+idempotency_total = metrics.counter(
+    "idempotency_requests_total",
+    "Requests with an Idempotency-Key by outcome "
+    "(new / replayed / waited / in_progress / mismatch / unavailable)",
+)
+
+
+def request_fingerprint(*parts: Any) -> str:
+    """Hash of what makes two requests "the same" for one endpoint."""
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def record_key(user_id: uuid.UUID | str, scope: str, key: str) -> str:
+    return f"{_KEY_PREFIX}{user_id}:{scope}:{key}"
+
+
+class IdempotencyStore:
+    """Pending / done records in Redis (never raises)."""
+
+    def __init__(self, ttl: int | None = None, lock_ttl: int | None = None) -> None:
+        self._ttl = ttl if ttl is not None else settings.IDEMPOTENCY_TTL
+        self._lock_ttl = lock_ttl if lock_ttl is not None else settings.IDEMPOTENCY_LOCK_TTL
+
+    async def claim(self, key: str, fingerprint: str) -> bool | None:
+        """True = claimed, False = a record exists, None = Redis unavailable."""
+        record = json.dumps({"state": PENDING, "fingerprint": fingerprint})
+        try:
+            r = await get_redis()
+            return bool(await r.set(key, record, nx=True, ex=self._lock_ttl))
+        except Exception as exc:
+            logger.warning("idempotency_redis_error", op="claim", error=str(exc))
+            return None
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        try:
+            r = await get_redis()
+            raw = await r.get(key)
+        except Exception as exc:
+            logger.warning("idempotency_redis_error", op="get", error=str(exc))
+            return None
+        return json.loads(raw) if raw else None
+
+    async def save(self, key: str, fingerprint: str, status_code: int, body: Any) -> None:
+        record = json.dumps(
+            {"state": DONE, "fingerprint": fingerprint, "status_code": status_code, "body": body}
+        )
+        try:
+            r = await get_redis()
+            await r.set(key, record, ex=self._ttl)
+        except Exception as exc:
+            logger.warning("idempotency_redis_error", op="save", error=str(exc))
+
+    async def release(self, key: str) -> None:
+        try:
+            r = await get_redis()
+            await r.delete(key)
+        except Exception as exc:  # the claim expires on its own
+            logger.warning("idempotency_redis_error", op="release", error=str(exc))
+
+
+idempotency_store = IdempotencyStore()
@@ -0,0 +1,188 @@
+"""
+Pre-generated interview question pools, one Redis list per resume + preset.
+
+Generating questions is the slow part of ``/interview/start``, yet its input
+— the analyzed resume and a difficulty preset — repeats for every interview
+on the same resume.  So every start of an interview schedules a Celery
+task that tops up::
+
+    interview:pool:<resume_id>:<difficulty>:<context fingerprint>
+
+to ``QUESTION_POOL_SIZE`` question sets of ``QUESTION_POOL_SET_SIZE``
+questions each, and the next start on that resume and preset pops one set
+(a hit needs no LLM call).  Pools fill lazily: nothing is generated for a
+resume until an interview is started on it.  The fingerprint hashes the
+resume context and the question prompt version, both passed in by the
+caller along with the prompt to generate from, so a re-analysed resume or
+a new prompt never receives stale questions; orphaned lists simply expire
+(``QUESTION_POOL_TTL``).
+
+Interviews with focus areas always generate live.  Every Redis failure
+degrades to a miss.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import uuid
+from typing import Any
+
+import structlog
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.domain.interfaces.question_pool import IQuestionPool
+from app.infrastructure.cache.redis_client import get_redis, get_sync_redis
+
+logger = structlog.get_logger(__name__)
+
+_KEY_PREFIX = "interview:pool:"
+_REFILL_LOCK_TTL = 300  # seconds — longer than a few generate_questions calls
+
+pool_draws = metrics.counter(
+    "interview_question_pool_draws_total", "Question pool lookups by result (hit / miss)"
+)
+
+
+def context_fingerprint(resume_context: dict[str, Any], prompt_version: str) -> str:
+    """Short hash of everything besides the preset that shapes the generated questions."""
+    payload = json.dumps(resume_context, sort_keys=True, default=str)
+    return hashlib.sha256(f"{prompt_version}\0{payload}".encode()).hexdigest()[:16]
+
+
+def pool_key(
+    resume_id: uuid.UUID | str,
+    difficulty: str,
+    resume_context: dict[str, Any],
+    prompt_version: str,
+) -> str:
+    fingerprint = context_fingerprint(resume_context, prompt_version)
+    return f"{_KEY_PREFIX}{resume_id}:{difficulty}:{fingerprint}"
+
+
+class RedisQuestionPool(IQuestionPool):
+    """Question-set pool in Redis lists; refilled by ``refill_question_pool``."""
+
+    def __init__(self, ttl: int | None = None) -> None:
+        self._ttl = ttl if ttl is not None else settings.QUESTION_POOL_TTL
+
+    @property
+    def set_size(self) -> int:
+        return settings.QUESTION_POOL_SET_SIZE
+
+    # ------------------------------------------------------------------
+    # Async API (StartInterviewUseCase)
+    # ------------------------------------------------------------------
+
+    async def draw(
+        self,
+        resume_id: uuid.UUID,
+        difficulty: str,
+        resume_context: dict[str, Any],
+        prompt_version: str,
+        count: int,
+    ) -> list[Any] | None:
+        if count > self.set_size:
+            pool_draws.inc(result="miss", difficulty=difficulty)
+            return None
+        key = pool_key(resume_id, difficulty, resume_context, prompt_version)
+        try:
+            r = await get_redis()
+            raw = await r.lpop(key)
+        except Exception as exc:
+            logger.warning("question_pool_redis_error", op="lpop", error=str(exc))
+            raw = None
+
+        questions = json.loads(raw) if raw else None
+        if questions is None or len(questions) < count:
+            pool_draws.inc(result="miss", difficulty=difficulty)
+            logger.info("question_pool_miss", resume_id=str(resume_id), difficulty=difficulty)
+            return None
+
+        pool_draws.inc(result="hit", difficulty=difficulty)
+        logger.info("question_pool_hit", resume_id=str(resume_id), difficulty=difficulty)
+        return questions[:count]
+
+    def request_refill(
+        self,
+        resume_id: uuid.UUID,
+        difficulty: str,
+        resume_context: dict[str, Any],
+        prompt_version: str,
+        prompts: dict[str, str],
+    ) -> None:
+        from app.infrastructure.tasks.interview_tasks import (
+            dispatch_nowait,
+            refill_question_pool_task,
+        )
+
+        dispatch_nowait(
+            refill_question_pool_task,
+            {
+                "resume_id": str(resume_id),
+                "difficulty": difficulty,
+                "resume_context": resume_context,
+                "prompt_version": prompt_version,
+                "prompts": prompts,
+            },
+            resume_id=str(resume_id),
+        )
+
+    # ------------------------------------------------------------------
+    # Sync API (Celery refill task)
+    # ------------------------------------------------------------------
+
+    def size(
+        self,
+        resume_id: uuid.UUID | str,
+        difficulty: str,
+        context: dict[str, Any],
+        prompt_version: str,
+    ) -> int:
+        try:
+            key = pool_key(resume_id, difficulty, context, prompt_version)
+            return int(get_sync_redis().llen(key))
+        except Exception as exc:
+            logger.warning("question_pool_redis_error", op="llen", error=str(exc))
+            return 0
+
+    def add(
+        self,
+        resume_id: uuid.UUID | str,
+        difficulty: str,
+        context: dict[str, Any],
+        prompt_version: str,
+        questions: list[Any],
+    ) -> None:
+        key = pool_key(resume_id, difficulty, context, prompt_version)
+        try:
+            r = get_sync_redis()
+            r.rpush(key, json.dumps(questions))
+            r.expire(key, self._ttl)
+        except Exception as exc:
+            logger.warning("question_pool_redis_error", op="rpush", error=str(exc))
+
+    def acquire_refill_lock(self, resume_id: uuid.UUID | str, difficulty: str) -> bool:
+        """One refill per resume + preset at a time (False when Redis is down)."""
+        try:
+            return bool(
+                get_sync_redis().set(
+                    f"{_KEY_PREFIX}{resume_id}:{difficulty}:refilling",
+                    "1",
+                    nx=True,
+                    ex=_REFILL_LOCK_TTL,
+                )
+            )
+        except Exception as exc:
+            logger.warning("question_pool_redis_error", op="lock", error=str(exc))
+            return False
+
+    def release_refill_lock(self, resume_id: uuid.UUID | str, difficulty: str) -> None:
+        try:
+            get_sync_redis().delete(f"{_KEY_PREFIX}{resume_id}:{difficulty}:refilling")
+        except Exception as exc:  # the lock expires on its own
+            logger.debug("question_pool_redis_error", op="unlock", error=str(exc))
+
+
+question_pool = RedisQuestionPool()
@@ -12,10 +12,17 @@ Usage::
 
     # Graceful shutdown (called from main.py lifespan):
     await redis_client.close()
+
+    # Synchronous code (Celery tasks, sync fallbacks):
+    r = get_sync_redis()
+    r.get("key")
 """
 
 from __future__ import annotations
 
+import os
+
+import redis
 import structlog
 from redis.asyncio import Redis
 
@@ -23,8 +30,10 @@ from app.core.config import settings
 
 logger = structlog.get_logger(__name__)
 
-# Module-level singleton — lazily connected on first use
+# Module-level singletons — lazily connected on first use
 _redis: Redis | None = None
+_sync_redis: redis.Redis | None = None
+_sync_redis_pid: int | None = None
 
 
 async def get_redis() -> Redis:
@@ -50,6 +59,24 @@ async def close_redis() -> None:
         logger.info("redis_closed")
 
 
+def get_sync_redis() -> redis.Redis:
+    """Return the process-local sync Redis client, creating it lazily.
+
+    Rebuilt after ``fork`` so Celery prefork children never share the
+    parent's sockets.
+    """
+    global _sync_redis, _sync_redis_pid
+    if _sync_redis is None or _sync_redis_pid != os.getpid():
+        _sync_redis = redis.Redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            socket_connect_timeout=5,
+            retry_on_timeout=True,
+        )
+        _sync_redis_pid = os.getpid()
+    return _sync_redis
+
+
 class RedisTokenBlacklist:
     """
     Redis-backed token blacklist.
@@ -0,0 +1,215 @@
+"""
+Content-addressed cache for LLM resume-parse results.
+
+A parse result depends only on the extracted text, the model chain and the
+parse prompt, so the key is::
+
+    sha256(prompt_version \\0 model \\0 normalized_text)
+
+Re-uploading the same file, creating a version from it, or re-analysing an
+unchanged resume therefore costs a lookup instead of a 10–60 s LLM call.
+
+Storage is two-tier:
+
+* **Redis** (``resume:parse:<hash>``, TTL ``RESUME_PARSE_CACHE_TTL``) — hot path.
+* **Postgres** (``resume_parse_cache`` table) — durable fallback used when
+  Redis misses or is unreachable; hits are written back to Redis.
+
+Hit/miss counters live in Redis so API processes and Celery workers share
+them; ``stats()`` / ``astats()`` read them for the ``/metrics`` endpoint.
+The cache never raises — any backend failure degrades to a miss.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import unicodedata
+from typing import Any
+
+import structlog
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.infrastructure.cache.redis_client import get_redis, get_sync_redis
+from app.infrastructure.persistence.models.cache import ResumeParseCacheEntry
+
+logger = structlog.get_logger(__name__)
+
+# Bump whenever the resume-parse prompt of any provider changes so parses
+# produced by the old prompt are no longer served.
+PROMPT_VERSION = "resume-v2"
+
+_KEY_PREFIX = "resume:parse:"
+_STATS_KEY = "metrics:resume_parse_cache"
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Canonical form used for hashing — NFKC, collapsed whitespace, trimmed."""
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+def cache_key(text: str, model: str, prompt_version: str = PROMPT_VERSION) -> str:
+    """SHA-256 hex digest identifying a (text, model, prompt) parse."""
+    payload = f"{prompt_version}\0{model}\0{normalize_text(text)}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResumeParseCache:
+    """Two-tier (Redis → Postgres) parse-result cache with shared hit/miss counters."""
+
+    def __init__(self, ttl: int | None = None) -> None:
+        self._ttl = ttl if ttl is not None else settings.RESUME_PARSE_CACHE_TTL
+
+    # ------------------------------------------------------------------
+    # Sync API (Celery tasks, in-process fallback)
+    # ------------------------------------------------------------------
+
+    def get(self, db: Session, key: str) -> dict[str, Any] | None:
+        """Return the cached parse for *key*, or ``None`` on a miss."""
+        cached = self._redis_call("get", _KEY_PREFIX + key)
+        if cached is not None:
+            self._redis_call("hincrby", _STATS_KEY, "hits_redis", 1)
+            return json.loads(cached)
+
+        result = _db_get(db, key)
+        if result is not None:
+            self._redis_call("set", _KEY_PREFIX + key, json.dumps(result), ex=self._ttl)
+            self._redis_call("hincrby", _STATS_KEY, "hits_postgres", 1)
+            return result
+
+        self._redis_call("hincrby", _STATS_KEY, "misses", 1)
+        return None
+
+    def set(
+        self,
+        db: Session,
+        key: str,
+        result: dict[str, Any],
+        model: str,
+        prompt_version: str = PROMPT_VERSION,
+    ) -> None:
+        """Store *result* in both tiers (Postgres row joins the caller's transaction).
+
+        *prompt_version* is the one *key* was built with (see ``cache_key``).
+        """
+        self._redis_call("set", _KEY_PREFIX + key, json.dumps(result), ex=self._ttl)
+        _db_put(db, key, result, model, prompt_version)
+
+    def stats(self) -> dict[str, Any]:
+        return _format_stats(self._redis_call("hgetall", _STATS_KEY))
+
+    # ------------------------------------------------------------------
+    # Async API (background reanalysis)
+    # ------------------------------------------------------------------
+
+    async def aget(self, db: AsyncSession, key: str) -> dict[str, Any] | None:
+        """Async variant of ``get`` — Postgres is queried via ``run_sync``."""
+        cached = await self._aredis_call("get", _KEY_PREFIX + key)
+        if cached is not None:
+            await self._aredis_call("hincrby", _STATS_KEY, "hits_redis", 1)
+            return json.loads(cached)
+
+        result = await db.run_sync(_db_get, key)
+        if result is not None:
+            await self._aredis_call("set", _KEY_PREFIX + key, json.dumps(result), ex=self._ttl)
+            await self._aredis_call("hincrby", _STATS_KEY, "hits_postgres", 1)
+            return result
+
+        await self._aredis_call("hincrby", _STATS_KEY, "misses", 1)
+        return None
+
+    async def aset(
+        self,
+        db: AsyncSession,
+        key: str,
+        result: dict[str, Any],
+        model: str,
+        prompt_version: str = PROMPT_VERSION,
+    ) -> None:
+        """Async variant of ``set``."""
+        await self._aredis_call("set", _KEY_PREFIX + key, json.dumps(result), ex=self._ttl)
+        await db.run_sync(_db_put, key, result, model, prompt_version)
+
+    async def astats(self) -> dict[str, Any]:
+        return _format_stats(await self._aredis_call("hgetall", _STATS_KEY))
+
+    # ------------------------------------------------------------------
+    # Redis helpers — failures degrade to "no value"
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _redis_call(method: str, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return getattr(get_sync_redis(), method)(*args, **kwargs)
+        except Exception as exc:
+            logger.warning("resume_parse_cache_redis_error", op=method, error=str(exc))
+            return None
+
+    @staticmethod
+    async def _aredis_call(method: str, *args: Any, **kwargs: Any) -> Any:
+        try:
+            r = await get_redis()
+            return await getattr(r, method)(*args, **kwargs)
+        except Exception as exc:
+            logger.warning("resume_parse_cache_redis_error", op=method, error=str(exc))
+            return None
+
+
+# ------------------------------------------------------------------
+# Postgres tier (sync Session — async callers go through run_sync)
+# ------------------------------------------------------------------
+
+
+# Both run in a savepoint: a failed statement aborts the whole transaction on
+# Postgres, and the caller's transaction goes on to update the resume.
+
+
+def _db_get(db: Session, key: str) -> dict[str, Any] | None:
+    try:
+        with db.begin_nested():
+            entry = db.get(ResumeParseCacheEntry, key)
+    except SQLAlchemyError as exc:
+        logger.warning("resume_parse_cache_db_error", op="get", error=str(exc))
+        return None
+    return dict(entry.result) if entry is not None else None
+
+
+def _db_put(db: Session, key: str, result: dict[str, Any], model: str, prompt_version: str) -> None:
+    # A concurrent insert of the same hash is expected and harmless.
+    try:
+        with db.begin_nested():
+            db.merge(
+                ResumeParseCacheEntry(
+                    content_hash=key,
+                    model=model[:255],
+                    prompt_version=prompt_version,
+                    result=result,
+                )
+            )
+    except IntegrityError:
+        logger.debug("resume_parse_cache_concurrent_insert", content_hash=key)
+    except SQLAlchemyError as exc:
+        logger.warning("resume_parse_cache_db_error", op="put", error=str(exc))
+
+
+def _format_stats(raw: dict[str, str] | None) -> dict[str, Any]:
+    raw = raw or {}
+    hits_redis = int(raw.get("hits_redis", 0))
+    hits_postgres = int(raw.get("hits_postgres", 0))
+    misses = int(raw.get("misses", 0))
+    lookups = hits_redis + hits_postgres + misses
+    return {
+        "hits": hits_redis + hits_postgres,
+        "hits_redis": hits_redis,
+        "hits_postgres": hits_postgres,
+        "misses": misses,
+        "hit_rate": round((hits_redis + hits_postgres) / lookups, 4) if lookups else None,
+    }
+
+
+resume_parse_cache = ResumeParseCache()
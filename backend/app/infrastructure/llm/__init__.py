@@ -1,12 +1,86 @@
-"""LLM provider adapters — OpenAI (primary) + Gemini (fallback)."""
+"""LLM provider adapters — OpenAI (primary) + Gemini (fallback), sync and async."""
 
-from app.infrastructure.llm.factory import LLMProviderWithFallback, get_llm_provider
-from app.infrastructure.llm.gemini_provider import GeminiProvider
-from app.infrastructure.llm.openai_provider import OpenAIProvider
+from app.infrastructure.llm.cassette import (
+    AsyncRecordingLLMProvider,
+    AsyncReplayLLMProvider,
+    Cassette,
+    RecordingLLMProvider,
+    ReplayLLMProvider,
+)
+from app.infrastructure.llm.circuit_breaker import (
+    AsyncCircuitBreakerLLMProvider,
+    CircuitBreaker,
+    CircuitBreakerLLMProvider,
+)
+from app.infrastructure.llm.factory import (
+    AsyncLLMProviderWithFallback,
+    LLMProviderWithFallback,
+    get_async_llm_provider,
+    get_llm_provider,
+)
+from app.infrastructure.llm.fake_provider import (
+    AsyncFakeLLMProvider,
+    FakeLLMProvider,
+    FakeProfile,
+)
+from app.infrastructure.llm.gemini_provider import AsyncGeminiProvider, GeminiProvider
+from app.infrastructure.llm.hedging import LatencyTracker
+from app.infrastructure.llm.openai_provider import AsyncOpenAIProvider, OpenAIProvider
+from app.infrastructure.llm.rate_limiter import (
+    AsyncRateLimitedLLMProvider,
+    RateLimitedLLMProvider,
+    TokenBucketLimiter,
+)
+from app.infrastructure.llm.registry import (
+    LLMProviderRegistry,
+    close_llm_providers,
+    get_shared_async_llm_provider,
+    get_shared_llm_provider,
+)
+from app.infrastructure.llm.routing import (
+    AsyncRoutedLLMProvider,
+    ProviderScoreboard,
+    RoutedLLMProvider,
+)
+from app.infrastructure.llm.single_flight import (
+    AsyncSingleFlightLLMProvider,
+    SingleFlightLLMProvider,
+)
+from app.infrastructure.llm.telemetry import AsyncTelemetryLLMProvider, TelemetryLLMProvider
 
 __all__ = [
     "OpenAIProvider",
     "GeminiProvider",
+    "AsyncOpenAIProvider",
+    "AsyncGeminiProvider",
     "LLMProviderWithFallback",
+    "AsyncLLMProviderWithFallback",
     "get_llm_provider",
+    "get_async_llm_provider",
+    "LatencyTracker",
+    "ProviderScoreboard",
+    "RoutedLLMProvider",
+    "AsyncRoutedLLMProvider",
+    "SingleFlightLLMProvider",
+    "AsyncSingleFlightLLMProvider",
+    "CircuitBreaker",
+    "CircuitBreakerLLMProvider",
+    "AsyncCircuitBreakerLLMProvider",
+    "TokenBucketLimiter",
+    "RateLimitedLLMProvider",
+    "AsyncRateLimitedLLMProvider",
+    "TelemetryLLMProvider",
+    "AsyncTelemetryLLMProvider",
+    "FakeProfile",
+    "FakeLLMProvider",
+    "AsyncFakeLLMProvider",
+    "Cassette",
+    "RecordingLLMProvider",
+    "AsyncRecordingLLMProvider",
+    "ReplayLLMProvider",
+    "AsyncReplayLLMProvider",
+    "LLMProviderRegistry",
+    "get_shared_llm_provider",
+    "get_shared_async_llm_provider",
+    "close_llm_providers",
 ]
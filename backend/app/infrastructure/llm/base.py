@@ -0,0 +1,102 @@
+"""
+Delegating provider bases for cross-cutting LLM wrappers.
+
+Concerns such as circuit breaking, rate limiting and telemetry wrap a single
+provider and must apply to *every* port method.  Subclasses override
+``_call`` (sync) or ``_acall`` (async) once instead of re-implementing each
+method — and ``_stream`` / ``_astream`` for the streaming methods, whose
+call only ends when the iterator is exhausted; everything else — name,
+model, shutdown — is forwarded unchanged.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+from app.domain.interfaces.llm_provider import IAsyncLLMProvider, ILLMProvider
+
+
+class DelegatingLLMProvider(ILLMProvider):
+    """Forwards every ``ILLMProvider`` method to *inner* through ``_call``."""
+
+    def __init__(self, inner: ILLMProvider) -> None:
+        self._inner = inner
+
+    @property
+    def provider_name(self) -> str:
+        return self._inner.provider_name
+
+    @property
+    def model_name(self) -> str:
+        return self._inner.model_name
+
+    def _call(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
+        return getattr(self._inner, method_name)(*args, **kwargs)
+
+    def generate_questions(self, prompts: dict[str, str]) -> list[dict[str, str] | str]:
+        return self._call("generate_questions", prompts)
+
+    def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        return self._call("generate_feedback", prompts)
+
+    def generate_completion(self, prompt: str) -> str:
+        return self._call("generate_completion", prompt)
+
+    def parse_resume(self, text: str) -> dict[str, Any]:
+        return self._call("parse_resume", text)
+
+    def _stream(self, method_name: str, *args: Any, **kwargs: Any) -> Iterator[Any]:
+        yield from getattr(self._inner, method_name)(*args, **kwargs)
+
+    def stream_questions(self, prompts: dict[str, str]) -> Iterator[dict[str, str] | str]:
+        return self._stream("stream_questions", prompts)
+
+    def stream_feedback(self, prompts: dict[str, str]) -> Iterator[dict[str, Any]]:
+        return self._stream("stream_feedback", prompts)
+
+    def close(self) -> None:
+        self._inner.close()
+
+
+class AsyncDelegatingLLMProvider(IAsyncLLMProvider):
+    """Forwards every ``IAsyncLLMProvider`` method to *inner* through ``_acall``."""
+
+    def __init__(self, inner: IAsyncLLMProvider) -> None:
+        self._inner = inner
+
+    @property
+    def provider_name(self) -> str:
+        return self._inner.provider_name
+
+    @property
+    def model_name(self) -> str:
+        return self._inner.model_name
+
+    async def _acall(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
+        return await getattr(self._inner, method_name)(*args, **kwargs)
+
+    async def generate_questions(self, prompts: dict[str, str]) -> list[dict[str, str] | str]:
+        return await self._acall("generate_questions", prompts)
+
+    async def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        return await self._acall("generate_feedback", prompts)
+
+    async def generate_completion(self, prompt: str) -> str:
+        return await self._acall("generate_completion", prompt)
+
+    async def parse_resume(self, text: str) -> dict[str, Any]:
+        return await self._acall("parse_resume", text)
+
+    async def _astream(self, method_name: str, *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        async for item in getattr(self._inner, method_name)(*args, **kwargs):
+            yield item
+
+    def stream_questions(self, prompts: dict[str, str]) -> AsyncIterator[dict[str, str] | str]:
+        return self._astream("stream_questions", prompts)
+
+    def stream_feedback(self, prompts: dict[str, str]) -> AsyncIterator[dict[str, Any]]:
+        return self._astream("stream_feedback", prompts)
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
@@ -0,0 +1,220 @@
+"""
+LLM cassettes — record real provider responses, replay them offline.
+
+Synthetic responses (``fake_provider.py``) exercise the plumbing; replaying
+what the real models actually returned also keeps response sizes, shapes
+and latencies realistic.  A cassette is a JSON-lines file, one entry per
+successful call::
+
+    {"key": ..., "method": ..., "provider": ..., "model": ...,
+     "latency": 4.21, "ids": [...], "response": ...}
+
+* ``LLM_PROVIDER_MODE=record`` — the live chain runs unchanged, and every
+  concrete provider appends its successful responses to
+  ``LLM_CASSETTE_PATH`` (``RecordingLLMProvider``, innermost layer).
+* ``LLM_PROVIDER_MODE=replay`` — no network: ``ReplayLLMProvider`` (a
+  ``FakeLLMProvider``) serves the recorded response after its recorded
+  latency, still applying the fake profile's error and 429 rates.  Requests
+  without a recording get a synthetic response.
+
+The key hashes the method and its arguments with UUIDs masked, because
+question and session ids differ on every run.  The UUIDs of the recorded
+request are stored with the entry and, on replay, swapped for the ones in
+the new request — so a batch evaluation still answers for the question ids
+it was asked about.  Several recordings under one key are served in turn.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from collections import defaultdict
+from hashlib import sha256
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from app.core.metrics import metrics
+from app.domain.interfaces.llm_provider import IAsyncLLMProvider, ILLMProvider
+from app.infrastructure.llm.base import AsyncDelegatingLLMProvider, DelegatingLLMProvider
+from app.infrastructure.llm.fake_provider import AsyncFakeLLMProvider, FakeLLMProvider
+
+logger = structlog.get_logger(__name__)
+
+_UUID_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.I)
+
+cassette_lookups = metrics.counter(
+    "llm_cassette_lookups_total", "Replayed LLM calls by result (hit / miss)"
+)
+
+
+def request_key(method_name: str, arg: Any) -> tuple[str, list[str]]:
+    """Cassette key of a call and the UUIDs (in order) masked out of it."""
+    payload = json.dumps(arg, sort_keys=True, default=str)
+    ids = list(dict.fromkeys(_UUID_RE.findall(payload)))
+    masked = _UUID_RE.sub("<id>", payload)
+    return sha256(f"{method_name}\0{masked}".encode()).hexdigest(), ids
+
+
+class Cassette:
+    """Append-only JSON-lines store of recorded LLM responses."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._entries: dict[str, list[dict[str, Any]]] | None = None
+        self._cursor: dict[str, int] = defaultdict(int)
+
+    def _load(self) -> dict[str, list[dict[str, Any]]]:
+        """Index the file by key on first use (caller holds the lock)."""
+        if self._entries is None:
+            self._entries = defaultdict(list)
+            if self.path.exists():
+                with self.path.open(encoding="utf-8") as fh:
+                    for line in fh:
+                        if line.strip():
+                            entry = json.loads(line)
+                            self._entries[entry["key"]].append(entry)
+            logger.info("llm_cassette_loaded", path=str(self.path), keys=len(self._entries))
+        return self._entries
+
+    def record(
+        self,
+        method_name: str,
+        arg: Any,
+        response: Any,
+        latency: float,
+        provider: str,
+        model: str,
+    ) -> None:
+        key, ids = request_key(method_name, arg)
+        entry = {
+            "key": key,
+            "method": method_name,
+            "provider": provider,
+            "model": model,
+            "latency": round(latency, 4),
+            "ids": ids,
+            "response": response,
+        }
+        line = json.dumps(entry, default=str)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as fh:
+                fh.write(line + "\n")
+            if self._entries is not None:
+                self._entries[key].append(entry)
+
+    def lookup(self, method_name: str, arg: Any) -> tuple[Any, float] | None:
+        """Recorded ``(response, latency)`` for a call, ids rebound; None on a miss."""
+        key, ids = request_key(method_name, arg)
+        with self._lock:
+            recorded = self._load().get(key)
+            if not recorded:
+                return None
+            entry = recorded[self._cursor[key] % len(recorded)]
+            self._cursor[key] += 1
+
+        payload = json.dumps(entry["response"])
+        for old, new in zip(entry.get("ids", []), ids, strict=False):
+            payload = payload.replace(old, new)
+        return json.loads(payload), float(entry.get("latency", 0.0))
+
+
+_cassettes: dict[str, Cassette] = {}
+_cassettes_lock = threading.Lock()
+
+
+def get_cassette(path: str | Path) -> Cassette:
+    """Process-wide cassette per path, shared by the sync and async chains."""
+    resolved = str(Path(path).resolve())
+    with _cassettes_lock:
+        if resolved not in _cassettes:
+            _cassettes[resolved] = Cassette(resolved)
+        return _cassettes[resolved]
+
+
+# ------------------------------------------------------------------
+# Record
+# ------------------------------------------------------------------
+
+
+class RecordingLLMProvider(DelegatingLLMProvider):
+    """Appends every successful response of *inner* to *cassette*."""
+
+    def __init__(self, inner: ILLMProvider, cassette: Cassette) -> None:
+        super().__init__(inner)
+        self._cassette = cassette
+
+    def _call(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
+        started = time.monotonic()
+        response = super()._call(method_name, *args, **kwargs)
+        self._cassette.record(
+            method_name,
+            args[0],
+            response,
+            time.monotonic() - started,
+            self.provider_name,
+            self.model_name,
+        )
+        return response
+
+
+class AsyncRecordingLLMProvider(AsyncDelegatingLLMProvider):
+    def __init__(self, inner: IAsyncLLMProvider, cassette: Cassette) -> None:
+        super().__init__(inner)
+        self._cassette = cassette
+
+    async def _acall(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
+        started = time.monotonic()
+        response = await super()._acall(method_name, *args, **kwargs)
+        self._cassette.record(
+            method_name,
+            args[0],
+            response,
+            time.monotonic() - started,
+            self.provider_name,
+            self.model_name,
+        )
+        return response
+
+
+# ------------------------------------------------------------------
+# Replay
+# ------------------------------------------------------------------
+
+
+def _replay(
+    provider: FakeLLMProvider | AsyncFakeLLMProvider,
+    cassette: Cassette,
+    method_name: str,
+    arg: Any,
+) -> tuple[Any, float | None] | None:
+    hit = cassette.lookup(method_name, arg)
+    cassette_lookups.inc(result="hit" if hit else "miss", method=method_name)
+    if hit is None:
+        logger.info("llm_cassette_miss", method=method_name, provider=provider.provider_name)
+    return hit
+
+
+class ReplayLLMProvider(FakeLLMProvider):
+    """Fake provider answering from a cassette (synthetic on a miss)."""
+
+    def __init__(self, cassette: Cassette, role: str = "primary", **kwargs: Any) -> None:
+        super().__init__(role, **kwargs)
+        self._cassette = cassette
+
+    def _respond(self, method_name: str, arg: Any) -> tuple[Any, float | None]:
+        return _replay(self, self._cassette, method_name, arg) or super()._respond(method_name, arg)
+
+
+class AsyncReplayLLMProvider(AsyncFakeLLMProvider):
+    def __init__(self, cassette: Cassette, role: str = "primary", **kwargs: Any) -> None:
+        super().__init__(role, **kwargs)
+        self._cassette = cassette
+
+    def _respond(self, method_name: str, arg: Any) -> tuple[Any, float | None]:
+        return _replay(self, self._cassette, method_name, arg) or super()._respond(method_name, arg)
@@ -0,0 +1,405 @@
+"""
+Per-provider circuit breaker with state shared through Redis.
+
+Without a breaker, every API process and Celery worker independently sits
+through a degraded provider's timeout/back-off loop before falling back.
+The breaker state lives in Redis, so once one process trips a provider all
+of them skip it immediately — the fallback composite sees an instant
+``LLMProviderError`` and moves on.
+
+States (hash ``llm:breaker:<provider>``)::
+
+    closed ──(N consecutive failures)──▶ open ──(recovery timeout)──▶ half_open
+      ▲                                   ▲                               │
+      └──────────── probe succeeds ───────┴──────── probe fails ◀─────────┘
+
+* ``closed``    — calls pass; failures within ``LLM_BREAKER_FAILURE_WINDOW``
+  seconds are counted and a success resets the count.
+* ``open``      — calls are rejected until ``LLM_BREAKER_RECOVERY_TIMEOUT``
+  has elapsed.
+* ``half_open`` — a single probe call (guarded by a ``SET NX`` key) is let
+  through; its outcome closes or re-opens the circuit.
+
+Only an ``LLMProviderError`` that says the provider is unhealthy counts as
+a failure — a transport error, a provider timeout, a 429 or a 5xx (see
+``error_kind``).  A reply that does not parse or match the schema, a 4xx,
+or a timeout cut short by the request deadline neither counts nor resets
+the streak; a half-open probe failing that way just frees the probe slot.
+If Redis itself is unreachable the breaker fails open (calls pass) rather
+than blocking LLM traffic.  Transitions are logged as
+``llm_circuit_<state>`` events.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+import httpx
+import openai
+import structlog
+
+from app.core import deadline
+from app.core.config import settings
+from app.domain.exceptions import LLMProviderError
+from app.domain.interfaces.llm_provider import IAsyncLLMProvider, ILLMProvider
+from app.infrastructure.cache.redis_client import get_redis, get_sync_redis
+from app.infrastructure.llm.base import AsyncDelegatingLLMProvider, DelegatingLLMProvider
+
+logger = structlog.get_logger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_KEY_PREFIX = "llm:breaker:"
+_REDIS_RETRY_AFTER = 10.0  # seconds to stop consulting Redis after an error
+
+# Error kinds that count towards opening the circuit.
+PROVIDER_FAULTS = frozenset({"transport", "timeout", "rate_limit", "server"})
+
+
+def error_kind(exc: LLMProviderError) -> str:
+    """What *exc* came from: its ``kind`` if set, else the first chained cause
+    recognised as ``transport``, ``timeout``, ``rate_limit``, ``server``,
+    ``client`` or ``parse``; ``other`` when none is.  A timeout with the
+    request deadline used up is ``deadline`` — the deadline capped it, not
+    the provider.
+    """
+    if exc.kind:
+        return exc.kind
+    cause = exc.__cause__
+    while cause is not None:
+        kind = _cause_kind(cause)
+        if kind == "timeout" and deadline.remaining() == 0.0:
+            return "deadline"
+        if kind:
+            return kind
+        cause = cause.__cause__
+    return "other"
+
+
+def _cause_kind(exc: BaseException) -> str | None:
+    if isinstance(exc, openai.APITimeoutError | httpx.TimeoutException | TimeoutError):
+        return "timeout"
+    if isinstance(exc, openai.APIConnectionError | httpx.TransportError | ConnectionError):
+        return "transport"
+    # OpenAI errors carry ``status_code``, google-genai ones ``code``.
+    status = getattr(exc, "status_code", None) or getattr(exc, "code", None)
+    if isinstance(status, int) and not isinstance(status, bool) and 400 <= status < 600:
+        if status == 429:
+            return "rate_limit"
+        return "server" if status >= 500 else "client"
+    if isinstance(exc, ValueError):  # JSON decode and schema validation errors
+        return "parse"
+    return None
+
+
+class CircuitBreaker:
+    """Redis-backed breaker state machine for one upstream provider."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int | None = None,
+        recovery_timeout: float | None = None,
+        failure_window: int | None = None,
+    ) -> None:
+        self.name = name
+        self._threshold = failure_threshold or settings.LLM_BREAKER_FAILURE_THRESHOLD
+        self._recovery = recovery_timeout or settings.LLM_BREAKER_RECOVERY_TIMEOUT
+        self._window = failure_window or settings.LLM_BREAKER_FAILURE_WINDOW
+        self._key = f"{_KEY_PREFIX}{name}"
+        self._probe_key = f"{self._key}:probe"
+        self._redis_down_until = 0.0
+
+    # ------------------------------------------------------------------
+    # Helpers shared by the sync and async paths
+    # ------------------------------------------------------------------
+
+    def _cooling_down(self, raw: dict[str, str]) -> bool:
+        opened_at = float(raw.get("opened_at", 0))
+        return time.time() - opened_at < self._recovery
+
+    def _redis_down(self) -> bool:
+        return time.monotonic() < self._redis_down_until
+
+    def _redis_error(self, exc: Exception) -> None:
+        # Fail open and stop paying a connect timeout on every call for a while.
+        self._redis_down_until = time.monotonic() + _REDIS_RETRY_AFTER
+        logger.warning("llm_circuit_redis_error", provider=self.name, error=str(exc))
+
+    def _log_transition(self, old: str, new: str, **extra: Any) -> None:
+        log = logger.warning if new == OPEN else logger.info
+        log(f"llm_circuit_{new}", provider=self.name, previous=old, **extra)
+
+    # ------------------------------------------------------------------
+    # Sync API
+    # ------------------------------------------------------------------
+
+    def before_call(self) -> str | None:
+        """Return the observed state if the call may proceed, ``None`` to reject."""
+        if self._redis_down():
+            return CLOSED
+        try:
+            r = get_sync_redis()
+            raw = r.hgetall(self._key)
+            state = raw.get("state", CLOSED)
+            if state == CLOSED:
+                return CLOSED
+            if state == OPEN and self._cooling_down(raw):
+                return None
+            if not r.set(self._probe_key, "1", nx=True, ex=int(self._recovery)):
+                return None
+            if state == OPEN:
+                r.hset(self._key, "state", HALF_OPEN)
+                self._log_transition(OPEN, HALF_OPEN)
+            return HALF_OPEN
+        except Exception as exc:
+            self._redis_error(exc)
+            return CLOSED
+
+    def on_success(self, observed: str) -> None:
+        if self._redis_down():
+            return
+        try:
+            r = get_sync_redis()
+            if observed == CLOSED:
+                r.hdel(self._key, "failures")
+                return
+            r.hset(self._key, mapping={"state": CLOSED, "failures": 0})
+            r.delete(self._probe_key)
+            self._log_transition(observed, CLOSED)
+        except Exception as exc:
+            self._redis_error(exc)
+
+    def on_failure(self, observed: str, error: str) -> None:
+        if self._redis_down():
+            return
+        try:
+            r = get_sync_redis()
+            if observed != CLOSED:
+                r.hset(self._key, mapping=self._open_mapping())
+                r.persist(self._key)
+                r.delete(self._probe_key)
+                self._log_transition(observed, OPEN, error=error)
+                return
+            failures = r.hincrby(self._key, "failures", 1)
+            if failures == 1:
+                r.expire(self._key, self._window)
+            if failures == self._threshold:
+                r.hset(self._key, mapping=self._open_mapping())
+                r.persist(self._key)
+                self._log_transition(CLOSED, OPEN, failures=failures, error=error)
+        except Exception as exc:
+            self._redis_error(exc)
+
+    def release(self, observed: str) -> None:
+        """End a call whose failure says nothing about the provider's health."""
+        if observed == CLOSED or self._redis_down():
+            return
+        try:
+            get_sync_redis().delete(self._probe_key)
+        except Exception as exc:
+            self._redis_error(exc)
+
+    def state(self) -> str:
+        try:
+            raw = get_sync_redis().hgetall(self._key)
+        except Exception:
+            return "unknown"
+        return self._effective_state(raw)
+
+    # ------------------------------------------------------------------
+    # Async API
+    # ------------------------------------------------------------------
+
+    async def abefore_call(self) -> str | None:
+        if self._redis_down():
+            return CLOSED
+        try:
+            r = await get_redis()
+            raw = await r.hgetall(self._key)
+            state = raw.get("state", CLOSED)
+            if state == CLOSED:
+                return CLOSED
+            if state == OPEN and self._cooling_down(raw):
+                return None
+            if not await r.set(self._probe_key, "1", nx=True, ex=int(self._recovery)):
+                return None
+            if state == OPEN:
+                await r.hset(self._key, "state", HALF_OPEN)
+                self._log_transition(OPEN, HALF_OPEN)
+            return HALF_OPEN
+        except Exception as exc:
+            self._redis_error(exc)
+            return CLOSED
+
+    async def aon_success(self, observed: str) -> None:
+        if self._redis_down():
+            return
+        try:
+            r = await get_redis()
+            if observed == CLOSED:
+                await r.hdel(self._key, "failures")
+                return
+            await r.hset(self._key, mapping={"state": CLOSED, "failures": 0})
+            await r.delete(self._probe_key)
+            self._log_transition(observed, CLOSED)
+        except Exception as exc:
+            self._redis_error(exc)
+
+    async def aon_failure(self, observed: str, error: str) -> None:
+        if self._redis_down():
+            return
+        try:
+            r = await get_redis()
+            if observed != CLOSED:
+                await r.hset(self._key, mapping=self._open_mapping())
+                await r.persist(self._key)
+                await r.delete(self._probe_key)
+                self._log_transition(observed, OPEN, error=error)
+                return
+            failures = await r.hincrby(self._key, "failures", 1)
+            if failures == 1:
+                await r.expire(self._key, self._window)
+            if failures == self._threshold:
+                await r.hset(self._key, mapping=self._open_mapping())
+                await r.persist(self._key)
+                self._log_transition(CLOSED, OPEN, failures=failures, error=error)
+        except Exception as exc:
+            self._redis_error(exc)
+
+    async def arelease(self, observed: str) -> None:
+        if observed == CLOSED or self._redis_down():
+            return
+        try:
+            r = await get_redis()
+            await r.delete(self._probe_key)
+        except Exception as exc:
+            self._redis_error(exc)
+
+    async def astate(self) -> str:
+        try:
+            r = await get_redis()
+            raw = await r.hgetall(self._key)
+        except Exception:
+            return "unknown"
+        return self._effective_state(raw)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _open_mapping() -> dict[str, Any]:
+        # Callers PERSIST the key afterwards: an open circuit must not
+        # expire along with the closed-state failure window.
+        return {"state": OPEN, "opened_at": time.time()}
+
+    def _effective_state(self, raw: dict[str, str]) -> str:
+        state = raw.get("state", CLOSED)
+        if state == OPEN and not self._cooling_down(raw):
+            return HALF_OPEN  # next call will probe
+        return state
+
+
+# ------------------------------------------------------------------
+# Provider wrappers
+# ------------------------------------------------------------------
+
+
+def _rejected(name: str) -> LLMProviderError:
+    return LLMProviderError(f"{name} circuit is open — provider skipped", kind="circuit_open")
+
+
+class CircuitBreakerLLMProvider(DelegatingLLMProvider):
+    """Sync provider guarded by a shared ``CircuitBreaker``."""
+
+    def __init__(self, inner: ILLMProvider, breaker: CircuitBreaker | None = None) -> None:
+        super().__init__(inner)
+        self._breaker = breaker or CircuitBreaker(inner.provider_name.lower())
+
+    def _call(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
+        observed = self._breaker.before_call()
+        if observed is None:
+            raise _rejected(self.provider_name)
+        try:
+            result = super()._call(method_name, *args, **kwargs)
+        except LLMProviderError as exc:
+            self._failed(observed, exc)
+            raise
+        self._breaker.on_success(observed)
+        return result
+
+    def _stream(self, method_name: str, *args: Any, **kwargs: Any) -> Iterator[Any]:
+        observed = self._breaker.before_call()
+        if observed is None:
+            raise _rejected(self.provider_name)
+        try:
+            yield from super()._stream(method_name, *args, **kwargs)
+        except LLMProviderError as exc:
+            self._failed(observed, exc)
+            raise
+        except GeneratorExit:  # consumer stopped early — the provider was fine
+            self._breaker.on_success(observed)
+            raise
+        self._breaker.on_success(observed)
+
+    def _failed(self, observed: str, exc: LLMProviderError) -> None:
+        if error_kind(exc) in PROVIDER_FAULTS:
+            self._breaker.on_failure(observed, str(exc))
+        else:
+            self._breaker.release(observed)
+
+
+class AsyncCircuitBreakerLLMProvider(AsyncDelegatingLLMProvider):
+    """Async provider guarded by a shared ``CircuitBreaker``."""
+
+    def __init__(self, inner: IAsyncLLMProvider, breaker: CircuitBreaker | None = None) -> None:
+        super().__init__(inner)
+        self._breaker = breaker or CircuitBreaker(inner.provider_name.lower())
+
+    async def _acall(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
+        observed = await self._breaker.abefore_call()
+        if observed is None:
+            raise _rejected(self.provider_name)
+        try:
+            result = await super()._acall(method_name, *args, **kwargs)
+        except LLMProviderError as exc:
+            await self._afailed(observed, exc)
+            raise
+        await self._breaker.aon_success(observed)
+        return result
+
+    async def _astream(self, method_name: str, *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        observed = await self._breaker.abefore_call()
+        if observed is None:
+            raise _rejected(self.provider_name)
+        try:
+            async for item in super()._astream(method_name, *args, **kwargs):
+                yield item
+        except LLMProviderError as exc:
+            await self._afailed(observed, exc)
+            raise
+        except GeneratorExit:
+            await self._breaker.aon_success(observed)
+            raise
+        await self._breaker.aon_success(observed)
+
+    async def _afailed(self, observed: str, exc: LLMProviderError) -> None:
+        if error_kind(exc) in PROVIDER_FAULTS:
+            await self._breaker.aon_failure(observed, str(exc))
+        else:
+            await self._breaker.arelease(observed)
+
+
+async def circuit_states() -> dict[str, str]:
+    """Breaker state of every configured provider (for ``/ready``)."""
+    names = []
+    if settings.OPENAI_API_KEY:
+        names.append("openai")
+    if settings.GEMINI_API_KEY:
+        names.append("gemini")
+    return {name: await CircuitBreaker(name).astate() for name in names}
@@ -5,27 +5,83 @@ fallback.  The primary provider is determined by ``settings.LLM_PRIMARY_PROVIDER
 If only one API key is configured, returns a single provider (no fallback).
 If neither key is configured, raises ``LLMProviderError`` at call time.
 
+With ``LLM_ROUTING_ENABLED`` the fixed pair is replaced by a latency-aware
+router over any number of ``provider:model`` candidates (``routing.py``).
+
+``LLM_PROVIDER_MODE`` swaps the concrete providers for load testing:
+``fake`` (synthetic responses), ``record`` / ``replay`` (cassettes).  The
+guards and the fallback composite stay the same in every mode.
+
 Usage::
 
     from app.infrastructure.llm.factory import get_llm_provider
     provider = get_llm_provider()          # single provider with fallback
     questions = provider.generate_questions(prompts)
+
+    # Inside async code (use cases) — same chain, non-blocking calls:
+    provider = get_async_llm_provider()
+    questions = await provider.generate_questions(prompts)
 """
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+import httpx
+import openai
 import structlog
+from google.genai import types as genai_types
 
 from app.core.config import settings
 from app.domain.exceptions import LLMProviderError
-from app.domain.interfaces.llm_provider import ILLMProvider
-from app.infrastructure.llm.gemini_provider import GeminiProvider
-from app.infrastructure.llm.openai_provider import OpenAIProvider
+from app.domain.interfaces.llm_provider import IAsyncLLMProvider, ILLMProvider
+from app.infrastructure.llm.cassette import (
+    AsyncRecordingLLMProvider,
+    AsyncReplayLLMProvider,
+    RecordingLLMProvider,
+    ReplayLLMProvider,
+    get_cassette,
+)
+from app.infrastructure.llm.circuit_breaker import (
+    AsyncCircuitBreakerLLMProvider,
+    CircuitBreakerLLMProvider,
+)
+from app.infrastructure.llm.fake_provider import AsyncFakeLLMProvider, FakeLLMProvider
+from app.infrastructure.llm.gemini_provider import AsyncGeminiProvider, GeminiProvider
+from app.infrastructure.llm.hedging import LatencyTracker, ahedged_call, hedged_call
+from app.infrastructure.llm.openai_provider import AsyncOpenAIProvider, OpenAIProvider
+from app.infrastructure.llm.rate_limiter import (
+    AsyncRateLimitedLLMProvider,
+    RateLimitedLLMProvider,
+    acharge_retry,
+    charge_retry,
+)
+from app.infrastructure.llm.routing import (
+    AsyncRoutedLLMProvider,
+    ProviderScoreboard,
+    RoutedLLMProvider,
+)
+from app.infrastructure.llm.single_flight import (
+    AsyncSingleFlightLLMProvider,
+    SingleFlightLLMProvider,
+)
+from app.infrastructure.llm.telemetry import (
+    AsyncTelemetryLLMProvider,
+    TelemetryLLMProvider,
+    async_http_event_hooks,
+    fallback_total,
+    http_event_hooks,
+)
 
 logger = structlog.get_logger(__name__)
 
+_NO_PROVIDER = (
+    "No LLM provider configured. Set at least one of "
+    "OPENAI_API_KEY or GEMINI_API_KEY in your .env file."
+)
+
 
 class LLMProviderWithFallback(ILLMProvider):
     """
@@ -33,27 +89,61 @@ class LLMProviderWithFallback(ILLMProvider):
     transparently retries with *fallback*.
 
     Implements ILLMProvider so callers are unaware of the retry logic.
+
+    With a *hedge_tracker*, calls are hedged: the fallback is also fired once
+    the primary has been outstanding longer than its learned p95 for that
+    method, and the first valid response wins (see ``hedging.py``).
+
+    Streaming methods fall back only while the primary has not yielded
+    anything yet — items already handed to the caller cannot be taken back,
+    so a stream that breaks midway raises.  Streams are never hedged.
     """
 
-    def __init__(self, primary: ILLMProvider, fallback: ILLMProvider) -> None:
+    def __init__(
+        self,
+        primary: ILLMProvider,
+        fallback: ILLMProvider,
+        hedge_tracker: LatencyTracker | None = None,
+    ) -> None:
         self._primary = primary
         self._fallback = fallback
+        self._hedge_tracker = hedge_tracker
+        self._executor: ThreadPoolExecutor | None = None
         logger.info(
             "llm_fallback_chain_initialized",
             primary=primary.provider_name,
             fallback=fallback.provider_name,
+            hedging=hedge_tracker is not None,
         )
 
     @property
     def provider_name(self) -> str:
         return f"{self._primary.provider_name}+{self._fallback.provider_name}"
 
+    @property
+    def model_name(self) -> str:
+        return f"{self._primary.model_name}+{self._fallback.model_name}"
+
     # ------------------------------------------------------------------
     # Delegate helpers
     # ------------------------------------------------------------------
 
     def _call_with_fallback(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
         """Try *primary*; on ``LLMProviderError`` retry with *fallback*."""
+        if self._hedge_tracker is not None:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=settings.LLM_HEDGE_MAX_WORKERS, thread_name_prefix="llm-hedge"
+                )
+            return hedged_call(
+                self._executor,
+                self._hedge_tracker,
+                method_name,
+                lambda: getattr(self._primary, method_name)(*args, **kwargs),
+                lambda: getattr(self._fallback, method_name)(*args, **kwargs),
+                primary_name=self._primary.provider_name,
+                fallback_name=self._fallback.provider_name,
+            )
         try:
             return getattr(self._primary, method_name)(*args, **kwargs)
         except LLMProviderError as exc:
@@ -64,6 +154,9 @@ class LLMProviderWithFallback(ILLMProvider):
                 error=str(exc),
                 fallback=self._fallback.provider_name,
             )
+            fallback_total.inc(
+                method=method_name, fallback=self._fallback.provider_name, reason="error"
+            )
             try:
                 return getattr(self._fallback, method_name)(*args, **kwargs)
             except LLMProviderError:
@@ -74,6 +167,29 @@ class LLMProviderWithFallback(ILLMProvider):
                 )
                 raise
 
+    def _stream_with_fallback(self, method_name: str, *args: Any) -> Iterator[Any]:
+        """Stream from *primary*; switch to *fallback* if it fails before the first item."""
+        started = False
+        try:
+            for item in getattr(self._primary, method_name)(*args):
+                started = True
+                yield item
+            return
+        except LLMProviderError as exc:
+            if started:
+                raise
+            logger.warning(
+                "primary_provider_failed",
+                provider=self._primary.provider_name,
+                method=method_name,
+                error=str(exc),
+                fallback=self._fallback.provider_name,
+            )
+            fallback_total.inc(
+                method=method_name, fallback=self._fallback.provider_name, reason="error"
+            )
+        yield from getattr(self._fallback, method_name)(*args)
+
     # ------------------------------------------------------------------
     # ILLMProvider interface
     # ------------------------------------------------------------------
@@ -90,66 +206,461 @@ class LLMProviderWithFallback(ILLMProvider):
     def parse_resume(self, text: str) -> dict[str, Any]:
         return self._call_with_fallback("parse_resume", text)
 
+    def stream_questions(self, prompts: dict[str, str]) -> Iterator[dict[str, str] | str]:
+        return self._stream_with_fallback("stream_questions", prompts)
+
+    def stream_feedback(self, prompts: dict[str, str]) -> Iterator[dict[str, Any]]:
+        return self._stream_with_fallback("stream_feedback", prompts)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._primary.close()
+        self._fallback.close()
+
+
+class AsyncLLMProviderWithFallback(IAsyncLLMProvider):
+    """
+    Async composite: awaits *primary* and, on failure, awaits *fallback*.
+
+    Same semantics as ``LLMProviderWithFallback`` for ``IAsyncLLMProvider``
+    chains; when hedging, the losing request is cancelled.
+    """
+
+    def __init__(
+        self,
+        primary: IAsyncLLMProvider,
+        fallback: IAsyncLLMProvider,
+        hedge_tracker: LatencyTracker | None = None,
+    ) -> None:
+        self._primary = primary
+        self._fallback = fallback
+        self._hedge_tracker = hedge_tracker
+        logger.info(
+            "llm_async_fallback_chain_initialized",
+            primary=primary.provider_name,
+            fallback=fallback.provider_name,
+            hedging=hedge_tracker is not None,
+        )
+
+    @property
+    def provider_name(self) -> str:
+        return f"{self._primary.provider_name}+{self._fallback.provider_name}"
+
+    @property
+    def model_name(self) -> str:
+        return f"{self._primary.model_name}+{self._fallback.model_name}"
+
+    # ------------------------------------------------------------------
+    # Delegate helpers
+    # ------------------------------------------------------------------
+
+    async def _call_with_fallback(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
+        """Await *primary*; on ``LLMProviderError`` await *fallback*."""
+        if self._hedge_tracker is not None:
+            return await ahedged_call(
+                self._hedge_tracker,
+                method_name,
+                lambda: getattr(self._primary, method_name)(*args, **kwargs),
+                lambda: getattr(self._fallback, method_name)(*args, **kwargs),
+                primary_name=self._primary.provider_name,
+                fallback_name=self._fallback.provider_name,
+            )
+        try:
+            return await getattr(self._primary, method_name)(*args, **kwargs)
+        except LLMProviderError as exc:
+            logger.warning(
+                "primary_provider_failed",
+                provider=self._primary.provider_name,
+                method=method_name,
+                error=str(exc),
+                fallback=self._fallback.provider_name,
+            )
+            fallback_total.inc(
+                method=method_name, fallback=self._fallback.provider_name, reason="error"
+            )
+            try:
+                return await getattr(self._fallback, method_name)(*args, **kwargs)
+            except LLMProviderError:
+                logger.error(
+                    "fallback_provider_failed",
+                    provider=self._fallback.provider_name,
+                    method=method_name,
+                )
+                raise
+
+    async def _stream_with_fallback(self, method_name: str, *args: Any) -> AsyncIterator[Any]:
+        """Stream from *primary*; switch to *fallback* if it fails before the first item."""
+        started = False
+        try:
+            async for item in getattr(self._primary, method_name)(*args):
+                started = True
+                yield item
+            return
+        except LLMProviderError as exc:
+            if started:
+                raise
+            logger.warning(
+                "primary_provider_failed",
+                provider=self._primary.provider_name,
+                method=method_name,
+                error=str(exc),
+                fallback=self._fallback.provider_name,
+            )
+            fallback_total.inc(
+                method=method_name, fallback=self._fallback.provider_name, reason="error"
+            )
+        async for item in getattr(self._fallback, method_name)(*args):
+            yield item
+
+    # ------------------------------------------------------------------
+    # IAsyncLLMProvider interface
+    # ------------------------------------------------------------------
+
+    async def generate_questions(self, prompts: dict[str, str]) -> list[dict[str, str] | str]:
+        return await self._call_with_fallback("generate_questions", prompts)
+
+    async def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        return await self._call_with_fallback("generate_feedback", prompts)
+
+    async def generate_completion(self, prompt: str) -> str:
+        return await self._call_with_fallback("generate_completion", prompt)
+
+    async def parse_resume(self, text: str) -> dict[str, Any]:
+        return await self._call_with_fallback("parse_resume", text)
+
+    def stream_questions(self, prompts: dict[str, str]) -> AsyncIterator[dict[str, str] | str]:
+        return self._stream_with_fallback("stream_questions", prompts)
+
+    def stream_feedback(self, prompts: dict[str, str]) -> AsyncIterator[dict[str, Any]]:
+        return self._stream_with_fallback("stream_feedback", prompts)
+
+    async def aclose(self) -> None:
+        await self._primary.aclose()
+        await self._fallback.aclose()
+
+
+# ------------------------------------------------------------------
+# Connection pools — sized from settings, one pool per provider instance
+# ------------------------------------------------------------------
+
+
+def _http_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.LLM_HTTP_KEEPALIVE_EXPIRY,
+    )
+
+
+def _http_timeout() -> httpx.Timeout:
+    return httpx.Timeout(settings.LLM_TIMEOUT, connect=settings.LLM_HTTP_CONNECT_TIMEOUT)
+
+
+def _event_hooks() -> dict[str, list[Any]]:
+    """Telemetry (attempt counts, TTFB), then a rate-limit charge for each retry."""
+    hooks = http_event_hooks()
+    hooks["request"].append(charge_retry)
+    return hooks
+
+
+def _async_event_hooks() -> dict[str, list[Any]]:
+    hooks = async_http_event_hooks()
+    hooks["request"].append(acharge_retry)
+    return hooks
+
+
+def _gemini_http_options() -> genai_types.HttpOptions:
+    """Gemini SDK options: timeout is in milliseconds, client args go to httpx.
+
+    The event hooks feed per-call attempt counts and TTFB to ``telemetry.py``
+    and charge retries to the rate limiter.
+    """
+    client_args = {"limits": _http_limits(), "timeout": _http_timeout()}
+    return genai_types.HttpOptions(
+        timeout=settings.LLM_TIMEOUT * 1000,
+        client_args={**client_args, "event_hooks": _event_hooks()},
+        async_client_args={**client_args, "event_hooks": _async_event_hooks()},
+    )
+
 
 # ------------------------------------------------------------------
 # Factory helper — safe provider instantiation
 # ------------------------------------------------------------------
 
 
-def _try_build_openai() -> OpenAIProvider | None:
+def _try_build_openai(model: str | None = None) -> OpenAIProvider | None:
     """Return an OpenAI provider if the API key is configured, else None."""
     if not settings.OPENAI_API_KEY:
         logger.info("openai_provider_skipped", reason="OPENAI_API_KEY is empty")
         return None
     return OpenAIProvider(
         api_key=settings.OPENAI_API_KEY,
-        model=settings.OPENAI_MODEL,
+        model=model or settings.OPENAI_MODEL,
         timeout=settings.LLM_TIMEOUT,
         max_retries=settings.LLM_MAX_RETRIES,
+        http_client=openai.DefaultHttpxClient(
+            limits=_http_limits(), timeout=_http_timeout(), event_hooks=_event_hooks()
+        ),
     )
 
 
-def _try_build_gemini() -> GeminiProvider | None:
+def _try_build_gemini(model: str | None = None) -> GeminiProvider | None:
     """Return a Gemini provider if the API key is configured, else None."""
     if not settings.GEMINI_API_KEY:
         logger.info("gemini_provider_skipped", reason="GEMINI_API_KEY is empty")
         return None
     return GeminiProvider(
         api_key=settings.GEMINI_API_KEY,
-        model=settings.GEMINI_MODEL,
+        model=model or settings.GEMINI_MODEL,
+        http_options=_gemini_http_options(),
     )
 
 
-def get_llm_provider() -> ILLMProvider:
-    """
-    Build the composite LLM provider based on ``settings.LLM_PRIMARY_PROVIDER``.
+def _try_build_async_openai(model: str | None = None) -> AsyncOpenAIProvider | None:
+    """Return an async OpenAI provider if the API key is configured, else None."""
+    if not settings.OPENAI_API_KEY:
+        logger.info("openai_provider_skipped", reason="OPENAI_API_KEY is empty")
+        return None
+    return AsyncOpenAIProvider(
+        api_key=settings.OPENAI_API_KEY,
+        model=model or settings.OPENAI_MODEL,
+        timeout=settings.LLM_TIMEOUT,
+        max_retries=settings.LLM_MAX_RETRIES,
+        http_client=openai.DefaultAsyncHttpxClient(
+            limits=_http_limits(), timeout=_http_timeout(), event_hooks=_async_event_hooks()
+        ),
+    )
 
-    Returns an ``LLMProviderWithFallback`` wrapping *primary* → *fallback*
-    when both API keys are available.
 
-    If only one API key is available, returns a single provider without fallback.
-    If neither API key is configured, raises ``LLMProviderError``.
+def _try_build_async_gemini(model: str | None = None) -> AsyncGeminiProvider | None:
+    """Return an async Gemini provider if the API key is configured, else None."""
+    if not settings.GEMINI_API_KEY:
+        logger.info("gemini_provider_skipped", reason="GEMINI_API_KEY is empty")
+        return None
+    return AsyncGeminiProvider(
+        api_key=settings.GEMINI_API_KEY,
+        model=model or settings.GEMINI_MODEL,
+        http_options=_gemini_http_options(),
+    )
+
+
+def _guard(provider: ILLMProvider | None) -> ILLMProvider | None:
+    """Wrap a concrete provider: telemetry → circuit breaker → rate limiter → provider."""
+    if provider is None:
+        return None
+    if settings.LLM_RATE_LIMIT_ENABLED:
+        provider = RateLimitedLLMProvider(provider)
+    if settings.LLM_BREAKER_ENABLED:
+        provider = CircuitBreakerLLMProvider(provider)
+    if settings.LLM_TELEMETRY_ENABLED:
+        provider = TelemetryLLMProvider(provider)
+    return provider
+
+
+def _aguard(provider: IAsyncLLMProvider | None) -> IAsyncLLMProvider | None:
+    if provider is None:
+        return None
+    if settings.LLM_RATE_LIMIT_ENABLED:
+        provider = AsyncRateLimitedLLMProvider(provider)
+    if settings.LLM_BREAKER_ENABLED:
+        provider = AsyncCircuitBreakerLLMProvider(provider)
+    if settings.LLM_TELEMETRY_ENABLED:
+        provider = AsyncTelemetryLLMProvider(provider)
+    return provider
+
+
+def _hedge_tracker() -> LatencyTracker | None:
+    """Return a latency tracker when hedging is enabled, else None."""
+    if not settings.LLM_HEDGING_ENABLED:
+        return None
+    return LatencyTracker(
+        default_delay=settings.LLM_HEDGE_DEFAULT_DELAY,
+        percentile=settings.LLM_HEDGE_PERCENTILE,
+        window=settings.LLM_HEDGE_WINDOW,
+        min_samples=settings.LLM_HEDGE_MIN_SAMPLES,
+    )
+
+
+def _order_chain(openai: Any, gemini: Any) -> tuple[Any, Any]:
+    """Return ``(primary, fallback)`` according to ``settings.LLM_PRIMARY_PROVIDER``.
+
+    Works on builders as well as instances, so callers can validate the
+    setting before any SDK client is constructed.
     """
     primary_name = settings.LLM_PRIMARY_PROVIDER.lower()
+    if primary_name == "openai":
+        return openai, gemini
+    if primary_name == "gemini":
+        return gemini, openai
+    raise LLMProviderError(
+        f"Unknown LLM_PRIMARY_PROVIDER: '{settings.LLM_PRIMARY_PROVIDER}'. "
+        "Expected 'openai' or 'gemini'."
+    )
 
-    # Build both providers (returns None if key is empty)
-    openai = _try_build_openai()
-    gemini = _try_build_gemini()
 
-    # Determine primary / fallback based on setting
-    if primary_name == "openai":
-        primary, fallback = openai, gemini
-    elif primary_name == "gemini":
-        primary, fallback = gemini, openai
-    else:
+def _check_live_mode(mode: str) -> None:
+    if mode not in ("live", "record"):
+        raise LLMProviderError(
+            f"Unknown LLM_PROVIDER_MODE: '{settings.LLM_PROVIDER_MODE}'. "
+            "Expected 'live', 'fake', 'record' or 'replay'."
+        )
+
+
+def _build_chain() -> tuple[ILLMProvider | None, ILLMProvider | None]:
+    """Unguarded ``(primary, fallback)`` for the configured provider mode."""
+    mode = settings.LLM_PROVIDER_MODE.lower()
+    if mode == "fake":
+        return FakeLLMProvider("primary"), FakeLLMProvider("fallback")
+    if mode == "replay":
+        cassette = get_cassette(settings.LLM_CASSETTE_PATH)
+        return ReplayLLMProvider(cassette, "primary"), ReplayLLMProvider(cassette, "fallback")
+
+    # Determine primary / fallback based on setting, then build both
+    # (each builder returns None if its key is empty)
+    build_primary, build_fallback = _order_chain(_try_build_openai, _try_build_gemini)
+    _check_live_mode(mode)
+    primary, fallback = build_primary(), build_fallback()
+    if mode == "record":
+        cassette = get_cassette(settings.LLM_CASSETTE_PATH)
+        primary = primary and RecordingLLMProvider(primary, cassette)
+        fallback = fallback and RecordingLLMProvider(fallback, cassette)
+    return primary, fallback
+
+
+def _build_async_chain() -> tuple[IAsyncLLMProvider | None, IAsyncLLMProvider | None]:
+    mode = settings.LLM_PROVIDER_MODE.lower()
+    if mode == "fake":
+        return AsyncFakeLLMProvider("primary"), AsyncFakeLLMProvider("fallback")
+    if mode == "replay":
+        cassette = get_cassette(settings.LLM_CASSETTE_PATH)
+        return (
+            AsyncReplayLLMProvider(cassette, "primary"),
+            AsyncReplayLLMProvider(cassette, "fallback"),
+        )
+
+    build_primary, build_fallback = _order_chain(_try_build_async_openai, _try_build_async_gemini)
+    _check_live_mode(mode)
+    primary, fallback = build_primary(), build_fallback()
+    if mode == "record":
+        cassette = get_cassette(settings.LLM_CASSETTE_PATH)
+        primary = primary and AsyncRecordingLLMProvider(primary, cassette)
+        fallback = fallback and AsyncRecordingLLMProvider(fallback, cassette)
+    return primary, fallback
+
+
+# ------------------------------------------------------------------
+# Adaptive routing — N candidates from "provider:model" specs
+# ------------------------------------------------------------------
+
+
+def _parse_spec(spec: str) -> tuple[str, str]:
+    kind, _, model = spec.partition(":")
+    kind, model = kind.strip().lower(), model.strip()
+    if kind not in ("openai", "gemini") or not model:
         raise LLMProviderError(
-            f"Unknown LLM_PRIMARY_PROVIDER: '{settings.LLM_PRIMARY_PROVIDER}'. "
-            "Expected 'openai' or 'gemini'."
+            f"Invalid LLM provider spec: '{spec}'. Expected 'openai:<model>' or 'gemini:<model>'."
         )
+    return kind, model
+
+
+def _router_specs() -> list[str]:
+    """``LLM_PROVIDERS``, or the two configured models in ``LLM_PRIMARY_PROVIDER`` order."""
+    if settings.LLM_PROVIDERS:
+        return list(settings.LLM_PROVIDERS)
+    return list(_order_chain(f"openai:{settings.OPENAI_MODEL}", f"gemini:{settings.GEMINI_MODEL}"))
+
+
+def _build_candidates(specs: list[str]) -> list[ILLMProvider | None]:
+    """Unguarded provider per spec (None when its API key is missing).
+
+    In ``fake`` / ``replay`` mode each spec becomes a fake whose profile is
+    ``LLM_FAKE_PROFILES[spec]``.
+    """
+    mode = settings.LLM_PROVIDER_MODE.lower()
+    parsed = [(spec, *_parse_spec(spec)) for spec in specs]
+    if mode == "fake":
+        return [FakeLLMProvider(spec) for spec, _, _ in parsed]
+    if mode == "replay":
+        cassette = get_cassette(settings.LLM_CASSETTE_PATH)
+        return [ReplayLLMProvider(cassette, spec) for spec, _, _ in parsed]
+    _check_live_mode(mode)
+    builders = {"openai": _try_build_openai, "gemini": _try_build_gemini}
+    providers = [builders[kind](model) for _, kind, model in parsed]
+    if mode == "record":
+        cassette = get_cassette(settings.LLM_CASSETTE_PATH)
+        providers = [p and RecordingLLMProvider(p, cassette) for p in providers]
+    return providers
+
+
+def _build_async_candidates(specs: list[str]) -> list[IAsyncLLMProvider | None]:
+    mode = settings.LLM_PROVIDER_MODE.lower()
+    parsed = [(spec, *_parse_spec(spec)) for spec in specs]
+    if mode == "fake":
+        return [AsyncFakeLLMProvider(spec) for spec, _, _ in parsed]
+    if mode == "replay":
+        cassette = get_cassette(settings.LLM_CASSETTE_PATH)
+        return [AsyncReplayLLMProvider(cassette, spec) for spec, _, _ in parsed]
+    _check_live_mode(mode)
+    builders = {"openai": _try_build_async_openai, "gemini": _try_build_async_gemini}
+    providers = [builders[kind](model) for _, kind, model in parsed]
+    if mode == "record":
+        cassette = get_cassette(settings.LLM_CASSETTE_PATH)
+        providers = [p and AsyncRecordingLLMProvider(p, cassette) for p in providers]
+    return providers
+
+
+def _scoreboard() -> ProviderScoreboard:
+    return ProviderScoreboard(
+        alpha=settings.LLM_ROUTER_EWMA_ALPHA,
+        error_penalty=settings.LLM_ROUTER_ERROR_PENALTY,
+        min_samples=settings.LLM_ROUTER_MIN_SAMPLES,
+        explore_rate=settings.LLM_ROUTER_EXPLORE_RATE,
+    )
+
+
+def _routed_provider() -> RoutedLLMProvider:
+    candidates = [p for p in map(_guard, _build_candidates(_router_specs())) if p]
+    if not candidates:
+        raise LLMProviderError(_NO_PROVIDER)
+    fast = [p for p in map(_guard, _build_candidates(settings.LLM_ROUTER_FAST_PROVIDERS)) if p]
+    return RoutedLLMProvider(
+        candidates,
+        _scoreboard(),
+        fast=fast,
+        fast_methods=settings.LLM_ROUTER_FAST_METHODS,
+        fast_max_prompt_chars=settings.LLM_ROUTER_FAST_MAX_PROMPT_CHARS,
+    )
+
+
+def _async_routed_provider() -> AsyncRoutedLLMProvider:
+    candidates = [p for p in map(_aguard, _build_async_candidates(_router_specs())) if p]
+    if not candidates:
+        raise LLMProviderError(_NO_PROVIDER)
+    fast = [
+        p for p in map(_aguard, _build_async_candidates(settings.LLM_ROUTER_FAST_PROVIDERS)) if p
+    ]
+    return AsyncRoutedLLMProvider(
+        candidates,
+        _scoreboard(),
+        fast=fast,
+        fast_methods=settings.LLM_ROUTER_FAST_METHODS,
+        fast_max_prompt_chars=settings.LLM_ROUTER_FAST_MAX_PROMPT_CHARS,
+    )
+
+
+def _build_provider() -> ILLMProvider:
+    if settings.LLM_ROUTING_ENABLED:
+        return _routed_provider()
+    primary, fallback = _build_chain()
+    primary, fallback = _guard(primary), _guard(fallback)
 
     # Return the best available configuration
     if primary and fallback:
-        return LLMProviderWithFallback(primary=primary, fallback=fallback)
+        return LLMProviderWithFallback(
+            primary=primary, fallback=fallback, hedge_tracker=_hedge_tracker()
+        )
     elif primary:
         logger.warning("llm_no_fallback", provider=primary.provider_name)
         return primary
@@ -160,7 +671,63 @@ def get_llm_provider() -> ILLMProvider:
         )
         return fallback
     else:
-        raise LLMProviderError(
-            "No LLM provider configured. Set at least one of "
-            "OPENAI_API_KEY or GEMINI_API_KEY in your .env file."
+        raise LLMProviderError(_NO_PROVIDER)
+
+
+def _build_async_provider() -> IAsyncLLMProvider:
+    if settings.LLM_ROUTING_ENABLED:
+        return _async_routed_provider()
+    primary, fallback = _build_async_chain()
+    primary, fallback = _aguard(primary), _aguard(fallback)
+
+    if primary and fallback:
+        return AsyncLLMProviderWithFallback(
+            primary=primary, fallback=fallback, hedge_tracker=_hedge_tracker()
+        )
+    elif primary:
+        logger.warning("llm_no_fallback", provider=primary.provider_name)
+        return primary
+    elif fallback:
+        logger.warning(
+            "llm_primary_unavailable_using_fallback",
+            fallback=fallback.provider_name,
         )
+        return fallback
+    else:
+        raise LLMProviderError(_NO_PROVIDER)
+
+
+def get_llm_provider() -> ILLMProvider:
+    """
+    Build the composite LLM provider based on ``settings.LLM_PRIMARY_PROVIDER``.
+
+    Returns an ``LLMProviderWithFallback`` wrapping *primary* → *fallback*
+    when both API keys are available (hedged when ``LLM_HEDGING_ENABLED``).
+    Each concrete provider sits behind its shared circuit breaker and
+    rate limiter (``LLM_BREAKER_ENABLED`` / ``LLM_RATE_LIMIT_ENABLED``).
+    ``LLM_PROVIDER_MODE`` selects live, fake, recording or replaying providers.
+
+    With ``LLM_ROUTING_ENABLED`` returns a ``RoutedLLMProvider`` over
+    ``LLM_PROVIDERS`` instead (see ``routing.py``).
+
+    The result is wrapped in a ``SingleFlightLLMProvider`` so identical
+    concurrent calls share one request (``LLM_SINGLE_FLIGHT_ENABLED``).
+
+    If only one API key is available, returns a single provider without fallback.
+    If neither API key is configured, raises ``LLMProviderError``.
+    """
+    provider = _build_provider()
+    if settings.LLM_SINGLE_FLIGHT_ENABLED:
+        provider = SingleFlightLLMProvider(provider)
+    return provider
+
+
+def get_async_llm_provider() -> IAsyncLLMProvider:
+    """
+    Async counterpart of ``get_llm_provider`` — same selection rules,
+    returning an ``IAsyncLLMProvider`` chain.
+    """
+    provider = _build_async_provider()
+    if settings.LLM_SINGLE_FLIGHT_ENABLED:
+        provider = AsyncSingleFlightLLMProvider(provider)
+    return provider
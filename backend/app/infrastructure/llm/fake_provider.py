@@ -0,0 +1,389 @@
+"""
+Fake LLM provider — synthetic, schema-valid responses for offline load tests.
+
+``FakeLLMProvider`` (and its async twin) implements the provider port
+without any network I/O, so the full request path — use cases, circuit
+breaker, rate limiter, telemetry, fallback and hedging — can be driven at
+load without API keys or spend.  Responses have the shape the real
+providers return:
+
+* ``generate_questions`` — ``{type, question, difficulty}`` dicts, as many as
+  the prompt's "Total questions: N" asks for;
+* ``generate_feedback`` — the keys named in the prompt's OUTPUT FORMAT
+  (per-answer, batch, summary-only or full-transcript evaluations), with one
+  ``questions_feedback`` entry per question id found in the prompt;
+* ``parse_resume`` — every field of the resume schema, with email / phone /
+  skills / years pulled from the text where present.
+
+Each instance plays one position of the chain (``primary`` / ``fallback``)
+with a ``FakeProfile`` from ``LLM_FAKE_PROFILES``: a lognormal latency
+distribution, a failure rate and an HTTP 429 rate.  A 429 is retried like
+the SDKs do (``LLM_MAX_RETRIES`` times, exponential back-off) and shows up
+in ``llm_retries_total``; a call whose every attempt is rate limited, or
+that draws a failure, raises ``LLMProviderError`` like a real provider.
+The streaming methods spread the sampled latency evenly over the items, so
+time-to-first-item behaves like a streamed completion.
+
+Enabled with ``LLM_PROVIDER_MODE=fake``; see ``cassette.py`` for replaying
+recorded real responses instead of synthetic ones.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import random
+import re
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+
+from app.application.use_cases.interview.prompts import INPUT_MARKER
+from app.core.config import settings
+from app.domain.exceptions import LLMProviderError
+from app.domain.interfaces.llm_provider import IAsyncLLMProvider, ILLMProvider
+from app.infrastructure.llm.streaming_json import feedback_items, question_items
+from app.infrastructure.llm.telemetry import current_call, note_usage
+
+logger = structlog.get_logger(__name__)
+
+_RATE_LIMIT_BACKOFF = 0.5  # seconds before the first retry of an injected 429
+_DEFAULT_QUESTION_COUNT = 5
+
+_QUESTION_TYPES = ("technical", "behavioral", "project", "system_design", "coding")
+_DIFFICULTIES = ("easy", "medium", "hard")
+_KNOWN_SKILLS = (
+    "Python", "Java", "JavaScript", "TypeScript", "Go", "Rust", "C++", "C#", "SQL",
+    "PostgreSQL", "MySQL", "MongoDB", "Redis", "Docker", "Kubernetes", "AWS", "GCP",
+    "Azure", "React", "Node.js", "FastAPI", "Django", "Flask", "Spring", "Terraform",
+    "Kafka", "Git", "Linux", "GraphQL", "Celery",
+)  # fmt: skip
+
+_TOTAL_QUESTIONS_RE = re.compile(r"Total questions:\s*(\d+)")
+_SINGLE_DIFFICULTY_RE = re.compile(r"at \*\*(easy|medium|hard)\*\* difficulty")
+_SKILLS_LINE_RE = re.compile(r"Key Skills:\s*(.+)")
+_ANSWER_ROW_ID_RE = re.compile(r"^(\d+) \|", re.M)  # rows of evaluation.encode_answers
+_EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+_PHONE_RE = re.compile(r"\+?\d[\d\s().-]{7,}\d")
+_YEARS_RE = re.compile(r"(\d{1,2})\+?\s*years", re.I)
+
+
+class FakeRateLimitError(Exception):
+    """Injected HTTP 429 Too Many Requests."""
+
+
+class FakeAPIError(Exception):
+    """Injected provider-side failure."""
+
+
+@dataclass(frozen=True)
+class FakeProfile:
+    """Latency and fault-injection settings for one fake provider."""
+
+    latency_median: float = 1.0  # seconds; 0 = respond immediately
+    latency_sigma: float = 0.5  # lognormal shape — larger means a heavier tail
+    error_rate: float = 0.0  # share of calls failing with FakeAPIError
+    rate_limit_rate: float = 0.0  # share of HTTP attempts answered with 429
+
+    @classmethod
+    def for_role(cls, role: str) -> FakeProfile:
+        """Profile for *role* from ``LLM_FAKE_PROFILES`` (defaults when absent)."""
+        return cls(**settings.LLM_FAKE_PROFILES.get(role, {}))
+
+
+# ------------------------------------------------------------------
+# Synthetic responses
+# ------------------------------------------------------------------
+
+
+def fake_questions(prompts: dict[str, str], rng: random.Random) -> list[dict[str, str]]:
+    """Questions in the ``generate_questions`` output shape."""
+    user_prompt = prompts.get("user_prompt", "")
+    count_match = _TOTAL_QUESTIONS_RE.search(user_prompt)
+    count = int(count_match.group(1)) if count_match else _DEFAULT_QUESTION_COUNT
+    difficulty_match = _SINGLE_DIFFICULTY_RE.search(user_prompt)
+    skills_match = _SKILLS_LINE_RE.search(user_prompt)
+    skills = [s.strip() for s in skills_match.group(1).split(",")] if skills_match else []
+    skills = [s for s in skills if s and s != "Not specified"] or ["software design"]
+
+    questions = []
+    for i in range(count):
+        kind = _QUESTION_TYPES[i % len(_QUESTION_TYPES)]
+        skill = skills[i % len(skills)]
+        questions.append(
+            {
+                "type": kind,
+                "question": f"[{kind}] How have you applied {skill} in production? (#{i + 1})",
+                "difficulty": difficulty_match.group(1)
+                if difficulty_match
+                else rng.choice(_DIFFICULTIES),
+            }
+        )
+    return questions
+
+
+def fake_feedback(prompts: dict[str, str], rng: random.Random) -> dict[str, Any]:
+    """An evaluation with exactly the keys the prompt's OUTPUT FORMAT asks for."""
+    user_prompt = prompts.get("user_prompt", "")
+    # Templates put the data after the format; keys quoted in an answer must not count.
+    output_format = user_prompt.rpartition("OUTPUT FORMAT")[2].partition(INPUT_MARKER)[0]
+
+    def score() -> float:
+        return round(rng.uniform(0.3, 0.95), 2)
+
+    if '"questions_feedback"' not in output_format and '"evaluation_score"' in output_format:
+        return {"evaluation_score": score(), "feedback_comment": "Clear answer; add specifics."}
+
+    response: dict[str, Any] = {}
+    if '"questions_feedback"' in output_format:
+        data = user_prompt.partition(INPUT_MARKER)[2]
+        question_ids = list(dict.fromkeys(_ANSWER_ROW_ID_RE.findall(data)))
+        response["questions_feedback"] = [
+            {
+                "question_id": question_id,
+                "evaluation_score": score(),
+                "feedback_comment": "Reasonable answer; could go deeper on trade-offs.",
+            }
+            for question_id in question_ids
+        ]
+    if '"summary"' in output_format:
+        response["summary"] = "The candidate showed solid fundamentals with room to grow."
+        response["strengths"] = ["Clear communication", "Relevant experience"]
+        response["weaknesses"] = ["Limited depth on system design"]
+    if '"confidence_score"' in output_format:
+        response["confidence_score"] = score()
+    return response
+
+
+def fake_completion(prompt: str, rng: random.Random) -> str:
+    return f"Synthetic completion for a {len(prompt)}-character prompt."
+
+
+def fake_resume(text: str, rng: random.Random) -> dict[str, Any]:
+    """A parse with every field of the resume schema."""
+    lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
+    email = _EMAIL_RE.search(text)
+    phone = _PHONE_RE.search(text)
+    years = _YEARS_RE.search(text)
+    lowered = text.lower()
+    skills = [
+        s for s in _KNOWN_SKILLS if re.search(rf"(?<!\w){re.escape(s.lower())}(?!\w)", lowered)
+    ] or ["Communication"]
+    name = lines[0] if lines and len(lines[0]) <= 60 else "Jane Doe"
+    return {
+        "name": name,
+        "email": email.group() if email else "candidate@example.com",
+        "phone": phone.group().strip() if phone else "",
+        "summary": " ".join(lines[1:3])[:300] if len(lines) > 1 else "",
+        "inferred_role": "Software Engineer",
+        "skills": skills,
+        "education": [
+            {
+                "degree": "BSc Computer Science",
+                "university": "State University",
+                "start_date": "2012",
+                "end_date": "2016",
+                "cgpa": None,
+                "certification": None,
+                "institution": "State University",
+                "date": "2016",
+            }
+        ],
+        "experience": [
+            {
+                "job_title": "Software Engineer",
+                "company": "Acme Corp",
+                "start_date": "2016",
+                "end_date": "Present",
+                "description": "Built and operated backend services.",
+            }
+        ],
+        "job_titles": ["Software Engineer"],
+        "years_of_experience": float(years.group(1)) if years else 3.0,
+        "confidence_score": round(rng.uniform(0.7, 0.95), 2),
+        "processing_time": 0.0,
+    }
+
+
+_RESPONDERS = {
+    "generate_questions": fake_questions,
+    "generate_feedback": fake_feedback,
+    "generate_completion": fake_completion,
+    "parse_resume": fake_resume,
+}
+
+
+# ------------------------------------------------------------------
+# Providers
+# ------------------------------------------------------------------
+
+
+class _FakeProviderBase:
+    """State and decisions shared by the sync and async fakes (no I/O)."""
+
+    def __init__(
+        self,
+        role: str = "primary",
+        profile: FakeProfile | None = None,
+        seed: int | None = None,
+        max_retries: int | None = None,
+    ) -> None:
+        self._role = role
+        self._profile = profile or FakeProfile.for_role(role)
+        self._rng = random.Random(seed if seed is not None else settings.LLM_FAKE_SEED)
+        self._rng_lock = threading.Lock()
+        self._max_retries = max_retries if max_retries is not None else settings.LLM_MAX_RETRIES
+        logger.info("fake_llm_provider_initialized", role=role, profile=self._profile)
+
+    @property
+    def provider_name(self) -> str:
+        return f"Fake{self._role.capitalize()}"
+
+    @property
+    def model_name(self) -> str:
+        return f"fake:{self._role}"
+
+    def _respond(self, method_name: str, arg: Any) -> tuple[Any, float | None]:
+        """Response for a call and, when known, its latency (None = sample one)."""
+        with self._rng_lock:
+            return _RESPONDERS[method_name](arg, self._rng), None
+
+    def _plan(self, latency: float | None) -> tuple[list[float], Exception | None]:
+        """Duration of each simulated HTTP attempt and the error the call ends with."""
+        profile = self._profile
+        with self._rng_lock:
+            delays: list[float] = []
+            for attempt in range(self._max_retries + 1):
+                if self._rng.random() < profile.rate_limit_rate:
+                    delays.append(_RATE_LIMIT_BACKOFF * 2**attempt)
+                    continue
+                if latency is None and profile.latency_median > 0:
+                    latency = self._rng.lognormvariate(
+                        math.log(profile.latency_median), profile.latency_sigma
+                    )
+                delays.append(latency or 0.0)
+                if self._rng.random() < profile.error_rate:
+                    return delays, FakeAPIError("500 Internal Server Error (injected)")
+                return delays, None
+        return delays, FakeRateLimitError("429 Too Many Requests (injected)")
+
+    def _finish(self, method_name: str, arg: Any, response: Any, error: Exception | None) -> Any:
+        if error is not None:
+            raise LLMProviderError(f"{self.provider_name} {method_name} failed: {error}") from error
+        prompt_chars = len(arg) if isinstance(arg, str) else sum(map(len, arg.values()))
+        note_usage(prompt_chars // 4, len(str(response)) // 4)
+        return response
+
+
+def _note_attempt() -> None:
+    """Count a finished simulated HTTP attempt the way the httpx event hooks would."""
+    stats = current_call()
+    if stats is None:
+        return
+    stats.attempts += 1
+    if stats.ttfb is None:
+        stats.ttfb = time.monotonic() - stats.started
+
+
+class FakeLLMProvider(_FakeProviderBase, ILLMProvider):
+    """Synchronous fake provider; blocks for the simulated latency."""
+
+    def _invoke(self, method_name: str, arg: Any) -> Any:
+        response, latency = self._respond(method_name, arg)
+        delays, error = self._plan(latency)
+        for delay in delays:
+            time.sleep(delay)
+            _note_attempt()
+        return self._finish(method_name, arg, response, error)
+
+    def generate_questions(self, prompts: dict[str, str]) -> list[dict[str, str] | str]:
+        return self._invoke("generate_questions", prompts)
+
+    def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        return self._invoke("generate_feedback", prompts)
+
+    def generate_completion(self, prompt: str) -> str:
+        return self._invoke("generate_completion", prompt)
+
+    def parse_resume(self, text: str) -> dict[str, Any]:
+        return self._invoke("parse_resume", text)
+
+    def _invoke_stream(
+        self, method_name: str, arg: Any, extract: Callable[[Any], list[Any]]
+    ) -> Iterator[Any]:
+        response, latency = self._respond(method_name, arg)
+        delays, error = self._plan(latency)
+        for delay in delays[:-1]:
+            time.sleep(delay)
+            _note_attempt()
+        items = extract(response) if error is None else []
+        step = delays[-1] / max(len(items), 1)
+        if not items:
+            time.sleep(step)
+            _note_attempt()
+        self._finish(method_name, arg, response, error)
+        for i, item in enumerate(items):
+            time.sleep(step)
+            if i == 0:
+                _note_attempt()
+            yield item
+
+    def stream_questions(self, prompts: dict[str, str]) -> Iterator[dict[str, str] | str]:
+        return self._invoke_stream("generate_questions", prompts, question_items)
+
+    def stream_feedback(self, prompts: dict[str, str]) -> Iterator[dict[str, Any]]:
+        return self._invoke_stream("generate_feedback", prompts, feedback_items)
+
+
+class AsyncFakeLLMProvider(_FakeProviderBase, IAsyncLLMProvider):
+    """Async fake provider; awaits the simulated latency."""
+
+    async def _invoke(self, method_name: str, arg: Any) -> Any:
+        response, latency = self._respond(method_name, arg)
+        delays, error = self._plan(latency)
+        for delay in delays:
+            await asyncio.sleep(delay)
+            _note_attempt()
+        return self._finish(method_name, arg, response, error)
+
+    async def generate_questions(self, prompts: dict[str, str]) -> list[dict[str, str] | str]:
+        return await self._invoke("generate_questions", prompts)
+
+    async def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        return await self._invoke("generate_feedback", prompts)
+
+    async def generate_completion(self, prompt: str) -> str:
+        return await self._invoke("generate_completion", prompt)
+
+    async def parse_resume(self, text: str) -> dict[str, Any]:
+        return await self._invoke("parse_resume", text)
+
+    async def _invoke_stream(
+        self, method_name: str, arg: Any, extract: Callable[[Any], list[Any]]
+    ) -> AsyncIterator[Any]:
+        response, latency = self._respond(method_name, arg)
+        delays, error = self._plan(latency)
+        for delay in delays[:-1]:
+            await asyncio.sleep(delay)
+            _note_attempt()
+        items = extract(response) if error is None else []
+        step = delays[-1] / max(len(items), 1)
+        if not items:
+            await asyncio.sleep(step)
+            _note_attempt()
+        self._finish(method_name, arg, response, error)
+        for i, item in enumerate(items):
+            await asyncio.sleep(step)
+            if i == 0:
+                _note_attempt()
+            yield item
+
+    def stream_questions(self, prompts: dict[str, str]) -> AsyncIterator[dict[str, str] | str]:
+        return self._invoke_stream("generate_questions", prompts, question_items)
+
+    def stream_feedback(self, prompts: dict[str, str]) -> AsyncIterator[dict[str, Any]]:
+        return self._invoke_stream("generate_feedback", prompts, feedback_items)
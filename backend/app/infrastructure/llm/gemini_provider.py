@@ -1,22 +1,51 @@
 """
 Gemini LLM provider — fallback provider implementing ILLMProvider.
 
-Wraps the ``google-genai`` SDK.  Gemini does not expose a native JSON mode
-so responses are cleaned of markdown fences before parsing.
+Wraps the ``google-genai`` SDK.  JSON calls request
+``response_mime_type="application/json"`` plus a response schema for the
+fixed-shape outputs (questions, resume parse); responses are still
+repaired and validated locally (``structured_output.py``), since fences,
+truncation and the like do occur.  ``stream_questions`` /
+``stream_feedback`` use ``generate_content_stream`` and yield each item as
+soon as it is complete.
+
+``AsyncGeminiProvider`` is the ``IAsyncLLMProvider`` twin that goes through
+the SDK's ``client.aio`` surface and shares prompts/parsing with the sync class.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
-import re
 import time
+from collections.abc import AsyncIterator, Callable, Iterator
 from typing import Any
 
 import structlog
 from google import genai
+from google.genai import types
+from pydantic import BaseModel
 
+from app.core import deadline
+from app.core.config import settings
 from app.domain.exceptions import LLMProviderError
-from app.domain.interfaces.llm_provider import ILLMProvider
+from app.domain.interfaces.llm_provider import IAsyncLLMProvider, ILLMProvider
+from app.infrastructure.llm.streaming_json import (
+    FEEDBACK_KEY,
+    QUESTIONS_KEY,
+    aiter_json_items,
+    feedback_items,
+    iter_json_items,
+    question_items,
+)
+from app.infrastructure.llm.structured_output import (
+    FeedbackPayload,
+    ParsedResume,
+    QuestionsPayload,
+    decode_json,
+    response_schema,
+)
+from app.infrastructure.llm.telemetry import note_usage
 
 logger = structlog.get_logger(__name__)
 
@@ -24,10 +53,99 @@ logger = structlog.get_logger(__name__)
 _RATE_LIMIT_RETRIES = 2
 _RATE_LIMIT_BACKOFF_BASE = 15  # seconds
 
+# Streams with a fixed item shape get a response schema too.
+_STREAM_SCHEMAS: dict[str, type[BaseModel]] = {QUESTIONS_KEY: QuestionsPayload}
+
+
+def _is_rate_limit(exc: Exception) -> bool:
+    exc_str = str(exc)
+    return "429" in exc_str or "RESOURCE_EXHAUSTED" in exc_str
+
+
+def _note_usage(response: Any) -> None:
+    """Report SDK token usage to the telemetry layer."""
+    usage = getattr(response, "usage_metadata", None)
+    if usage is None:
+        return
+    note_usage(
+        usage.prompt_token_count,
+        usage.candidates_token_count,
+        usage.cached_content_token_count,
+    )
+
+
+def _json_config(schema: type[BaseModel] | None) -> types.GenerateContentConfig | None:
+    """JSON output, constrained to *schema* when given (None when disabled)."""
+    if not settings.LLM_STRUCTURED_OUTPUT_ENABLED:
+        return None
+    return types.GenerateContentConfig(
+        response_mime_type="application/json",
+        response_json_schema=response_schema(schema) if schema is not None else None,
+    )
+
+
+def _user_contents(prompts: dict[str, str]) -> list[dict[str, Any]]:
+    """Gemini has no system role here — fold both prompts into one user turn."""
+    full_prompt = f"{prompts['system_prompt']}\n\n{prompts['user_prompt']}"
+    return [{"role": "user", "parts": [{"text": full_prompt}]}]
+
 
-def _clean_gemini_json(raw: str) -> str:
-    """Strip markdown code-fences that Gemini sometimes wraps around JSON."""
-    return re.sub(r"```(?:json)?|```", "", raw).strip()
+def _extract_questions(raw: str) -> list[dict[str, str] | str]:
+    """Decode a (possibly fenced) questions payload into question items."""
+    if not raw:
+        raise ValueError("Gemini response is empty")
+    return question_items(
+        decode_json(raw, QuestionsPayload, provider="gemini", method="generate_questions")
+    )
+
+
+def _stream_text(chunks: Any) -> Iterator[str]:
+    """Text of streamed response chunks; the last chunk carries the final usage."""
+    last = None
+    for chunk in chunks:
+        last = chunk
+        if chunk.text:
+            yield chunk.text
+    if last is not None:
+        _note_usage(last)
+
+
+async def _astream_text(chunks: Any) -> AsyncIterator[str]:
+    last = None
+    async for chunk in chunks:
+        last = chunk
+        if chunk.text:
+            yield chunk.text
+    if last is not None:
+        _note_usage(last)
+
+
+def _resume_prompt(text: str) -> str:
+    return (
+        "You are a professional resume parser. Extract structured resume data "
+        "from the provided raw text.\n"
+        "Return ONLY valid JSON with exactly the following fields:\n"
+        "- name (string)\n"
+        "- email (string)\n"
+        "- phone (string)\n"
+        "- summary (string)\n"
+        "- inferred_role (string) – if not explicitly stated, infer from summary\n"
+        "- skills (array of strings)\n"
+        "- education (array of objects: degree, university, start_date, end_date, "
+        "cgpa, certification, institution, date)\n"
+        "- experience (array of objects: job_title, company, start_date, end_date, "
+        "description)\n"
+        "- job_titles (array of strings)\n"
+        "- years_of_experience (float)\n"
+        "- confidence_score (float 0.0–1.0)\n"
+        "- processing_time (float in seconds)\n\n"
+        "INSTRUCTIONS:\n"
+        "• If a field is missing, use null or an empty array ([]).\n"
+        "• Do not include any explanations, markdown, or extra formatting.\n"
+        "• Return ONLY valid parsable JSON.\n"
+        "• Use your best judgment to summarize and infer fields if not explicitly written.\n\n"
+        f"TEXT:\n{text}"
+    )
 
 
 class GeminiProvider(ILLMProvider):
@@ -37,13 +155,18 @@ class GeminiProvider(ILLMProvider):
         self,
         api_key: str,
         model: str = "gemini-2.0-flash",
+        http_options: types.HttpOptions | None = None,
     ) -> None:
         if not api_key:
             raise ValueError("GEMINI_API_KEY is required for GeminiProvider")
         self._model = model
-        self._client = genai.Client(api_key=api_key)
+        self._client = genai.Client(api_key=api_key, http_options=http_options)
         logger.info("gemini_provider_initialized", model=model)
 
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._client.close()
+
     # ------------------------------------------------------------------
     # Retry wrapper for rate-limited requests
     # ------------------------------------------------------------------
@@ -53,12 +176,12 @@ class GeminiProvider(ILLMProvider):
         last_exc: Exception | None = None
         for attempt in range(1, _RATE_LIMIT_RETRIES + 2):
             try:
-                return self._client.models.generate_content(**generate_kwargs)
+                response = self._client.models.generate_content(**generate_kwargs)
+                _note_usage(response)
+                return response
             except Exception as exc:
-                exc_str = str(exc)
-                is_rate_limit = "429" in exc_str or "RESOURCE_EXHAUSTED" in exc_str
-                if is_rate_limit and attempt <= _RATE_LIMIT_RETRIES:
-                    wait = _RATE_LIMIT_BACKOFF_BASE * attempt
+                wait = _RATE_LIMIT_BACKOFF_BASE * attempt
+                if _is_rate_limit(exc) and attempt <= _RATE_LIMIT_RETRIES and deadline.allows(wait):
                     logger.warning(
                         "gemini_rate_limit_retry",
                         method=method_name,
@@ -79,6 +202,10 @@ class GeminiProvider(ILLMProvider):
     def provider_name(self) -> str:
         return "Gemini"
 
+    @property
+    def model_name(self) -> str:
+        return f"gemini:{self._model}"
+
     def generate_questions(self, prompts: dict[str, str]) -> list[dict[str, str] | str]:
         """
         Generate interview questions using Gemini.
@@ -88,29 +215,13 @@ class GeminiProvider(ILLMProvider):
         Falls back to plain strings if LLM returns unstructured items.
         """
         try:
-            full_prompt = f"{prompts['system_prompt']}\n\n{prompts['user_prompt']}"
             response = self._call_with_rate_limit_retry(
                 "generate_questions",
                 model=self._model,
-                contents=[{"role": "user", "parts": [{"text": full_prompt}]}],
+                contents=_user_contents(prompts),
+                config=_json_config(QuestionsPayload),
             )
-            raw = (response.text or "").strip()
-            if not raw:
-                raise ValueError("Gemini response is empty")
-
-            cleaned = _clean_gemini_json(raw)
-            data = json.loads(cleaned)
-
-            questions_list = data if isinstance(data, list) else data.get("questions", [])
-
-            results: list[dict[str, str] | str] = []
-            for item in questions_list:
-                if isinstance(item, dict) and "question" in item:
-                    results.append(item)  # preserve type/difficulty metadata
-                elif isinstance(item, str):
-                    results.append(item)
-                else:
-                    logger.warning("unexpected_question_item", item=repr(item))
+            results = _extract_questions((response.text or "").strip())
 
             logger.info("gemini_questions_generated", count=len(results), model=self._model)
             return results
@@ -125,18 +236,19 @@ class GeminiProvider(ILLMProvider):
     def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
         """Generate interview feedback/evaluation."""
         try:
-            full_prompt = f"{prompts['system_prompt']}\n\n{prompts['user_prompt']}"
             response = self._call_with_rate_limit_retry(
                 "generate_feedback",
                 model=self._model,
-                contents=[{"role": "user", "parts": [{"text": full_prompt}]}],
+                contents=_user_contents(prompts),
+                config=_json_config(None),
             )
             raw = (response.text or "").strip()
             if not raw:
                 raise ValueError("Gemini response is empty")
 
-            cleaned = _clean_gemini_json(raw)
-            result = json.loads(cleaned)
+            result = decode_json(
+                raw, FeedbackPayload, provider="gemini", method="generate_feedback"
+            )
             logger.info("gemini_feedback_generated", model=self._model)
             return result
 
@@ -165,41 +277,201 @@ class GeminiProvider(ILLMProvider):
 
     def parse_resume(self, text: str) -> dict[str, Any]:
         """Parse raw resume text into structured data."""
-        prompt = (
-            "You are a professional resume parser. Extract structured resume data "
-            "from the provided raw text.\n"
-            "Return ONLY valid JSON with exactly the following fields:\n"
-            "- name (string)\n"
-            "- email (string)\n"
-            "- phone (string)\n"
-            "- summary (string)\n"
-            "- inferred_role (string) – if not explicitly stated, infer from summary\n"
-            "- skills (array of strings)\n"
-            "- education (array of objects: degree, university, start_date, end_date, "
-            "cgpa, certification, institution, date)\n"
-            "- experience (array of objects: job_title, company, start_date, end_date, "
-            "description)\n"
-            "- job_titles (array of strings)\n"
-            "- years_of_experience (float)\n"
-            "- confidence_score (float 0.0–1.0)\n"
-            "- processing_time (float in seconds)\n\n"
-            "INSTRUCTIONS:\n"
-            "• If a field is missing, use null or an empty array ([]).\n"
-            "• Do not include any explanations, markdown, or extra formatting.\n"
-            "• Return ONLY valid parsable JSON.\n"
-            "• Use your best judgment to summarize and infer fields if not explicitly written.\n\n"
-            f"TEXT:\n{text}"
-        )
+        prompt = _resume_prompt(text)
 
         try:
             response = self._call_with_rate_limit_retry(
                 "parse_resume",
                 model=self._model,
                 contents=[prompt],
+                config=_json_config(ParsedResume),
+            )
+            raw = (response.text or "").strip()
+            result = decode_json(raw, ParsedResume, provider="gemini", method="parse_resume")
+            logger.info("gemini_resume_parsed", model=self._model)
+            return result
+
+        except json.JSONDecodeError as exc:
+            logger.error("gemini_json_error", method="parse_resume", error=str(exc))
+            raise LLMProviderError(f"Gemini JSON decode error: {exc}") from exc
+        except Exception as exc:
+            logger.error("gemini_error", method="parse_resume", error=str(exc))
+            raise LLMProviderError(f"Gemini parse_resume failed: {exc}") from exc
+
+    def _stream_items(
+        self,
+        method_name: str,
+        prompts: dict[str, str],
+        items_key: str,
+        extract: Callable[[Any], list[Any]],
+    ) -> Iterator[Any]:
+        """Stream a completion, yielding items as each one closes."""
+        try:
+            chunks = self._client.models.generate_content_stream(
+                model=self._model,
+                contents=_user_contents(prompts),
+                config=_json_config(_STREAM_SCHEMAS.get(items_key)),
+            )
+            count = 0
+            for item in iter_json_items(_stream_text(chunks), items_key, extract):
+                count += 1
+                yield item
+            logger.info(
+                "gemini_stream_completed", method=method_name, items=count, model=self._model
+            )
+
+        except json.JSONDecodeError as exc:
+            logger.error("gemini_json_error", method=method_name, error=str(exc))
+            raise LLMProviderError(f"Gemini JSON decode error: {exc}") from exc
+        except Exception as exc:
+            logger.error("gemini_error", method=method_name, error=str(exc))
+            raise LLMProviderError(f"Gemini {method_name} failed: {exc}") from exc
+
+    def stream_questions(self, prompts: dict[str, str]) -> Iterator[dict[str, str] | str]:
+        """Yield each generated question as soon as it is complete."""
+        return self._stream_items("stream_questions", prompts, QUESTIONS_KEY, question_items)
+
+    def stream_feedback(self, prompts: dict[str, str]) -> Iterator[dict[str, Any]]:
+        """Yield each ``questions_feedback`` entry as soon as it is complete."""
+        return self._stream_items("stream_feedback", prompts, FEEDBACK_KEY, feedback_items)
+
+
+class AsyncGeminiProvider(IAsyncLLMProvider):
+    """Concrete IAsyncLLMProvider backed by Gemini's ``client.aio`` API.
+
+    Rate-limit back-off uses ``asyncio.sleep`` so a 429 stall does not
+    block the event loop or a worker thread.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gemini-2.0-flash",
+        http_options: types.HttpOptions | None = None,
+    ) -> None:
+        if not api_key:
+            raise ValueError("GEMINI_API_KEY is required for AsyncGeminiProvider")
+        self._model = model
+        self._client = genai.Client(api_key=api_key, http_options=http_options)
+        logger.info("gemini_async_provider_initialized", model=model)
+
+    async def aclose(self) -> None:
+        """Close the underlying async HTTP connection pool."""
+        await self._client.aio.aclose()
+
+    # ------------------------------------------------------------------
+    # Retry wrapper for rate-limited requests
+    # ------------------------------------------------------------------
+
+    async def _call_with_rate_limit_retry(self, method_name: str, **generate_kwargs) -> Any:
+        """Await generate_content with retry on 429 RESOURCE_EXHAUSTED."""
+        last_exc: Exception | None = None
+        for attempt in range(1, _RATE_LIMIT_RETRIES + 2):
+            try:
+                response = await self._client.aio.models.generate_content(**generate_kwargs)
+                _note_usage(response)
+                return response
+            except Exception as exc:
+                wait = _RATE_LIMIT_BACKOFF_BASE * attempt
+                if _is_rate_limit(exc) and attempt <= _RATE_LIMIT_RETRIES and deadline.allows(wait):
+                    logger.warning(
+                        "gemini_rate_limit_retry",
+                        method=method_name,
+                        attempt=attempt,
+                        wait_seconds=wait,
+                    )
+                    await asyncio.sleep(wait)
+                    last_exc = exc
+                else:
+                    raise
+        raise last_exc  # type: ignore[misc]
+
+    # ------------------------------------------------------------------
+    # IAsyncLLMProvider interface
+    # ------------------------------------------------------------------
+
+    @property
+    def provider_name(self) -> str:
+        return "Gemini"
+
+    @property
+    def model_name(self) -> str:
+        return f"gemini:{self._model}"
+
+    async def generate_questions(self, prompts: dict[str, str]) -> list[dict[str, str] | str]:
+        """Generate interview questions using Gemini."""
+        try:
+            response = await self._call_with_rate_limit_retry(
+                "generate_questions",
+                model=self._model,
+                contents=_user_contents(prompts),
+                config=_json_config(QuestionsPayload),
+            )
+            results = _extract_questions((response.text or "").strip())
+
+            logger.info("gemini_questions_generated", count=len(results), model=self._model)
+            return results
+
+        except json.JSONDecodeError as exc:
+            logger.error("gemini_json_error", method="generate_questions", error=str(exc))
+            raise LLMProviderError(f"Gemini JSON decode error: {exc}") from exc
+        except Exception as exc:
+            logger.error("gemini_error", method="generate_questions", error=str(exc))
+            raise LLMProviderError(f"Gemini generate_questions failed: {exc}") from exc
+
+    async def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        """Generate interview feedback/evaluation."""
+        try:
+            response = await self._call_with_rate_limit_retry(
+                "generate_feedback",
+                model=self._model,
+                contents=_user_contents(prompts),
+                config=_json_config(None),
+            )
+            raw = (response.text or "").strip()
+            if not raw:
+                raise ValueError("Gemini response is empty")
+
+            result = decode_json(
+                raw, FeedbackPayload, provider="gemini", method="generate_feedback"
+            )
+            logger.info("gemini_feedback_generated", model=self._model)
+            return result
+
+        except json.JSONDecodeError as exc:
+            logger.error("gemini_json_error", method="generate_feedback", error=str(exc))
+            raise LLMProviderError(f"Gemini JSON decode error: {exc}") from exc
+        except Exception as exc:
+            logger.error("gemini_error", method="generate_feedback", error=str(exc))
+            raise LLMProviderError(f"Gemini generate_feedback failed: {exc}") from exc
+
+    async def generate_completion(self, prompt: str) -> str:
+        """Generate a free-form text completion."""
+        try:
+            response = await self._call_with_rate_limit_retry(
+                "generate_completion",
+                model=self._model,
+                contents=[prompt],
+            )
+            text = (response.text or "").strip()
+            logger.info("gemini_completion_generated", model=self._model)
+            return text
+
+        except Exception as exc:
+            logger.error("gemini_error", method="generate_completion", error=str(exc))
+            raise LLMProviderError(f"Gemini generate_completion failed: {exc}") from exc
+
+    async def parse_resume(self, text: str) -> dict[str, Any]:
+        """Parse raw resume text into structured data."""
+        try:
+            response = await self._call_with_rate_limit_retry(
+                "parse_resume",
+                model=self._model,
+                contents=[_resume_prompt(text)],
+                config=_json_config(ParsedResume),
             )
             raw = (response.text or "").strip()
-            cleaned = _clean_gemini_json(raw)
-            result = json.loads(cleaned)
+            result = decode_json(raw, ParsedResume, provider="gemini", method="parse_resume")
             logger.info("gemini_resume_parsed", model=self._model)
             return result
 
@@ -209,3 +481,40 @@ class GeminiProvider(ILLMProvider):
         except Exception as exc:
             logger.error("gemini_error", method="parse_resume", error=str(exc))
             raise LLMProviderError(f"Gemini parse_resume failed: {exc}") from exc
+
+    async def _stream_items(
+        self,
+        method_name: str,
+        prompts: dict[str, str],
+        items_key: str,
+        extract: Callable[[Any], list[Any]],
+    ) -> AsyncIterator[Any]:
+        """Stream a completion, yielding items as each one closes."""
+        try:
+            chunks = await self._client.aio.models.generate_content_stream(
+                model=self._model,
+                contents=_user_contents(prompts),
+                config=_json_config(_STREAM_SCHEMAS.get(items_key)),
+            )
+            count = 0
+            async for item in aiter_json_items(_astream_text(chunks), items_key, extract):
+                count += 1
+                yield item
+            logger.info(
+                "gemini_stream_completed", method=method_name, items=count, model=self._model
+            )
+
+        except json.JSONDecodeError as exc:
+            logger.error("gemini_json_error", method=method_name, error=str(exc))
+            raise LLMProviderError(f"Gemini JSON decode error: {exc}") from exc
+        except Exception as exc:
+            logger.error("gemini_error", method=method_name, error=str(exc))
+            raise LLMProviderError(f"Gemini {method_name} failed: {exc}") from exc
+
+    def stream_questions(self, prompts: dict[str, str]) -> AsyncIterator[dict[str, str] | str]:
+        """Yield each generated question as soon as it is complete."""
+        return self._stream_items("stream_questions", prompts, QUESTIONS_KEY, question_items)
+
+    def stream_feedback(self, prompts: dict[str, str]) -> AsyncIterator[dict[str, Any]]:
+        """Yield each ``questions_feedback`` entry as soon as it is complete."""
+        return self._stream_items("stream_feedback", prompts, FEEDBACK_KEY, feedback_items)
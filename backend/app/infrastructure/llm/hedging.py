@@ -0,0 +1,247 @@
+"""
+Hedged requests for the fallback composites.
+
+Instead of waiting for the primary to *fail* (which, with the OpenAI
+timeout-retry loop, can take several minutes), a hedged call fires the same
+request at the fallback once the primary has been outstanding for longer
+than its recent p95 latency for that method.  Whichever provider returns a
+valid response first wins and the other is cancelled.
+
+``LatencyTracker`` learns the per-method hedge delay from a sliding window
+of primary latencies.  Until ``min_samples`` observations exist it uses
+``default_delay``.  Only the primary's own successful completions are
+recorded — a fallback win says nothing about the primary.  A sync primary
+that loses still finishes in the background and is recorded then; a
+cancelled async primary is not recorded.
+
+Cancellation semantics:
+
+* async — the losing task is cancelled, which aborts its in-flight HTTP
+  request.
+* sync  — Python threads cannot be interrupted, so the losing call is
+  abandoned: it finishes in the background and its result is discarded.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import math
+import threading
+import time
+from collections import defaultdict, deque
+from collections.abc import Awaitable, Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+import structlog
+
+from app.domain.exceptions import LLMProviderError
+from app.infrastructure.llm.telemetry import fallback_total
+
+logger = structlog.get_logger(__name__)
+
+
+class LatencyTracker:
+    """Sliding window of primary-provider latencies per method (thread-safe)."""
+
+    def __init__(
+        self,
+        default_delay: float,
+        percentile: float = 0.95,
+        window: int = 200,
+        min_samples: int = 20,
+        min_delay: float = 0.5,
+    ) -> None:
+        self._default_delay = default_delay
+        self._percentile = percentile
+        self._min_samples = min_samples
+        self._min_delay = min_delay
+        self._samples: dict[str, deque[float]] = defaultdict(lambda: deque(maxlen=window))
+        self._lock = threading.Lock()
+
+    def record(self, method: str, seconds: float) -> None:
+        with self._lock:
+            self._samples[method].append(seconds)
+
+    def delay(self, method: str) -> float:
+        """Seconds to wait on the primary before hedging *method*."""
+        with self._lock:
+            samples = sorted(self._samples[method])
+        if len(samples) < self._min_samples:
+            return self._default_delay
+        idx = max(math.ceil(self._percentile * len(samples)) - 1, 0)
+        return max(samples[idx], self._min_delay)
+
+
+# ------------------------------------------------------------------
+# Sync — thread-based
+# ------------------------------------------------------------------
+
+
+def hedged_call(
+    executor: ThreadPoolExecutor,
+    tracker: LatencyTracker,
+    method: str,
+    primary: Callable[[], Any],
+    fallback: Callable[[], Any],
+    *,
+    primary_name: str,
+    fallback_name: str,
+) -> Any:
+    """Run *primary*; start *fallback* after the hedge delay or on primary failure."""
+    start = time.monotonic()
+    # Each leg runs in a copy of the caller's context so per-call telemetry
+    # (and other context variables) follow it onto the worker thread.
+    primary_fut = executor.submit(contextvars.copy_context().run, primary)
+    done, _ = wait([primary_fut], timeout=tracker.delay(method))
+
+    if done:
+        try:
+            result = primary_fut.result()
+        except LLMProviderError as exc:
+            logger.warning(
+                "primary_provider_failed",
+                provider=primary_name,
+                method=method,
+                error=str(exc),
+                fallback=fallback_name,
+            )
+            fallback_total.inc(method=method, fallback=fallback_name, reason="error")
+            return _run_fallback(fallback, method, fallback_name)
+        tracker.record(method, time.monotonic() - start)
+        return result
+
+    logger.info(
+        "llm_hedge_fired",
+        method=method,
+        primary=primary_name,
+        fallback=fallback_name,
+        after_seconds=round(time.monotonic() - start, 3),
+    )
+    fallback_fut = executor.submit(contextvars.copy_context().run, fallback)
+    names: dict[Future, str] = {primary_fut: primary_name, fallback_fut: fallback_name}
+    pending = {primary_fut, fallback_fut}
+    last_exc: BaseException | None = None
+
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for fut in done:
+            exc = fut.exception()
+            if exc is not None:
+                last_exc = exc
+                logger.warning(
+                    "llm_hedge_leg_failed", method=method, provider=names[fut], error=str(exc)
+                )
+                continue
+            if fut is primary_fut:
+                tracker.record(method, time.monotonic() - start)
+            else:
+                primary_fut.add_done_callback(
+                    lambda leg: _record_late_primary(tracker, method, start, leg)
+                )
+            for loser in pending:
+                loser.cancel()  # no-op once running; the thread finishes in the background
+            logger.info("llm_hedge_won", method=method, provider=names[fut])
+            if fut is fallback_fut:
+                fallback_total.inc(method=method, fallback=fallback_name, reason="hedge")
+            return fut.result()
+
+    logger.error("fallback_provider_failed", provider=fallback_name, method=method)
+    assert last_exc is not None
+    raise last_exc
+
+
+def _record_late_primary(tracker: LatencyTracker, method: str, start: float, leg: Future) -> None:
+    # Runs when the abandoned primary finishes (immediately if it already has).
+    if not leg.cancelled() and leg.exception() is None:
+        tracker.record(method, time.monotonic() - start)
+
+
+def _run_fallback(fallback: Callable[[], Any], method: str, fallback_name: str) -> Any:
+    try:
+        return fallback()
+    except LLMProviderError:
+        logger.error("fallback_provider_failed", provider=fallback_name, method=method)
+        raise
+
+
+# ------------------------------------------------------------------
+# Async — task-based
+# ------------------------------------------------------------------
+
+
+async def ahedged_call(
+    tracker: LatencyTracker,
+    method: str,
+    primary: Callable[[], Awaitable[Any]],
+    fallback: Callable[[], Awaitable[Any]],
+    *,
+    primary_name: str,
+    fallback_name: str,
+) -> Any:
+    """Async ``hedged_call``: the losing task is cancelled."""
+    start = time.monotonic()
+    primary_task = asyncio.ensure_future(primary())
+    tasks: list[asyncio.Future[Any]] = [primary_task]
+    try:
+        done, _ = await asyncio.wait({primary_task}, timeout=tracker.delay(method))
+
+        if done:
+            try:
+                result = primary_task.result()
+            except LLMProviderError as exc:
+                logger.warning(
+                    "primary_provider_failed",
+                    provider=primary_name,
+                    method=method,
+                    error=str(exc),
+                    fallback=fallback_name,
+                )
+                fallback_total.inc(method=method, fallback=fallback_name, reason="error")
+                try:
+                    return await fallback()
+                except LLMProviderError:
+                    logger.error("fallback_provider_failed", provider=fallback_name, method=method)
+                    raise
+            tracker.record(method, time.monotonic() - start)
+            return result
+
+        logger.info(
+            "llm_hedge_fired",
+            method=method,
+            primary=primary_name,
+            fallback=fallback_name,
+            after_seconds=round(time.monotonic() - start, 3),
+        )
+        fallback_task = asyncio.ensure_future(fallback())
+        tasks.append(fallback_task)
+        names = {primary_task: primary_name, fallback_task: fallback_name}
+        pending: set[asyncio.Future[Any]] = {primary_task, fallback_task}
+        last_exc: BaseException | None = None
+
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                exc = task.exception()
+                if exc is not None:
+                    last_exc = exc
+                    logger.warning(
+                        "llm_hedge_leg_failed", method=method, provider=names[task], error=str(exc)
+                    )
+                    continue
+                if task is primary_task:
+                    tracker.record(method, time.monotonic() - start)
+                logger.info("llm_hedge_won", method=method, provider=names[task])
+                if task is fallback_task:
+                    fallback_total.inc(method=method, fallback=fallback_name, reason="hedge")
+                return task.result()
+
+        logger.error("fallback_provider_failed", provider=fallback_name, method=method)
+        assert last_exc is not None
+        raise last_exc
+    finally:
+        # Cancel the losing leg — and both legs if we are cancelled ourselves.
+        for task in tasks:
+            if not task.done():
+                task.cancel()
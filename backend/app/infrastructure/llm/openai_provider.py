@@ -1,21 +1,51 @@
 """
 OpenAI LLM provider — primary provider implementing ILLMProvider.
 
-Uses the OpenAI Python SDK with ``response_format={"type":"json_object"}``
-for structured JSON output (no markdown fence cleaning needed).
+Uses the OpenAI Python SDK with a ``json_schema`` response format for the
+fixed-shape outputs (questions, resume parse) and JSON mode for feedback;
+responses are repaired and validated locally (``structured_output.py``).
+
+``AsyncOpenAIProvider`` is the ``IAsyncLLMProvider`` twin backed by
+``AsyncOpenAI``; it shares prompts and response parsing with the sync class.
+
+``stream_questions`` / ``stream_feedback`` request a streamed completion
+and yield each question / feedback entry as soon as it is complete (see
+``streaming_json.py``).
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import time
+from collections.abc import AsyncIterator, Callable, Iterator
 from typing import Any
 
+import httpx
 import structlog
-from openai import APIError, APITimeoutError, OpenAI, RateLimitError
+from openai import APIError, APITimeoutError, AsyncOpenAI, OpenAI, RateLimitError
+from pydantic import BaseModel
 
+from app.core import deadline
+from app.core.config import settings
 from app.domain.exceptions import LLMProviderError
-from app.domain.interfaces.llm_provider import ILLMProvider
+from app.domain.interfaces.llm_provider import IAsyncLLMProvider, ILLMProvider
+from app.infrastructure.llm.streaming_json import (
+    FEEDBACK_KEY,
+    QUESTIONS_KEY,
+    aiter_json_items,
+    feedback_items,
+    iter_json_items,
+    question_items,
+)
+from app.infrastructure.llm.structured_output import (
+    FeedbackPayload,
+    ParsedResume,
+    QuestionsPayload,
+    decode_json,
+    openai_response_format,
+)
+from app.infrastructure.llm.telemetry import note_usage
 
 logger = structlog.get_logger(__name__)
 
@@ -23,6 +53,78 @@ logger = structlog.get_logger(__name__)
 _TIMEOUT_RETRIES = 2
 _TIMEOUT_BACKOFF_BASE = 5  # seconds
 
+# Streams with a fixed item shape get a response schema too.
+_STREAM_SCHEMAS: dict[str, type[BaseModel]] = {QUESTIONS_KEY: QuestionsPayload}
+
+_RESUME_SYSTEM_PROMPT = (
+    "You are a professional resume parser. Extract structured data from the "
+    "provided resume text. Return ONLY valid JSON with these fields:\n"
+    "- name (string)\n"
+    "- email (string)\n"
+    "- phone (string)\n"
+    "- summary (string)\n"
+    "- inferred_role (string) — infer from content if not explicit\n"
+    "- skills (array of strings)\n"
+    "- education (array of objects: degree, university, start_date, end_date, cgpa, "
+    "certification, institution, date)\n"
+    "- experience (array of objects: job_title, company, start_date, end_date, description)\n"
+    "- job_titles (array of strings)\n"
+    "- years_of_experience (float)\n"
+    "- confidence_score (float 0.0–1.0)\n"
+    "- processing_time (float in seconds)\n\n"
+    "If a field is missing, use null or empty array."
+)
+
+
+def _chat_messages(prompts: dict[str, str]) -> list[dict[str, str]]:
+    """Build the system + user message pair from a ``prompts`` dict."""
+    return [
+        {"role": "system", "content": prompts["system_prompt"]},
+        {"role": "user", "content": prompts["user_prompt"]},
+    ]
+
+
+def _note_usage(response: Any) -> None:
+    """Report SDK token usage to the telemetry layer."""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return
+    details = getattr(usage, "prompt_tokens_details", None)
+    note_usage(
+        usage.prompt_tokens,
+        usage.completion_tokens,
+        getattr(details, "cached_tokens", 0) if details is not None else 0,
+    )
+
+
+def _response_format(schema: type[BaseModel] | None) -> dict[str, Any]:
+    """Schema-constrained output for fixed shapes; JSON mode otherwise."""
+    if schema is not None and settings.LLM_STRUCTURED_OUTPUT_ENABLED:
+        return openai_response_format(schema)
+    return {"type": "json_object"}
+
+
+def _extract_questions(raw: str) -> list[dict[str, str] | str]:
+    """Decode a questions payload, accepting ``{"questions": [...]}`` or ``[...]``."""
+    return question_items(
+        decode_json(raw, QuestionsPayload, provider="openai", method="generate_questions")
+    )
+
+
+def _stream_text(stream: Any) -> Iterator[str]:
+    """Content deltas of a streamed chat completion; usage arrives on the last chunk."""
+    for chunk in stream:
+        _note_usage(chunk)
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
+
+
+async def _astream_text(stream: Any) -> AsyncIterator[str]:
+    async for chunk in stream:
+        _note_usage(chunk)
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
+
 
 class OpenAIProvider(ILLMProvider):
     """Concrete ILLMProvider backed by the OpenAI API."""
@@ -33,17 +135,24 @@ class OpenAIProvider(ILLMProvider):
         model: str = "gpt-5-2025-08-07",
         timeout: int = 180,
         max_retries: int = 3,
+        http_client: httpx.Client | None = None,
     ) -> None:
         if not api_key:
             raise ValueError("OPENAI_API_KEY is required for OpenAIProvider")
         self._model = model
+        self._timeout = timeout
         self._client = OpenAI(
             api_key=api_key,
             timeout=timeout,
             max_retries=max_retries,
+            http_client=http_client,
         )
         logger.info("openai_provider_initialized", model=model, timeout=timeout)
 
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._client.close()
+
     # ------------------------------------------------------------------
     # Retry wrapper for timeout-prone GPT-5 calls
     # ------------------------------------------------------------------
@@ -52,12 +161,16 @@ class OpenAIProvider(ILLMProvider):
         """Call chat.completions.create with retry on APITimeoutError."""
         last_exc: Exception | None = None
         for attempt in range(1, _TIMEOUT_RETRIES + 2):  # 1-based, total = retries+1
+            if deadline.remaining() is not None:
+                create_kwargs["timeout"] = deadline.cap_timeout(self._timeout)
             try:
-                return self._client.chat.completions.create(**create_kwargs)
+                response = self._client.chat.completions.create(**create_kwargs)
+                _note_usage(response)
+                return response
             except APITimeoutError as exc:
                 last_exc = exc
-                if attempt <= _TIMEOUT_RETRIES:
-                    wait = _TIMEOUT_BACKOFF_BASE * attempt
+                wait = _TIMEOUT_BACKOFF_BASE * attempt
+                if attempt <= _TIMEOUT_RETRIES and deadline.allows(wait):
                     logger.warning(
                         "openai_timeout_retry",
                         method=method_name,
@@ -77,6 +190,10 @@ class OpenAIProvider(ILLMProvider):
     def provider_name(self) -> str:
         return "OpenAI"
 
+    @property
+    def model_name(self) -> str:
+        return f"openai:{self._model}"
+
     def generate_questions(self, prompts: dict[str, str]) -> list[dict[str, str] | str]:
         """
         Generate interview questions using OpenAI JSON mode.
@@ -89,26 +206,11 @@ class OpenAIProvider(ILLMProvider):
             response = self._call_with_timeout_retry(
                 "generate_questions",
                 model=self._model,
-                response_format={"type": "json_object"},
-                messages=[
-                    {"role": "system", "content": prompts["system_prompt"]},
-                    {"role": "user", "content": prompts["user_prompt"]},
-                ],
+                response_format=_response_format(QuestionsPayload),
+                messages=_chat_messages(prompts),
             )
             raw = response.choices[0].message.content or ""
-            data = json.loads(raw)
-
-            # Accept both {"questions": [...]} and top-level [...]
-            questions_list = data if isinstance(data, list) else data.get("questions", [])
-
-            results: list[dict[str, str] | str] = []
-            for item in questions_list:
-                if isinstance(item, dict) and "question" in item:
-                    results.append(item)  # preserve type/difficulty metadata
-                elif isinstance(item, str):
-                    results.append(item)
-                else:
-                    logger.warning("unexpected_question_item", item=repr(item))
+            results = _extract_questions(raw)
 
             logger.info("openai_questions_generated", count=len(results), model=self._model)
             return results
@@ -131,14 +233,13 @@ class OpenAIProvider(ILLMProvider):
             response = self._call_with_timeout_retry(
                 "generate_feedback",
                 model=self._model,
-                response_format={"type": "json_object"},
-                messages=[
-                    {"role": "system", "content": prompts["system_prompt"]},
-                    {"role": "user", "content": prompts["user_prompt"]},
-                ],
+                response_format=_response_format(None),
+                messages=_chat_messages(prompts),
             )
             raw = response.choices[0].message.content or ""
-            result = json.loads(raw)
+            result = decode_json(
+                raw, FeedbackPayload, provider="openai", method="generate_feedback"
+            )
             logger.info("openai_feedback_generated", model=self._model)
             return result
 
@@ -177,36 +278,232 @@ class OpenAIProvider(ILLMProvider):
         """
         Parse raw resume text into structured data using OpenAI JSON mode.
         """
-        system_prompt = (
-            "You are a professional resume parser. Extract structured data from the "
-            "provided resume text. Return ONLY valid JSON with these fields:\n"
-            "- name (string)\n"
-            "- email (string)\n"
-            "- phone (string)\n"
-            "- summary (string)\n"
-            "- inferred_role (string) — infer from content if not explicit\n"
-            "- skills (array of strings)\n"
-            "- education (array of objects: degree, university, start_date, end_date, cgpa, "
-            "certification, institution, date)\n"
-            "- experience (array of objects: job_title, company, start_date, end_date, description)\n"
-            "- job_titles (array of strings)\n"
-            "- years_of_experience (float)\n"
-            "- confidence_score (float 0.0–1.0)\n"
-            "- processing_time (float in seconds)\n\n"
-            "If a field is missing, use null or empty array."
-        )
         try:
             response = self._call_with_timeout_retry(
                 "parse_resume",
                 model=self._model,
-                response_format={"type": "json_object"},
+                response_format=_response_format(ParsedResume),
+                messages=[
+                    {"role": "system", "content": _RESUME_SYSTEM_PROMPT},
+                    {"role": "user", "content": f"RESUME TEXT:\n{text}"},
+                ],
+            )
+            raw = response.choices[0].message.content or ""
+            result = decode_json(raw, ParsedResume, provider="openai", method="parse_resume")
+            logger.info("openai_resume_parsed", model=self._model)
+            return result
+
+        except (APIError, APITimeoutError, RateLimitError) as exc:
+            logger.error("openai_api_error", method="parse_resume", error=str(exc))
+            raise LLMProviderError(f"OpenAI parse_resume failed: {exc}") from exc
+        except json.JSONDecodeError as exc:
+            logger.error("openai_json_error", method="parse_resume", error=str(exc))
+            raise LLMProviderError(f"OpenAI JSON decode error: {exc}") from exc
+        except Exception as exc:
+            logger.error("openai_unexpected_error", method="parse_resume", error=str(exc))
+            raise LLMProviderError(f"OpenAI parse_resume unexpected error: {exc}") from exc
+
+    def _stream_items(
+        self,
+        method_name: str,
+        prompts: dict[str, str],
+        items_key: str,
+        extract: Callable[[Any], list[Any]],
+    ) -> Iterator[Any]:
+        """Stream a JSON-mode completion, yielding items as each one closes."""
+        try:
+            stream = self._call_with_timeout_retry(
+                method_name,
+                model=self._model,
+                response_format=_response_format(_STREAM_SCHEMAS.get(items_key)),
+                messages=_chat_messages(prompts),
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+            count = 0
+            with stream:
+                for item in iter_json_items(_stream_text(stream), items_key, extract):
+                    count += 1
+                    yield item
+            logger.info(
+                "openai_stream_completed", method=method_name, items=count, model=self._model
+            )
+
+        except (APIError, APITimeoutError, RateLimitError) as exc:
+            logger.error("openai_api_error", method=method_name, error=str(exc))
+            raise LLMProviderError(f"OpenAI {method_name} failed: {exc}") from exc
+        except json.JSONDecodeError as exc:
+            logger.error("openai_json_error", method=method_name, error=str(exc))
+            raise LLMProviderError(f"OpenAI JSON decode error: {exc}") from exc
+        except Exception as exc:
+            logger.error("openai_unexpected_error", method=method_name, error=str(exc))
+            raise LLMProviderError(f"OpenAI {method_name} unexpected error: {exc}") from exc
+
+    def stream_questions(self, prompts: dict[str, str]) -> Iterator[dict[str, str] | str]:
+        """Yield each generated question as soon as it is complete."""
+        return self._stream_items("stream_questions", prompts, QUESTIONS_KEY, question_items)
+
+    def stream_feedback(self, prompts: dict[str, str]) -> Iterator[dict[str, Any]]:
+        """Yield each ``questions_feedback`` entry as soon as it is complete."""
+        return self._stream_items("stream_feedback", prompts, FEEDBACK_KEY, feedback_items)
+
+
+class AsyncOpenAIProvider(IAsyncLLMProvider):
+    """Concrete IAsyncLLMProvider backed by ``AsyncOpenAI``.
+
+    Mirrors ``OpenAIProvider`` but awaits the SDK and backs off with
+    ``asyncio.sleep`` so a pending call never ties up a worker thread.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-5-2025-08-07",
+        timeout: int = 180,
+        max_retries: int = 3,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY is required for AsyncOpenAIProvider")
+        self._model = model
+        self._timeout = timeout
+        self._client = AsyncOpenAI(
+            api_key=api_key,
+            timeout=timeout,
+            max_retries=max_retries,
+            http_client=http_client,
+        )
+        logger.info("openai_async_provider_initialized", model=model, timeout=timeout)
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.close()
+
+    # ------------------------------------------------------------------
+    # Retry wrapper for timeout-prone GPT-5 calls
+    # ------------------------------------------------------------------
+
+    async def _call_with_timeout_retry(self, method_name: str, **create_kwargs) -> Any:
+        """Await chat.completions.create with retry on APITimeoutError."""
+        last_exc: Exception | None = None
+        for attempt in range(1, _TIMEOUT_RETRIES + 2):
+            if deadline.remaining() is not None:
+                create_kwargs["timeout"] = deadline.cap_timeout(self._timeout)
+            try:
+                response = await self._client.chat.completions.create(**create_kwargs)
+                _note_usage(response)
+                return response
+            except APITimeoutError as exc:
+                last_exc = exc
+                wait = _TIMEOUT_BACKOFF_BASE * attempt
+                if attempt <= _TIMEOUT_RETRIES and deadline.allows(wait):
+                    logger.warning(
+                        "openai_timeout_retry",
+                        method=method_name,
+                        attempt=attempt,
+                        wait_seconds=wait,
+                    )
+                    await asyncio.sleep(wait)
+                else:
+                    raise
+        raise last_exc  # unreachable, but keeps mypy happy
+
+    # ------------------------------------------------------------------
+    # IAsyncLLMProvider interface
+    # ------------------------------------------------------------------
+
+    @property
+    def provider_name(self) -> str:
+        return "OpenAI"
+
+    @property
+    def model_name(self) -> str:
+        return f"openai:{self._model}"
+
+    async def generate_questions(self, prompts: dict[str, str]) -> list[dict[str, str] | str]:
+        """Generate interview questions using OpenAI JSON mode."""
+        try:
+            response = await self._call_with_timeout_retry(
+                "generate_questions",
+                model=self._model,
+                response_format=_response_format(QuestionsPayload),
+                messages=_chat_messages(prompts),
+            )
+            raw = response.choices[0].message.content or ""
+            results = _extract_questions(raw)
+
+            logger.info("openai_questions_generated", count=len(results), model=self._model)
+            return results
+
+        except (APIError, APITimeoutError, RateLimitError) as exc:
+            logger.error("openai_api_error", method="generate_questions", error=str(exc))
+            raise LLMProviderError(f"OpenAI generate_questions failed: {exc}") from exc
+        except json.JSONDecodeError as exc:
+            logger.error("openai_json_error", method="generate_questions", error=str(exc))
+            raise LLMProviderError(f"OpenAI JSON decode error: {exc}") from exc
+        except Exception as exc:
+            logger.error("openai_unexpected_error", method="generate_questions", error=str(exc))
+            raise LLMProviderError(f"OpenAI generate_questions unexpected error: {exc}") from exc
+
+    async def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        """Generate interview feedback/evaluation using OpenAI JSON mode."""
+        try:
+            response = await self._call_with_timeout_retry(
+                "generate_feedback",
+                model=self._model,
+                response_format=_response_format(None),
+                messages=_chat_messages(prompts),
+            )
+            raw = response.choices[0].message.content or ""
+            result = decode_json(
+                raw, FeedbackPayload, provider="openai", method="generate_feedback"
+            )
+            logger.info("openai_feedback_generated", model=self._model)
+            return result
+
+        except (APIError, APITimeoutError, RateLimitError) as exc:
+            logger.error("openai_api_error", method="generate_feedback", error=str(exc))
+            raise LLMProviderError(f"OpenAI generate_feedback failed: {exc}") from exc
+        except json.JSONDecodeError as exc:
+            logger.error("openai_json_error", method="generate_feedback", error=str(exc))
+            raise LLMProviderError(f"OpenAI JSON decode error: {exc}") from exc
+        except Exception as exc:
+            logger.error("openai_unexpected_error", method="generate_feedback", error=str(exc))
+            raise LLMProviderError(f"OpenAI generate_feedback unexpected error: {exc}") from exc
+
+    async def generate_completion(self, prompt: str) -> str:
+        """Generate a free-form text completion."""
+        try:
+            response = await self._call_with_timeout_retry(
+                "generate_completion",
+                model=self._model,
+                messages=[{"role": "user", "content": prompt}],
+            )
+            text = response.choices[0].message.content or ""
+            logger.info("openai_completion_generated", model=self._model)
+            return text.strip()
+
+        except (APIError, APITimeoutError, RateLimitError) as exc:
+            logger.error("openai_api_error", method="generate_completion", error=str(exc))
+            raise LLMProviderError(f"OpenAI generate_completion failed: {exc}") from exc
+        except Exception as exc:
+            logger.error("openai_unexpected_error", method="generate_completion", error=str(exc))
+            raise LLMProviderError(f"OpenAI generate_completion unexpected error: {exc}") from exc
+
+    async def parse_resume(self, text: str) -> dict[str, Any]:
+        """Parse raw resume text into structured data using OpenAI JSON mode."""
+        try:
+            response = await self._call_with_timeout_retry(
+                "parse_resume",
+                model=self._model,
+                response_format=_response_format(ParsedResume),
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    {"role": "system", "content": _RESUME_SYSTEM_PROMPT},
                     {"role": "user", "content": f"RESUME TEXT:\n{text}"},
                 ],
             )
             raw = response.choices[0].message.content or ""
-            result = json.loads(raw)
+            result = decode_json(raw, ParsedResume, provider="openai", method="parse_resume")
             logger.info("openai_resume_parsed", model=self._model)
             return result
 
@@ -219,3 +516,47 @@ class OpenAIProvider(ILLMProvider):
         except Exception as exc:
             logger.error("openai_unexpected_error", method="parse_resume", error=str(exc))
             raise LLMProviderError(f"OpenAI parse_resume unexpected error: {exc}") from exc
+
+    async def _stream_items(
+        self,
+        method_name: str,
+        prompts: dict[str, str],
+        items_key: str,
+        extract: Callable[[Any], list[Any]],
+    ) -> AsyncIterator[Any]:
+        """Stream a JSON-mode completion, yielding items as each one closes."""
+        try:
+            stream = await self._call_with_timeout_retry(
+                method_name,
+                model=self._model,
+                response_format=_response_format(_STREAM_SCHEMAS.get(items_key)),
+                messages=_chat_messages(prompts),
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+            count = 0
+            async with stream:
+                async for item in aiter_json_items(_astream_text(stream), items_key, extract):
+                    count += 1
+                    yield item
+            logger.info(
+                "openai_stream_completed", method=method_name, items=count, model=self._model
+            )
+
+        except (APIError, APITimeoutError, RateLimitError) as exc:
+            logger.error("openai_api_error", method=method_name, error=str(exc))
+            raise LLMProviderError(f"OpenAI {method_name} failed: {exc}") from exc
+        except json.JSONDecodeError as exc:
+            logger.error("openai_json_error", method=method_name, error=str(exc))
+            raise LLMProviderError(f"OpenAI JSON decode error: {exc}") from exc
+        except Exception as exc:
+            logger.error("openai_unexpected_error", method=method_name, error=str(exc))
+            raise LLMProviderError(f"OpenAI {method_name} unexpected error: {exc}") from exc
+
+    def stream_questions(self, prompts: dict[str, str]) -> AsyncIterator[dict[str, str] | str]:
+        """Yield each generated question as soon as it is complete."""
+        return self._stream_items("stream_questions", prompts, QUESTIONS_KEY, question_items)
+
+    def stream_feedback(self, prompts: dict[str, str]) -> AsyncIterator[dict[str, Any]]:
+        """Yield each ``questions_feedback`` entry as soon as it is complete."""
+        return self._stream_items("stream_feedback", prompts, FEEDBACK_KEY, feedback_items)
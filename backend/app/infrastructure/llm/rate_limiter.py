@@ -0,0 +1,344 @@
+"""
+Distributed token-bucket rate limiter for outbound LLM calls.
+
+Every API process and Celery worker draws from the same pair of Redis
+buckets per provider + model before dispatching a call:
+
+* ``llm:ratelimit:<provider>:<model>:req`` — requests per minute
+* ``llm:ratelimit:<provider>:<model>:tok`` — (estimated) tokens per minute
+
+Refill and debit happen atomically in a Lua script using the Redis server
+clock, so all processes agree on the budget.  When a bucket is short the
+script returns how long until enough capacity refills; the caller sleeps
+that long and retries, i.e. calls *queue briefly* instead of being sent
+into a 429.  If the wait would exceed ``LLM_RATE_LIMIT_MAX_WAIT`` — or run
+past the request deadline (``app/core/deadline.py``) — the call is
+dispatched anyway and the provider's own 429 handling takes over.
+
+The buckets bound HTTP requests, not port calls.  The wrapper pays for the
+first attempt before dispatching; every further attempt of the same call —
+SDK ``max_retries``, the OpenAI timeout-retry loop, Gemini's 429 retries —
+is charged again by an httpx request hook (``charge_retry`` /
+``acharge_retry``, installed on the pooled clients in ``factory.py``)
+before it goes out.
+
+Token cost is estimated before dispatch (prompt characters / 4 plus a fixed
+completion allowance).  Queue waits are exported as the
+``llm_rate_limit_wait_seconds`` histogram and logged when non-zero.  Redis
+errors fail open.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+import structlog
+
+from app.core import deadline
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.domain.interfaces.llm_provider import IAsyncLLMProvider, ILLMProvider
+from app.infrastructure.cache.redis_client import get_redis, get_sync_redis
+from app.infrastructure.llm.base import AsyncDelegatingLLMProvider, DelegatingLLMProvider
+
+logger = structlog.get_logger(__name__)
+
+_KEY_PREFIX = "llm:ratelimit:"
+_COMPLETION_TOKEN_ALLOWANCE = 1000  # expected completion size added to each estimate
+_REDIS_RETRY_AFTER = 10.0  # seconds to stop consulting Redis after an error
+
+wait_histogram = metrics.histogram(
+    "llm_rate_limit_wait_seconds", "Time LLM calls queued for rate-limit capacity"
+)
+
+# KEYS: request bucket, token bucket
+# ARGV: requests/min, tokens/min, token cost
+# Returns 0 when both buckets were debited, else milliseconds until they can be.
+_TOKEN_BUCKET_LUA = """
+if redis.replicate_commands then redis.replicate_commands() end
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local limits = {tonumber(ARGV[1]), tonumber(ARGV[2])}
+local costs = {1, tonumber(ARGV[3])}
+local levels = {}
+local wait = 0
+for i = 1, 2 do
+  local capacity = limits[i]
+  if capacity > 0 then
+    local rate = capacity / 60.0
+    local b = redis.call('HMGET', KEYS[i], 'level', 'ts')
+    local level = tonumber(b[1]) or capacity
+    local ts = tonumber(b[2]) or now
+    level = math.min(capacity, level + math.max(0, now - ts) * rate)
+    local cost = math.min(costs[i], capacity)
+    if level < cost then
+      wait = math.max(wait, (cost - level) / rate)
+    end
+    levels[i] = {level, cost}
+  end
+end
+for i = 1, 2 do
+  if levels[i] then
+    local level = levels[i][1]
+    if wait == 0 then level = level - levels[i][2] end
+    redis.call('HSET', KEYS[i], 'level', tostring(level), 'ts', tostring(now))
+    redis.call('EXPIRE', KEYS[i], 120)
+  end
+end
+return math.ceil(wait * 1000)
+"""
+
+
+def estimate_tokens(*args: Any) -> int:
+    """Rough token estimate for a provider call (≈4 characters per token)."""
+    chars = 0
+    for arg in args:
+        if isinstance(arg, str):
+            chars += len(arg)
+        elif isinstance(arg, dict):
+            chars += sum(len(v) for v in arg.values() if isinstance(v, str))
+    return chars // 4 + _COMPLETION_TOKEN_ALLOWANCE
+
+
+def provider_limits(provider_name: str) -> tuple[int, int]:
+    """``(requests/min, tokens/min)`` configured for a provider (0 = unlimited)."""
+    name = provider_name.lower()
+    if name == "openai":
+        return settings.OPENAI_RPM, settings.OPENAI_TPM
+    if name == "gemini":
+        return settings.GEMINI_RPM, settings.GEMINI_TPM
+    return 0, 0
+
+
+class TokenBucketLimiter:
+    """Shared requests/min + tokens/min budget for one provider + model."""
+
+    def __init__(
+        self,
+        provider: str,
+        model: str,
+        rpm: int,
+        tpm: int,
+        max_wait: float | None = None,
+    ) -> None:
+        self.provider = provider
+        self.model = model
+        self._rpm = rpm
+        self._tpm = tpm
+        self._max_wait = max_wait if max_wait is not None else settings.LLM_RATE_LIMIT_MAX_WAIT
+        base = f"{_KEY_PREFIX}{provider}:{model}"
+        self._keys = [f"{base}:req", f"{base}:tok"]
+        self._script: Any = None
+        self._ascript: Any = None
+        self._redis_down_until = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return (self._rpm > 0 or self._tpm > 0) and time.monotonic() >= self._redis_down_until
+
+    def _args(self, tokens: int) -> list[int]:
+        return [self._rpm, self._tpm, tokens]
+
+    def _redis_error(self, exc: Exception) -> None:
+        self._redis_down_until = time.monotonic() + _REDIS_RETRY_AFTER
+        logger.warning("llm_rate_limit_redis_error", provider=self.provider, error=str(exc))
+
+    def _finish(self, started: float, tokens: int, timed_out: bool = False) -> float:
+        waited = time.monotonic() - started
+        wait_histogram.observe(waited, provider=self.provider, model=self.model)
+        if timed_out:
+            logger.warning(
+                "llm_rate_limit_queue_timeout",
+                provider=self.provider,
+                model=self.model,
+                waited_seconds=round(waited, 3),
+            )
+        elif waited >= 0.001:
+            logger.info(
+                "llm_rate_limit_queued",
+                provider=self.provider,
+                model=self.model,
+                tokens=tokens,
+                waited_seconds=round(waited, 3),
+            )
+        return waited
+
+    def _wait_left(self, started: float) -> float:
+        """Seconds this call may still queue: ``max_wait``, capped by the deadline."""
+        left = self._max_wait - (time.monotonic() - started)
+        until_deadline = deadline.remaining()
+        return left if until_deadline is None else min(left, until_deadline)
+
+    # ------------------------------------------------------------------
+    # Sync
+    # ------------------------------------------------------------------
+
+    def acquire(self, tokens: int) -> float:
+        """Block until capacity for one call of *tokens* is available; return seconds waited."""
+        started = time.monotonic()
+        if not self.enabled:
+            return 0.0
+        while True:
+            try:
+                if self._script is None:
+                    self._script = get_sync_redis().register_script(_TOKEN_BUCKET_LUA)
+                wait_ms = int(self._script(keys=self._keys, args=self._args(tokens)))
+            except Exception as exc:
+                self._redis_error(exc)
+                self._script = None
+                return self._finish(started, tokens)
+            if wait_ms <= 0:
+                return self._finish(started, tokens)
+            remaining = self._wait_left(started)
+            if remaining <= 0:
+                return self._finish(started, tokens, timed_out=True)
+            time.sleep(min(wait_ms / 1000, remaining))
+
+    # ------------------------------------------------------------------
+    # Async
+    # ------------------------------------------------------------------
+
+    async def aacquire(self, tokens: int) -> float:
+        """Async ``acquire`` — waits with ``asyncio.sleep``."""
+        started = time.monotonic()
+        if not self.enabled:
+            return 0.0
+        while True:
+            try:
+                if self._ascript is None:
+                    self._ascript = (await get_redis()).register_script(_TOKEN_BUCKET_LUA)
+                wait_ms = int(await self._ascript(keys=self._keys, args=self._args(tokens)))
+            except Exception as exc:
+                self._redis_error(exc)
+                self._ascript = None
+                return self._finish(started, tokens)
+            if wait_ms <= 0:
+                return self._finish(started, tokens)
+            remaining = self._wait_left(started)
+            if remaining <= 0:
+                return self._finish(started, tokens, timed_out=True)
+            await asyncio.sleep(min(wait_ms / 1000, remaining))
+
+
+# ------------------------------------------------------------------
+# Per-attempt charging — httpx request hooks
+# ------------------------------------------------------------------
+
+
+@dataclass
+class _Charge:
+    """The budget one rate-limited call draws from for each HTTP attempt."""
+
+    limiter: TokenBucketLimiter
+    tokens: int
+    attempts: int = 0
+
+
+_current_charge: ContextVar[_Charge | None] = ContextVar("llm_rate_limit_charge", default=None)
+
+
+def charge_retry(request: httpx.Request) -> None:
+    """Request hook: charge every attempt after the first (prepaid by the wrapper)."""
+    charge = _current_charge.get()
+    if charge is None:
+        return
+    charge.attempts += 1
+    if charge.attempts > 1:
+        charge.limiter.acquire(charge.tokens)
+
+
+async def acharge_retry(request: httpx.Request) -> None:
+    charge = _current_charge.get()
+    if charge is None:
+        return
+    charge.attempts += 1
+    if charge.attempts > 1:
+        await charge.limiter.aacquire(charge.tokens)
+
+
+# ------------------------------------------------------------------
+# Provider wrappers
+# ------------------------------------------------------------------
+
+
+def _limiter_for(provider: ILLMProvider | IAsyncLLMProvider) -> TokenBucketLimiter:
+    rpm, tpm = provider_limits(provider.provider_name)
+    # model_name is "<provider>:<model>"; the key already has the provider.
+    model = provider.model_name.split(":", 1)[-1]
+    return TokenBucketLimiter(provider.provider_name.lower(), model, rpm, tpm)
+
+
+class RateLimitedLLMProvider(DelegatingLLMProvider):
+    """Sync provider that acquires rate-limit capacity before each call."""
+
+    def __init__(self, inner: ILLMProvider, limiter: TokenBucketLimiter | None = None) -> None:
+        super().__init__(inner)
+        self._limiter = limiter or _limiter_for(inner)
+
+    def _call(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
+        charge = _Charge(self._limiter, estimate_tokens(*args))
+        self._limiter.acquire(charge.tokens)
+        token = _current_charge.set(charge)
+        try:
+            return super()._call(method_name, *args, **kwargs)
+        finally:
+            _current_charge.reset(token)
+
+    def _stream(self, method_name: str, *args: Any, **kwargs: Any) -> Iterator[Any]:
+        # The charge is only current while the inner iterator runs, never
+        # across a yield into the consumer.
+        charge = _Charge(self._limiter, estimate_tokens(*args))
+        self._limiter.acquire(charge.tokens)
+        inner = super()._stream(method_name, *args, **kwargs)
+        try:
+            while True:
+                token = _current_charge.set(charge)
+                try:
+                    item = next(inner)
+                except StopIteration:
+                    return
+                finally:
+                    _current_charge.reset(token)
+                yield item
+        finally:
+            inner.close()
+
+
+class AsyncRateLimitedLLMProvider(AsyncDelegatingLLMProvider):
+    """Async provider that acquires rate-limit capacity before each call."""
+
+    def __init__(self, inner: IAsyncLLMProvider, limiter: TokenBucketLimiter | None = None) -> None:
+        super().__init__(inner)
+        self._limiter = limiter or _limiter_for(inner)
+
+    async def _acall(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
+        charge = _Charge(self._limiter, estimate_tokens(*args))
+        await self._limiter.aacquire(charge.tokens)
+        token = _current_charge.set(charge)
+        try:
+            return await super()._acall(method_name, *args, **kwargs)
+        finally:
+            _current_charge.reset(token)
+
+    async def _astream(self, method_name: str, *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        charge = _Charge(self._limiter, estimate_tokens(*args))
+        await self._limiter.aacquire(charge.tokens)
+        inner = super()._astream(method_name, *args, **kwargs)
+        try:
+            while True:
+                token = _current_charge.set(charge)
+                try:
+                    item = await anext(inner)
+                except StopAsyncIteration:
+                    return
+                finally:
+                    _current_charge.reset(token)
+                yield item
+        finally:
+            await inner.aclose()
@@ -0,0 +1,125 @@
+"""
+Process-wide LLM provider registry.
+
+Building a provider chain constructs SDK clients and their HTTP connection
+pools, so doing it per request throws away warm keep-alive sockets and TLS
+sessions.  The registry builds each chain (sync and async) once per process
+and hands out the same instance to every caller.
+
+Fork safety: Celery's prefork pool forks workers from a parent that may
+already hold providers.  Sockets must never be shared across processes, so
+the registry records the PID that built its providers and drops them
+(without closing — the parent still owns the sockets) whenever it is used
+from a different PID.  ``os.register_at_fork`` performs the same reset
+eagerly in the child.
+
+Usage::
+
+    from app.infrastructure.llm.registry import get_shared_llm_provider
+    provider = get_shared_llm_provider()
+
+    # Application shutdown (FastAPI lifespan)
+    await close_llm_providers()
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+
+import structlog
+
+from app.domain.interfaces.llm_provider import IAsyncLLMProvider, ILLMProvider
+from app.infrastructure.llm.factory import get_async_llm_provider, get_llm_provider
+
+logger = structlog.get_logger(__name__)
+
+
+class LLMProviderRegistry:
+    """Lazily builds and caches one sync and one async provider chain per process."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._provider: ILLMProvider | None = None
+        self._async_provider: IAsyncLLMProvider | None = None
+
+    def _check_pid(self) -> None:
+        """Forget providers inherited from a parent process (caller holds the lock)."""
+        pid = os.getpid()
+        if pid != self._pid:
+            self._provider = None
+            self._async_provider = None
+            self._pid = pid
+
+    def get_provider(self) -> ILLMProvider:
+        with self._lock:
+            self._check_pid()
+            if self._provider is None:
+                self._provider = get_llm_provider()
+                logger.info(
+                    "llm_registry_provider_built",
+                    provider=self._provider.provider_name,
+                    pid=self._pid,
+                )
+            return self._provider
+
+    def get_async_provider(self) -> IAsyncLLMProvider:
+        with self._lock:
+            self._check_pid()
+            if self._async_provider is None:
+                self._async_provider = get_async_llm_provider()
+                logger.info(
+                    "llm_registry_async_provider_built",
+                    provider=self._async_provider.provider_name,
+                    pid=self._pid,
+                )
+            return self._async_provider
+
+    def reset(self) -> None:
+        """Drop cached providers without closing them (use after ``fork``)."""
+        # A fresh lock: the parent's may have been held at fork time.
+        self._lock = threading.Lock()
+        self._provider = None
+        self._async_provider = None
+        self._pid = os.getpid()
+
+    def close(self) -> None:
+        """Close the sync provider's connection pool (Celery worker shutdown)."""
+        with self._lock:
+            self._check_pid()
+            provider, self._provider = self._provider, None
+        if provider is not None:
+            provider.close()
+            logger.info("llm_registry_provider_closed", pid=self._pid)
+
+    async def aclose(self) -> None:
+        """Close both providers' connection pools (FastAPI shutdown)."""
+        with self._lock:
+            self._check_pid()
+            async_provider, self._async_provider = self._async_provider, None
+        if async_provider is not None:
+            await async_provider.aclose()
+            logger.info("llm_registry_async_provider_closed", pid=self._pid)
+        self.close()
+
+
+registry = LLMProviderRegistry()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=registry.reset)
+
+
+def get_shared_llm_provider() -> ILLMProvider:
+    """Return this process's shared sync provider chain."""
+    return registry.get_provider()
+
+
+def get_shared_async_llm_provider() -> IAsyncLLMProvider:
+    """Return this process's shared async provider chain."""
+    return registry.get_async_provider()
+
+
+async def close_llm_providers() -> None:
+    """Close every pooled provider client held by this process."""
+    await registry.aclose()
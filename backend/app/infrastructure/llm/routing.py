@@ -0,0 +1,336 @@
+"""
+Latency-aware routing over an N-provider chain.
+
+The fallback composites always try the same provider first, however slow
+or flaky it currently is.  ``RoutedLLMProvider`` instead keeps an
+exponentially weighted moving average (EWMA) of latency and error rate per
+candidate and method, and sends each call to the best-scoring candidate;
+the remaining candidates, best first, are the fallbacks.
+
+    score = latency_ewma + error_penalty * error_rate_ewma   (lower wins)
+
+Only successful calls update the latency average, so a provider that fails
+fast does not look fast.  Candidates with fewer than ``min_samples``
+observations for a method score 0 and are tried first, in configured
+order: every candidate is measured before routing starts.  With
+probability ``explore_rate`` a call goes to a random other candidate
+first, so a provider that was slow during an incident gets another chance.
+
+Small cheap calls (``LLM_ROUTER_FAST_METHODS`` with a prompt of at most
+``LLM_ROUTER_FAST_MAX_PROMPT_CHARS`` characters) first try the *fast*
+candidates, e.g. a mini model, ranked the same way, before the regular
+ones.  Fast candidates never serve other calls.
+
+The scoreboard is in-process; each API process and Celery worker learns
+its own.  Streaming calls are scored by time to the first item and fall
+back only before it (same rule as ``LLMProviderWithFallback``).
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+
+from app.core.metrics import metrics
+from app.domain.exceptions import LLMProviderError
+from app.domain.interfaces.llm_provider import IAsyncLLMProvider, ILLMProvider
+from app.infrastructure.llm.telemetry import fallback_total
+
+logger = structlog.get_logger(__name__)
+
+routed_total = metrics.counter(
+    "llm_route_total", "LLM calls by the candidate the router tried first"
+)
+
+
+@dataclass
+class _Stats:
+    latency: float = 0.0  # EWMA of successful call latency, seconds
+    error_rate: float = 0.0  # EWMA of the failure indicator
+    samples: int = 0
+
+
+class ProviderScoreboard:
+    """EWMA latency and error rate per (candidate, method) — thread-safe."""
+
+    def __init__(
+        self,
+        alpha: float = 0.2,
+        error_penalty: float = 60.0,
+        min_samples: int = 3,
+        explore_rate: float = 0.05,
+        rng: random.Random | None = None,
+    ) -> None:
+        self._alpha = alpha
+        self._error_penalty = error_penalty
+        self._min_samples = min_samples
+        self._explore_rate = explore_rate
+        self._rng = rng or random.Random()
+        self._stats: dict[tuple[str, str], _Stats] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, candidate: str, method: str, seconds: float, ok: bool) -> None:
+        with self._lock:
+            stats = self._stats.setdefault((candidate, method), _Stats())
+            if stats.samples == 0:
+                stats.latency = seconds if ok else 0.0
+                stats.error_rate = 0.0 if ok else 1.0
+            else:
+                a = self._alpha
+                if ok:
+                    # A candidate whose first observations were failures has
+                    # no latency yet — take this one as is.
+                    stats.latency = (
+                        seconds if not stats.latency else (a * seconds + (1 - a) * stats.latency)
+                    )
+                stats.error_rate = a * (0.0 if ok else 1.0) + (1 - a) * stats.error_rate
+            stats.samples += 1
+
+    def score(self, candidate: str, method: str) -> float | None:
+        """Expected cost of sending *method* to *candidate*; None while unmeasured."""
+        with self._lock:
+            stats = self._stats.get((candidate, method))
+            if stats is None or stats.samples < self._min_samples:
+                return None
+            return stats.latency + self._error_penalty * stats.error_rate
+
+    def rank(self, candidates: Sequence[str], method: str) -> list[str]:
+        """*candidates* best first (unmeasured first, then by score; ties keep order)."""
+        ranked = sorted(candidates, key=lambda c: self.score(c, method) or 0.0)
+        if len(ranked) > 1:
+            with self._lock:
+                explore = self._rng.random() < self._explore_rate
+                pick = self._rng.randrange(1, len(ranked)) if explore else 0
+            if pick:
+                ranked.insert(0, ranked.pop(pick))
+        return ranked
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """``{"<candidate> <method>": {latency, error_rate, samples}}`` for logs / debugging."""
+        with self._lock:
+            return {
+                f"{candidate} {method}": {
+                    "latency": round(s.latency, 3),
+                    "error_rate": round(s.error_rate, 3),
+                    "samples": s.samples,
+                }
+                for (candidate, method), s in self._stats.items()
+            }
+
+
+def prompt_chars(arg: Any) -> int:
+    """Size of a call's argument: a prompt string or a ``{system_prompt, user_prompt}`` dict."""
+    if isinstance(arg, str):
+        return len(arg)
+    if isinstance(arg, dict):
+        return sum(len(v) for v in arg.values() if isinstance(v, str))
+    return 0
+
+
+class _RouterBase:
+    """Candidate ordering shared by the sync and async routers (no I/O)."""
+
+    def __init__(
+        self,
+        candidates: Sequence[Any],
+        scoreboard: ProviderScoreboard,
+        fast: Sequence[Any] = (),
+        fast_methods: Sequence[str] = (),
+        fast_max_prompt_chars: int = 0,
+    ) -> None:
+        if not candidates:
+            raise LLMProviderError("RoutedLLMProvider needs at least one candidate")
+        self._candidates = {c.model_name: c for c in candidates}
+        self._fast = {c.model_name: c for c in fast}
+        self._scoreboard = scoreboard
+        self._fast_methods = frozenset(fast_methods)
+        self._fast_max_prompt_chars = fast_max_prompt_chars
+        logger.info(
+            "llm_router_initialized",
+            candidates=list(self._candidates),
+            fast=list(self._fast),
+        )
+
+    @property
+    def provider_name(self) -> str:
+        return "+".join(c.provider_name for c in self._candidates.values())
+
+    @property
+    def model_name(self) -> str:
+        return "+".join(self._candidates)
+
+    @property
+    def scoreboard(self) -> ProviderScoreboard:
+        return self._scoreboard
+
+    def _order(self, method_name: str, args: tuple[Any, ...]) -> list[Any]:
+        """Candidates to try for this call, best first."""
+        order: list[Any] = []
+        if (
+            self._fast
+            and method_name in self._fast_methods
+            and args
+            and prompt_chars(args[0]) <= self._fast_max_prompt_chars
+        ):
+            order += [self._fast[n] for n in self._scoreboard.rank(list(self._fast), method_name)]
+        ranked = self._scoreboard.rank(list(self._candidates), method_name)
+        order += [self._candidates[n] for n in ranked]
+        routed_total.inc(method=method_name, provider=order[0].model_name)
+        return order
+
+    def _failed(self, provider: Any, nxt: Any | None, method_name: str, exc: Exception) -> None:
+        if nxt is None:
+            logger.error("llm_route_exhausted", provider=provider.model_name, method=method_name)
+            return
+        logger.warning(
+            "primary_provider_failed",
+            provider=provider.model_name,
+            method=method_name,
+            error=str(exc),
+            fallback=nxt.model_name,
+        )
+        fallback_total.inc(method=method_name, fallback=nxt.provider_name, reason="error")
+
+
+class RoutedLLMProvider(_RouterBase, ILLMProvider):
+    """Sends each call to the best-scoring candidate; the rest are ordered fallbacks."""
+
+    def _call(self, method_name: str, *args: Any) -> Any:
+        order = self._order(method_name, args)
+        for provider, nxt in zip(order, [*order[1:], None], strict=True):
+            started = time.monotonic()
+            try:
+                result = getattr(provider, method_name)(*args)
+            except LLMProviderError as exc:
+                self._scoreboard.observe(
+                    provider.model_name, method_name, time.monotonic() - started, ok=False
+                )
+                self._failed(provider, nxt, method_name, exc)
+                if nxt is None:
+                    raise
+                continue
+            self._scoreboard.observe(
+                provider.model_name, method_name, time.monotonic() - started, ok=True
+            )
+            return result
+
+    def _stream(self, method_name: str, *args: Any) -> Iterator[Any]:
+        order = self._order(method_name, args)
+        for provider, nxt in zip(order, [*order[1:], None], strict=True):
+            started = time.monotonic()
+            first = True
+            try:
+                for item in getattr(provider, method_name)(*args):
+                    if first:
+                        first = False
+                        self._scoreboard.observe(
+                            provider.model_name, method_name, time.monotonic() - started, ok=True
+                        )
+                    yield item
+                return
+            except LLMProviderError as exc:
+                if not first:
+                    raise
+                self._scoreboard.observe(
+                    provider.model_name, method_name, time.monotonic() - started, ok=False
+                )
+                self._failed(provider, nxt, method_name, exc)
+                if nxt is None:
+                    raise
+
+    def generate_questions(self, prompts: dict[str, str]) -> list[dict[str, str] | str]:
+        return self._call("generate_questions", prompts)
+
+    def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        return self._call("generate_feedback", prompts)
+
+    def generate_completion(self, prompt: str) -> str:
+        return self._call("generate_completion", prompt)
+
+    def parse_resume(self, text: str) -> dict[str, Any]:
+        return self._call("parse_resume", text)
+
+    def stream_questions(self, prompts: dict[str, str]) -> Iterator[dict[str, str] | str]:
+        return self._stream("stream_questions", prompts)
+
+    def stream_feedback(self, prompts: dict[str, str]) -> Iterator[dict[str, Any]]:
+        return self._stream("stream_feedback", prompts)
+
+    def close(self) -> None:
+        for provider in (*self._candidates.values(), *self._fast.values()):
+            provider.close()
+
+
+class AsyncRoutedLLMProvider(_RouterBase, IAsyncLLMProvider):
+    """Async twin of ``RoutedLLMProvider``."""
+
+    async def _call(self, method_name: str, *args: Any) -> Any:
+        order = self._order(method_name, args)
+        for provider, nxt in zip(order, [*order[1:], None], strict=True):
+            started = time.monotonic()
+            try:
+                result = await getattr(provider, method_name)(*args)
+            except LLMProviderError as exc:
+                self._scoreboard.observe(
+                    provider.model_name, method_name, time.monotonic() - started, ok=False
+                )
+                self._failed(provider, nxt, method_name, exc)
+                if nxt is None:
+                    raise
+                continue
+            self._scoreboard.observe(
+                provider.model_name, method_name, time.monotonic() - started, ok=True
+            )
+            return result
+
+    async def _stream(self, method_name: str, *args: Any) -> AsyncIterator[Any]:
+        order = self._order(method_name, args)
+        for provider, nxt in zip(order, [*order[1:], None], strict=True):
+            started = time.monotonic()
+            first = True
+            try:
+                async for item in getattr(provider, method_name)(*args):
+                    if first:
+                        first = False
+                        self._scoreboard.observe(
+                            provider.model_name, method_name, time.monotonic() - started, ok=True
+                        )
+                    yield item
+                return
+            except LLMProviderError as exc:
+                if not first:
+                    raise
+                self._scoreboard.observe(
+                    provider.model_name, method_name, time.monotonic() - started, ok=False
+                )
+                self._failed(provider, nxt, method_name, exc)
+                if nxt is None:
+                    raise
+
+    async def generate_questions(self, prompts: dict[str, str]) -> list[dict[str, str] | str]:
+        return await self._call("generate_questions", prompts)
+
+    async def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        return await self._call("generate_feedback", prompts)
+
+    async def generate_completion(self, prompt: str) -> str:
+        return await self._call("generate_completion", prompt)
+
+    async def parse_resume(self, text: str) -> dict[str, Any]:
+        return await self._call("parse_resume", text)
+
+    def stream_questions(self, prompts: dict[str, str]) -> AsyncIterator[dict[str, str] | str]:
+        return self._stream("stream_questions", prompts)
+
+    def stream_feedback(self, prompts: dict[str, str]) -> AsyncIterator[dict[str, Any]]:
+        return self._stream("stream_feedback", prompts)
+
+    async def aclose(self) -> None:
+        for provider in (*self._candidates.values(), *self._fast.values()):
+            await provider.aclose()
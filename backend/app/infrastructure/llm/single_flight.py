@@ -0,0 +1,359 @@
+"""
+Single-flight coalescing of identical in-flight LLM calls.
+
+A double-click or a client retry on ``/interview/start``, ``/complete`` or
+``/resume/{id}/reanalyze`` sends the exact same prompt again while the
+first call is still running, doubling provider load and spend.  The
+single-flight wrapper sits in front of the whole provider chain and keys
+every call on a hash of model chain, method and argument:
+
+* **In-process** — the first caller (the *leader*) makes the call; identical
+  calls arriving while it runs wait for it and receive a copy of its result
+  (or its exception).
+* **Across workers** — the leader also takes a Redis lock
+  (``llm:flight:<key>``, ``SET NX``) holding a token unique to its flight.
+  Leaders in other processes that find the lock held read that token and
+  poll for the flight's own result key (``llm:flight:<key>:result:<token>``,
+  written on success and kept ``LLM_SINGLE_FLIGHT_RESULT_TTL`` seconds), so
+  a result left over from an earlier flight is never handed to a later
+  one; if the winner fails, or dies and its lock expires, the next waiter
+  takes over.
+
+Only calls that overlap are coalesced: a call starting after the previous
+one finished takes the lock again and gets a fresh response.  Generation
+that needs a result of its own even when an identical call is in flight —
+question pool refills, whose prompt can equal a live interview start's —
+runs inside ``uncoalesced()`` and bypasses the wrapper.  Streams are not
+coalesced.  If Redis is unreachable, coalescing is in-process only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from hashlib import sha256
+from typing import Any
+
+import structlog
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.domain.interfaces.llm_provider import IAsyncLLMProvider, ILLMProvider
+from app.infrastructure.cache.redis_client import get_redis, get_sync_redis
+from app.infrastructure.llm.base import AsyncDelegatingLLMProvider, DelegatingLLMProvider
+
+logger = structlog.get_logger(__name__)
+
+_KEY_PREFIX = "llm:flight:"
+_REDIS_RETRY_AFTER = 10.0  # seconds to stop consulting Redis after an error
+
+single_flight_total = metrics.counter(
+    "llm_single_flight_total",
+    "LLM calls by single-flight role (leader / local / remote = shared a leader's call)",
+)
+
+
+_uncoalesced: ContextVar[bool] = ContextVar("llm_uncoalesced", default=False)
+
+
+@contextmanager
+def uncoalesced() -> Iterator[None]:
+    """Calls made in the block neither lead nor join a flight."""
+    token = _uncoalesced.set(True)
+    try:
+        yield
+    finally:
+        _uncoalesced.reset(token)
+
+
+def flight_key(model_name: str, method_name: str, arg: Any) -> str:
+    payload = json.dumps([model_name, method_name, arg], sort_keys=True, default=str)
+    return sha256(payload.encode()).hexdigest()
+
+
+class _Flight:
+    """One in-process call that identical callers wait for."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class _RedisFlights:
+    """Lock / result keys shared by all processes (fails soft, like the breaker)."""
+
+    def __init__(self, lock_ttl: int, result_ttl: int) -> None:
+        self._lock_ttl = lock_ttl
+        self._result_ttl = result_ttl
+        self._down_until = 0.0
+
+    @staticmethod
+    def _lock_key(key: str) -> str:
+        return f"{_KEY_PREFIX}{key}"
+
+    @staticmethod
+    def _result_key(key: str, token: str) -> str:
+        return f"{_KEY_PREFIX}{key}:result:{token}"
+
+    def _usable(self) -> bool:
+        return time.monotonic() >= self._down_until
+
+    def _error(self, op: str, exc: Exception) -> None:
+        self._down_until = time.monotonic() + _REDIS_RETRY_AFTER
+        logger.warning("llm_single_flight_redis_error", op=op, error=str(exc))
+
+    # -- sync ------------------------------------------------------------
+
+    def acquire(self, key: str, token: str) -> bool | None:
+        """Take the lock for flight *token*.
+
+        True = lock taken, False = another process holds it, None = no Redis.
+        """
+        if not self._usable():
+            return None
+        try:
+            r = get_sync_redis()
+            return bool(r.set(self._lock_key(key), token, nx=True, ex=self._lock_ttl))
+        except Exception as exc:
+            self._error("lock", exc)
+            return None
+
+    def poll(self, key: str, token: str | None) -> tuple[str | None, str | None] | None:
+        """``(result of flight *token* or None, token now holding the lock)``; None = no Redis.
+
+        The lock is read before the result: a leader that finishes in
+        between is seen with its result, never as a failure.
+        """
+        try:
+            r = get_sync_redis()
+            holder = r.get(self._lock_key(key))
+            return (r.get(self._result_key(key, token)) if token else None), holder
+        except Exception as exc:
+            self._error("poll", exc)
+            return None
+
+    def complete(self, key: str, token: str, result: Any | None) -> None:
+        """Publish *result* of flight *token* (None = failed) and release the lock."""
+        try:
+            r = get_sync_redis()
+            if result is not None:
+                r.set(
+                    self._result_key(key, token),
+                    json.dumps(result, default=str),
+                    ex=self._result_ttl,
+                )
+            r.delete(self._lock_key(key))
+        except Exception as exc:  # the lock expires on its own
+            self._error("release", exc)
+
+    # -- async -----------------------------------------------------------
+
+    async def aacquire(self, key: str, token: str) -> bool | None:
+        if not self._usable():
+            return None
+        try:
+            r = await get_redis()
+            return bool(await r.set(self._lock_key(key), token, nx=True, ex=self._lock_ttl))
+        except Exception as exc:
+            self._error("lock", exc)
+            return None
+
+    async def apoll(self, key: str, token: str | None) -> tuple[str | None, str | None] | None:
+        try:
+            r = await get_redis()
+            holder = await r.get(self._lock_key(key))
+            return (await r.get(self._result_key(key, token)) if token else None), holder
+        except Exception as exc:
+            self._error("poll", exc)
+            return None
+
+    async def acomplete(self, key: str, token: str, result: Any | None) -> None:
+        try:
+            r = await get_redis()
+            if result is not None:
+                await r.set(
+                    self._result_key(key, token),
+                    json.dumps(result, default=str),
+                    ex=self._result_ttl,
+                )
+            await r.delete(self._lock_key(key))
+        except Exception as exc:
+            self._error("release", exc)
+
+
+def _redis_flights(lock_ttl: int | None, result_ttl: int | None) -> _RedisFlights:
+    return _RedisFlights(
+        lock_ttl or settings.LLM_SINGLE_FLIGHT_LOCK_TTL,
+        result_ttl or settings.LLM_SINGLE_FLIGHT_RESULT_TTL,
+    )
+
+
+class SingleFlightLLMProvider(DelegatingLLMProvider):
+    """Identical concurrent calls to *inner* share one provider request."""
+
+    def __init__(
+        self,
+        inner: ILLMProvider,
+        lock_ttl: int | None = None,
+        result_ttl: int | None = None,
+        poll_interval: float | None = None,
+    ) -> None:
+        super().__init__(inner)
+        self._redis = _redis_flights(lock_ttl, result_ttl)
+        self._poll = poll_interval or settings.LLM_SINGLE_FLIGHT_POLL_INTERVAL
+        self._flights: dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def _call(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
+        if _uncoalesced.get():
+            return super()._call(method_name, *args, **kwargs)
+        key = flight_key(self.model_name, method_name, args[0] if args else None)
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            single_flight_total.inc(method=method_name, role="local")
+            if flight.error is not None:
+                raise flight.error
+            return copy.deepcopy(flight.result)
+
+        try:
+            flight.result = self._call_once(key, method_name, *args, **kwargs)
+            return flight.result
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def _call_once(self, key: str, method_name: str, *args: Any, **kwargs: Any) -> Any:
+        """Lead the call across processes, or collect another process's result."""
+        token = uuid.uuid4().hex
+        while True:
+            held = self._redis.acquire(key, token)
+            if held is not False:
+                break
+            watched = None  # the flight whose result we wait for
+            while (status := self._redis.poll(key, watched)) is not None:
+                raw, holder = status
+                if raw is not None:
+                    single_flight_total.inc(method=method_name, role="remote")
+                    logger.info("llm_single_flight_shared", method=method_name, key=key[:12])
+                    return json.loads(raw)
+                if holder is None:
+                    break  # the other leader failed or expired — try to take over
+                if holder != watched:
+                    watched = holder  # read its result before sleeping
+                    continue
+                time.sleep(self._poll)
+            else:
+                held = None  # Redis went away while waiting
+                break
+
+        single_flight_total.inc(method=method_name, role="leader")
+        result = None
+        try:
+            result = super()._call(method_name, *args, **kwargs)
+            return result
+        finally:
+            if held:
+                self._redis.complete(key, token, result)
+
+
+class AsyncSingleFlightLLMProvider(AsyncDelegatingLLMProvider):
+    """Async twin of ``SingleFlightLLMProvider``.
+
+    Waiters are shielded from each other: a cancelled waiter leaves the
+    call running, and if the leader itself is cancelled the next waiter
+    takes over.
+    """
+
+    def __init__(
+        self,
+        inner: IAsyncLLMProvider,
+        lock_ttl: int | None = None,
+        result_ttl: int | None = None,
+        poll_interval: float | None = None,
+    ) -> None:
+        super().__init__(inner)
+        self._redis = _redis_flights(lock_ttl, result_ttl)
+        self._poll = poll_interval or settings.LLM_SINGLE_FLIGHT_POLL_INTERVAL
+        self._flights: dict[str, asyncio.Future[Any]] = {}
+
+    async def _acall(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
+        if _uncoalesced.get():
+            return await super()._acall(method_name, *args, **kwargs)
+        key = flight_key(self.model_name, method_name, args[0] if args else None)
+        loop = asyncio.get_running_loop()
+        while (flight := self._flights.get(key)) is not None and flight.get_loop() is loop:
+            try:
+                result = await asyncio.shield(flight)
+            except asyncio.CancelledError:
+                if flight.cancelled():
+                    continue  # the leader was cancelled — take over
+                raise
+            single_flight_total.inc(method=method_name, role="local")
+            return copy.deepcopy(result)
+
+        flight = self._flights[key] = loop.create_future()
+        try:
+            result = await self._acall_once(key, method_name, *args, **kwargs)
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except BaseException as exc:
+            flight.set_exception(exc)
+            flight.exception()  # retrieved — no "never retrieved" warning without waiters
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+    async def _acall_once(self, key: str, method_name: str, *args: Any, **kwargs: Any) -> Any:
+        token = uuid.uuid4().hex
+        while True:
+            held = await self._redis.aacquire(key, token)
+            if held is not False:
+                break
+            watched = None
+            while (status := await self._redis.apoll(key, watched)) is not None:
+                raw, holder = status
+                if raw is not None:
+                    single_flight_total.inc(method=method_name, role="remote")
+                    logger.info("llm_single_flight_shared", method=method_name, key=key[:12])
+                    return json.loads(raw)
+                if holder is None:
+                    break
+                if holder != watched:
+                    watched = holder
+                    continue
+                await asyncio.sleep(self._poll)
+            else:
+                held = None
+                break
+
+        single_flight_total.inc(method=method_name, role="leader")
+        result = None
+        try:
+            result = await super()._acall(method_name, *args, **kwargs)
+            return result
+        finally:
+            if held:
+                await self._redis.acomplete(key, token, result)
@@ -0,0 +1,220 @@
+"""
+Incremental JSON parsing for streamed LLM output.
+
+Providers used to buffer the whole completion and ``json.loads`` it, so
+nothing was usable until the last token and a truncated response lost
+everything.  ``JSONItemStream`` is fed text chunks as they arrive and
+returns each element of the payload's item array as soon as that element
+is closed — the questions of ``{"questions": [...]}``, the entries of
+``{"questions_feedback": [...]}`` or the elements of a top-level array.
+
+Anything before the first ``{`` / ``[`` (markdown fences, "Here is the
+JSON:") and anything after the document closes (closing fence, chatter) is
+ignored.  ``finish`` returns the whole document; a truncated one is cut
+back to its last closed object or array and closed, so the complete part
+survives.
+
+This is a scanner, not a validating parser: it only tracks strings,
+escapes and bracket depth, and hands every closed element to ``json.loads``.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+QUESTIONS_KEY = "questions"
+FEEDBACK_KEY = "questions_feedback"
+
+_KEY_BEFORE_RE = re.compile(r'"((?:[^"\\]|\\.)*)"\s*:\s*$')
+_KEY_LOOKBEHIND = 256  # chars searched backwards for the key of an array
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+class JSONItemStream:
+    """Incremental scanner over one streamed JSON document.
+
+    Args:
+        items_key: Key of the item array inside a top-level object.  The
+            elements of a top-level array are items regardless.
+    """
+
+    def __init__(self, items_key: str | None = None) -> None:
+        self._items_key = items_key
+        self._text = ""
+        self._pos = 0  # next character to scan
+        self._start = -1  # index of the document's opening bracket
+        self._end = -1  # index just past its closing bracket
+        self._stack: list[str] = []
+        self._in_string = False
+        self._escape = False
+        self._items_depth = 0  # stack depth of the item array while it is open
+        self._items_seen = False
+        self._item_start = -1
+        self._safe: tuple[int, tuple[str, ...]] | None = None
+        self.item_count = 0
+
+    @property
+    def done(self) -> bool:
+        """True once the document's closing bracket has been seen."""
+        return self._end >= 0
+
+    def feed(self, chunk: str) -> list[Any]:
+        """Consume *chunk*; return the items closed by it (usually zero or one)."""
+        if self.done or not chunk:
+            return []
+        self._text += chunk
+        text, stack = self._text, self._stack
+        items: list[Any] = []
+
+        for i in range(self._pos, len(text)):
+            c = text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                continue
+            if self._start < 0:
+                if c not in _CLOSERS:
+                    continue  # preamble: fences, prose
+                self._start = i
+            if c == '"':
+                self._in_string = True
+            elif c in _CLOSERS:
+                stack.append(c)
+                if c == "[" and self._is_items_array(i):
+                    self._items_depth, self._items_seen = len(stack), True
+                elif c == "{" and self._items_depth and len(stack) == self._items_depth + 1:
+                    self._item_start = i
+            elif c in "}]" and stack:
+                depth = len(stack)
+                stack.pop()
+                if self._item_start >= 0 and depth == self._items_depth + 1:
+                    items.extend(self._decode_item(text[self._item_start : i + 1]))
+                    self._item_start = -1
+                elif depth == self._items_depth:
+                    self._items_depth = 0
+                self._safe = (i + 1, tuple(stack))
+                if not stack:
+                    self._end = i + 1
+                    break
+
+        self._pos = len(text) if not self.done else self._end
+        self.item_count += len(items)
+        return items
+
+    def finish(self) -> Any:
+        """The whole document, repaired if the stream stopped early.
+
+        Raises ``json.JSONDecodeError`` when no usable JSON was received.
+        """
+        text = self._text
+        if self._start < 0:
+            raise json.JSONDecodeError("No JSON document in response", text, 0)
+        if self.done:
+            return json.loads(text[self._start : self._end])
+        if self._safe is None:
+            raise json.JSONDecodeError("Truncated JSON document", text, len(text))
+
+        end, still_open = self._safe
+        head = text[self._start : end].rstrip().rstrip(",")
+        repaired = head + "".join(_CLOSERS[c] for c in reversed(still_open))
+        logger.warning("llm_json_truncated", received=len(text), kept=end - self._start)
+        return json.loads(repaired)
+
+    # ------------------------------------------------------------------
+
+    def _is_items_array(self, index: int) -> bool:
+        """Is the ``[`` just pushed at *index* the item array?"""
+        if self._items_seen:
+            return False
+        stack = self._stack
+        if len(stack) == 1:
+            return True
+        if len(stack) != 2 or stack[0] != "{" or self._items_key is None:
+            return False
+        window = self._text[max(self._start, index - _KEY_LOOKBEHIND) : index]
+        match = _KEY_BEFORE_RE.search(window)
+        return match is not None and match.group(1) == self._items_key
+
+    @staticmethod
+    def _decode_item(raw: str) -> list[Any]:
+        try:
+            return [json.loads(raw)]
+        except ValueError:
+            logger.warning("llm_json_item_skipped", chars=len(raw))
+            return []
+
+
+def question_items(data: Any) -> list[Any]:
+    """Question items of a ``{"questions": [...]}`` or ``[...]`` payload."""
+    questions = data if isinstance(data, list) else (data or {}).get(QUESTIONS_KEY) or []
+    results: list[Any] = []
+    for item in questions:
+        if isinstance(item, dict) and "question" in item:
+            results.append(item)  # preserve type/difficulty metadata
+        elif isinstance(item, str):
+            results.append(item)
+        else:
+            logger.warning("unexpected_question_item", item=repr(item))
+    return results
+
+
+def feedback_items(data: Any) -> list[dict[str, Any]]:
+    """``questions_feedback`` entries of a batch evaluation payload."""
+    feedback = data.get(FEEDBACK_KEY) if isinstance(data, dict) else None
+    return (
+        [item for item in feedback if isinstance(item, dict)] if isinstance(feedback, list) else []
+    )
+
+
+def loads_lenient(raw: str) -> Any:
+    """``json.loads`` that tolerates fences, surrounding text and truncation."""
+    stream = JSONItemStream()
+    stream.feed(raw)
+    return stream.finish()
+
+
+def iter_json_items(
+    chunks: Iterable[str],
+    items_key: str,
+    extract: Callable[[Any], list[Any]],
+) -> Iterator[Any]:
+    """Yield items from streamed text chunks as each one closes.
+
+    Every item goes through *extract* (as ``{items_key: [item]}``), which
+    drops malformed ones.  If the stream produced no items in the expected
+    place (e.g. the model picked a different top-level shape), *extract* is
+    applied to the whole document instead.
+    """
+    stream = JSONItemStream(items_key)
+    for chunk in chunks:
+        for item in stream.feed(chunk):
+            yield from extract({items_key: [item]})
+    if not stream.item_count:
+        yield from extract(stream.finish())
+
+
+async def aiter_json_items(
+    chunks: AsyncIterable[str],
+    items_key: str,
+    extract: Callable[[Any], list[Any]],
+) -> AsyncIterator[Any]:
+    """Async variant of ``iter_json_items``."""
+    stream = JSONItemStream(items_key)
+    async for chunk in chunks:
+        for item in stream.feed(chunk):
+            for extracted in extract({items_key: [item]}):
+                yield extracted
+    if not stream.item_count:
+        for extracted in extract(stream.finish()):
+            yield extracted
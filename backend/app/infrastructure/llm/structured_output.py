@@ -0,0 +1,284 @@
+"""
+Structured LLM output — response schemas, local JSON repair and validation.
+
+A malformed provider response used to surface as ``LLMProviderError``,
+which costs a second paid call (fallback provider, or a Celery retry of
+the whole parse).  Two layers now keep that rare:
+
+* **Constrained generation** — where the output shape is fixed (questions,
+  resume parse) the providers pass the schema of the pydantic model below
+  (OpenAI ``json_schema`` response format, Gemini ``response_json_schema``;
+  ``LLM_STRUCTURED_OUTPUT_ENABLED``).  Feedback prompts vary in shape and
+  only get plain JSON mode.
+* **Local repair** — ``decode_json`` accepts clean JSON as is; otherwise
+  ``repair_json`` fixes the usual defects (markdown fences and chatter,
+  trailing commas, single-quoted strings, Python ``True``/``None``,
+  truncation) without calling the model again.  The result is validated
+  against the pydantic model, which also coerces near-misses (``"0.8"``,
+  ``"5+ years"``).
+
+``llm_json_parse_total`` counts payloads by outcome (clean / repaired /
+invalid) per provider and method — repaired / total is the repair rate.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+import structlog
+from pydantic import BaseModel, ConfigDict, ValidationError, field_validator, model_validator
+
+from app.core.metrics import metrics
+from app.infrastructure.llm.streaming_json import QUESTIONS_KEY, loads_lenient
+
+logger = structlog.get_logger(__name__)
+
+json_parse_total = metrics.counter(
+    "llm_json_parse_total", "Provider JSON payloads by outcome (clean / repaired / invalid)"
+)
+
+_PY_LITERALS = {"True": "true", "False": "false", "None": "null"}
+_NUMBER_RE = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+# ------------------------------------------------------------------
+# Payload models
+# ------------------------------------------------------------------
+
+
+class _Payload(BaseModel):
+    # Unknown keys are kept — callers read what they need with ``.get``.
+    model_config = ConfigDict(extra="allow", coerce_numbers_to_str=True)
+
+
+def _leading_number(value: Any) -> Any:
+    """``"5+ years"`` → 5.0; unparseable strings → None; other values unchanged."""
+    if isinstance(value, str):
+        match = _NUMBER_RE.search(value)
+        return float(match.group()) if match else None
+    return value
+
+
+class QuestionItem(_Payload):
+    question: str
+    type: str | None = None
+    difficulty: str | None = None
+
+
+class QuestionsPayload(_Payload):
+    questions: list[QuestionItem]
+
+    @model_validator(mode="before")
+    @classmethod
+    def _wrap_array(cls, data: Any) -> Any:
+        return {QUESTIONS_KEY: data} if isinstance(data, list) else data
+
+    @field_validator("questions", mode="before")
+    @classmethod
+    def _usable_items(cls, items: Any) -> Any:
+        # Plain strings are questions without metadata; other junk is dropped
+        # (one odd item should not cost the whole set).
+        if not isinstance(items, list):
+            return items
+        usable = []
+        for item in items:
+            if isinstance(item, str):
+                usable.append({"question": item})
+            elif isinstance(item, dict) and "question" in item:
+                usable.append(item)
+            else:
+                logger.warning("unexpected_question_item", item=repr(item)[:200])
+        return usable
+
+
+class FeedbackItem(_Payload):
+    question_id: str | None = None
+    evaluation_score: float | None = None
+    feedback_comment: str | None = None
+
+    @field_validator("evaluation_score", mode="before")
+    @classmethod
+    def _score(cls, value: Any) -> Any:
+        return _leading_number(value)
+
+
+class FeedbackPayload(FeedbackItem):
+    """Every ``generate_feedback`` shape: single answer, batch, summary, transcript."""
+
+    questions_feedback: list[FeedbackItem] | None = None
+    summary: str | None = None
+    strengths: list[str] | None = None
+    weaknesses: list[str] | None = None
+    confidence_score: float | None = None
+    score_breakdown: dict[str, float] | None = None
+
+    @field_validator("confidence_score", mode="before")
+    @classmethod
+    def _confidence(cls, value: Any) -> Any:
+        return _leading_number(value)
+
+
+class EducationItem(_Payload):
+    degree: str | None = None
+    university: str | None = None
+    start_date: str | None = None
+    end_date: str | None = None
+    cgpa: str | None = None
+    certification: str | None = None
+    institution: str | None = None
+    date: str | None = None
+
+
+class ExperienceItem(_Payload):
+    job_title: str | None = None
+    company: str | None = None
+    start_date: str | None = None
+    end_date: str | None = None
+    description: str | None = None
+
+
+class ParsedResume(_Payload):
+    name: str | None = None
+    email: str | None = None
+    phone: str | None = None
+    summary: str | None = None
+    inferred_role: str | None = None
+    skills: list[str] = []
+    education: list[EducationItem] = []
+    experience: list[ExperienceItem] = []
+    job_titles: list[str] = []
+    years_of_experience: float | None = None
+    confidence_score: float | None = None
+    processing_time: float | None = None
+
+    @field_validator("years_of_experience", "confidence_score", "processing_time", mode="before")
+    @classmethod
+    def _numbers(cls, value: Any) -> Any:
+        return _leading_number(value)
+
+    @field_validator("skills", "job_titles", "education", "experience", mode="before")
+    @classmethod
+    def _null_is_empty(cls, value: Any) -> Any:
+        return [] if value is None else value
+
+
+# ------------------------------------------------------------------
+# Provider response formats
+# ------------------------------------------------------------------
+
+
+def response_schema(model: type[BaseModel]) -> dict[str, Any]:
+    """JSON schema of *model* for constrained generation."""
+    return model.model_json_schema()
+
+
+def openai_response_format(model: type[BaseModel]) -> dict[str, Any]:
+    """``response_format`` for ``chat.completions.create`` (non-strict json_schema)."""
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": model.__name__, "schema": response_schema(model)},
+    }
+
+
+# ------------------------------------------------------------------
+# Repair + validation
+# ------------------------------------------------------------------
+
+
+def _repair_text(text: str) -> str:
+    """Rewrite JSON-ish *text*: single → double quotes, no trailing commas,
+    Python literals → JSON.  Double-quoted strings are left untouched."""
+    out: list[str] = []
+    quote: str | None = None
+    i, n = 0, len(text)
+    while i < n:
+        c = text[i]
+        if quote is not None:
+            if c == "\\" and i + 1 < n:
+                nxt = text[i + 1]
+                out.append("'" if quote == "'" and nxt == "'" else c + nxt)
+                i += 2
+                continue
+            if c == quote:
+                out.append('"')
+                quote = None
+            elif c == '"':  # a double quote inside a single-quoted string
+                out.append('\\"')
+            else:
+                out.append(c)
+            i += 1
+            continue
+        if c in "\"'":
+            quote = c
+            out.append('"')
+        elif c == ",":
+            j = i + 1
+            while j < n and text[j].isspace():
+                j += 1
+            if j < n and text[j] in "}]":
+                i = j  # drop the trailing comma
+                continue
+            out.append(c)
+        elif c.isalpha():
+            j = i
+            while j < n and (text[j].isalnum() or text[j] == "_"):
+                j += 1
+            word = text[i:j]
+            out.append(_PY_LITERALS.get(word, word))
+            i = j
+            continue
+        else:
+            out.append(c)
+        i += 1
+    return "".join(out)
+
+
+def repair_json(raw: str) -> Any:
+    """Decode a defective JSON document; raises ``json.JSONDecodeError`` if hopeless.
+
+    Fences, surrounding prose and truncation are handled by ``loads_lenient``;
+    anything else gets one rewrite pass (``_repair_text``) first.
+    """
+    try:
+        return loads_lenient(raw)
+    except json.JSONDecodeError as exc:
+        error = exc
+    starts = [i for i in (raw.find("{"), raw.find("[")) if i >= 0]
+    if not starts:
+        raise error
+    # Only from the document on: prose like "Here's the JSON" would open a string.
+    return loads_lenient(_repair_text(raw[min(starts) :]))
+
+
+def decode_json(raw: str, model: type[BaseModel], *, provider: str, method: str) -> Any:
+    """Parse *raw* (repairing it when needed) and validate it against *model*.
+
+    Returns the validated payload as plain data (only the keys present in
+    the response).  Raises ``json.JSONDecodeError`` / ``ValueError`` when
+    the payload is unusable even after repair.
+    """
+    labels = {"provider": provider, "method": method}
+    outcome = "clean"
+    try:
+        data = json.loads(raw)
+    except ValueError:
+        try:
+            data = repair_json(raw)
+        except json.JSONDecodeError:
+            json_parse_total.inc(outcome="invalid", **labels)
+            raise
+        outcome = "repaired"
+    try:
+        result = model.model_validate(data).model_dump(exclude_unset=True)
+    except ValidationError as exc:
+        json_parse_total.inc(outcome="invalid", **labels)
+        raise ValueError(
+            f"{method} response does not match {model.__name__} "
+            f"({exc.error_count()} errors): {exc.errors()[0]['msg']}"
+        ) from exc
+    json_parse_total.inc(outcome=outcome, **labels)
+    if outcome == "repaired":
+        logger.info("llm_json_repaired", **labels, chars=len(raw))
+    return result
@@ -0,0 +1,364 @@
+"""
+LLM call telemetry — latency, TTFB, retries, tokens and cost per method.
+
+``TelemetryLLMProvider`` (and its async twin) wraps each concrete provider
+as the outermost layer and opens an ``LLMCallStats`` record in a context
+variable for the duration of every port method.  Lower layers fill it in
+without any plumbing through the port signatures:
+
+* the pooled httpx clients' event hooks (``http_event_hooks`` /
+  ``async_http_event_hooks``) count HTTP attempts — so SDK-internal
+  retries are included — and stamp time-to-first-byte on the first
+  response headers;
+* the concrete providers call ``note_usage`` with the token counts from
+  the SDK response.
+
+When the call finishes the record is aggregated into the in-process
+metrics registry and emitted as one ``llm_call`` structured log event:
+
+* ``llm_call_duration_seconds`` / ``llm_call_ttfb_seconds`` — histograms
+* ``llm_stream_first_item_seconds`` — time until a streaming call yields
+  its first usable item
+* ``llm_calls_total``, ``llm_call_errors_total``, ``llm_retries_total``
+* ``llm_tokens_total`` (kind = prompt / completion / cached)
+* ``llm_prompt_tokens_total`` (kind = prompt / cached) per prompt template
+  version, for prompts rendered from the registry in
+  ``app/application/use_cases/interview/prompts.py`` — cached / prompt is
+  the provider-side prefix cache hit rate of that template
+* ``llm_cost_usd_total`` — from ``LLM_PRICING_PER_1M_TOKENS``
+* ``llm_cancelled_calls_total`` / ``llm_reclaimed_seconds_total`` — calls
+  cancelled because the client disconnected or the request deadline passed
+  (see ``app/core/deadline.py``), and the provider time that saved,
+  estimated as the method's median successful duration minus the time the
+  call had already run
+
+Fallback and hedge usage is counted by the composites in ``factory.py``
+as ``llm_fallback_total``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+import structlog
+
+from app.core import deadline
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.infrastructure.llm.base import AsyncDelegatingLLMProvider, DelegatingLLMProvider
+
+logger = structlog.get_logger(__name__)
+
+call_duration = metrics.histogram("llm_call_duration_seconds", "Wall time per LLM call")
+call_ttfb = metrics.histogram("llm_call_ttfb_seconds", "Time to first response byte")
+stream_first_item = metrics.histogram(
+    "llm_stream_first_item_seconds", "Time to the first item of a streaming LLM call"
+)
+calls_total = metrics.counter("llm_calls_total", "LLM calls by outcome")
+call_errors = metrics.counter("llm_call_errors_total", "Failed LLM calls by failure class")
+retries_total = metrics.counter("llm_retries_total", "HTTP retries inside LLM calls")
+tokens_total = metrics.counter("llm_tokens_total", "Tokens reported by the provider SDK")
+cost_total = metrics.counter("llm_cost_usd_total", "Estimated spend in USD")
+prompt_tokens_total = metrics.counter(
+    "llm_prompt_tokens_total", "Prompt and cached prompt tokens per prompt template version"
+)
+fallback_total = metrics.counter("llm_fallback_total", "Calls served by the fallback provider")
+cancelled_total = metrics.counter(
+    "llm_cancelled_calls_total", "LLM calls cancelled before they finished, by reason"
+)
+reclaimed_seconds = metrics.counter(
+    "llm_reclaimed_seconds_total", "Estimated provider time saved by cancelled LLM calls"
+)
+
+
+@dataclass
+class LLMCallStats:
+    """Mutable record for one provider method call."""
+
+    provider: str
+    model: str
+    method: str
+    started: float = field(default_factory=time.monotonic)
+    attempts: int = 0
+    ttfb: float | None = None
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+    prompt_version: str | None = None
+
+    @property
+    def retries(self) -> int:
+        return max(self.attempts - 1, 0)
+
+
+_current_call: ContextVar[LLMCallStats | None] = ContextVar("llm_current_call", default=None)
+
+
+def current_call() -> LLMCallStats | None:
+    """The call record of the provider method running in this context, if any."""
+    return _current_call.get()
+
+
+def note_usage(
+    prompt_tokens: int | None, completion_tokens: int | None, cached_tokens: int | None = 0
+) -> None:
+    """Add SDK-reported token usage to the current call (no-op outside a call)."""
+    stats = _current_call.get()
+    if stats is None:
+        return
+    stats.prompt_tokens += prompt_tokens or 0
+    stats.completion_tokens += completion_tokens or 0
+    stats.cached_tokens += cached_tokens or 0
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """USD cost from ``LLM_PRICING_PER_1M_TOKENS`` (0.0 for unpriced models)."""
+    bare_model = model.split(":", 1)[-1]
+    price = settings.LLM_PRICING_PER_1M_TOKENS.get(bare_model)
+    if not price:
+        return 0.0
+    input_price, output_price = price
+    return (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+
+
+# ------------------------------------------------------------------
+# httpx event hooks — installed on the pooled clients in factory.py
+# ------------------------------------------------------------------
+
+
+def _on_request(request: httpx.Request) -> None:
+    stats = _current_call.get()
+    if stats is not None:
+        stats.attempts += 1
+
+
+def _on_response(response: httpx.Response) -> None:
+    stats = _current_call.get()
+    if stats is not None and stats.ttfb is None:
+        stats.ttfb = time.monotonic() - stats.started
+
+
+async def _aon_request(request: httpx.Request) -> None:
+    _on_request(request)
+
+
+async def _aon_response(response: httpx.Response) -> None:
+    _on_response(response)
+
+
+def http_event_hooks() -> dict[str, list[Any]]:
+    return {"request": [_on_request], "response": [_on_response]}
+
+
+def async_http_event_hooks() -> dict[str, list[Any]]:
+    return {"request": [_aon_request], "response": [_aon_response]}
+
+
+# ------------------------------------------------------------------
+# Aggregation
+# ------------------------------------------------------------------
+
+
+def _failure_class(exc: BaseException) -> str:
+    """Name the root cause (e.g. ``APITimeoutError``) rather than the wrapper."""
+    cause = exc.__cause__ or exc
+    return type(cause).__name__
+
+
+def _prompt_version(args: tuple[Any, ...]) -> str | None:
+    """The ``prompt_version`` of a ``{system_prompt, user_prompt, ...}`` argument."""
+    if args and isinstance(args[0], dict):
+        version = args[0].get("prompt_version")
+        return version if isinstance(version, str) else None
+    return None
+
+
+def _new_stats(provider: Any, method_name: str, args: tuple[Any, ...]) -> LLMCallStats:
+    return LLMCallStats(
+        provider.provider_name.lower(),
+        provider.model_name,
+        method_name,
+        prompt_version=_prompt_version(args),
+    )
+
+
+def _observe_first_item(stats: LLMCallStats) -> None:
+    stream_first_item.observe(
+        time.monotonic() - stats.started,
+        provider=stats.provider,
+        model=stats.model,
+        method=stats.method,
+    )
+
+
+def _cancel_reason(exc: asyncio.CancelledError) -> str:
+    reason = exc.args[0] if exc.args else None
+    return reason if reason in (deadline.DISCONNECT, deadline.DEADLINE) else "cancelled"
+
+
+def _record_cancelled(
+    stats: LLMCallStats, exc: asyncio.CancelledError, elapsed: float, labels: dict[str, str]
+) -> None:
+    reason = _cancel_reason(exc)
+    typical = call_duration.quantile(0.5, outcome="ok", **labels)
+    saved = max((typical or 0.0) - elapsed, 0.0)
+    cancelled_total.inc(reason=reason, **labels)
+    reclaimed_seconds.inc(saved, reason=reason, **labels)
+    logger.info(
+        "llm_call_cancelled",
+        **labels,
+        reason=reason,
+        elapsed_ms=round(elapsed * 1000, 1),
+        reclaimed_ms=round(saved * 1000, 1),
+    )
+
+
+def _record(stats: LLMCallStats, error: BaseException | None) -> None:
+    elapsed = time.monotonic() - stats.started
+    labels = {"provider": stats.provider, "model": stats.model, "method": stats.method}
+    if isinstance(error, asyncio.CancelledError):
+        _record_cancelled(stats, error, elapsed, labels)
+        outcome = "cancelled"
+    else:
+        outcome = "ok" if error is None else "error"
+    cost = estimate_cost(stats.model, stats.prompt_tokens, stats.completion_tokens)
+
+    call_duration.observe(elapsed, outcome=outcome, **labels)
+    if stats.ttfb is not None:
+        call_ttfb.observe(stats.ttfb, **labels)
+    calls_total.inc(outcome=outcome, **labels)
+    if outcome == "error":
+        call_errors.inc(error=_failure_class(error), **labels)
+    if stats.retries:
+        retries_total.inc(stats.retries, **labels)
+    for kind, count in (
+        ("prompt", stats.prompt_tokens),
+        ("completion", stats.completion_tokens),
+        ("cached", stats.cached_tokens),
+    ):
+        if count:
+            tokens_total.inc(count, kind=kind, **labels)
+    if stats.prompt_version is not None:
+        for kind, count in (("prompt", stats.prompt_tokens), ("cached", stats.cached_tokens)):
+            if count:
+                prompt_tokens_total.inc(
+                    count, prompt_version=stats.prompt_version, kind=kind, provider=stats.provider
+                )
+    if cost:
+        cost_total.inc(cost, **labels)
+
+    logger.info(
+        "llm_call",
+        **labels,
+        prompt_version=stats.prompt_version,
+        outcome=outcome,
+        error=_failure_class(error) if error is not None else None,
+        duration_ms=round(elapsed * 1000, 1),
+        ttfb_ms=round(stats.ttfb * 1000, 1) if stats.ttfb is not None else None,
+        retries=stats.retries,
+        prompt_tokens=stats.prompt_tokens,
+        completion_tokens=stats.completion_tokens,
+        cached_tokens=stats.cached_tokens,
+        cost_usd=round(cost, 6),
+    )
+
+
+# ------------------------------------------------------------------
+# Provider wrappers
+# ------------------------------------------------------------------
+
+
+class TelemetryLLMProvider(DelegatingLLMProvider):
+    """Records an ``LLMCallStats`` for every sync provider call."""
+
+    def _call(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
+        stats = _new_stats(self, method_name, args)
+        token = _current_call.set(stats)
+        error: BaseException | None = None
+        try:
+            return super()._call(method_name, *args, **kwargs)
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            _current_call.reset(token)
+            _record(stats, error)
+
+    def _stream(self, method_name: str, *args: Any, **kwargs: Any) -> Iterator[Any]:
+        # The record is only current while the inner iterator runs, never
+        # across a yield into the consumer.
+        stats = _new_stats(self, method_name, args)
+        inner = super()._stream(method_name, *args, **kwargs)
+        error: BaseException | None = None
+        first = True
+        try:
+            while True:
+                token = _current_call.set(stats)
+                try:
+                    item = next(inner)
+                except StopIteration:
+                    break
+                finally:
+                    _current_call.reset(token)
+                if first:
+                    _observe_first_item(stats)
+                    first = False
+                yield item
+        except GeneratorExit:
+            raise
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            inner.close()
+            _record(stats, error)
+
+
+class AsyncTelemetryLLMProvider(AsyncDelegatingLLMProvider):
+    """Records an ``LLMCallStats`` for every async provider call."""
+
+    async def _acall(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
+        stats = _new_stats(self, method_name, args)
+        token = _current_call.set(stats)
+        error: BaseException | None = None
+        try:
+            return await super()._acall(method_name, *args, **kwargs)
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            _current_call.reset(token)
+            _record(stats, error)
+
+    async def _astream(self, method_name: str, *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        stats = _new_stats(self, method_name, args)
+        inner = super()._astream(method_name, *args, **kwargs)
+        error: BaseException | None = None
+        first = True
+        try:
+            while True:
+                token = _current_call.set(stats)
+                try:
+                    item = await anext(inner)
+                except StopAsyncIteration:
+                    break
+                finally:
+                    _current_call.reset(token)
+                if first:
+                    _observe_first_item(stats)
+                    first = False
+                yield item
+        except GeneratorExit:
+            raise
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            await inner.aclose()
+            _record(stats, error)
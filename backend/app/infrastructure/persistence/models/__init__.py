@@ -6,6 +6,7 @@ Import them from here or via the backward-compatible ``app.models`` package.
 """
 
 from app.infrastructure.persistence.models.base import Base, TimestampMixin
+from app.infrastructure.persistence.models.cache import ResumeParseCacheEntry
 from app.infrastructure.persistence.models.interview import InterviewQuestion, InterviewSession
 from app.infrastructure.persistence.models.resume import Resume
 from app.infrastructure.persistence.models.security import (
@@ -29,4 +30,5 @@ __all__ = [
     "UserSession",
     "PasswordHistory",
     "PasswordResetToken",
+    "ResumeParseCacheEntry",
 ]
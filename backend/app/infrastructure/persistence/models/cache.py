@@ -0,0 +1,18 @@
+"""Cache ORM models — durable fallback for Redis-backed caches."""
+
+from sqlalchemy import JSON, Column, DateTime, String
+from sqlalchemy.sql import func
+
+from app.infrastructure.persistence.models.base import Base
+
+
+class ResumeParseCacheEntry(Base):
+    """LLM resume-parse result keyed by the content hash of the extracted text."""
+
+    __tablename__ = "resume_parse_cache"
+
+    content_hash = Column(String(64), primary_key=True)
+    model = Column(String(255), nullable=False)
+    prompt_version = Column(String(32), nullable=False)
+    result = Column(JSON, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -17,6 +17,7 @@ Start the beat scheduler (optional — for periodic cleanup)::
 from __future__ import annotations
 
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
 
 from app.core.config import settings
 
@@ -40,7 +41,10 @@ celery_app.conf.update(
     task_acks_late=True,
     worker_prefetch_multiplier=1,  # one task at a time per worker
     # ── Auto-discover tasks in infrastructure.tasks ────────────────────────
-    imports=["app.infrastructure.tasks.resume_tasks"],
+    imports=[
+        "app.infrastructure.tasks.resume_tasks",
+        "app.infrastructure.tasks.interview_tasks",
+    ],
     # ── Beat schedule (periodic cleanup) ───────────────────────────────────
     beat_schedule={
         "prune-expired-blacklist-tokens": {
@@ -49,3 +53,23 @@ celery_app.conf.update(
         },
     },
 )
+
+
+# ── Per-process LLM connection pools ─────────────────────────────────────
+# Prefork children must never reuse sockets inherited from the parent, so
+# each worker process starts with an empty provider registry and closes its
+# own pools on exit.
+
+
+@worker_process_init.connect
+def _reset_llm_registry(**_kwargs: object) -> None:
+    from app.infrastructure.llm.registry import registry
+
+    registry.reset()
+
+
+@worker_process_shutdown.connect
+def _close_llm_registry(**_kwargs: object) -> None:
+    from app.infrastructure.llm.registry import registry
+
+    registry.close()
@@ -0,0 +1,356 @@
+"""
+Background Celery tasks for interview sessions.
+
+* ``evaluate_answer`` scores each answer as soon as it is submitted, so
+  completing the interview no longer waits for one large evaluation call
+  over the whole transcript.
+* ``refill_question_pool`` pre-generates question sets for an analyzed
+  resume, so starting an interview usually needs no LLM call.
+* ``complete_interview`` runs ``CompleteInterviewUseCase`` for
+  ``POST /interview/{id}/complete/job``, so a long evaluation does not hold
+  an API worker (or the client's connection) open.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import structlog
+
+from app.domain.interfaces.task_queue import ICompletionQueue, IEvaluationQueue
+from app.infrastructure.tasks.celery_app import celery_app
+from app.infrastructure.tasks.resume_tasks import _get_sync_session
+from app.infrastructure.tasks.task_owners import record_owner
+
+logger = structlog.get_logger(__name__)
+
+
+@celery_app.task(
+    bind=True,
+    name="app.infrastructure.tasks.interview_tasks.evaluate_answer",
+    ignore_result=True,
+    max_retries=2,
+    default_retry_delay=10,
+)
+def evaluate_answer_task(self, session_id: str, question_id: str):
+    """
+    Score one submitted answer and persist ``evaluation_score`` /
+    ``feedback_comment`` on the question row.
+
+    The write is skipped when the session has been completed in the
+    meantime (completion scored it already) or the answer was edited while
+    the LLM call was running (a newer task covers the new answer).
+    Trivially weak answers are scored locally without an LLM call
+    (``INTERVIEW_PRESCORE_ENABLED``).
+
+    Parameters
+    ----------
+    session_id : str
+        UUID of the interview session.
+    question_id : str
+        UUID of the answered question.
+    """
+    from sqlalchemy import select
+
+    from app.application.use_cases.interview.evaluation import (
+        build_answer_prompt,
+        parse_answer_feedback,
+    )
+    from app.application.use_cases.interview.prescore import prescore
+    from app.core.config import settings
+    from app.infrastructure.llm.registry import get_shared_llm_provider
+    from app.models.interview import InterviewQuestion, InterviewSession
+
+    question_uuid = uuid.UUID(question_id)
+    session_uuid = uuid.UUID(session_id)
+
+    def _load(db) -> tuple[InterviewQuestion | None, InterviewSession | None]:
+        question = (
+            db.execute(
+                select(InterviewQuestion).where(
+                    InterviewQuestion.id == question_uuid,
+                    InterviewQuestion.session_id == session_uuid,
+                )
+            )
+            .scalars()
+            .first()
+        )
+        session = db.get(InterviewSession, session_uuid)
+        return question, session
+
+    db = _get_sync_session()
+    try:
+        question, session = _load(db)
+        if question is None or session is None or question.answer_text is None:
+            return {"question_id": question_id, "status": "skipped"}
+        if session.completed_at is not None:
+            return {"question_id": question_id, "status": "skipped"}
+
+        answer_text = question.answer_text
+        grade = (
+            prescore(question.question_text, answer_text)
+            if settings.INTERVIEW_PRESCORE_ENABLED
+            else None
+        )
+        if grade is not None:
+            # Trivially weak answer: scored locally, no LLM call.
+            question.evaluation_score = grade.score  # type: ignore[assignment]
+            question.feedback_comment = grade.feedback  # type: ignore[assignment]
+            db.commit()
+            logger.info("answer_prescored", question_id=question_id, reason=grade.reason)
+            return {"question_id": question_id, "status": "prescored", "score": grade.score}
+
+        prompt = build_answer_prompt(question.question_text, answer_text, question.category)
+        # Release the connection while the LLM call runs.
+        db.rollback()
+
+        score, comment = parse_answer_feedback(get_shared_llm_provider().generate_feedback(prompt))
+
+        question, session = _load(db)
+        if (
+            question is None
+            or session is None
+            or session.completed_at is not None
+            or question.answer_text != answer_text
+        ):
+            logger.info("answer_evaluation_stale", question_id=question_id)
+            return {"question_id": question_id, "status": "stale"}
+
+        question.evaluation_score = score  # type: ignore[assignment]
+        question.feedback_comment = comment  # type: ignore[assignment]
+        db.commit()
+
+        logger.info("answer_evaluated", question_id=question_id, score=score)
+        return {"question_id": question_id, "status": "evaluated", "score": score}
+
+    except Exception as exc:
+        db.rollback()
+        logger.warning("answer_evaluation_failed", question_id=question_id, error=str(exc))
+        # Unscored answers are evaluated at completion, so retries are best-effort.
+        raise self.retry(exc=exc) from exc
+
+    finally:
+        db.close()
+
+
+@celery_app.task(
+    bind=True,
+    name="app.infrastructure.tasks.interview_tasks.refill_question_pool",
+    ignore_result=True,
+    max_retries=1,
+    default_retry_delay=60,
+)
+def refill_question_pool_task(
+    self,
+    resume_id: str,
+    difficulty: str,
+    resume_context: dict[str, Any],
+    prompt_version: str,
+    prompts: dict[str, str],
+):
+    """
+    Top up one preset's question pool for a resume.
+
+    Enqueued by ``StartInterviewUseCase`` after each draw from the pool,
+    which builds the context and the prompt — the pool only stores sets.
+
+    Parameters
+    ----------
+    resume_id : str
+        UUID of the analyzed resume.
+    difficulty : str
+        Preset to refill.
+    resume_context, prompt_version : dict, str
+        What the pool is keyed by (see ``question_pool.pool_key``).
+    prompts : dict[str, str]
+        ``generate_questions`` prompt for one set of ``QUESTION_POOL_SET_SIZE``
+        questions.
+    """
+    from app.core.config import settings
+    from app.infrastructure.cache.question_pool import question_pool
+    from app.infrastructure.llm.registry import get_shared_llm_provider
+    from app.infrastructure.llm.single_flight import uncoalesced
+
+    generated = 0
+    if not question_pool.acquire_refill_lock(resume_id, difficulty):
+        return {"resume_id": resume_id, "generated": generated}
+    try:
+        missing = settings.QUESTION_POOL_SIZE - question_pool.size(
+            resume_id, difficulty, resume_context, prompt_version
+        )
+        for _ in range(max(missing, 0)):
+            # The prompt can equal a live start's (same count, no focus
+            # areas): joining that call would pool the set just served.
+            with uncoalesced():
+                questions = get_shared_llm_provider().generate_questions(prompts)
+            if len(questions) < question_pool.set_size:
+                logger.warning(
+                    "question_pool_short_set",
+                    resume_id=resume_id,
+                    difficulty=difficulty,
+                    count=len(questions),
+                )
+                break
+            question_pool.add(resume_id, difficulty, resume_context, prompt_version, questions)
+            generated += 1
+    except Exception as exc:
+        logger.warning(
+            "question_pool_refill_failed",
+            resume_id=resume_id,
+            difficulty=difficulty,
+            error=str(exc),
+        )
+    finally:
+        question_pool.release_refill_lock(resume_id, difficulty)
+
+    logger.info(
+        "question_pool_refilled", resume_id=resume_id, difficulty=difficulty, generated=generated
+    )
+    return {"resume_id": resume_id, "generated": generated}
+
+
+@celery_app.task(
+    bind=True,
+    name="app.infrastructure.tasks.interview_tasks.complete_interview",
+    acks_late=False,  # a redelivered completion would evaluate the transcript twice
+)
+def complete_interview_task(self, user_id: str, session_id: str):
+    """
+    Evaluate and finalize an interview session in the background.
+
+    Progress is published as the custom task state ``PROGRESS`` with
+    ``{"stage", "done", "total"}`` meta (see ``CompleteInterviewUseCase``);
+    the result is the ``SummaryOut`` payload of ``POST /complete``.  Both
+    are read through ``GET /tasks/{task_id}``.
+
+    Parameters
+    ----------
+    user_id : str
+        UUID of the session owner.
+    session_id : str
+        UUID of the interview session to complete.
+    """
+
+    def report(stage: str, done: int, total: int) -> None:
+        self.update_state(state="PROGRESS", meta={"stage": stage, "done": done, "total": total})
+
+    logger.info("complete_interview_task_started", session_id=session_id)
+    result = asyncio.run(_complete_interview(uuid.UUID(user_id), uuid.UUID(session_id), report))
+    logger.info("complete_interview_task_finished", session_id=session_id)
+    return result
+
+
+async def _complete_interview(
+    user_id: uuid.UUID, session_id: uuid.UUID, report: Any
+) -> dict[str, Any]:
+    from dataclasses import asdict
+
+    from app.application.use_cases.interview import CompleteInterviewUseCase
+    from app.core.config import settings
+    from app.db.session import AsyncSessionLocal, async_engine
+    from app.infrastructure.cache.redis_client import close_redis
+    from app.infrastructure.llm.factory import get_async_llm_provider
+    from app.infrastructure.persistence.repositories import InterviewRepository
+    from app.schemas.interview import SummaryOut
+
+    # Each task runs on a fresh event loop, while async DB connections and
+    # LLM HTTP clients are bound to the loop that opened them: build the
+    # provider per task and drop pooled connections before the loop closes.
+    llm = get_async_llm_provider()
+    try:
+        async with AsyncSessionLocal() as db:
+            use_case = CompleteInterviewUseCase(
+                InterviewRepository(db),
+                llm,
+                summarize_with_llm=settings.INTERVIEW_SUMMARY_LLM_ENABLED,
+                prescore=settings.INTERVIEW_PRESCORE_ENABLED,
+                batch_size=settings.INTERVIEW_EVAL_BATCH_SIZE,
+                batch_concurrency=settings.INTERVIEW_EVAL_BATCH_CONCURRENCY,
+                batch_retries=settings.INTERVIEW_EVAL_BATCH_RETRIES,
+                on_progress=report,
+            )
+            result = await use_case.execute(user_id, session_id)
+        return SummaryOut.model_validate(asdict(result)).model_dump(mode="json")
+    finally:
+        await llm.aclose()
+        await close_redis()
+        await async_engine.dispose()
+
+
+# ------------------------------------------------------------------
+# Dispatch from the request path
+# ------------------------------------------------------------------
+# Publishing blocks for seconds while kombu retries an unreachable broker, so
+# tasks enqueued from API requests are published on a small thread pool and
+# the request never waits for the broker.
+
+_dispatcher: ThreadPoolExecutor | None = None
+_dispatcher_pid: int | None = None
+
+
+def _get_dispatcher() -> ThreadPoolExecutor:
+    global _dispatcher, _dispatcher_pid
+    if _dispatcher is None or _dispatcher_pid != os.getpid():
+        _dispatcher = ThreadPoolExecutor(max_workers=2, thread_name_prefix="celery-dispatch")
+        _dispatcher_pid = os.getpid()
+    return _dispatcher
+
+
+def dispatch_nowait(task: Any, kwargs: dict[str, Any], **log: Any) -> str | None:
+    """Publish *task* in the background and return its id right away."""
+    task_id = str(uuid.uuid4())
+
+    def _publish() -> None:
+        try:
+            task.apply_async(kwargs=kwargs, task_id=task_id, retry=False)
+        except Exception as exc:
+            logger.warning("task_dispatch_failed", task=task.name, error=str(exc), **log)
+
+    try:
+        _get_dispatcher().submit(_publish)
+    except RuntimeError as exc:  # interpreter shutting down
+        logger.warning("task_dispatch_failed", task=task.name, error=str(exc), **log)
+        return None
+    return task_id
+
+
+class CeleryEvaluationQueue(IEvaluationQueue):
+    """Dispatches ``evaluate_answer_task`` through the Celery broker."""
+
+    def enqueue_answer_evaluation(
+        self, session_id: uuid.UUID, question_id: uuid.UUID
+    ) -> str | None:
+        return dispatch_nowait(
+            evaluate_answer_task,
+            {"session_id": str(session_id), "question_id": str(question_id)},
+            question_id=str(question_id),
+        )
+
+
+class CeleryCompletionQueue(ICompletionQueue):
+    """Publishes ``complete_interview_task`` — synchronously, so failures are reported."""
+
+    def enqueue_interview_completion(self, user_id: uuid.UUID, session_id: uuid.UUID) -> str | None:
+        # The result holds the user's scores: only the owner may poll it.
+        task_id = str(uuid.uuid4())
+        if not record_owner(task_id, user_id):
+            return None
+        try:
+            task = complete_interview_task.apply_async(
+                kwargs={"user_id": str(user_id), "session_id": str(session_id)},
+                task_id=task_id,
+                retry=False,
+            )
+        except Exception as exc:
+            logger.warning(
+                "task_dispatch_failed",
+                task=complete_interview_task.name,
+                error=str(exc),
+                session_id=str(session_id),
+            )
+            return None
+        return task.id
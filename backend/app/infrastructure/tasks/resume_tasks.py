@@ -58,7 +58,7 @@ def parse_resume_task(self, file_path: str, user_id: str, resume_id: str):
     """
     from sqlalchemy import select
 
-    from app.infrastructure.llm.factory import get_llm_provider
+    from app.infrastructure.llm.registry import get_shared_llm_provider
     from app.models.resume import Resume as ResumeModel
     from app.schemas.resume import ResumeStatus
 
@@ -74,17 +74,19 @@ def parse_resume_task(self, file_path: str, user_id: str, resume_id: str):
     db = _get_sync_session()
     try:
         # 1. Text extraction (synchronous — CPU-bound, no async needed)
-        from app.services.resume_parser import _extract_text, _validate_mandatory
+        from app.services.resume_parser import (
+            MANDATORY_FIELDS,
+            _extract_text,
+            _validate_mandatory,
+            parse_resume_text,
+        )
 
         text = _extract_text(file_path)
 
-        # 2. LLM parse (provider.parse_resume is sync)
-        provider = get_llm_provider()
-        parsed = provider.parse_resume(text)
-        if not parsed:
-            parsed = {}
+        # 2. LLM parse (sync provider, served from the parse cache when possible)
+        parsed = parse_resume_text(get_shared_llm_provider(), text, db)
 
-        _validate_mandatory(parsed, fields=("experience", "education", "skills"))
+        _validate_mandatory(parsed, fields=MANDATORY_FIELDS)
 
         # 3. Update the existing Resume row
         result = db.execute(select(ResumeModel).where(ResumeModel.id == resume_uuid))
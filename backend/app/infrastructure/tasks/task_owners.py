@@ -0,0 +1,46 @@
+"""
+Task ownership — who may poll a background task.
+
+``GET /tasks/{task_id}`` returns task results (a completed interview's
+summary, a parsed resume), so it only answers the user who dispatched the
+task.  Dispatchers record the owner before publishing::
+
+    task:owner:<task_id>  →  <user_id>   (kept as long as Celery results)
+
+A task whose owner cannot be recorded is not published.  Unknown, expired
+or unreadable owners read as ``None`` — the endpoint then answers 404, as
+for another user's task.
+"""
+
+from __future__ import annotations
+
+import uuid
+
+import structlog
+
+from app.infrastructure.cache.redis_client import get_redis, get_sync_redis
+from app.infrastructure.tasks.celery_app import celery_app
+
+logger = structlog.get_logger(__name__)
+
+_KEY_PREFIX = "task:owner:"
+
+
+def record_owner(task_id: str, user_id: uuid.UUID | str) -> bool:
+    """Record *user_id* as the owner of *task_id*; ``False`` if Redis failed."""
+    try:
+        get_sync_redis().set(_KEY_PREFIX + task_id, str(user_id), ex=celery_app.conf.result_expires)
+    except Exception as exc:
+        logger.warning("task_owner_record_failed", task_id=task_id, error=str(exc))
+        return False
+    return True
+
+
+async def get_owner(task_id: str) -> str | None:
+    """The user id recorded for *task_id*, or ``None``."""
+    try:
+        r = await get_redis()
+        return await r.get(_KEY_PREFIX + task_id)
+    except Exception as exc:
+        logger.warning("task_owner_read_failed", task_id=task_id, error=str(exc))
+        return None
@@ -0,0 +1,9 @@
+"""
+Backward-compatible re-export.
+
+Canonical location: app.infrastructure.persistence.models.cache
+"""
+
+from app.infrastructure.persistence.models.cache import ResumeParseCacheEntry  # noqa: F401
+
+__all__ = ["ResumeParseCacheEntry"]
@@ -110,3 +110,9 @@ class SummaryOut(BaseModel):
     score_breakdown: dict[str, Any] | None = None
     strengths: list[str] | None = None
     weaknesses: list[str] | None = None
+
+
+class CompletionJobOut(BaseModel):
+    session_id: UUID
+    task_id: str
+    status_url: str  # poll for progress and the final SummaryOut
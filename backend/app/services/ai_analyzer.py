@@ -11,7 +11,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.value_objects.enums import ResumeStatus
-from app.infrastructure.llm.factory import get_llm_provider
+from app.infrastructure.llm.registry import get_shared_async_llm_provider
 from app.models.resume import Resume
 
 logger = structlog.get_logger(__name__)
@@ -30,11 +30,11 @@ async def analyze_resume_content(resume_id: UUID, db: AsyncSession) -> None:
 
     try:
         # Extract text from the stored file
-        from app.services.resume_parser import _extract_text  # local import to avoid circulars
+        # local import to avoid circulars
+        from app.services.resume_parser import _extract_text, aparse_resume_text
 
         text = _extract_text(resume.file_path)
-        provider = get_llm_provider()
-        parsed = provider.parse_resume(text)
+        parsed = await aparse_resume_text(get_shared_async_llm_provider(), text, db)
 
         resume.analysis = parsed
         resume.status = ResumeStatus.ANALYZED
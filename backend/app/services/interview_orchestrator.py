@@ -8,7 +8,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.interfaces.llm_provider import ILLMProvider
-from app.infrastructure.llm.factory import get_llm_provider
+from app.infrastructure.llm.registry import get_shared_llm_provider
 from app.models.interview import InterviewQuestion, InterviewSession
 from app.models.resume import Resume
 from app.models.user import User
@@ -20,7 +20,7 @@ logger = structlog.get_logger(__name__)
 class InterviewOrchestrator:
     def __init__(self, db: AsyncSession, llm_provider: ILLMProvider | None = None):
         self.db = db
-        self.llm_provider = llm_provider or get_llm_provider()
+        self.llm_provider = llm_provider or get_shared_llm_provider()
 
     async def fetch_resume_context(self, resume_id: UUID) -> dict:
         result = await self.db.execute(select(Resume).where(Resume.id == resume_id))
@@ -181,7 +181,7 @@ async def complete_interview_session(db: AsyncSession, session: InterviewSession
         ),
     }
 
-    llm_provider = get_llm_provider()
+    llm_provider = get_shared_llm_provider()
     try:
         llm_response = llm_provider.generate_feedback(prompt)
     except Exception as e:
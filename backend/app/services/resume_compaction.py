@@ -0,0 +1,237 @@
+"""
+Resume text compaction — shrink extracted text before it reaches the LLM.
+
+pdfplumber output carries a lot that costs prompt tokens without telling
+the parser anything: whitespace runs, the same header / footer on every
+page, page numbers, boilerplate ("References available upon request") and
+sections pasted twice.  ``compact_resume_text`` removes those, then trims
+the longest sections until the text fits ``RESUME_TOKEN_BUDGET``.
+
+Token counts use ``estimate_tokens`` — a local, dependency-free
+approximation of a BPE tokenizer (words split into ~6-character pieces,
+digits into ~3, punctuation one each).  Counts before and after compaction
+are exported as ``resume_compaction_tokens_total`` (stage = before / after)
+and logged per resume as ``resume_text_compacted``.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass
+
+import structlog
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+logger = structlog.get_logger(__name__)
+
+PAGE_BREAK = "\f"
+
+compaction_tokens = metrics.counter(
+    "resume_compaction_tokens_total", "Estimated resume prompt tokens before / after compaction"
+)
+
+_TOKEN_RE = re.compile(r"[^\W\d_]+|\d+|[^\w\s]|_")
+_INLINE_SPACE_RE = re.compile(r"[ \t\u00a0\u2000-\u200b\u3000]+")
+_DIGITS_RE = re.compile(r"\d+")
+_PAGE_NUMBER_RE = re.compile(r"^(page\s*)?\d{1,3}(\s*(of|/)\s*\d{1,3})?$|^-\s*\d{1,3}\s*-$", re.I)
+_BOILERPLATE_RE = re.compile(
+    r"^(references\s+(are\s+)?available\s+(up)?on\s+request\.?"
+    r"|curriculum\s+vitae|r[eé]sum[eé]|cv"
+    r"|this\s+(resume|cv)\s+was\s+(generated|created)\s+(with|by|using)\b.*)$",
+    re.I,
+)
+_HEADING_MAX_CHARS = 40
+_REPEATED_LINE_MAX_CHARS = 120
+_DEDUPE_LINE_MIN_CHARS = 25
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate BPE token count of *text*."""
+    count = 0
+    for match in _TOKEN_RE.finditer(text):
+        piece = match.group()
+        if piece.isdigit():
+            count += math.ceil(len(piece) / 3)
+        elif piece[0].isalpha():
+            count += math.ceil(len(piece) / 6)
+        else:
+            count += 1
+    return count
+
+
+@dataclass(frozen=True)
+class CompactionResult:
+    text: str
+    tokens_before: int
+    tokens_after: int
+    truncated: bool = False
+
+    @property
+    def saved_ratio(self) -> float:
+        if not self.tokens_before:
+            return 0.0
+        return round(1 - self.tokens_after / self.tokens_before, 4)
+
+
+def compact_resume_text(text: str, token_budget: int | None = None) -> CompactionResult:
+    """Compact extracted resume text and fit it into *token_budget* tokens.
+
+    Pages are expected to be separated by ``PAGE_BREAK`` (as produced by
+    ``resume_parser._extract_text``); without page breaks, repeated
+    header / footer detection is skipped.
+    """
+    budget = token_budget if token_budget is not None else settings.RESUME_TOKEN_BUDGET
+    tokens_before = estimate_tokens(text)
+
+    pages = [_normalize_lines(page) for page in text.split(PAGE_BREAK)]
+    lines = _drop_repeated_page_lines(pages)
+    lines = [ln for ln in lines if not _is_noise(ln)]
+    sections = _dedupe_sections(_split_sections(lines))
+
+    truncated = False
+    if budget > 0:
+        sections, truncated = _fit_budget(sections, budget)
+
+    compacted = "\n\n".join("\n".join(section) for section in sections if section).strip()
+    result = CompactionResult(compacted, tokens_before, estimate_tokens(compacted), truncated)
+
+    compaction_tokens.inc(result.tokens_before, stage="before")
+    compaction_tokens.inc(result.tokens_after, stage="after")
+    logger.info(
+        "resume_text_compacted",
+        tokens_before=result.tokens_before,
+        tokens_after=result.tokens_after,
+        saved_ratio=result.saved_ratio,
+        truncated=truncated,
+    )
+    return result
+
+
+# ─── Stages ────────────────────────────────────────────────────────────────────
+def _normalize_lines(page: str) -> list[str]:
+    """NFKC, collapsed inline whitespace, stripped lines, no blank runs."""
+    page = unicodedata.normalize("NFKC", page).replace("\r", "\n")
+    lines: list[str] = []
+    for raw in page.split("\n"):
+        line = _INLINE_SPACE_RE.sub(" ", raw).strip()
+        if line or (lines and lines[-1]):
+            lines.append(line)
+    while lines and not lines[-1]:
+        lines.pop()
+    return lines
+
+
+def _drop_repeated_page_lines(pages: list[list[str]]) -> list[str]:
+    """Keep only the first copy of short lines found on at least half of the
+    pages (headers, footers) — the first copy often carries the candidate's
+    name and contact details.
+
+    Digits are masked for the comparison so "Page 2 of 3" style footers match.
+    """
+    if len(pages) < 2:
+        return pages[0] if pages else []
+
+    def _mask(line: str) -> str:
+        return _DIGITS_RE.sub("#", line.lower())
+
+    seen_on = Counter(
+        masked
+        for page in pages
+        for masked in {_mask(ln) for ln in page if 0 < len(ln) <= _REPEATED_LINE_MAX_CHARS}
+    )
+    threshold = max(2, math.ceil(len(pages) / 2))
+    repeated = {masked for masked, n in seen_on.items() if n >= threshold}
+
+    emitted: set[str] = set()
+    lines: list[str] = []
+    for page in pages:
+        kept: list[str] = []
+        for ln in page:
+            masked = _mask(ln)
+            if ln and masked in repeated:
+                if masked in emitted:
+                    continue
+                emitted.add(masked)
+            kept.append(ln)
+        if lines and kept:
+            lines.append("")
+        lines.extend(kept)
+    return lines
+
+
+def _is_noise(line: str) -> bool:
+    return bool(line) and bool(_PAGE_NUMBER_RE.match(line) or _BOILERPLATE_RE.match(line))
+
+
+def is_heading(line: str) -> bool:
+    """Short line that is all caps or ends with a colon ("EXPERIENCE", "Skills:")."""
+    if not line or len(line) > _HEADING_MAX_CHARS or line[-1] in ".,;":
+        return False
+    letters = [c for c in line if c.isalpha()]
+    return bool(letters) and (line.endswith(":") or all(c.isupper() for c in letters))
+
+
+def _split_sections(lines: list[str]) -> list[list[str]]:
+    """Group lines into sections starting at heading lines; blank lines are dropped."""
+    sections: list[list[str]] = [[]]
+    for line in lines:
+        if not line:
+            continue
+        if is_heading(line) and sections[-1]:
+            sections.append([])
+        sections[-1].append(line)
+    return [s for s in sections if s]
+
+
+def _dedupe_sections(sections: list[list[str]]) -> list[list[str]]:
+    """Drop sections identical to an earlier one, then repeated long lines."""
+    seen_sections: set[tuple[str, ...]] = set()
+    seen_lines: set[str] = set()
+    result: list[list[str]] = []
+    for section in sections:
+        signature = tuple(ln.lower() for ln in section)
+        if signature in seen_sections:
+            continue
+        seen_sections.add(signature)
+        kept: list[str] = []
+        for line in section:
+            key = line.lower()
+            if len(line) >= _DEDUPE_LINE_MIN_CHARS:
+                if key in seen_lines:
+                    continue
+                seen_lines.add(key)
+            kept.append(line)
+        result.append(kept)
+    return result
+
+
+def _fit_budget(sections: list[list[str]], budget: int) -> tuple[list[list[str]], bool]:
+    """Trim the tail of the longest section until the estimate fits *budget*.
+
+    Every section keeps at least its first line, so no part of the resume
+    (skills, education …) disappears entirely; only if the headings alone
+    exceed the budget are whole trailing sections dropped.
+    """
+    sizes = [[estimate_tokens(ln) + 1 for ln in section] for section in sections]
+    total = sum(map(sum, sizes)) + 2 * len(sections)
+    if total <= budget:
+        return sections, False
+
+    sections = [list(s) for s in sections]
+    while total > budget:
+        trimmable = [i for i, s in enumerate(sizes) if len(s) > 1]
+        if not trimmable:
+            break
+        longest = max(trimmable, key=lambda i: sum(sizes[i]))
+        sections[longest].pop()
+        total -= sizes[longest].pop()
+
+    while total > budget and len(sections) > 1:
+        sections.pop()
+        total -= sum(sizes.pop()) + 2
+    return sections, True
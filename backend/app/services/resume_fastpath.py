@@ -0,0 +1,308 @@
+"""
+Resume fast path — fields extracted locally instead of by the LLM.
+
+Contact details and the skill inventory need no model: ``parse_resume`` used
+to have the LLM read the contact header and the skills section and write
+them back out as JSON.  ``extract_fast_fields`` takes them in milliseconds:
+
+* ``email`` / ``phone`` — regexes (the phone only from the header lines);
+* ``name`` — the leading segment of the first line when it reads as a name;
+* ``skills`` — every item of the skills section, plus every skill of the
+  dictionary (``skills_dictionary``) mentioned anywhere in the text, found
+  in a single pass by an Aho-Corasick automaton.
+
+Lines fully accounted for — contact lines, the list lines of the skills
+section — are dropped from the text sent to the LLM, and
+``merge_fast_fields`` folds the local fields into the LLM's parse.  Token
+counts before / after are exported as ``resume_fastpath_tokens_total``
+(stage = before / after).
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+
+from app.core.metrics import metrics
+from app.services.resume_compaction import estimate_tokens, is_heading
+from app.services.skills_dictionary import AMBIGUOUS, SKILLS
+
+logger = structlog.get_logger(__name__)
+
+fastpath_tokens = metrics.counter(
+    "resume_fastpath_tokens_total", "Estimated resume prompt tokens before / after the fast path"
+)
+
+_HEADER_LINES = 8  # contact details are looked for in this many leading lines
+_MAX_SKILL_WORDS = 4
+_MAX_SKILL_CHARS = 40
+
+_EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+_PHONE_RE = re.compile(r"(?<![\w+])\+?\(?\d[\d ().-]{7,}\d(?!\w)")
+_URL_RE = re.compile(r"(?:https?://|www\.)\S+|\b(?:linkedin|github|gitlab)\.com/\S*", re.I)
+_CONTACT_LABEL_RE = re.compile(
+    r"\b(?:e-?mail|phone|tel|mobile|cell|linkedin|github|portfolio|website|name)\b\s*:?", re.I
+)
+_NAME_WORD_RE = re.compile(r"^[A-Z][A-Za-z'.-]*$")
+_NOT_NAME_WORDS = frozenset(
+    {"resume", "curriculum", "vitae", "profile", "summary", "contact", "engineer",
+     "developer", "manager", "software", "senior", "analyst", "scientist", "designer",
+     "consultant", "intern", "architect", "lead"}
+)  # fmt: skip
+_SKILLS_HEADING_RE = re.compile(
+    r"^(?:technical |core |key |professional )?"
+    r"(?:skills|competencies|technologies|tech stack|tools)"
+    r"(?: (?:&|and) (?:tools|technologies|expertise))?\s*(?P<colon>:?)\s*(?P<rest>.*)$",
+    re.I,
+)
+_SECTION_RE = re.compile(
+    r"^(?:professional |work |relevant )?(?:experience|employment|work history|education|"
+    r"projects?|certifications?|summary|profile|objective|awards|publications|interests|"
+    r"languages|references|volunteering)$",
+    re.I,
+)
+_SKILL_SPLIT_RE = re.compile(r"[,;|•·()]|\s+-\s+")
+_BULLET_RE = re.compile(r"^[-*•·▪◦]+\s*")
+_SEPARATORS_RE = re.compile(r"[\s|•·,;:/()\-–—]+")
+
+
+class AhoCorasick:
+    """Multi-pattern matcher: every occurrence of any pattern in one pass."""
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[str]] = [[]]
+        for pattern in patterns:
+            self._add(pattern)
+        self._link()
+
+    def _add(self, pattern: str) -> None:
+        node = 0
+        for ch in pattern:
+            child = self._goto[node].get(ch)
+            if child is None:
+                child = len(self._goto)
+                self._goto[node][ch] = child
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = child
+        self._out[node].append(pattern)
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def find(self, text: str) -> Iterator[tuple[int, str]]:
+        """``(start, pattern)`` of every occurrence, overlapping ones included."""
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            for pattern in self._out[node]:
+                yield i - len(pattern) + 1, pattern
+
+
+# Lower-cased spelling → canonical skill name.
+_CANONICAL: dict[str, str] = {
+    spelling.lower(): name for name, aliases in SKILLS.items() for spelling in (name, *aliases)
+}
+_AUTOMATON = AhoCorasick(_CANONICAL)
+
+
+@dataclass(frozen=True)
+class FastPathResult:
+    fields: dict[str, Any] = field(default_factory=dict)
+    text: str = ""  # what is left for the LLM
+    tokens_before: int = 0
+    tokens_after: int = 0
+
+
+def extract_fast_fields(text: str) -> FastPathResult:
+    """Extract contact details and skills from *text* and strip the lines they used."""
+    lines = text.split("\n")
+    fields: dict[str, Any] = {}
+    consumed: set[int] = set()
+
+    email = _EMAIL_RE.search(text)
+    if email:
+        fields["email"] = email.group()
+    _extract_contact(lines, fields, consumed)
+
+    skills = _skills_section(lines, consumed)
+    for skill in find_skills(text):
+        if skill.lower() not in {s.lower() for s in skills}:
+            skills.append(skill)
+    if skills:
+        fields["skills"] = skills
+
+    remaining = "\n".join(ln for i, ln in enumerate(lines) if i not in consumed).strip()
+    result = FastPathResult(fields, remaining, estimate_tokens(text), estimate_tokens(remaining))
+
+    fastpath_tokens.inc(result.tokens_before, stage="before")
+    fastpath_tokens.inc(result.tokens_after, stage="after")
+    logger.info(
+        "resume_fastpath_extracted",
+        fields=sorted(fields),
+        skills=len(skills),
+        tokens_before=result.tokens_before,
+        tokens_after=result.tokens_after,
+    )
+    return result
+
+
+def merge_fast_fields(fields: dict[str, Any], parsed: dict[str, Any]) -> dict[str, Any]:
+    """Fold locally extracted *fields* into the LLM's *parsed* resume.
+
+    Email and phone come from the regexes; the LLM's name wins when it gave
+    one.  Skills are the LLM's followed by the local ones it did not list.
+    """
+    merged = dict(parsed)
+    for key in ("email", "phone"):
+        if fields.get(key):
+            merged[key] = fields[key]
+    if fields.get("name") and not parsed.get("name"):
+        merged["name"] = fields["name"]
+    if fields.get("skills"):
+        skills = [s for s in parsed.get("skills") or [] if isinstance(s, str)]
+        seen = {s.lower() for s in skills}
+        skills.extend(s for s in fields["skills"] if s.lower() not in seen)
+        merged["skills"] = skills
+    return merged
+
+
+def find_skills(text: str) -> list[str]:
+    """Dictionary skills mentioned in *text*, canonical names in order of appearance."""
+    lowered = text.lower()
+    if len(lowered) != len(text):  # a few characters lower-case to two
+        lowered = "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+
+    matches = sorted(_AUTOMATON.find(lowered), key=lambda m: (m[0], -len(m[1])))
+    found: list[str] = []
+    end = 0
+    for start, pattern in matches:
+        stop = start + len(pattern)
+        if start < end or not _on_word_boundary(lowered, start, stop):
+            continue
+        name = _CANONICAL[pattern]
+        if name in AMBIGUOUS and pattern == name.lower() and text[start:stop] != name:
+            continue
+        end = stop
+        if name not in found:
+            found.append(name)
+    return found
+
+
+# ─── Helpers ───────────────────────────────────────────────────────────────────
+def _on_word_boundary(text: str, start: int, stop: int) -> bool:
+    before = text[start - 1] if start > 0 else " "
+    after = text[stop] if stop < len(text) else " "
+    # "R&D", "C's" are not the languages.
+    return not (before.isalnum() or after.isalnum() or after in "&'")
+
+
+def _looks_like_name(segment: str) -> bool:
+    words = segment.split()
+    return (
+        2 <= len(words) <= 4
+        and all(_NAME_WORD_RE.match(w) for w in words)
+        and not any(w.lower().strip(".") in _NOT_NAME_WORDS for w in words)
+        and not find_skills(segment)
+    )
+
+
+def _extract_contact(lines: list[str], fields: dict[str, Any], consumed: set[int]) -> None:
+    """Name and phone from the header lines; header lines with nothing else are consumed."""
+    header = [i for i, ln in enumerate(lines) if ln.strip()][:_HEADER_LINES]
+    for position, i in enumerate(header):
+        line = lines[i]
+        rest = _URL_RE.sub(" ", _EMAIL_RE.sub(" ", line))
+        if "phone" not in fields:
+            for match in _PHONE_RE.finditer(rest):
+                digits = sum(c.isdigit() for c in match.group())
+                if 9 <= digits <= 15:
+                    fields["phone"] = match.group().strip()
+                    rest = rest.replace(match.group(), " ")
+                    break
+        if position == 0:
+            name = re.split(r"[|•·,]", _CONTACT_LABEL_RE.sub(" ", rest))[0].strip()
+            if _looks_like_name(name):
+                fields["name"] = name.title() if name.isupper() else name
+                rest = rest.replace(name, " ", 1)
+        rest = _CONTACT_LABEL_RE.sub(" ", rest)
+        if rest != line and not _SEPARATORS_RE.sub("", rest):
+            consumed.add(i)
+
+
+def _skill_items(line: str) -> list[str] | None:
+    """Items of one skills-list line, or None when the line reads as prose."""
+    line = _BULLET_RE.sub("", line.strip())
+    label, colon, rest = line.partition(":")
+    if colon and len(label.split()) <= 3:
+        line = rest  # "Languages: Python, Go"
+    items = [item.strip(" .") for item in _SKILL_SPLIT_RE.split(line)]
+    items = [item for item in items if item]
+    if not items or any(
+        len(item.split()) > _MAX_SKILL_WORDS or len(item) > _MAX_SKILL_CHARS for item in items
+    ):
+        return None
+    return [_CANONICAL.get(item.lower(), item) for item in items if any(c.isalpha() for c in item)]
+
+
+def _skills_section(lines: list[str], consumed: set[int]) -> list[str]:
+    """Items of the skills section; its heading and list lines are consumed."""
+    skills: list[str] = []
+    seen: set[str] = set()
+
+    def _add(items: list[str]) -> None:
+        for item in items:
+            if item.lower() not in seen:
+                seen.add(item.lower())
+                skills.append(item)
+
+    in_section = False
+    heading = -1
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        match = _SKILLS_HEADING_RE.match(stripped)
+        if match and (match.group("colon") or is_heading(stripped)):
+            in_section, heading = True, i
+            rest = match.group("rest")
+            items = _skill_items(rest) if rest else []
+            if items is not None:
+                _add(items)
+                consumed.add(i)
+            continue
+        if not in_section:
+            continue
+        if not stripped or _is_section_start(stripped):
+            in_section = False
+            continue
+        items = _skill_items(stripped)
+        if items is None:
+            consumed.discard(heading)  # prose stays with its heading
+            continue
+        _add(items)
+        consumed.add(i)
+    return skills
+
+
+def _is_section_start(line: str) -> bool:
+    label = line.rstrip(":").strip()
+    return bool(_SECTION_RE.match(label)) or (is_heading(line) and not line.endswith(":"))
@@ -1,6 +1,9 @@
 # app/services/resume_parser.py
 
+import asyncio
+import contextvars
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import docx
@@ -8,14 +11,34 @@ import pdfplumber
 import structlog
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
-from app.domain.interfaces.llm_provider import ILLMProvider
-from app.infrastructure.llm.factory import get_llm_provider
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.domain.interfaces.llm_provider import IAsyncLLMProvider, ILLMProvider
+from app.infrastructure.cache.resume_parse_cache import cache_key, resume_parse_cache
+from app.infrastructure.llm.registry import get_shared_llm_provider
 from app.models.resume import Resume as ResumeModel
 from app.schemas.resume import FileType, ResumeStatus
+from app.services.resume_compaction import PAGE_BREAK, compact_resume_text, estimate_tokens
+from app.services.resume_fastpath import FastPathResult, extract_fast_fields, merge_fast_fields
+from app.services.resume_sections import (
+    SECTION_PROMPT_VERSION,
+    ResumeSection,
+    merge_sections,
+    section_complete,
+    section_prompt,
+    split_sections,
+)
 
 logger = structlog.get_logger(__name__)
 
+section_parses = metrics.counter(
+    "resume_section_parses_total", "Per-section resume parses by kind and outcome"
+)
+
+MANDATORY_FIELDS = ("experience", "education", "skills")
+
 
 # ─── Public API ────────────────────────────────────────────────────────────────
 async def parse_and_store_resume(
@@ -31,15 +54,17 @@ async def parse_and_store_resume(
       3) Mandatory field validation
       4) ORM mapping & persistence
     """
-    provider = llm_provider or get_llm_provider()
+    provider = llm_provider or get_shared_llm_provider()
 
-    text = _extract_text(file_path)
-    parsed = provider.parse_resume(text)
+    text = _prepare_text(_extract_text(file_path))
+    fast = _fast_path(text)
+    parsed = provider.parse_resume(fast.text)
     if not parsed:
         logger.warning("llm_parse_empty_result", file_path=file_path)
         parsed = {}
+    parsed = merge_fast_fields(fast.fields, parsed)
 
-    _validate_mandatory(parsed, fields=("experience", "education", "skills"))
+    _validate_mandatory(parsed, fields=MANDATORY_FIELDS)
 
     resume = _map_to_model(parsed, user_id, file_path)
     db.add(resume)
@@ -48,12 +73,232 @@ async def parse_and_store_resume(
     return resume
 
 
+def parse_resume_text(provider: ILLMProvider, text: str, db: Session) -> dict[str, Any]:
+    """
+    LLM-parse extracted resume *text* through the content-addressed cache.
+
+    The text is compacted first (see ``resume_compaction``) and the fields
+    the fast path extracts locally are taken out (see ``resume_fastpath``).
+    The cache holds the LLM's parse keyed on the text actually sent; the
+    local fields are merged in on every call.  Only complete parses (all
+    ``MANDATORY_FIELDS`` present after the merge) are cached, so a bad LLM
+    response is retried on the next attempt instead of being served.
+
+    Long text is parsed section by section instead (see ``_parse_sections``).
+    """
+    fast = _fast_path(_prepare_text(text))
+    sections = _sections(fast.text)
+    if sections:
+        return merge_fast_fields(fast.fields, _parse_sections(provider, sections, db))
+    if not settings.RESUME_PARSE_CACHE_ENABLED:
+        return merge_fast_fields(fast.fields, provider.parse_resume(fast.text) or {})
+
+    key = cache_key(fast.text, provider.model_name)
+    cached = resume_parse_cache.get(db, key)
+    if cached is not None:
+        logger.info("resume_parse_cache_hit", content_hash=key)
+        return merge_fast_fields(fast.fields, cached)
+
+    parsed = provider.parse_resume(fast.text) or {}
+    merged = merge_fast_fields(fast.fields, parsed)
+    if _is_complete(merged):
+        resume_parse_cache.set(db, key, parsed, provider.model_name)
+    return merged
+
+
+async def aparse_resume_text(
+    provider: IAsyncLLMProvider, text: str, db: AsyncSession
+) -> dict[str, Any]:
+    """Async variant of ``parse_resume_text``."""
+    fast = _fast_path(_prepare_text(text))
+    sections = _sections(fast.text)
+    if sections:
+        return merge_fast_fields(fast.fields, await _aparse_sections(provider, sections, db))
+    if not settings.RESUME_PARSE_CACHE_ENABLED:
+        return merge_fast_fields(fast.fields, await provider.parse_resume(fast.text) or {})
+
+    key = cache_key(fast.text, provider.model_name)
+    cached = await resume_parse_cache.aget(db, key)
+    if cached is not None:
+        logger.info("resume_parse_cache_hit", content_hash=key)
+        return merge_fast_fields(fast.fields, cached)
+
+    parsed = await provider.parse_resume(fast.text) or {}
+    merged = merge_fast_fields(fast.fields, parsed)
+    if _is_complete(merged):
+        await resume_parse_cache.aset(db, key, parsed, provider.model_name)
+    return merged
+
+
+# ─── Per-Section Parsing ───────────────────────────────────────────────────────
+def _parse_sections(
+    provider: ILLMProvider, sections: list[ResumeSection], db: Session
+) -> dict[str, Any]:
+    """
+    Parse each of *sections* with its own focused ``parse_resume`` call.
+
+    Cached sections are served from the parse cache; the others are parsed
+    concurrently in threads (``RESUME_SECTION_PARSE_CONCURRENCY``), a failed
+    one retried on its own up to ``RESUME_SECTION_PARSE_RETRIES`` times.
+    Every section parsed is cached before a failure is raised, so the next
+    attempt only repeats the sections that failed.  The cache (and its DB
+    session) is only touched from the calling thread.
+    """
+    keys = {s.kind: _section_key(s, provider.model_name) for s in sections}
+    results: dict[str, dict[str, Any]] = {}
+    todo: list[ResumeSection] = []
+    for section in sections:
+        cached = resume_parse_cache.get(db, keys[section.kind]) if keys[section.kind] else None
+        if cached is not None:
+            results[section.kind] = cached
+        else:
+            todo.append(section)
+
+    def _parse(section: ResumeSection) -> dict[str, Any]:
+        for attempt in range(1, settings.RESUME_SECTION_PARSE_RETRIES + 1):
+            try:
+                return provider.parse_resume(section_prompt(section)) or {}
+            except Exception as e:
+                _log_section_retry(section, attempt, e)
+        return provider.parse_resume(section_prompt(section)) or {}
+
+    errors: dict[str, BaseException] = {}
+    if todo:
+        workers = max(1, min(len(todo), settings.RESUME_SECTION_PARSE_CONCURRENCY))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="resume-section") as pool:
+            futures = {s.kind: pool.submit(contextvars.copy_context().run, _parse, s) for s in todo}
+        for kind, future in futures.items():
+            try:
+                results[kind] = future.result()
+            except Exception as e:
+                errors[kind] = e
+                continue
+            if keys[kind] and section_complete(kind, results[kind]):
+                resume_parse_cache.set(
+                    db, keys[kind], results[kind], provider.model_name, SECTION_PROMPT_VERSION
+                )
+
+    return _merge_section_results(sections, todo, results, errors)
+
+
+async def _aparse_sections(
+    provider: IAsyncLLMProvider, sections: list[ResumeSection], db: AsyncSession
+) -> dict[str, Any]:
+    """Async variant of ``_parse_sections`` (``asyncio.gather`` instead of threads)."""
+    keys = {s.kind: _section_key(s, provider.model_name) for s in sections}
+    results: dict[str, dict[str, Any]] = {}
+    todo: list[ResumeSection] = []
+    for section in sections:
+        key = keys[section.kind]
+        cached = await resume_parse_cache.aget(db, key) if key else None
+        if cached is not None:
+            results[section.kind] = cached
+        else:
+            todo.append(section)
+
+    semaphore = asyncio.Semaphore(max(1, settings.RESUME_SECTION_PARSE_CONCURRENCY))
+
+    async def _parse(section: ResumeSection) -> dict[str, Any]:
+        async with semaphore:
+            for attempt in range(1, settings.RESUME_SECTION_PARSE_RETRIES + 1):
+                try:
+                    return await provider.parse_resume(section_prompt(section)) or {}
+                except Exception as e:
+                    _log_section_retry(section, attempt, e)
+            return await provider.parse_resume(section_prompt(section)) or {}
+
+    outcomes = await asyncio.gather(*(_parse(s) for s in todo), return_exceptions=True)
+
+    # Cache sequentially — the DB session is not concurrency-safe.
+    errors: dict[str, BaseException] = {}
+    for section, outcome in zip(todo, outcomes, strict=True):
+        if isinstance(outcome, BaseException):
+            errors[section.kind] = outcome
+            continue
+        results[section.kind] = outcome
+        key = keys[section.kind]
+        if key and section_complete(section.kind, outcome):
+            await resume_parse_cache.aset(
+                db, key, outcome, provider.model_name, SECTION_PROMPT_VERSION
+            )
+
+    return _merge_section_results(sections, todo, results, errors)
+
+
+def _sections(text: str) -> list[ResumeSection]:
+    """Sections to parse separately — none (one call) when disabled or *text* is short."""
+    if not settings.RESUME_SECTION_PARSE_ENABLED:
+        return []
+    if estimate_tokens(text) < settings.RESUME_SECTION_PARSE_MIN_TOKENS:
+        return []
+    sections = split_sections(text)
+    return sections if len(sections) > 1 else []
+
+
+def _section_key(section: ResumeSection, model: str) -> str | None:
+    """Cache key of *section*'s parse, or ``None`` when the cache is disabled."""
+    if not settings.RESUME_PARSE_CACHE_ENABLED:
+        return None
+    return cache_key(section_prompt(section), model, prompt_version=SECTION_PROMPT_VERSION)
+
+
+def _log_section_retry(section: ResumeSection, attempt: int, error: Exception) -> None:
+    logger.warning(
+        "resume_section_parse_retry", section=section.kind, attempt=attempt, error=str(error)
+    )
+
+
+def _merge_section_results(
+    sections: list[ResumeSection],
+    parsed: list[ResumeSection],
+    results: dict[str, dict[str, Any]],
+    errors: dict[str, BaseException],
+) -> dict[str, Any]:
+    """Merge the per-section parses, or raise the first failure once all are recorded."""
+    for section in sections:
+        if section.kind in errors:
+            outcome = "failed"
+        elif section in parsed:
+            outcome = "parsed"
+        else:
+            outcome = "cached"
+        section_parses.inc(kind=section.kind, outcome=outcome)
+    logger.info(
+        "resume_sections_parsed",
+        sections=[s.kind for s in sections],
+        cached=len(sections) - len(parsed),
+        failed=sorted(errors),
+    )
+    if errors:
+        raise next(iter(errors.values()))
+    return merge_sections(results)
+
+
 # ─── Internal Helpers ──────────────────────────────────────────────────────────
+def _prepare_text(text: str) -> str:
+    """Compact extracted text to the token budget (no-op when disabled)."""
+    if not settings.RESUME_COMPACTION_ENABLED:
+        return text
+    return compact_resume_text(text).text
+
+
+def _fast_path(text: str) -> FastPathResult:
+    """Locally extracted fields and the text left for the LLM (all of it when disabled)."""
+    if not settings.RESUME_FASTPATH_ENABLED:
+        return FastPathResult(text=text)
+    return extract_fast_fields(text)
+
+
+def _is_complete(parsed: dict[str, Any]) -> bool:
+    return all(parsed.get(f) for f in MANDATORY_FIELDS)
+
+
 def _extract_text(file_path: str) -> str:
     ext = file_path.rsplit(".", 1)[-1].lower()
     if ext == "pdf":
         with pdfplumber.open(file_path) as pdf:
-            return "\n".join(page.extract_text() or "" for page in pdf.pages)
+            # Pages stay separated so compaction can spot repeated headers/footers.
+            return PAGE_BREAK.join(page.extract_text() or "" for page in pdf.pages)
     elif ext == "docx":
         doc = docx.Document(file_path)
         return "\n".join(p.text for p in doc.paragraphs)
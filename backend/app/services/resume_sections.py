@@ -0,0 +1,162 @@
+"""
+Resume sections — split long resumes for per-section parsing.
+
+A single ``parse_resume`` call over a long CV takes time in proportion to the
+whole document, and one failure loses all of it.  ``split_sections`` cuts
+the text left for the LLM into the parts the parse is made of:
+
+* ``summary``    — the header, profile and any section not listed below
+  (projects, awards, languages, …);
+* ``experience`` — work history;
+* ``education``  — degrees and certifications;
+* ``skills``     — whatever of the skills section the fast path left.
+
+Sections start at heading lines: short lines (at most ``_HEADING_MAX_WORDS``
+words, no sentence punctuation) that begin with a capital and name a known
+section, optionally after a qualifier or followed by a second one ("Work
+Experience", "TECHNICAL SKILLS:", "Education & Certifications") — a job
+title such as "Project Manager" is not a heading.  Each section is sent
+with a focused instruction (``section_prompt``) naming only the fields it
+is trusted with (``FIELDS``), and ``merge_sections`` folds the per-section
+parses back into the single ``ParsedResume`` shape stored as ``analysis``.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any
+
+from app.infrastructure.llm.structured_output import ParsedResume
+
+# Part of every per-section cache key; bump when ``section_prompt`` changes.
+SECTION_PROMPT_VERSION = "resume-section-v1"
+
+KINDS = ("summary", "experience", "education", "skills")
+
+# Fields each section's parse is asked for — and trusted with.
+FIELDS: dict[str, tuple[str, ...]] = {
+    "summary": ("name", "email", "phone", "summary", "inferred_role", "skills"),
+    "experience": ("experience", "job_titles", "years_of_experience"),
+    "education": ("education",),
+    "skills": ("skills",),
+}
+
+_DESCRIPTIONS = {
+    "summary": "the header and profile part",
+    "experience": "the work experience section",
+    "education": "the education section",
+    "skills": "the skills section",
+}
+
+_HEADING_MAX_WORDS = 4
+_QUALIFIER = (
+    r"(?:(?:professional|work|relevant|technical|core|key|selected|personal|career|other|"
+    r"academic|additional)\s+)?"
+)
+_CONJUNCT = r"(?:\s*(?:&|and|/)\s*[a-z]+(?:\s+[a-z]+)?)?$"  # "Education & Certifications"
+_HEADINGS: tuple[tuple[str, re.Pattern[str]], ...] = tuple(
+    (kind, re.compile(_QUALIFIER + pattern + _CONJUNCT, re.I))
+    for kind, pattern in (
+        ("experience", r"(?:experience|employment|work history|career history|positions)"),
+        ("education", r"(?:education|qualifications|certifications?|training|courses)"),
+        ("skills", r"(?:skills|competencies|technologies|tech stack|tools|expertise)"),
+        (
+            "summary",
+            r"(?:summary|profile|objective|about me|projects?|awards|honou?rs|achievements|"
+            r"publications|languages|interests|hobbies|volunteering|references|activities)",
+        ),
+    )
+)
+
+
+@dataclass(frozen=True)
+class ResumeSection:
+    kind: str
+    text: str
+
+
+def split_sections(text: str) -> list[ResumeSection]:
+    """Sections of *text* in ``KINDS`` order; parts of the same kind are joined.
+
+    Text before the first heading belongs to ``summary``; sections holding
+    nothing but their heading are left out.
+    """
+    lines: dict[str, list[str]] = {}
+    has_content: set[str] = set()
+    kind = "summary"
+    for line in text.split("\n"):
+        heading = _heading_kind(line)
+        kind = heading or kind
+        lines.setdefault(kind, []).append(line)
+        if not heading and line.strip():
+            has_content.add(kind)
+    return [
+        ResumeSection(kind, "\n".join(lines[kind]).strip()) for kind in KINDS if kind in has_content
+    ]
+
+
+def section_prompt(section: ResumeSection) -> str:
+    """The text sent to ``parse_resume`` for *section*: a focused instruction, then the section."""
+    fields = ", ".join(FIELDS[section.kind])
+    return (
+        f"[{section.kind.upper()} SECTION ONLY] The text below is only "
+        f"{_DESCRIPTIONS[section.kind]} of a resume. Fill {fields}; leave every other "
+        f"field null or empty.\n\n{section.text}"
+    )
+
+
+def section_complete(kind: str, parsed: dict[str, Any]) -> bool:
+    """Whether *parsed* holds any of the fields its section is trusted with."""
+    return any(parsed.get(name) for name in FIELDS[kind])
+
+
+def merge_sections(results: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """Fold per-section parses (by kind) into one ``ParsedResume``-shaped dict.
+
+    Each field comes from the section trusted with it and, failing that,
+    from the first section that filled it anyway; skills are the union of
+    all sections.  The confidence score is the lowest of the sections', the
+    processing time the longest (the sections are parsed concurrently).
+    """
+    merged = ParsedResume().model_dump()
+    ordered = [results[kind] for kind in KINDS if kind in results]
+
+    for kind in KINDS:
+        for name in FIELDS[kind]:
+            value = results.get(kind, {}).get(name)
+            if value and name != "skills" and not merged.get(name):
+                merged[name] = value
+    for parsed in ordered:
+        for name, value in parsed.items():
+            if value and not merged.get(name):
+                merged[name] = value
+
+    skills: list[str] = []
+    seen: set[str] = set()
+    for parsed in ordered:
+        for skill in parsed.get("skills") or []:
+            if isinstance(skill, str) and skill.lower() not in seen:
+                seen.add(skill.lower())
+                skills.append(skill)
+    merged["skills"] = skills
+
+    scores = [p["confidence_score"] for p in ordered if _is_number(p.get("confidence_score"))]
+    times = [p["processing_time"] for p in ordered if _is_number(p.get("processing_time"))]
+    merged["confidence_score"] = min(scores) if scores else None
+    merged["processing_time"] = max(times) if times else None
+    return merged
+
+
+# ─── Helpers ───────────────────────────────────────────────────────────────────
+def _heading_kind(line: str) -> str | None:
+    label = line.strip().rstrip(":").strip()
+    if not label or not label[0].isupper() or label[-1] in ".,;":
+        return None
+    if len(label.split()) > _HEADING_MAX_WORDS:
+        return None
+    return next((kind for kind, pattern in _HEADINGS if pattern.match(label)), None)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, int | float) and not isinstance(value, bool)
@@ -0,0 +1,126 @@
+"""
+Skills dictionary for the local resume fast path (``resume_fastpath``).
+
+``SKILLS`` maps each canonical skill name — the spelling stored on the
+resume — to the aliases it is also written as.  Matching is
+case-insensitive on word boundaries, except for the names in ``AMBIGUOUS``:
+ordinary English words ("Go", "Swift", "Spring") only count when written
+capitalized as in the canonical name.
+
+Add a skill by adding an entry; aliases must not repeat across entries.
+"""
+
+from __future__ import annotations
+
+SKILLS: dict[str, tuple[str, ...]] = {
+    # Languages
+    "Python": ("python3",),
+    "Java": (),
+    "JavaScript": ("js", "ecmascript", "es6"),
+    "TypeScript": (),
+    "Go": ("golang",),
+    "Rust": (),
+    "C": (),
+    "C++": ("cpp",),
+    "C#": ("csharp", "c sharp"),
+    "Kotlin": (),
+    "Swift": (),
+    "Ruby": (),
+    "PHP": (),
+    "Scala": (),
+    "R": (),
+    "Dart": (),
+    "Elixir": (),
+    "Bash": ("shell scripting",),
+    "SQL": (),
+    "HTML": ("html5",),
+    "CSS": ("css3",),
+    # Web / backend frameworks
+    "React": ("react.js", "reactjs"),
+    "Next.js": ("nextjs",),
+    "Angular": ("angularjs",),
+    "Vue.js": ("vue", "vuejs"),
+    "Svelte": (),
+    "Node.js": ("nodejs",),
+    "Express": ("express.js", "expressjs"),
+    "NestJS": (),
+    "FastAPI": (),
+    "Django": (),
+    "Flask": (),
+    "Spring": ("spring boot", "springboot"),
+    "Ruby on Rails": (),
+    "Laravel": (),
+    ".NET": ("dotnet", "asp.net"),
+    "GraphQL": (),
+    "REST": ("restful", "rest api", "rest apis"),
+    "gRPC": (),
+    "SQLAlchemy": (),
+    "Celery": (),
+    "Pydantic": (),
+    # Data stores and messaging
+    "PostgreSQL": ("postgres", "postgresql"),
+    "MySQL": (),
+    "SQLite": (),
+    "MongoDB": ("mongo",),
+    "Redis": (),
+    "Elasticsearch": ("elastic search",),
+    "Cassandra": (),
+    "DynamoDB": (),
+    "Oracle": (),
+    "Snowflake": (),
+    "Kafka": ("apache kafka",),
+    "RabbitMQ": (),
+    # Cloud and infrastructure
+    "AWS": ("amazon web services",),
+    "GCP": ("google cloud", "google cloud platform"),
+    "Azure": ("microsoft azure",),
+    "Docker": (),
+    "Kubernetes": ("k8s",),
+    "Terraform": (),
+    "Ansible": (),
+    "Helm": (),
+    "Linux": (),
+    "Nginx": (),
+    "Git": (),
+    "GitHub Actions": (),
+    "GitLab CI": (),
+    "Jenkins": (),
+    "CI/CD": ("ci cd",),
+    "Prometheus": (),
+    "Grafana": (),
+    # Data and ML
+    "Pandas": (),
+    "NumPy": (),
+    "scikit-learn": ("sklearn", "scikit learn"),
+    "TensorFlow": (),
+    "PyTorch": (),
+    "Spark": ("apache spark", "pyspark"),
+    "Airflow": ("apache airflow",),
+    "Machine Learning": ("ml",),
+    "Deep Learning": (),
+    "NLP": ("natural language processing",),
+    "LLM": ("llms", "large language models"),
+    "Power BI": ("powerbi",),
+    "Tableau": (),
+    "Excel": (),
+    # Mobile
+    "Android": (),
+    "iOS": (),
+    "Flutter": (),
+    "React Native": (),
+    # Testing and practice
+    "pytest": (),
+    "Jest": (),
+    "Selenium": (),
+    "Cypress": (),
+    "Microservices": ("microservice",),
+    "System Design": (),
+    "Agile": (),
+    "Scrum": (),
+}
+
+# Also ordinary words: matched only when capitalized like the canonical name.
+AMBIGUOUS: frozenset[str] = frozenset(
+    {"Go", "C", "R", "Rust", "Swift", "Ruby", "Dart", "Spring", "Express", "Oracle", "Spark",
+     "Helm", "Jest", "Agile", "Excel", "React", "Flutter", "Snowflake", "REST"}
+)  # fmt: skip
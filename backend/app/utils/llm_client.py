@@ -2,7 +2,7 @@
 Backward-compatibility shim — delegates to the new LLM provider infrastructure.
 
 .. deprecated::
-    Use ``app.infrastructure.llm.factory.get_llm_provider()`` directly.
+    Use ``app.infrastructure.llm.registry.get_shared_llm_provider()`` directly.
 """
 
 from __future__ import annotations
@@ -11,7 +11,7 @@ import warnings
 
 import structlog
 
-from app.infrastructure.llm.factory import get_llm_provider
+from app.infrastructure.llm.registry import get_shared_llm_provider
 
 logger = structlog.get_logger(__name__)
 
@@ -21,12 +21,12 @@ class LLMClient:
 
     def __init__(self, api_key: str | None = None):
         warnings.warn(
-            "LLMClient is deprecated. Use get_llm_provider() from "
-            "app.infrastructure.llm.factory instead.",
+            "LLMClient is deprecated. Use get_shared_llm_provider() from "
+            "app.infrastructure.llm.registry instead.",
             DeprecationWarning,
             stacklevel=2,
         )
-        self._provider = get_llm_provider()
+        self._provider = get_shared_llm_provider()
 
     def generate_questions(self, prompts: dict) -> list:
         return self._provider.generate_questions(prompts)
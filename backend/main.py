@@ -4,6 +4,7 @@ import sentry_sdk
 from fastapi import FastAPI
 
 from app.api.health import router as health_router
+from app.api.metrics import router as metrics_router
 from app.api.v1.api import api_router
 from app.core.config import settings
 from app.core.exceptions import register_exception_handlers
@@ -34,7 +35,9 @@ async def lifespan(app: FastAPI):
     yield
     # ── shutdown ───────────────────────────────────────────────────────────
     from app.infrastructure.cache.redis_client import close_redis
+    from app.infrastructure.llm.registry import close_llm_providers
 
+    await close_llm_providers()
     await close_redis()
 
 
@@ -82,8 +85,9 @@ setup_middleware(app)
 # Register domain exception → HTTP response handlers
 register_exception_handlers(app)
 
-# Health / readiness probes (no prefix — accessible at /health, /ready)
+# Health / readiness probes and metrics (no prefix — /health, /ready, /metrics)
 app.include_router(health_router)
+app.include_router(metrics_router)
 
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
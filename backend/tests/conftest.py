@@ -4,7 +4,7 @@ Shared pytest fixtures for the InterviewAce test suite.
 * In-memory async SQLite database (via aiosqlite)
 * HTTPX AsyncClient wired to the FastAPI app
 * Authenticated user / token helpers
-* Mock LLM provider returning deterministic responses
+* Mock LLM providers (sync + async) returning deterministic responses
 """
 
 from __future__ import annotations
@@ -58,7 +58,7 @@ def _patched_uuid_bind_processor(self, dialect):
 _sa_types.Uuid.bind_processor = _patched_uuid_bind_processor
 
 from app.infrastructure.persistence.models.base import Base  # noqa: E402
-from app.db.session import get_db  # noqa: E402
+from app.db.session import get_db, get_session_factory  # noqa: E402
 from app.core.security import get_password_hash, create_token  # noqa: E402
 from app.models.user import User  # noqa: E402
 from app.models.resume import Resume  # noqa: E402
@@ -66,7 +66,7 @@ from app.models.interview import InterviewSession, InterviewQuestion  # noqa: E4
 from app.models.security import (  # noqa: E402, F401
     LoginAttempt, TokenBlacklist, UserSession, PasswordHistory, PasswordResetToken,
 )
-from app.domain.interfaces.llm_provider import ILLMProvider  # noqa: E402
+from app.domain.interfaces.llm_provider import IAsyncLLMProvider, ILLMProvider  # noqa: E402
 
 # ---------------------------------------------------------------------------
 # In-memory SQLite async engine (tests only)
@@ -140,6 +140,29 @@ class MockLLMProvider(ILLMProvider):
         }
 
 
+class MockAsyncLLMProvider(IAsyncLLMProvider):
+    """Async twin of ``MockLLMProvider`` for the async use cases."""
+
+    def __init__(self) -> None:
+        self._sync = MockLLMProvider()
+
+    @property
+    def provider_name(self) -> str:
+        return "MockAsyncLLM"
+
+    async def generate_questions(self, prompts: Dict[str, str]) -> List[str]:
+        return self._sync.generate_questions(prompts)
+
+    async def generate_feedback(self, prompts: Dict[str, str]) -> Dict[str, Any]:
+        return self._sync.generate_feedback(prompts)
+
+    async def generate_completion(self, prompt: str) -> str:
+        return self._sync.generate_completion(prompt)
+
+    async def parse_resume(self, text: str) -> Dict[str, Any]:
+        return self._sync.parse_resume(text)
+
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
@@ -178,6 +201,7 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: TestSessionLocal
 
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://testserver") as ac:
@@ -224,6 +248,12 @@ def mock_llm_provider() -> MockLLMProvider:
     return MockLLMProvider()
 
 
+@pytest.fixture
+def mock_async_llm_provider() -> MockAsyncLLMProvider:
+    """Return a deterministic async mock LLM provider."""
+    return MockAsyncLLMProvider()
+
+
 @pytest.fixture(autouse=True)
 def _disable_rate_limiter():
     """Disable SlowAPI rate limiting in every test so requests don't get 429."""
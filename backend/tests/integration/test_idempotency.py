@@ -0,0 +1,204 @@
+"""
+Integration tests for ``Idempotency-Key`` on LLM-backed POST endpoints.
+
+Verifies:
+- A retry with the same key replays the first response (same session, one
+  LLM call, ``Idempotent-Replayed`` header)
+- Reusing a key for a different request is rejected with 422
+- A duplicate arriving while the first request runs waits for its result
+- A record that cannot be read is polled at the poll interval until the
+  wait deadline (409), never in a tight loop
+- Failed requests are not stored — the key is released for the retry
+- Without Redis the request simply runs
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import uuid
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from httpx import AsyncClient
+
+from app.infrastructure.cache.idempotency import DONE, record_key
+from tests.integration.test_interview import _create_resume
+
+API = "/api/v1/interview"
+_MODULE = "app.infrastructure.cache.idempotency"
+
+
+class _AsyncDictRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+
+    async def set(self, key: str, value: str, nx: bool = False, ex: int | None = None) -> bool:
+        if nx and key in self.store:
+            return False
+        self.store[key] = value
+        return True
+
+    async def get(self, key: str) -> str | None:
+        return self.store.get(key)
+
+    async def delete(self, key: str) -> int:
+        return int(self.store.pop(key, None) is not None)
+
+
+class _CountingLLM:
+    """Wraps the mock provider and counts question generations."""
+
+    def __init__(self, inner: Any) -> None:
+        self._inner = inner
+        self.calls = 0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._inner, name)
+
+    async def generate_questions(self, prompts: dict[str, str]) -> list[str]:
+        self.calls += 1
+        return await self._inner.generate_questions(prompts)
+
+
+@pytest.fixture
+def redis():
+    r = _AsyncDictRedis()
+
+    async def get_redis() -> _AsyncDictRedis:
+        return r
+
+    with patch(f"{_MODULE}.get_redis", get_redis):
+        yield r
+
+
+@pytest.fixture
+def llm(mock_async_llm_provider):
+    from app.api.deps import get_llm
+    from main import app
+
+    counting = _CountingLLM(mock_async_llm_provider)
+    app.dependency_overrides[get_llm] = lambda: counting
+    yield counting
+    del app.dependency_overrides[get_llm]
+
+
+async def _start(client: AsyncClient, headers: dict, resume_id, key: str | None, **body: Any):
+    if key is not None:
+        headers = {**headers, "Idempotency-Key": key}
+    return await client.post(
+        f"{API}/start", json={"resume_id": str(resume_id), **body}, headers=headers
+    )
+
+
+class TestIdempotentStart:
+    async def test_retry_replays_first_response(
+        self, client, test_user, auth_headers, db_session, redis, llm
+    ):
+        resume = await _create_resume(db_session, test_user.id)
+        first = await _start(client, auth_headers, resume.id, "key-1")
+        retry = await _start(client, auth_headers, resume.id, "key-1")
+
+        assert first.status_code == retry.status_code == 200
+        assert retry.json()["id"] == first.json()["id"]
+        assert retry.headers["Idempotent-Replayed"] == "true"
+        assert "Idempotent-Replayed" not in first.headers
+        assert llm.calls == 1
+
+    async def test_other_key_or_no_key_runs_again(
+        self, client, test_user, auth_headers, db_session, redis, llm
+    ):
+        resume = await _create_resume(db_session, test_user.id)
+        a = await _start(client, auth_headers, resume.id, "key-a")
+        b = await _start(client, auth_headers, resume.id, "key-b")
+        c = await _start(client, auth_headers, resume.id, None)
+        assert len({a.json()["id"], b.json()["id"], c.json()["id"]}) == 3
+
+    async def test_key_reused_for_different_request(
+        self, client, test_user, auth_headers, db_session, redis, llm
+    ):
+        resume = await _create_resume(db_session, test_user.id)
+        await _start(client, auth_headers, resume.id, "key-1")
+        resp = await _start(client, auth_headers, resume.id, "key-1", difficulty="hard")
+        assert resp.status_code == 422
+
+    async def test_duplicate_waits_for_in_flight_request(
+        self, client, test_user, auth_headers, db_session, redis, llm, monkeypatch
+    ):
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "IDEMPOTENCY_POLL_INTERVAL", 0.01)
+        resume = await _create_resume(db_session, test_user.id)
+        first = await _start(client, auth_headers, resume.id, "key-1")
+        key = record_key(test_user.id, "interview.start", "key-1")
+        done = redis.store[key]
+        # Rewind to "still running", then let the first request finish later.
+        record = json.loads(done)
+        redis.store[key] = json.dumps({"state": "pending", "fingerprint": record["fingerprint"]})
+
+        async def finish() -> None:
+            await asyncio.sleep(0.05)
+            redis.store[key] = done
+
+        finisher = asyncio.create_task(finish())
+        retry = await _start(client, auth_headers, resume.id, "key-1")
+        await finisher
+
+        assert retry.status_code == 200
+        assert retry.json()["id"] == first.json()["id"]
+        assert llm.calls == 1
+
+    async def test_unreadable_record_polls_until_deadline(
+        self, client, test_user, auth_headers, db_session, redis, llm, monkeypatch
+    ):
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "IDEMPOTENCY_POLL_INTERVAL", 0.01)
+        monkeypatch.setattr(settings, "IDEMPOTENCY_WAIT_TIMEOUT", 0.05)
+        resume = await _create_resume(db_session, test_user.id)
+        redis.store[record_key(test_user.id, "interview.start", "key-1")] = "{}"
+        reads = 0
+
+        async def unreadable(key: str) -> None:
+            nonlocal reads
+            reads += 1
+            return None
+
+        monkeypatch.setattr(redis, "get", unreadable)
+        resp = await _start(client, auth_headers, resume.id, "key-1")
+        assert resp.status_code == 409
+        assert reads <= 10  # one read per poll interval
+        assert llm.calls == 0
+
+    async def test_failure_releases_key(self, client, test_user, auth_headers, redis, llm):
+        missing = uuid.uuid4()
+        assert (await _start(client, auth_headers, missing, "key-1")).status_code == 404
+        assert not redis.store
+        assert (await _start(client, auth_headers, missing, "key-1")).status_code == 404
+
+    async def test_stored_record(self, client, test_user, auth_headers, db_session, redis, llm):
+        resume = await _create_resume(db_session, test_user.id)
+        resp = await _start(client, auth_headers, resume.id, "key-1")
+        record = json.loads(redis.store[record_key(test_user.id, "interview.start", "key-1")])
+        assert record["state"] == DONE
+        assert record["status_code"] == 200
+        assert record["body"]["id"] == resp.json()["id"]
+
+    async def test_runs_without_redis(self, client, test_user, auth_headers, db_session, llm):
+        resume = await _create_resume(db_session, test_user.id)
+        with patch(f"{_MODULE}.get_redis", side_effect=ConnectionError("down")):
+            a = await _start(client, auth_headers, resume.id, "key-1")
+            b = await _start(client, auth_headers, resume.id, "key-1")
+        assert a.status_code == b.status_code == 200
+        assert a.json()["id"] != b.json()["id"]
+
+
+class TestIdempotentComplete:
+    async def test_not_found_is_not_stored(self, client, test_user, auth_headers, redis):
+        resp = await client.post(
+            f"{API}/{uuid.uuid4()}/complete",
+            headers={**auth_headers, "Idempotency-Key": "key-1"},
+        )
+        assert resp.status_code == 404
+        assert not redis.store
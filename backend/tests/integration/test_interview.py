@@ -2,6 +2,10 @@
 Integration tests for interview endpoints.
 
 Flow tested: start session → get next question → answer → complete → summary.
+The streamed start (``/start/stream``) is checked event by event — on its
+own DB session and under the request deadline — and the
+background completion job (``/complete/job``) up to its dispatch and the
+task status it reports — to the task's owner only.
 
 The LLM provider is mocked via dependency injection override so no real
 API calls are made.
@@ -9,11 +13,16 @@ API calls are made.
 
 from __future__ import annotations
 
+import asyncio
+import json
 import uuid
+from unittest.mock import AsyncMock, patch
 
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.domain.exceptions import LLMProviderError
 from app.domain.value_objects.enums import FileType, ResumeStatus
 from app.models.resume import Resume
 
@@ -82,7 +91,7 @@ class TestStartInterview:
         test_user,
         auth_headers,
         db_session: AsyncSession,
-        mock_llm_provider,
+        mock_async_llm_provider,
     ):
         """Start an interview session with a resume and mock LLM."""
         from app.api.deps import get_llm
@@ -91,7 +100,7 @@ class TestStartInterview:
         resume = await _create_resume(db_session, test_user.id)
 
         # Override the FastAPI DI dependency so no real LLM call is made.
-        app.dependency_overrides[get_llm] = lambda: mock_llm_provider
+        app.dependency_overrides[get_llm] = lambda: mock_async_llm_provider
         try:
             resp = await client.post(
                 f"{API}/start",
@@ -107,6 +116,115 @@ class TestStartInterview:
         assert data["resume_id"] == str(resume.id)
 
 
+def _sse_events(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+class TestStartInterviewStream:
+    async def _stream(self, client, auth_headers, resume_id, llm):
+        from app.api.deps import get_llm
+        from main import app
+
+        app.dependency_overrides[get_llm] = lambda: llm
+        try:
+            return await client.post(
+                f"{API}/start/stream",
+                json={"resume_id": str(resume_id)},
+                headers=auth_headers,
+            )
+        finally:
+            del app.dependency_overrides[get_llm]
+
+    async def test_session_then_questions(
+        self, client, test_user, auth_headers, db_session, mock_async_llm_provider
+    ):
+        resume = await _create_resume(db_session, test_user.id)
+        resp = await self._stream(client, auth_headers, resume.id, mock_async_llm_provider)
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        events = _sse_events(resp.text)
+        assert [name for name, _ in events] == [
+            "session",
+            "question",
+            "question",
+            "question",
+            "done",
+        ]
+        session_id = events[0][1]["id"]
+        assert [data["order_index"] for _, data in events[1:4]] == [0, 1, 2]
+        assert events[-1][1] == {"question_count": 3}
+
+        next_q = await client.get(f"{API}/{session_id}/next", headers=auth_headers)
+        assert next_q.json()["question_id"] == events[1][1]["question_id"]
+
+    async def test_failure_midway_keeps_sent_questions(
+        self, client, test_user, auth_headers, db_session, mock_async_llm_provider
+    ):
+        class _Breaking(type(mock_async_llm_provider)):
+            async def stream_questions(self, prompts):
+                yield {"type": "technical", "question": "First?"}
+                raise LLMProviderError("connection reset")
+
+        resume = await _create_resume(db_session, test_user.id)
+        resp = await self._stream(client, auth_headers, resume.id, _Breaking())
+
+        events = _sse_events(resp.text)
+        assert [name for name, _ in events] == ["session", "question", "error"]
+        session = await client.get(f"{API}/{events[0][1]['id']}", headers=auth_headers)
+        assert [q["question_text"] for q in session.json()["questions"]] == ["First?"]
+
+    async def test_without_resume_returns_404(self, client, test_user, auth_headers):
+        resp = await client.post(
+            f"{API}/start/stream", json={"resume_id": str(uuid.uuid4())}, headers=auth_headers
+        )
+        assert resp.status_code == 404
+
+    async def test_deadline_ends_stream_with_error(
+        self, client, test_user, auth_headers, db_session, mock_async_llm_provider
+    ):
+        class _Stalling(type(mock_async_llm_provider)):
+            async def stream_questions(self, prompts):
+                yield {"type": "technical", "question": "First?"}
+                await asyncio.sleep(60)
+                yield {"type": "technical", "question": "Never sent?"}
+
+        resume = await _create_resume(db_session, test_user.id)
+        with patch.object(settings, "LLM_REQUEST_DEADLINE", 0.2):
+            resp = await self._stream(client, auth_headers, resume.id, _Stalling())
+
+        events = _sse_events(resp.text)
+        assert [name for name, _ in events] == ["session", "question", "error"]
+        assert "too long" in events[-1][1]["detail"]
+
+    async def test_stream_uses_its_own_db_session(
+        self, client, test_user, auth_headers, db_session, mock_async_llm_provider
+    ):
+        from app.db.session import get_session_factory
+        from main import app
+
+        session_factory = app.dependency_overrides[get_session_factory]()
+        opened: list[AsyncSession] = []
+
+        def _factory():
+            session = session_factory()
+            session.close = AsyncMock(wraps=session.close)
+            opened.append(session)
+            return session
+
+        resume = await _create_resume(db_session, test_user.id)
+        app.dependency_overrides[get_session_factory] = lambda: _factory
+        resp = await self._stream(client, auth_headers, resume.id, mock_async_llm_provider)
+
+        assert _sse_events(resp.text)[-1][0] == "done"
+        assert len(opened) == 1 and opened[0] is not db_session
+        opened[0].close.assert_awaited()
+
+
 class TestNextQuestion:
     async def test_next_question_invalid_session(self, client: AsyncClient, auth_headers):
         fake_id = str(uuid.uuid4())
@@ -131,3 +249,160 @@ class TestCompleteInterview:
         fake_id = str(uuid.uuid4())
         resp = await client.post(f"{API}/{fake_id}/complete", headers=auth_headers)
         assert resp.status_code == 404
+
+
+class _RecordingCompletionQueue:
+    def __init__(self, task_id: str | None = "job-1") -> None:
+        self.task_id = task_id
+        self.enqueued: list[tuple] = []
+
+    def enqueue_interview_completion(self, user_id, session_id):
+        self.enqueued.append((user_id, session_id))
+        return self.task_id
+
+
+class TestCompleteInterviewJob:
+    async def _session(self, client, auth_headers, db_session, test_user, llm, answered: bool):
+        from sqlalchemy import update
+
+        from app.api.deps import get_llm
+        from app.models.interview import InterviewQuestion
+        from main import app
+
+        resume = await _create_resume(db_session, test_user.id)
+        app.dependency_overrides[get_llm] = lambda: llm
+        try:
+            resp = await client.post(
+                f"{API}/start", json={"resume_id": str(resume.id)}, headers=auth_headers
+            )
+        finally:
+            del app.dependency_overrides[get_llm]
+        session_id = resp.json()["id"]
+        if answered:
+            await db_session.execute(
+                update(InterviewQuestion)
+                .where(InterviewQuestion.session_id == uuid.UUID(session_id))
+                .values(answer_text="A detailed answer")
+            )
+            await db_session.commit()
+        return session_id
+
+    async def _job(self, client, auth_headers, session_id, queue):
+        from app.api.deps import get_completion_queue
+        from main import app
+
+        app.dependency_overrides[get_completion_queue] = lambda: queue
+        try:
+            return await client.post(f"{API}/{session_id}/complete/job", headers=auth_headers)
+        finally:
+            del app.dependency_overrides[get_completion_queue]
+
+    async def test_job_accepted(
+        self, client, test_user, auth_headers, db_session, mock_async_llm_provider
+    ):
+        session_id = await self._session(
+            client, auth_headers, db_session, test_user, mock_async_llm_provider, answered=True
+        )
+        queue = _RecordingCompletionQueue()
+        resp = await self._job(client, auth_headers, session_id, queue)
+        assert resp.status_code == 202
+        assert resp.json() == {
+            "session_id": session_id,
+            "task_id": "job-1",
+            "status_url": "/api/v1/tasks/job-1",
+        }
+        assert queue.enqueued == [(test_user.id, uuid.UUID(session_id))]
+
+    async def test_unanswered_rejected_before_dispatch(
+        self, client, test_user, auth_headers, db_session, mock_async_llm_provider
+    ):
+        session_id = await self._session(
+            client, auth_headers, db_session, test_user, mock_async_llm_provider, answered=False
+        )
+        queue = _RecordingCompletionQueue()
+        resp = await self._job(client, auth_headers, session_id, queue)
+        assert resp.status_code == 400
+        assert queue.enqueued == []
+
+    async def test_unknown_session(self, client, auth_headers):
+        resp = await self._job(client, auth_headers, uuid.uuid4(), _RecordingCompletionQueue())
+        assert resp.status_code == 404
+
+    async def test_queue_unavailable(
+        self, client, test_user, auth_headers, db_session, mock_async_llm_provider
+    ):
+        session_id = await self._session(
+            client, auth_headers, db_session, test_user, mock_async_llm_provider, answered=True
+        )
+        resp = await self._job(client, auth_headers, session_id, _RecordingCompletionQueue(None))
+        assert resp.status_code == 503
+
+    async def test_task_status_reports_progress(self, client, test_user, auth_headers):
+        from unittest.mock import MagicMock, patch
+
+        running = MagicMock(status="PROGRESS", info={"stage": "evaluating", "done": 2, "total": 6})
+        with (
+            patch("app.api.v1.endpoints.tasks.get_owner", return_value=str(test_user.id)),
+            patch("app.api.v1.endpoints.tasks.celery_app.AsyncResult", return_value=running),
+        ):
+            resp = await client.get("/api/v1/tasks/job-1", headers=auth_headers)
+        assert resp.status_code == 200
+        assert resp.json()["progress"] == {"stage": "evaluating", "done": 2, "total": 6}
+        assert resp.json()["result"] is None
+
+    async def test_task_status_other_users_task(self, client, auth_headers):
+        from unittest.mock import MagicMock, patch
+
+        done = MagicMock(status="SUCCESS", result={"final_score": 0.9})
+        with (
+            patch("app.api.v1.endpoints.tasks.get_owner", return_value=str(uuid.uuid4())),
+            patch("app.api.v1.endpoints.tasks.celery_app.AsyncResult", return_value=done),
+        ):
+            resp = await client.get("/api/v1/tasks/job-1", headers=auth_headers)
+        assert resp.status_code == 404
+
+    async def test_task_status_unknown_task(self, client, auth_headers):
+        from unittest.mock import patch
+
+        with patch("app.api.v1.endpoints.tasks.get_owner", return_value=None):
+            resp = await client.get("/api/v1/tasks/job-1", headers=auth_headers)
+        assert resp.status_code == 404
+
+    async def test_task_status_requires_auth(self, client):
+        resp = await client.get("/api/v1/tasks/job-1")
+        assert resp.status_code == 403  # no bearer credentials
+
+    def test_enqueue_records_owner(self):
+        from types import SimpleNamespace
+        from unittest.mock import patch
+
+        from app.infrastructure.tasks.interview_tasks import CeleryCompletionQueue
+
+        user_id = uuid.uuid4()
+        with (
+            patch(
+                "app.infrastructure.tasks.interview_tasks.record_owner", return_value=True
+            ) as rec,
+            patch(
+                "app.infrastructure.tasks.interview_tasks.complete_interview_task.apply_async"
+            ) as publish,
+        ):
+            publish.side_effect = lambda **kw: SimpleNamespace(id=kw["task_id"])
+            task_id = CeleryCompletionQueue().enqueue_interview_completion(user_id, uuid.uuid4())
+        rec.assert_called_once_with(task_id, user_id)
+        assert publish.call_args.kwargs["task_id"] == task_id
+
+    def test_enqueue_not_published_without_owner(self):
+        from unittest.mock import patch
+
+        from app.infrastructure.tasks.interview_tasks import CeleryCompletionQueue
+
+        with (
+            patch("app.infrastructure.tasks.interview_tasks.record_owner", return_value=False),
+            patch(
+                "app.infrastructure.tasks.interview_tasks.complete_interview_task.apply_async"
+            ) as publish,
+        ):
+            queue = CeleryCompletionQueue()
+            assert queue.enqueue_interview_completion(uuid.uuid4(), uuid.uuid4()) is None
+        publish.assert_not_called()
@@ -0,0 +1,155 @@
+"""
+Unit tests for local rubric pre-scoring of trivially weak answers.
+
+Verifies:
+- Blank, "I don't know", too-short and restated answers get a fixed score
+  and canned feedback; substantive (also terse but on-point) answers pass
+- Completion only sends the substantive answers to the model — none at all
+  when every unscored answer is trivial
+- The full-transcript path leaves prescored answers out of the prompt and
+  counts their local scores towards the final score
+- The per-answer task scores a trivial answer without an LLM call
+- ``prescore=False`` sends every answer to the model
+"""
+
+from __future__ import annotations
+
+import os
+import uuid
+from unittest.mock import patch
+
+import pytest
+
+os.environ.setdefault("SECRET_KEY", "a" * 64)
+
+from app.application.use_cases.interview import CompleteInterviewUseCase
+from app.application.use_cases.interview.prescore import FEEDBACK, prescore
+from app.models.interview import InterviewQuestion
+from tests.unit.test_interview_evaluation import (
+    USER_ID,
+    _BatchLLM,
+    _FeedbackLLM,
+    _interview,
+    _row_ids,
+    _seed,
+    sync_db,  # noqa: F401 — fixture
+)
+
+_QUESTION = "How does Redis persistence work?"
+
+
+class TestPrescore:
+    @pytest.mark.parametrize(
+        ("answer", "reason", "score"),
+        [
+            (None, "blank", 0.0),
+            ("  ...  ", "blank", 0.0),
+            ("I don't know.", "non_answer", 0.0),
+            ("Sorry, I dont know", "non_answer", 0.0),
+            ("N/A", "non_answer", 0.0),
+            ("Snapshots.", "too_short", 0.1),
+            ("It is how Redis persistence works.", "restated", 0.1),
+        ],
+    )
+    def test_trivial_answers(self, answer, reason, score):
+        grade = prescore(_QUESTION, answer)
+        assert grade is not None
+        assert (grade.reason, grade.score, grade.feedback) == (reason, score, FEEDBACK[reason])
+
+    @pytest.mark.parametrize(
+        "answer",
+        [
+            "RDB snapshots and AOF logs.",
+            "It writes point-in-time snapshots and can also log every write to an AOF file.",
+        ],
+    )
+    def test_substantive_answers_pass(self, answer):
+        assert prescore(_QUESTION, answer) is None
+
+
+def _with_answers(*answers: str):
+    repo = _interview(*([None] * len(answers)))
+    for q, answer in zip(repo.questions.values(), answers, strict=True):
+        q.answer_text = answer
+    return repo
+
+
+class TestCompletionPrescore:
+    async def test_only_substantive_answers_sent(self):
+        repo = _with_answers(
+            "I don't know", "A long and detailed answer", "pass", "Another answer in detail"
+        )
+        llm = _BatchLLM()
+        await CompleteInterviewUseCase(repo, llm, batch_size=6).execute(USER_ID, repo.session.id)
+
+        batch_calls = [p for p in llm.prompts if "questions_feedback" in p["user_prompt"]]
+        assert len(batch_calls) == 1
+        assert len(_row_ids(batch_calls[0])) == 2
+        assert "I don't know" not in batch_calls[0]["user_prompt"]
+        assert [q.evaluation_score for q in repo.questions.values()] == [0.0, 0.5, 0.0, 0.5]
+        assert repo.session.final_score == 0.25
+
+    async def test_all_trivial_skips_evaluation(self):
+        repo = _with_answers("", "no idea")
+        llm = _FeedbackLLM({"summary": "Weak."})
+        result = await CompleteInterviewUseCase(repo, llm).execute(USER_ID, repo.session.id)
+        assert len(llm.prompts) == 1  # the summary only
+        assert result.final_score == 0.0
+        assert {f["feedback_comment"] for f in result.question_feedback} == {
+            FEEDBACK["blank"],
+            FEEDBACK["non_answer"],
+        }
+
+    async def test_transcript_blends_prescored_scores(self):
+        repo = _with_answers("A long and detailed answer", "skip")
+        llm = _FeedbackLLM(
+            {
+                "summary": "Mixed.",
+                "confidence_score": 0.8,
+                "questions_feedback": [
+                    {"question_id": "1", "evaluation_score": 0.8, "feedback_comment": "ok"}
+                ],
+            }
+        )
+        result = await CompleteInterviewUseCase(repo, llm).execute(USER_ID, repo.session.id)
+        assert len(_row_ids(llm.prompts[0])) == 1
+        assert result.final_score == 0.4
+        assert [f["evaluation_score"] for f in result.question_feedback] == [0.8, 0.0]
+
+    async def test_disabled_sends_everything(self):
+        repo = _with_answers("I don't know", "A long and detailed answer")
+        llm = _BatchLLM()
+        use_case = CompleteInterviewUseCase(repo, llm, prescore=False, batch_size=6)
+        await use_case.execute(USER_ID, repo.session.id)
+        assert len(_row_ids(llm.prompts[0])) == 2
+
+
+class _NoCallLLM:
+    def generate_feedback(self, prompts):
+        raise AssertionError("trivial answers must not reach the LLM")
+
+
+class TestTaskPrescore:
+    def test_trivial_answer_scored_without_llm(self, sync_db):  # noqa: F811
+        session_id, question_id = _seed(sync_db)
+        with sync_db() as db:
+            db.get(InterviewQuestion, uuid.UUID(question_id)).answer_text = "idk"
+            db.commit()
+
+        from app.infrastructure.tasks.interview_tasks import evaluate_answer_task
+
+        with (
+            patch(
+                "app.infrastructure.tasks.interview_tasks._get_sync_session",
+                side_effect=lambda: sync_db(),
+            ),
+            patch(
+                "app.infrastructure.llm.registry.get_shared_llm_provider",
+                return_value=_NoCallLLM(),
+            ),
+        ):
+            result = evaluate_answer_task.run(session_id, question_id)
+        assert result == {"question_id": question_id, "status": "prescored", "score": 0.0}
+        with sync_db() as db:
+            question = db.get(InterviewQuestion, uuid.UUID(question_id))
+            assert question.feedback_comment == FEEDBACK["non_answer"]
@@ -0,0 +1,329 @@
+"""
+Unit tests for the Redis-backed LLM circuit breaker.
+
+Verifies:
+- The circuit opens after N consecutive provider failures and rejects calls
+- After the recovery timeout a single half-open probe is allowed
+- Probe success closes the circuit, probe failure re-opens it
+- Only transport errors, provider timeouts, 429s and 5xx count; parse errors,
+  4xx and deadline-capped timeouts neither count nor reset the streak, and
+  free a half-open probe slot
+- State is shared: a second wrapper on the same provider sees the open circuit
+- Redis outages fail open
+- Open circuits make the fallback composite skip the provider immediately
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+os.environ.setdefault("SECRET_KEY", "a" * 64)
+
+from app.core.deadline import deadline_scope
+from app.domain.exceptions import LLMProviderError
+from app.domain.interfaces.llm_provider import IAsyncLLMProvider, ILLMProvider
+from app.infrastructure.llm.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    AsyncCircuitBreakerLLMProvider,
+    CircuitBreaker,
+    CircuitBreakerLLMProvider,
+    error_kind,
+)
+from app.infrastructure.llm.factory import LLMProviderWithFallback
+
+_SYNC_REDIS = "app.infrastructure.llm.circuit_breaker.get_sync_redis"
+_ASYNC_REDIS = "app.infrastructure.llm.circuit_breaker.get_redis"
+
+
+class _DictRedis:
+    """In-memory stand-in for the Redis hash / string commands the breaker uses."""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.strings: dict[str, str] = {}
+
+    def hgetall(self, key: str) -> dict[str, str]:
+        return dict(self.hashes.get(key, {}))
+
+    def hset(self, key: str, field: str | None = None, value: Any = None, mapping=None) -> None:
+        bucket = self.hashes.setdefault(key, {})
+        if field is not None:
+            bucket[field] = str(value)
+        for k, v in (mapping or {}).items():
+            bucket[k] = str(v)
+
+    def hdel(self, key: str, field: str) -> None:
+        self.hashes.get(key, {}).pop(field, None)
+
+    def hincrby(self, key: str, field: str, amount: int) -> int:
+        bucket = self.hashes.setdefault(key, {})
+        bucket[field] = str(int(bucket.get(field, 0)) + amount)
+        return int(bucket[field])
+
+    def set(self, key: str, value: str, nx: bool = False, ex: int | None = None) -> bool:
+        if nx and key in self.strings:
+            return False
+        self.strings[key] = value
+        return True
+
+    def delete(self, key: str) -> None:
+        self.strings.pop(key, None)
+
+    def expire(self, key: str, seconds: int) -> None:
+        pass
+
+    def persist(self, key: str) -> None:
+        pass
+
+
+class _AsyncDictRedis:
+    """Awaitable facade over ``_DictRedis``."""
+
+    def __init__(self, inner: _DictRedis) -> None:
+        self._inner = inner
+
+    def __getattr__(self, name: str):
+        method = getattr(self._inner, name)
+
+        async def _call(*args: Any, **kwargs: Any) -> Any:
+            return method(*args, **kwargs)
+
+        return _call
+
+
+class _StatusError(Exception):
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class _FlakyProvider(ILLMProvider):
+    def __init__(self, fail: bool = True) -> None:
+        self.fail = fail
+        self.cause: BaseException = ConnectionError("connection reset")
+        self.calls = 0
+
+    @property
+    def provider_name(self) -> str:
+        return "OpenAI"
+
+    def generate_questions(self, prompts: dict[str, str]) -> list[str]:
+        return []
+
+    def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        return {}
+
+    def generate_completion(self, prompt: str) -> str:
+        self.calls += 1
+        if self.fail:
+            raise LLMProviderError("upstream down") from self.cause
+        return "ok"
+
+    def parse_resume(self, text: str) -> dict[str, Any]:
+        return {}
+
+
+class _AsyncFlakyProvider(IAsyncLLMProvider):
+    def __init__(self, fail: bool = True) -> None:
+        self.fail = fail
+        self.calls = 0
+
+    @property
+    def provider_name(self) -> str:
+        return "Gemini"
+
+    async def generate_questions(self, prompts: dict[str, str]) -> list[str]:
+        return []
+
+    async def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        return {}
+
+    async def generate_completion(self, prompt: str) -> str:
+        self.calls += 1
+        if self.fail:
+            raise LLMProviderError("upstream down") from ConnectionError("connection reset")
+        return "ok"
+
+    async def parse_resume(self, text: str) -> dict[str, Any]:
+        return {}
+
+
+def _breaker(name: str = "openai") -> CircuitBreaker:
+    return CircuitBreaker(name, failure_threshold=3, recovery_timeout=30, failure_window=60)
+
+
+def _trip(provider: CircuitBreakerLLMProvider, times: int = 3) -> None:
+    for _ in range(times):
+        with pytest.raises(LLMProviderError):
+            provider.generate_completion("x")
+
+
+class TestCircuitBreakerSync:
+    def test_opens_after_threshold_and_rejects(self):
+        redis, inner = _DictRedis(), _FlakyProvider()
+        guarded = CircuitBreakerLLMProvider(inner, _breaker())
+        with patch(_SYNC_REDIS, return_value=redis):
+            _trip(guarded)
+            assert _breaker().state() == OPEN
+            with pytest.raises(LLMProviderError, match="circuit is open"):
+                guarded.generate_completion("x")
+        assert inner.calls == 3
+
+    def test_success_resets_failure_streak(self):
+        redis, inner = _DictRedis(), _FlakyProvider()
+        guarded = CircuitBreakerLLMProvider(inner, _breaker())
+        with patch(_SYNC_REDIS, return_value=redis):
+            _trip(guarded, times=2)
+            inner.fail = False
+            guarded.generate_completion("x")
+            inner.fail = True
+            _trip(guarded, times=2)
+            assert _breaker().state() == CLOSED
+
+    def test_half_open_probe_closes_on_success(self):
+        redis, inner = _DictRedis(), _FlakyProvider()
+        guarded = CircuitBreakerLLMProvider(inner, _breaker())
+        with patch(_SYNC_REDIS, return_value=redis):
+            _trip(guarded)
+            redis.hashes["llm:breaker:openai"]["opened_at"] = "0"
+            assert _breaker().state() == HALF_OPEN
+            inner.fail = False
+            assert guarded.generate_completion("x") == "ok"
+            assert _breaker().state() == CLOSED
+
+    def test_half_open_allows_single_probe(self):
+        redis = _DictRedis()
+        breaker = _breaker()
+        with patch(_SYNC_REDIS, return_value=redis):
+            _trip(CircuitBreakerLLMProvider(_FlakyProvider(), breaker))
+            redis.hashes["llm:breaker:openai"]["opened_at"] = "0"
+            assert breaker.before_call() == HALF_OPEN
+            assert breaker.before_call() is None
+
+    def test_failed_probe_reopens(self):
+        redis, inner = _DictRedis(), _FlakyProvider()
+        guarded = CircuitBreakerLLMProvider(inner, _breaker())
+        with patch(_SYNC_REDIS, return_value=redis):
+            _trip(guarded)
+            redis.hashes["llm:breaker:openai"]["opened_at"] = "0"
+            _trip(guarded, times=1)
+            assert _breaker().state() == OPEN
+
+    @pytest.mark.parametrize(
+        "cause",
+        [
+            json.JSONDecodeError("bad", "{", 0),
+            ValueError("schema mismatch"),
+            _StatusError(400),
+            None,
+        ],
+    )
+    def test_non_provider_faults_do_not_count(self, cause):
+        redis, inner = _DictRedis(), _FlakyProvider()
+        guarded = CircuitBreakerLLMProvider(inner, _breaker())
+        with patch(_SYNC_REDIS, return_value=redis):
+            _trip(guarded, times=2)
+            inner.cause = cause
+            _trip(guarded, times=3)
+            assert _breaker().state() == CLOSED
+            inner.cause = ConnectionError("connection reset")
+            _trip(guarded, times=1)
+            assert _breaker().state() == OPEN  # the streak was not reset either
+
+    def test_deadline_capped_timeout_does_not_count(self):
+        redis, inner = _DictRedis(), _FlakyProvider()
+        inner.cause = TimeoutError("read timeout")
+        guarded = CircuitBreakerLLMProvider(inner, _breaker())
+        with patch(_SYNC_REDIS, return_value=redis):
+            with deadline_scope(0.001):
+                time.sleep(0.01)
+                _trip(guarded)
+            assert _breaker().state() == CLOSED
+            _trip(guarded)
+            assert _breaker().state() == OPEN
+
+    def test_parse_error_frees_half_open_probe(self):
+        redis, inner = _DictRedis(), _FlakyProvider()
+        guarded = CircuitBreakerLLMProvider(inner, _breaker())
+        with patch(_SYNC_REDIS, return_value=redis):
+            _trip(guarded)
+            redis.hashes["llm:breaker:openai"]["opened_at"] = "0"
+            inner.cause = json.JSONDecodeError("bad", "{", 0)
+            _trip(guarded, times=1)
+            assert _breaker().state() == HALF_OPEN
+            assert _breaker().before_call() == HALF_OPEN
+
+    @pytest.mark.parametrize(
+        "cause, kind",
+        [
+            (ConnectionError("reset"), "transport"),
+            (TimeoutError("read"), "timeout"),
+            (_StatusError(429), "rate_limit"),
+            (_StatusError(503), "server"),
+            (_StatusError(404), "client"),
+            (json.JSONDecodeError("bad", "{", 0), "parse"),
+            (RuntimeError("?"), "other"),
+        ],
+    )
+    def test_error_kind(self, cause, kind):
+        try:
+            raise LLMProviderError("failed") from cause
+        except LLMProviderError as exc:
+            assert error_kind(exc) == kind
+        assert error_kind(LLMProviderError("x", kind="rate_limit")) == "rate_limit"
+
+    def test_state_shared_between_wrappers(self):
+        redis = _DictRedis()
+        with patch(_SYNC_REDIS, return_value=redis):
+            _trip(CircuitBreakerLLMProvider(_FlakyProvider(), _breaker()))
+            other = _FlakyProvider(fail=False)
+            with pytest.raises(LLMProviderError):
+                CircuitBreakerLLMProvider(other, _breaker()).generate_completion("x")
+        assert other.calls == 0
+
+    def test_redis_outage_fails_open(self):
+        inner = _FlakyProvider(fail=False)
+        guarded = CircuitBreakerLLMProvider(inner, _breaker())
+        with patch(_SYNC_REDIS, side_effect=ConnectionError("redis down")):
+            assert guarded.generate_completion("x") == "ok"
+
+    def test_open_primary_skipped_by_fallback_chain(self):
+        redis, primary = _DictRedis(), _FlakyProvider()
+
+        class _Backup(_FlakyProvider):
+            @property
+            def provider_name(self) -> str:
+                return "Gemini"
+
+        backup = _Backup(fail=False)
+        composite = LLMProviderWithFallback(
+            CircuitBreakerLLMProvider(primary, _breaker()),
+            CircuitBreakerLLMProvider(backup, _breaker("gemini")),
+        )
+        with patch(_SYNC_REDIS, return_value=redis):
+            for _ in range(5):
+                assert composite.generate_completion("x") == "ok"
+        assert primary.calls == 3
+
+
+class TestCircuitBreakerAsync:
+    async def test_opens_and_rejects(self):
+        redis, inner = _AsyncDictRedis(_DictRedis()), _AsyncFlakyProvider()
+        breaker = _breaker("gemini")
+        guarded = AsyncCircuitBreakerLLMProvider(inner, breaker)
+        with patch(_ASYNC_REDIS, AsyncMock(return_value=redis)):
+            for _ in range(3):
+                with pytest.raises(LLMProviderError):
+                    await guarded.generate_completion("x")
+            with pytest.raises(LLMProviderError, match="circuit is open"):
+                await guarded.generate_completion("x")
+            assert await breaker.astate() == OPEN
+        assert inner.calls == 3
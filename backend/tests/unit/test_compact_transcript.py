@@ -0,0 +1,126 @@
+"""
+Unit tests for the compact transcript encoding of evaluation prompts.
+
+Verifies:
+- Answers are sent as an ``id | category | question | answer`` table with
+  ordinal ids; cell whitespace is collapsed and pipes are escaped
+- Prompt ids map back to the questions in prompt order
+- The transcript prompt no longer asks the model for score_breakdown
+- Token savings on a fixed benchmark transcript, input and echoed ids
+"""
+
+from __future__ import annotations
+
+import os
+import uuid
+
+os.environ.setdefault("SECRET_KEY", "a" * 64)
+
+from app.application.use_cases.interview.evaluation import (
+    build_transcript_prompt,
+    encode_answers,
+    prompt_ids,
+)
+from app.application.use_cases.interview.prompts import INPUT_MARKER
+from app.domain.entities.interview import InterviewQuestionEntity
+from app.services.resume_compaction import estimate_tokens
+
+# Fixed benchmark: a 10-question session with answers of typical length.
+_BENCHMARK = [
+    ("technical", "How does Python's GIL affect multithreaded CPU-bound code?",
+     "Only one thread executes bytecode at a time, so CPU-bound threads don't run in "
+     "parallel. I'd use multiprocessing or move the hot loop into a C extension or NumPy."),
+    ("technical", "When would you choose PostgreSQL over MongoDB?",
+     "When the data is relational and I need transactions and joins — orders, payments, "
+     "inventory. Mongo fits documents with a flexible schema and few cross-document writes."),
+    ("behavioral", "Tell me about a time you disagreed with a teammate.",
+     "We disagreed on adding a cache layer. I proposed measuring first; the profile showed "
+     "the database was fine and the real cost was serialization, so we fixed that instead."),
+    ("project", "What was the hardest part of your payments service?",
+     "Idempotency. Retries from the mobile client created duplicate charges until we added "
+     "idempotency keys stored with a unique constraint and replayed the stored response."),
+    ("system_design", "Design a URL shortener for 100M links.",
+     "Base62 ids from a distributed counter, a key-value store for the mapping, a CDN and "
+     "read-through cache in front, and async click analytics through a queue."),
+    ("technical", "Explain how Redis persistence works.",
+     "RDB snapshots fork the process and write a point-in-time dump; AOF logs every write "
+     "and can be fsynced every second. Many setups combine both."),
+    ("behavioral", "How do you handle a missed deadline?",
+     "I tell the stakeholders as early as I know, with a new estimate and what we can ship "
+     "now, then look at why the estimate was off."),
+    ("coding", "How would you find duplicates in a large list?",
+     "Use a set while iterating — O(n) time and memory. If it does not fit in memory, sort "
+     "externally or hash-partition to disk and check each partition."),
+    ("project", "How did you test the Kafka consumers?",
+     "Unit tests for the handlers with fake messages, plus an integration test against a "
+     "Testcontainers broker that checks offsets are committed only after processing."),
+    ("technical", "What is the difference between a process and a thread?",
+     "Processes have separate memory spaces; threads share the memory of their process, "
+     "which makes communication cheap but needs synchronization."),
+]  # fmt: skip
+
+
+def _benchmark() -> list[InterviewQuestionEntity]:
+    return [
+        InterviewQuestionEntity(
+            id=uuid.UUID(int=i + 1), question_text=q, answer_text=a, category=c, order_index=i
+        )
+        for i, (c, q, a) in enumerate(_BENCHMARK)
+    ]
+
+
+def _data(prompt: dict[str, str]) -> str:
+    return prompt["user_prompt"].partition(INPUT_MARKER)[2]
+
+
+def _legacy_data(questions: list[InterviewQuestionEntity]) -> str:
+    """The previous encoding: a repr of dicts keyed by the question UUIDs."""
+    pairs = [
+        {
+            "question_id": str(q.id),
+            "question": q.question_text,
+            "answer": q.answer_text,
+            "category": q.category,
+        }
+        for q in questions
+    ]
+    return f"Session Q&A: {pairs}"
+
+
+def _echoed_ids(ids: list[str]) -> str:
+    return ", ".join(f'"question_id": "{i}"' for i in ids)
+
+
+class TestEncoding:
+    def test_table_with_ordinal_ids(self):
+        questions = _benchmark()[:2]
+        questions[0].answer_text = "Line one\n\n  line two | pipe"
+        lines = encode_answers(questions).splitlines()
+        assert lines[0] == "id | category | question | answer"
+        assert lines[1].startswith("1 | technical | How does Python's GIL")
+        assert lines[1].endswith("Line one line two \\| pipe")
+        assert lines[2].startswith("2 | technical | When would you choose")
+        assert len(lines) == 3
+
+    def test_prompt_ids_map_back(self):
+        questions = _benchmark()[:3]
+        assert prompt_ids(questions) == dict(zip(("1", "2", "3"), questions, strict=True))
+
+    def test_no_uuids_and_no_breakdown_requested(self):
+        questions = _benchmark()
+        prompt = build_transcript_prompt(questions)
+        assert all(str(q.id) not in prompt["user_prompt"] for q in questions)
+        assert "score_breakdown" not in prompt["user_prompt"]
+
+
+class TestTokenBenchmark:
+    def test_compact_encoding_saves_tokens(self):
+        questions = _benchmark()
+        legacy_in = estimate_tokens(_legacy_data(questions))
+        compact_in = estimate_tokens(_data(build_transcript_prompt(questions)))
+        legacy_out = estimate_tokens(_echoed_ids([str(q.id) for q in questions]))
+        compact_out = estimate_tokens(_echoed_ids(list(prompt_ids(questions))))
+
+        # Measured: input 1033 → 554 tokens, echoed ids 270 → 109 tokens.
+        assert compact_in <= legacy_in * 0.6
+        assert compact_out <= legacy_out * 0.5
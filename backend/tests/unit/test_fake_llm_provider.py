@@ -0,0 +1,214 @@
+"""
+Unit tests for the fake LLM provider and record / replay cassettes.
+
+Verifies:
+- Synthetic questions, feedback and resume parses match what the use cases parse
+- Injected 429s are retried and counted; exhausted retries and injected
+  failures raise ``LLMProviderError`` with the injected cause
+- ``LLM_PROVIDER_MODE=fake`` builds a guarded fallback chain of fakes
+- Recorded responses replay under a new request, with UUIDs rebound
+- A replay miss falls back to a synthetic response
+"""
+
+from __future__ import annotations
+
+import os
+import uuid
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+os.environ.setdefault("SECRET_KEY", "a" * 64)
+
+from app.application.use_cases.interview import StartInterviewUseCase
+from app.application.use_cases.interview.evaluation import (
+    build_answer_prompt,
+    build_batch_prompt,
+    build_summary_prompt,
+    parse_answer_feedback,
+    prompt_ids,
+)
+from app.core.config import settings
+from app.domain.entities.interview import InterviewQuestionEntity
+from app.domain.exceptions import LLMProviderError
+from app.domain.interfaces.llm_provider import ILLMProvider
+from app.infrastructure.llm.cassette import (
+    Cassette,
+    RecordingLLMProvider,
+    ReplayLLMProvider,
+    cassette_lookups,
+)
+from app.infrastructure.llm.factory import LLMProviderWithFallback, get_llm_provider
+from app.infrastructure.llm.fake_provider import (
+    AsyncFakeLLMProvider,
+    FakeAPIError,
+    FakeLLMProvider,
+    FakeProfile,
+    FakeRateLimitError,
+)
+from app.infrastructure.llm.telemetry import TelemetryLLMProvider, retries_total
+
+INSTANT = FakeProfile(latency_median=0)
+_SLEEP = "app.infrastructure.llm.fake_provider.time.sleep"
+
+
+def _questions(n: int) -> list[InterviewQuestionEntity]:
+    return [
+        InterviewQuestionEntity(
+            question_text=f"Q{i}?", answer_text=f"Answer {i}", category="technical"
+        )
+        for i in range(n)
+    ]
+
+
+class TestSyntheticResponses:
+    def test_questions_follow_prompt(self):
+        prompt = StartInterviewUseCase.build_prompt(
+            {"skills": ["Python", "Redis"]}, question_count=7, difficulty="hard"
+        )
+        questions = FakeLLMProvider(profile=INSTANT, seed=1).generate_questions(prompt)
+        assert len(questions) == 7
+        assert all(q["difficulty"] == "hard" and q["question"] and q["type"] for q in questions)
+        assert "Python" in questions[0]["question"]
+
+    def test_feedback_shapes_parse(self):
+        provider = FakeLLMProvider(profile=INSTANT, seed=1)
+        batch = _questions(3)
+
+        feedback = provider.generate_feedback(build_batch_prompt(batch))["questions_feedback"]
+        assert {item["question_id"] for item in feedback} == set(prompt_ids(batch))
+        assert all(0 <= parse_answer_feedback(item)[0] <= 1 for item in feedback)
+
+        single = provider.generate_feedback(build_answer_prompt("Q?", "A", "technical"))
+        assert 0 <= parse_answer_feedback(single)[0] <= 1
+
+        summary = provider.generate_feedback(build_summary_prompt(batch))
+        assert set(summary) == {"summary", "strengths", "weaknesses"}
+
+    def test_resume_parse_has_every_field(self):
+        text = "Jane Roe\njane@example.com +1 555 010 0200\n6 years of Python and Docker"
+        parsed = FakeLLMProvider(profile=INSTANT, seed=1).parse_resume(text)
+        assert parsed["name"] == "Jane Roe"
+        assert parsed["email"] == "jane@example.com"
+        assert parsed["skills"] == ["Python", "Docker"]
+        assert parsed["years_of_experience"] == 6.0
+        for field in (
+            "phone",
+            "summary",
+            "inferred_role",
+            "education",
+            "experience",
+            "job_titles",
+            "confidence_score",
+            "processing_time",
+        ):
+            assert field in parsed
+
+
+class TestFaultInjection:
+    def test_rate_limits_retried_then_raise(self):
+        profile = FakeProfile(latency_median=0, rate_limit_rate=1.0)
+        provider = TelemetryLLMProvider(FakeLLMProvider(profile=profile, seed=1, max_retries=2))
+        before = retries_total.value(
+            provider="fakeprimary", model="fake:primary", method="generate_completion"
+        )
+        with patch(_SLEEP) as sleep, pytest.raises(LLMProviderError) as exc_info:
+            provider.generate_completion("hi")
+        assert isinstance(exc_info.value.__cause__, FakeRateLimitError)
+        assert [c.args[0] for c in sleep.call_args_list] == [0.5, 1.0, 2.0]
+        after = retries_total.value(
+            provider="fakeprimary", model="fake:primary", method="generate_completion"
+        )
+        assert after == before + 2
+
+    def test_error_rate(self):
+        provider = FakeLLMProvider(profile=FakeProfile(latency_median=0, error_rate=1.0))
+        with pytest.raises(LLMProviderError) as exc_info:
+            provider.generate_completion("hi")
+        assert isinstance(exc_info.value.__cause__, FakeAPIError)
+
+    def test_latency_is_slept(self):
+        provider = FakeLLMProvider(profile=FakeProfile(latency_median=2.0, latency_sigma=0.0))
+        with patch(_SLEEP) as sleep:
+            provider.generate_completion("hi")
+        assert sleep.call_args.args[0] == pytest.approx(2.0)
+
+    async def test_async_twin(self):
+        provider = AsyncFakeLLMProvider(profile=INSTANT, seed=1)
+        assert len(await provider.generate_questions({"user_prompt": "Total questions: 3"})) == 3
+
+
+class TestFactoryFakeMode:
+    def test_chain_of_fakes_falls_back(self, monkeypatch):
+        monkeypatch.setattr(settings, "LLM_PROVIDER_MODE", "fake")
+        monkeypatch.setattr(settings, "LLM_BREAKER_ENABLED", False)
+        monkeypatch.setattr(settings, "LLM_SINGLE_FLIGHT_ENABLED", False)
+        monkeypatch.setattr(
+            settings,
+            "LLM_FAKE_PROFILES",
+            {
+                "primary": {"latency_median": 0, "error_rate": 1.0},
+                "fallback": {"latency_median": 0},
+            },
+        )
+        provider = get_llm_provider()
+        assert isinstance(provider, LLMProviderWithFallback)
+        assert provider.generate_completion("hi").startswith("Synthetic completion")
+
+    def test_unknown_mode(self, monkeypatch):
+        monkeypatch.setattr(settings, "LLM_PROVIDER_MODE", "bogus")
+        with pytest.raises(LLMProviderError, match="LLM_PROVIDER_MODE"):
+            get_llm_provider()
+
+
+class _EchoIdsProvider(ILLMProvider):
+    """Live stand-in: scores every question id it is asked about."""
+
+    @property
+    def provider_name(self) -> str:
+        return "OpenAI"
+
+    def generate_questions(self, prompts: dict[str, str]) -> list[str]:
+        return []
+
+    def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        return {
+            "questions_feedback": [
+                {"question_id": i, "evaluation_score": 0.9} for i in prompts["ids"]
+            ]
+        }
+
+    def generate_completion(self, prompt: str) -> str:
+        return "recorded"
+
+    def parse_resume(self, text: str) -> dict[str, Any]:
+        return {}
+
+
+class TestCassette:
+    def test_record_then_replay_rebinds_ids(self, tmp_path):
+        cassette = Cassette(tmp_path / "llm.jsonl")
+        recorded_ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+        RecordingLLMProvider(_EchoIdsProvider(), cassette).generate_feedback({"ids": recorded_ids})
+
+        new_ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+        replayed = ReplayLLMProvider(Cassette(cassette.path), profile=INSTANT).generate_feedback(
+            {"ids": new_ids}
+        )
+        assert [f["question_id"] for f in replayed["questions_feedback"]] == new_ids
+
+    def test_replay_sleeps_recorded_latency(self, tmp_path):
+        cassette = Cassette(tmp_path / "llm.jsonl")
+        cassette.record("generate_completion", "hi", "recorded", 3.5, "OpenAI", "openai:m")
+        with patch(_SLEEP) as sleep:
+            assert (
+                ReplayLLMProvider(cassette, profile=INSTANT).generate_completion("hi") == "recorded"
+            )
+        assert sleep.call_args.args[0] == 3.5
+
+    def test_miss_is_synthetic(self, tmp_path):
+        before = cassette_lookups.value(result="miss", method="generate_completion")
+        provider = ReplayLLMProvider(Cassette(tmp_path / "empty.jsonl"), profile=INSTANT)
+        assert provider.generate_completion("hi").startswith("Synthetic completion")
+        assert cassette_lookups.value(result="miss", method="generate_completion") == before + 1
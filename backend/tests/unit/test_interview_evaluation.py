@@ -0,0 +1,486 @@
+"""
+Unit tests for incremental per-answer interview evaluation.
+
+Verifies:
+- Submitting an answer enqueues its background evaluation
+- Editing an answer clears the stale score and re-enqueues it
+- The Celery task persists evaluation_score / feedback_comment
+- The task discards its result when the answer changed meanwhile
+- Completion with every answer scored makes only a small summary call
+  and computes the overall score / score_breakdown locally
+- Completion falls back to a local summary (or skips the LLM entirely)
+- Completion with unscored answers runs the full evaluation on those only,
+  keeping the background scores of the rest
+- Batched mode scores unscored answers in concurrent batches, retries a
+  failed batch alone and keeps the batches that succeeded
+- Scores streamed before a batch broke off are kept; the retry only asks
+  for the unscored answers
+- The full evaluation maps the prompt's ordinal ids back to the questions
+  and computes score_breakdown locally
+- Completion reports its progress (evaluating / summarizing) and
+  ``validate`` rejects incomplete sessions before any LLM call
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import uuid
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+os.environ.setdefault("SECRET_KEY", "a" * 64)
+
+from app.application.dto.interview import SubmitAnswerInput
+from app.application.use_cases.interview import CompleteInterviewUseCase, SubmitAnswerUseCase
+from app.application.use_cases.interview.evaluation import score_breakdown
+from app.domain.entities.interview import InterviewQuestionEntity, InterviewSessionEntity
+from app.domain.interfaces.llm_provider import IAsyncLLMProvider, ILLMProvider
+from app.domain.interfaces.task_queue import IEvaluationQueue
+from app.infrastructure.persistence.models.base import Base
+from app.models.interview import InterviewQuestion, InterviewSession
+
+USER_ID = uuid.uuid4()
+
+
+class _MemoryInterviewRepo:
+    """Just the repository methods the interview use cases touch."""
+
+    def __init__(self, session: InterviewSessionEntity, questions: list[InterviewQuestionEntity]):
+        self.session = session
+        self.questions = {q.id: q for q in questions}
+
+    async def get_session_by_id(self, session_id):
+        return self.session if session_id == self.session.id else None
+
+    async def get_question_by_id(self, question_id, session_id):
+        return self.questions.get(question_id)
+
+    async def update_question(self, entity):
+        self.questions[entity.id] = entity
+        return entity
+
+    async def update_session(self, entity):
+        self.session = entity
+        return entity
+
+    async def get_questions_by_session_id(self, session_id):
+        return list(self.questions.values())
+
+    async def get_next_unanswered_question(self, session_id):
+        return next((q for q in self.questions.values() if not q.is_answered()), None)
+
+
+class _RecordingQueue(IEvaluationQueue):
+    def __init__(self) -> None:
+        self.enqueued: list[uuid.UUID] = []
+
+    def enqueue_answer_evaluation(self, session_id, question_id):
+        self.enqueued.append(question_id)
+        return "task-id"
+
+
+class _FeedbackLLM(IAsyncLLMProvider):
+    def __init__(self, response: dict[str, Any] | Exception) -> None:
+        self.response = response
+        self.prompts: list[dict[str, str]] = []
+
+    @property
+    def provider_name(self) -> str:
+        return "MockAsyncLLM"
+
+    async def generate_questions(self, prompts: dict[str, str]) -> list[str]:
+        return []
+
+    async def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        self.prompts.append(prompts)
+        if isinstance(self.response, Exception):
+            raise self.response
+        return self.response
+
+    async def generate_completion(self, prompt: str) -> str:
+        return ""
+
+    async def parse_resume(self, text: str) -> dict[str, Any]:
+        return {}
+
+
+def _interview(*scores: float | None) -> _MemoryInterviewRepo:
+    session = InterviewSessionEntity(user_id=USER_ID, started_at=datetime.now(UTC))
+    categories = ["technical", "behavioral", "project"]
+    questions = [
+        InterviewQuestionEntity(
+            session_id=session.id,
+            question_text=f"Question {i}?",
+            answer_text=f"A long and detailed answer number {i}",
+            evaluation_score=score,
+            feedback_comment=f"Feedback {i}" if score is not None else None,
+            category=categories[i % 3],
+            order_index=i,
+        )
+        for i, score in enumerate(scores)
+    ]
+    return _MemoryInterviewRepo(session, questions)
+
+
+class TestSubmitAnswerEnqueues:
+    async def test_answer_is_enqueued(self):
+        repo = _interview(None)
+        question = next(iter(repo.questions.values()))
+        question.answer_text = None
+        queue = _RecordingQueue()
+        await SubmitAnswerUseCase(repo, queue).execute(
+            SubmitAnswerInput(USER_ID, repo.session.id, question.id, "My answer")
+        )
+        assert queue.enqueued == [question.id]
+
+    async def test_edited_answer_clears_score_and_requeues(self):
+        repo = _interview(0.9)
+        question = next(iter(repo.questions.values()))
+        queue = _RecordingQueue()
+        await SubmitAnswerUseCase(repo, queue).execute(
+            SubmitAnswerInput(USER_ID, repo.session.id, question.id, "A different answer")
+        )
+        assert question.evaluation_score is None
+        assert question.feedback_comment is None
+        assert queue.enqueued == [question.id]
+
+    async def test_resubmitting_same_answer_keeps_score(self):
+        repo = _interview(0.9)
+        question = next(iter(repo.questions.values()))
+        queue = _RecordingQueue()
+        await SubmitAnswerUseCase(repo, queue).execute(
+            SubmitAnswerInput(USER_ID, repo.session.id, question.id, question.answer_text)
+        )
+        assert question.evaluation_score == 0.9
+        assert queue.enqueued == []
+
+    async def test_without_queue_nothing_is_dispatched(self):
+        repo = _interview(None)
+        question = next(iter(repo.questions.values()))
+        await SubmitAnswerUseCase(repo).execute(
+            SubmitAnswerInput(USER_ID, repo.session.id, question.id, "My answer")
+        )
+        assert question.answer_text == "My answer"
+
+
+class TestCompleteInterview:
+    async def test_all_scored_runs_summary_only(self):
+        repo = _interview(1.0, 0.5, 0.6, 0.2)
+        llm = _FeedbackLLM({"summary": "Solid.", "strengths": ["APIs"], "weaknesses": ["SQL"]})
+        result = await CompleteInterviewUseCase(repo, llm).execute(USER_ID, repo.session.id)
+
+        assert len(llm.prompts) == 1
+        assert "A long and detailed answer" not in llm.prompts[0]["user_prompt"]
+        assert result.feedback_summary == "Solid."
+        assert result.final_score == pytest.approx(0.575)
+        assert result.score_breakdown == {
+            "technical": 0.6,
+            "behavioral": 0.5,
+            "project": 0.6,
+            "overall": 0.575,
+        }
+        assert repo.session.is_completed()
+
+    async def test_summary_failure_uses_local_summary(self):
+        repo = _interview(0.8, 0.4)
+        llm = _FeedbackLLM(RuntimeError("provider down"))
+        result = await CompleteInterviewUseCase(repo, llm).execute(USER_ID, repo.session.id)
+        assert "average score of 0.60" in result.feedback_summary
+        assert result.strengths == ["Feedback 0", "Feedback 1"]
+
+    async def test_summary_llm_can_be_skipped(self):
+        repo = _interview(0.8, 0.4)
+        llm = _FeedbackLLM({"summary": "unused"})
+        result = await CompleteInterviewUseCase(repo, llm, summarize_with_llm=False).execute(
+            USER_ID, repo.session.id
+        )
+        assert llm.prompts == []
+        assert result.final_score == pytest.approx(0.6)
+
+    async def test_unscored_answers_use_full_evaluation(self):
+        repo = _interview(0.8, None)
+        questions = list(repo.questions.values())
+        llm = _FeedbackLLM(
+            {
+                "summary": "Full.",
+                "confidence_score": 0.5,
+                "questions_feedback": [
+                    {"question_id": "1", "evaluation_score": 0.5, "feedback_comment": "ok"},
+                ],
+            }
+        )
+        result = await CompleteInterviewUseCase(repo, llm).execute(USER_ID, repo.session.id)
+        prompt = llm.prompts[0]["user_prompt"]
+        assert "answer number 1" in prompt
+        assert "answer number 0" not in prompt  # already scored in the background
+        assert result.final_score == pytest.approx(0.65)
+        assert [f["question_id"] for f in result.question_feedback] == [
+            str(q.id) for q in questions
+        ]
+        assert [q.evaluation_score for q in questions] == [0.8, 0.5]
+        assert [q.feedback_comment for q in questions] == ["Feedback 0", "ok"]
+        assert result.score_breakdown == {"technical": 0.8, "behavioral": 0.5, "overall": 0.65}
+
+    def test_breakdown_omits_unanswered_categories(self):
+        repo = _interview(0.5)
+        assert score_breakdown(list(repo.questions.values())) == {
+            "technical": 0.5,
+            "overall": 0.5,
+        }
+
+
+class _SyncFeedbackLLM(ILLMProvider):
+    def __init__(self, on_call=None) -> None:
+        self.on_call = on_call
+
+    @property
+    def provider_name(self) -> str:
+        return "MockLLM"
+
+    def generate_questions(self, prompts: dict[str, str]) -> list[str]:
+        return []
+
+    def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        if self.on_call:
+            self.on_call()
+        return {"evaluation_score": 0.75, "feedback_comment": "Clear and correct."}
+
+    def generate_completion(self, prompt: str) -> str:
+        return ""
+
+    def parse_resume(self, text: str) -> dict[str, Any]:
+        return {}
+
+
+@pytest.fixture
+def sync_db():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    tables = [InterviewSession.__table__, InterviewQuestion.__table__]
+    Base.metadata.create_all(engine, tables=tables)
+    factory = sessionmaker(bind=engine)
+    yield factory
+    engine.dispose()
+
+
+def _seed(factory) -> tuple[str, str]:
+    session_id, question_id = uuid.uuid4(), uuid.uuid4()
+    with factory() as db:
+        db.add(
+            InterviewSession(
+                id=session_id,
+                user_id=USER_ID,
+                resume_id=uuid.uuid4(),
+                started_at=datetime.now(UTC),
+            )
+        )
+        db.add(
+            InterviewQuestion(
+                id=question_id,
+                session_id=session_id,
+                question_text="What is a closure?",
+                answer_text="A function with captured scope.",
+            )
+        )
+        db.commit()
+    return str(session_id), str(question_id)
+
+
+class TestEvaluateAnswerTask:
+    def _run(self, factory, llm, session_id, question_id):
+        from app.infrastructure.tasks.interview_tasks import evaluate_answer_task
+
+        with (
+            patch(
+                "app.infrastructure.tasks.interview_tasks._get_sync_session",
+                side_effect=lambda: factory(),
+            ),
+            patch("app.infrastructure.llm.registry.get_shared_llm_provider", return_value=llm),
+        ):
+            return evaluate_answer_task.run(session_id, question_id)
+
+    def test_persists_evaluation(self, sync_db):
+        session_id, question_id = _seed(sync_db)
+        result = self._run(sync_db, _SyncFeedbackLLM(), session_id, question_id)
+        assert result["status"] == "evaluated"
+        with sync_db() as db:
+            question = db.get(InterviewQuestion, uuid.UUID(question_id))
+            assert question.evaluation_score == 0.75
+            assert question.feedback_comment == "Clear and correct."
+
+    def test_edited_answer_discards_result(self, sync_db):
+        session_id, question_id = _seed(sync_db)
+
+        def _edit_answer() -> None:
+            with sync_db() as db:
+                db.get(InterviewQuestion, uuid.UUID(question_id)).answer_text = "Edited."
+                db.commit()
+
+        result = self._run(sync_db, _SyncFeedbackLLM(_edit_answer), session_id, question_id)
+        assert result["status"] == "stale"
+        with sync_db() as db:
+            assert db.get(InterviewQuestion, uuid.UUID(question_id)).evaluation_score is None
+
+
+def _row_ids(prompts: dict[str, str]) -> list[str]:
+    """Prompt ids of the answer table rows."""
+    return re.findall(r"^(\d+) \|", prompts["user_prompt"], re.M)
+
+
+class _BatchLLM(_FeedbackLLM):
+    """Scores every question of a batch; the first *fail_first* calls error out."""
+
+    def __init__(self, fail_first: int = 0, always_fail_marker: str | None = None) -> None:
+        super().__init__({})
+        self.fail_first = fail_first
+        self.always_fail_marker = always_fail_marker
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        import asyncio
+
+        self.prompts.append(prompts)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if self.fail_first > 0:
+            self.fail_first -= 1
+            return {"questions_feedback": "not a list"}
+        if self.always_fail_marker and self.always_fail_marker in prompts["user_prompt"]:
+            raise RuntimeError("malformed JSON")
+        if "questions_feedback" not in prompts["user_prompt"]:
+            return {"summary": "Batched.", "strengths": [], "weaknesses": []}
+        ids = _row_ids(prompts)
+        return {
+            "questions_feedback": [
+                {"question_id": qid, "evaluation_score": 0.5, "feedback_comment": "ok"}
+                for qid in ids
+            ]
+        }
+
+
+class TestBatchedEvaluation:
+    async def test_batches_run_concurrently_and_merge(self):
+        repo = _interview(*([None] * 7))
+        llm = _BatchLLM()
+        use_case = CompleteInterviewUseCase(repo, llm, batch_size=3, batch_concurrency=2)
+        result = await use_case.execute(USER_ID, repo.session.id)
+
+        batch_calls = [p for p in llm.prompts if "questions_feedback" in p["user_prompt"]]
+        assert len(batch_calls) == 3
+        assert llm.max_in_flight == 2
+        assert all(q.evaluation_score == 0.5 for q in repo.questions.values())
+        assert result.score_breakdown["overall"] == 0.5
+        assert result.feedback_summary == "Batched."
+
+    async def test_failed_batch_retried_alone(self):
+        repo = _interview(*([None] * 4))
+        llm = _BatchLLM(fail_first=1)
+        use_case = CompleteInterviewUseCase(repo, llm, batch_size=2, batch_concurrency=1)
+        await use_case.execute(USER_ID, repo.session.id)
+
+        batch_calls = [p for p in llm.prompts if "questions_feedback" in p["user_prompt"]]
+        assert len(batch_calls) == 3  # two batches + one retry
+        assert repo.session.is_completed()
+
+    async def test_exhausted_batch_keeps_successful_ones(self):
+        from app.domain.exceptions import InterviewError
+
+        repo = _interview(*([None] * 4))
+        last = list(repo.questions.values())[-1]
+        llm = _BatchLLM(always_fail_marker=last.question_text)
+        use_case = CompleteInterviewUseCase(repo, llm, batch_size=2, batch_retries=1)
+        with pytest.raises(InterviewError, match="1 of 2 batches"):
+            await use_case.execute(USER_ID, repo.session.id)
+
+        scored = [q for q in repo.questions.values() if q.is_evaluated()]
+        assert len(scored) == 2
+        assert not repo.session.is_completed()
+
+        # Completing again only re-evaluates the failed batch.
+        llm.always_fail_marker = None
+        llm.prompts.clear()
+        await use_case.execute(USER_ID, repo.session.id)
+        batch_calls = [p for p in llm.prompts if "questions_feedback" in p["user_prompt"]]
+        assert len(batch_calls) == 1
+
+
+class _BreakingStreamLLM(_FeedbackLLM):
+    """Streams one score per call, then breaks off (until the last answer)."""
+
+    def __init__(self) -> None:
+        super().__init__({})
+
+    async def stream_feedback(self, prompts: dict[str, str]):
+        from app.domain.exceptions import LLMProviderError
+
+        self.prompts.append(prompts)
+        ids = _row_ids(prompts)
+        yield {"question_id": ids[0], "evaluation_score": 0.8, "feedback_comment": "ok"}
+        if len(ids) > 1:
+            raise LLMProviderError("stream broke off")
+
+
+class TestCompletionProgress:
+    async def test_batched_progress(self):
+        repo = _interview(*([None] * 4))
+        events: list[tuple[str, int, int]] = []
+        use_case = CompleteInterviewUseCase(
+            repo,
+            _BatchLLM(),
+            batch_size=2,
+            batch_concurrency=1,
+            on_progress=lambda *e: events.append(e),
+        )
+        await use_case.execute(USER_ID, repo.session.id)
+        assert events == [
+            ("evaluating", 0, 4),
+            ("evaluating", 2, 4),
+            ("evaluating", 4, 4),
+            ("summarizing", 4, 4),
+        ]
+
+    async def test_failing_callback_does_not_fail_completion(self):
+        repo = _interview(0.5, 0.7)
+
+        def broken(*_: Any) -> None:
+            raise ConnectionError("result backend down")
+
+        use_case = CompleteInterviewUseCase(
+            repo, _FeedbackLLM({"summary": "ok"}), on_progress=broken
+        )
+        await use_case.execute(USER_ID, repo.session.id)
+        assert repo.session.is_completed()
+
+    async def test_validate_rejects_unanswered(self):
+        from app.domain.exceptions import InterviewError
+
+        repo = _interview(None)
+        next(iter(repo.questions.values())).answer_text = None
+        llm = _FeedbackLLM({})
+        with pytest.raises(InterviewError, match="must be answered"):
+            await CompleteInterviewUseCase(repo, llm).validate(USER_ID, repo.session.id)
+        assert llm.prompts == []
+
+
+class TestStreamedBatchEvaluation:
+    async def test_partial_scores_kept_and_only_missing_retried(self):
+        repo = _interview(*([None] * 3))
+        llm = _BreakingStreamLLM()
+        use_case = CompleteInterviewUseCase(repo, llm, batch_size=3, batch_retries=2)
+        await use_case.execute(USER_ID, repo.session.id)
+
+        batch_calls = [p for p in llm.prompts if "questions_feedback" in p["user_prompt"]]
+        assert [len(_row_ids(p)) for p in batch_calls] == [3, 2, 1]
+        assert all(q.evaluation_score == 0.8 for q in repo.questions.values())
+        assert repo.session.is_completed()
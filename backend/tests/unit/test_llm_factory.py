@@ -5,12 +5,17 @@ Tests use mock providers to verify:
 - Primary succeeds → no fallback called
 - Primary fails → fallback succeeds
 - Both fail → LLMProviderError raised
-- Factory function returns correct provider types
+- Factory function returns correct provider types (single-flight in front)
+- The async chain (``AsyncLLMProviderWithFallback``) behaves identically
+- Hedged mode fires the fallback after the learned delay and keeps the winner
+- Only the primary's own completions feed the learned hedge delay
 """
 
 from __future__ import annotations
 
+import asyncio
 import os
+import time
 from typing import Any, Dict, List
 from unittest.mock import patch
 
@@ -20,9 +25,20 @@ os.environ.setdefault("SECRET_KEY", "a" * 64)
 os.environ.setdefault("OPENAI_API_KEY", "test-openai-key")
 os.environ.setdefault("GEMINI_API_KEY", "test-gemini-key")
 
+from app.core.config import settings
 from app.domain.exceptions import LLMProviderError
-from app.domain.interfaces.llm_provider import ILLMProvider
-from app.infrastructure.llm.factory import LLMProviderWithFallback, get_llm_provider
+from app.domain.interfaces.llm_provider import IAsyncLLMProvider, ILLMProvider
+from app.infrastructure.llm.factory import (
+    AsyncLLMProviderWithFallback,
+    LLMProviderWithFallback,
+    get_async_llm_provider,
+    get_llm_provider,
+)
+from app.infrastructure.llm.hedging import LatencyTracker
+from app.infrastructure.llm.single_flight import (
+    AsyncSingleFlightLLMProvider,
+    SingleFlightLLMProvider,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -72,6 +88,42 @@ class _FailProvider(ILLMProvider):
         return {}
 
 
+class _AsyncSuccessProvider(IAsyncLLMProvider):
+    @property
+    def provider_name(self) -> str:
+        return "AsyncSuccessProvider"
+
+    async def generate_questions(self, prompts: Dict[str, str]) -> List[str]:
+        return ["Q1", "Q2"]
+
+    async def generate_feedback(self, prompts: Dict[str, str]) -> Dict[str, Any]:
+        return {"summary": "ok"}
+
+    async def generate_completion(self, prompt: str) -> str:
+        return "completion"
+
+    async def parse_resume(self, text: str) -> Dict[str, Any]:
+        return {"name": "Test"}
+
+
+class _AsyncFailProvider(IAsyncLLMProvider):
+    @property
+    def provider_name(self) -> str:
+        return "AsyncFailProvider"
+
+    async def generate_questions(self, prompts: Dict[str, str]) -> List[str]:
+        raise LLMProviderError("boom")
+
+    async def generate_feedback(self, prompts: Dict[str, str]) -> Dict[str, Any]:
+        raise LLMProviderError("boom")
+
+    async def generate_completion(self, prompt: str) -> str:
+        raise LLMProviderError("boom")
+
+    async def parse_resume(self, text: str) -> Dict[str, Any]:
+        raise LLMProviderError("boom")
+
+
 # ---------------------------------------------------------------------------
 # Fallback chain tests
 # ---------------------------------------------------------------------------
@@ -121,18 +173,161 @@ class TestLLMProviderWithFallback:
         assert result == {"name": "Test"}
 
 
+class TestAsyncLLMProviderWithFallback:
+    async def test_primary_success_no_fallback(self):
+        composite = AsyncLLMProviderWithFallback(_AsyncSuccessProvider(), _AsyncFailProvider())
+        result = await composite.generate_questions({"system_prompt": "", "user_prompt": ""})
+        assert result == ["Q1", "Q2"]
+
+    async def test_primary_fails_fallback_succeeds(self):
+        composite = AsyncLLMProviderWithFallback(_AsyncFailProvider(), _AsyncSuccessProvider())
+        result = await composite.generate_feedback({"system_prompt": "", "user_prompt": ""})
+        assert result == {"summary": "ok"}
+
+    async def test_both_fail_raises(self):
+        composite = AsyncLLMProviderWithFallback(_AsyncFailProvider(), _AsyncFailProvider())
+        with pytest.raises(LLMProviderError):
+            await composite.parse_resume("resume text")
+
+    async def test_calls_run_concurrently(self):
+        """Many in-flight calls share the event loop instead of a thread each."""
+        class _SlowProvider(_AsyncSuccessProvider):
+            async def generate_completion(self, prompt: str) -> str:
+                await asyncio.sleep(0.05)
+                return prompt
+
+        composite = AsyncLLMProviderWithFallback(_SlowProvider(), _AsyncFailProvider())
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        results = await asyncio.gather(*(composite.generate_completion(str(i)) for i in range(200)))
+        assert results == [str(i) for i in range(200)]
+        assert loop.time() - started < 1.0
+
+
+# ---------------------------------------------------------------------------
+# Hedged requests
+# ---------------------------------------------------------------------------
+
+class _SlowSyncProvider(_SuccessProvider):
+    def generate_completion(self, prompt: str) -> str:
+        time.sleep(0.5)
+        return "slow"
+
+
+class _SlowAsyncProvider(_AsyncSuccessProvider):
+    def __init__(self) -> None:
+        self.cancelled = False
+
+    async def generate_completion(self, prompt: str) -> str:
+        try:
+            await asyncio.sleep(0.5)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return "slow"
+
+
+class TestLatencyTracker:
+    def test_default_until_min_samples(self):
+        tracker = LatencyTracker(default_delay=7.0, min_samples=3)
+        tracker.record("m", 1.0)
+        assert tracker.delay("m") == 7.0
+
+    def test_learns_percentile_per_method(self):
+        tracker = LatencyTracker(default_delay=7.0, min_samples=10, min_delay=0.0)
+        for i in range(1, 101):
+            tracker.record("parse_resume", float(i))
+        assert tracker.delay("parse_resume") == 95.0
+        assert tracker.delay("generate_questions") == 7.0
+
+
+class TestHedgedFallback:
+    def test_sync_fast_primary_not_hedged(self):
+        tracker = LatencyTracker(default_delay=1.0)
+        composite = LLMProviderWithFallback(_SuccessProvider(), _FailProvider(), tracker)
+        assert composite.generate_completion("x") == "completion"
+        composite.close()
+
+    def test_sync_slow_primary_hedged_to_fallback(self):
+        tracker = LatencyTracker(default_delay=0.05)
+        composite = LLMProviderWithFallback(_SlowSyncProvider(), _SuccessProvider(), tracker)
+        started = time.monotonic()
+        assert composite.generate_completion("x") == "completion"
+        assert time.monotonic() - started < 0.4
+        composite.close()
+
+    def test_sync_hedge_failure_waits_for_primary(self):
+        tracker = LatencyTracker(default_delay=0.05)
+        composite = LLMProviderWithFallback(_SlowSyncProvider(), _FailProvider(), tracker)
+        assert composite.generate_completion("x") == "slow"
+        composite.close()
+
+    def test_sync_fallback_win_records_only_the_late_primary(self):
+        tracker = LatencyTracker(default_delay=0.05, min_samples=1, min_delay=0.0)
+        composite = LLMProviderWithFallback(_SlowSyncProvider(), _SuccessProvider(), tracker)
+        assert composite.generate_completion("x") == "completion"
+        assert tracker.delay("generate_completion") == 0.05  # the fallback's latency is not kept
+        time.sleep(0.6)  # the abandoned primary finishes
+        assert tracker.delay("generate_completion") >= 0.5
+        composite.close()
+
+    async def test_async_fallback_win_not_recorded(self):
+        tracker = LatencyTracker(default_delay=0.05, min_samples=1, min_delay=0.0)
+        composite = AsyncLLMProviderWithFallback(
+            _SlowAsyncProvider(), _AsyncSuccessProvider(), tracker
+        )
+        assert await composite.generate_completion("x") == "completion"
+        assert tracker.delay("generate_completion") == 0.05
+
+    def test_hedge_executor_sized_from_settings(self, monkeypatch):
+        monkeypatch.setattr(settings, "LLM_HEDGE_MAX_WORKERS", 3)
+        tracker = LatencyTracker(default_delay=1.0)
+        composite = LLMProviderWithFallback(_SuccessProvider(), _FailProvider(), tracker)
+        composite.generate_completion("x")
+        assert composite._executor._max_workers == 3
+        composite.close()
+
+    async def test_async_loser_cancelled(self):
+        primary = _SlowAsyncProvider()
+        tracker = LatencyTracker(default_delay=0.05)
+        composite = AsyncLLMProviderWithFallback(primary, _AsyncSuccessProvider(), tracker)
+        assert await composite.generate_completion("x") == "completion"
+        await asyncio.sleep(0)
+        assert primary.cancelled is True
+
+    async def test_async_primary_error_falls_back_immediately(self):
+        tracker = LatencyTracker(default_delay=5.0)
+        composite = AsyncLLMProviderWithFallback(
+            _AsyncFailProvider(), _AsyncSuccessProvider(), tracker
+        )
+        assert await composite.parse_resume("text") == {"name": "Test"}
+
+
 # ---------------------------------------------------------------------------
 # Factory function tests
 # ---------------------------------------------------------------------------
 
 class TestGetLLMProvider:
-    def test_returns_fallback_composite(self):
+    def test_returns_fallback_composite(self, monkeypatch):
         """With both API keys set, factory should return a composite."""
+        monkeypatch.setattr(settings, "LLM_SINGLE_FLIGHT_ENABLED", False)
         provider = get_llm_provider()
         assert isinstance(provider, LLMProviderWithFallback)
 
+    def test_async_returns_fallback_composite(self, monkeypatch):
+        monkeypatch.setattr(settings, "LLM_SINGLE_FLIGHT_ENABLED", False)
+        provider = get_async_llm_provider()
+        assert isinstance(provider, AsyncLLMProviderWithFallback)
+
+    def test_chain_is_coalesced_by_default(self):
+        provider = get_llm_provider()
+        assert isinstance(provider, SingleFlightLLMProvider)
+        assert isinstance(provider._inner, LLMProviderWithFallback)
+        assert isinstance(get_async_llm_provider(), AsyncSingleFlightLLMProvider)
+
     def test_invalid_primary_raises(self):
         with patch("app.infrastructure.llm.factory.settings") as mock_settings:
+            mock_settings.LLM_ROUTING_ENABLED = False
             mock_settings.LLM_PRIMARY_PROVIDER = "unknown"
             mock_settings.OPENAI_API_KEY = "key"
             mock_settings.GEMINI_API_KEY = "key"
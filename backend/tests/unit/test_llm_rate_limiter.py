@@ -0,0 +1,249 @@
+"""
+Unit tests for the outbound LLM rate limiter and the in-process metrics registry.
+
+The Redis Lua script is replaced by a scripted sequence of "wait ms" replies
+so the queueing behaviour can be verified without a Redis server.
+
+Verifies:
+- Calls dispatch immediately when the bucket has capacity
+- Calls queue for the reported refill time, then dispatch
+- Queueing is capped by ``max_wait`` and the request deadline (dispatch anyway)
+- Bucket keys name the provider once, then the bare model id
+- Redis errors fail open
+- Wait times land in the ``llm_rate_limit_wait_seconds`` histogram
+- Every HTTP attempt of a call is charged: the first by the wrapper, retries
+  by the httpx request hook; the hooks do nothing outside a call
+- Histogram quantiles / counters behave as expected
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+
+os.environ.setdefault("SECRET_KEY", "a" * 64)
+
+from app.core import deadline
+from app.core.metrics import Counter, Histogram, MetricsRegistry
+from app.domain.interfaces.llm_provider import IAsyncLLMProvider, ILLMProvider
+from app.infrastructure.llm.rate_limiter import (
+    AsyncRateLimitedLLMProvider,
+    RateLimitedLLMProvider,
+    TokenBucketLimiter,
+    acharge_retry,
+    charge_retry,
+    estimate_tokens,
+    wait_histogram,
+)
+
+_SYNC_REDIS = "app.infrastructure.llm.rate_limiter.get_sync_redis"
+_ASYNC_REDIS = "app.infrastructure.llm.rate_limiter.get_redis"
+
+
+def _redis_replying(*waits_ms: int) -> MagicMock:
+    """Fake client whose registered script returns *waits_ms* in order."""
+    script = MagicMock(side_effect=list(waits_ms))
+    client = MagicMock()
+    client.register_script.return_value = script
+    return client
+
+
+class _EchoProvider(ILLMProvider):
+    @property
+    def provider_name(self) -> str:
+        return "OpenAI"
+
+    def generate_questions(self, prompts: dict[str, str]) -> list[str]:
+        return []
+
+    def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        return {}
+
+    def generate_completion(self, prompt: str) -> str:
+        return prompt
+
+    def parse_resume(self, text: str) -> dict[str, Any]:
+        return {}
+
+
+def _flaky_handler(*statuses: int):
+    """MockTransport handler answering *statuses* in order (then 200)."""
+    replies = iter(statuses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(next(replies, 200))
+
+    return handler
+
+
+class _RetryingProvider(_EchoProvider):
+    """Retries its HTTP request until it succeeds, like an SDK would."""
+
+    def __init__(self, *statuses: int) -> None:
+        self.client = httpx.Client(
+            transport=httpx.MockTransport(_flaky_handler(*statuses)),
+            event_hooks={"request": [charge_retry]},
+        )
+
+    def generate_completion(self, prompt: str) -> str:
+        while self.client.get("https://llm.test/v1").status_code != 200:
+            pass
+        return prompt
+
+
+class _AsyncRetryingProvider(IAsyncLLMProvider):
+    def __init__(self, *statuses: int) -> None:
+        self.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(_flaky_handler(*statuses)),
+            event_hooks={"request": [acharge_retry]},
+        )
+
+    @property
+    def provider_name(self) -> str:
+        return "Gemini"
+
+    async def generate_questions(self, prompts: dict[str, str]) -> list[str]:
+        return []
+
+    async def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        return {}
+
+    async def generate_completion(self, prompt: str) -> str:
+        while (await self.client.get("https://llm.test/v1")).status_code != 200:
+            pass
+        return prompt
+
+    async def parse_resume(self, text: str) -> dict[str, Any]:
+        return {}
+
+
+class TestTokenBucketLimiter:
+    def test_immediate_grant(self):
+        limiter = TokenBucketLimiter("openai", "m-immediate", rpm=10, tpm=1000)
+        with patch(_SYNC_REDIS, return_value=_redis_replying(0)):
+            assert limiter.acquire(100) < 0.05
+        assert wait_histogram.snapshot()["model=m-immediate,provider=openai"]["count"] == 1
+
+    def test_queues_until_refilled(self):
+        limiter = TokenBucketLimiter("openai", "m-queue", rpm=10, tpm=1000)
+        redis = _redis_replying(80, 0)
+        with patch(_SYNC_REDIS, return_value=redis):
+            waited = limiter.acquire(100)
+        assert waited >= 0.08
+        assert redis.register_script.return_value.call_count == 2
+
+    def test_max_wait_dispatches_anyway(self):
+        limiter = TokenBucketLimiter("openai", "m-cap", rpm=10, tpm=1000, max_wait=0.05)
+        with patch(_SYNC_REDIS, return_value=_redis_replying(*([10_000] * 5))):
+            waited = limiter.acquire(100)
+        assert 0.05 <= waited < 1.0
+
+    def test_deadline_caps_queueing(self):
+        limiter = TokenBucketLimiter("openai", "m-deadline", rpm=10, tpm=1000, max_wait=30)
+        with (
+            patch(_SYNC_REDIS, return_value=_redis_replying(*([10_000] * 5))),
+            deadline.deadline_scope(0.05),
+        ):
+            waited = limiter.acquire(100)
+        assert 0.04 <= waited < 1.0
+
+    async def test_deadline_caps_async_queueing(self):
+        limiter = TokenBucketLimiter("gemini", "m-adeadline", rpm=10, tpm=1000, max_wait=30)
+        client = MagicMock()
+        client.register_script.return_value = AsyncMock(side_effect=[10_000] * 5)
+        with patch(_ASYNC_REDIS, AsyncMock(return_value=client)), deadline.deadline_scope(0.05):
+            waited = await limiter.aacquire(100)
+        assert 0.04 <= waited < 1.0
+
+    def test_redis_error_fails_open(self):
+        limiter = TokenBucketLimiter("openai", "m-down", rpm=10, tpm=1000)
+        with patch(_SYNC_REDIS, side_effect=ConnectionError("redis down")):
+            assert limiter.acquire(100) < 0.05
+            assert limiter.enabled is False
+
+    def test_unlimited_skips_redis(self):
+        limiter = TokenBucketLimiter("gemini", "m-free", rpm=0, tpm=0)
+        with patch(_SYNC_REDIS) as get_sync_redis:
+            limiter.acquire(100)
+        get_sync_redis.assert_not_called()
+
+    async def test_async_queues(self):
+        limiter = TokenBucketLimiter("gemini", "m-async", rpm=10, tpm=1000)
+        script = AsyncMock(side_effect=[50, 0])
+        client = MagicMock()
+        client.register_script.return_value = script
+        with patch(_ASYNC_REDIS, AsyncMock(return_value=client)):
+            waited = await limiter.aacquire(100)
+        assert waited >= 0.05
+        assert script.await_count == 2
+
+
+class TestRateLimitedProvider:
+    def test_acquires_estimated_tokens_before_call(self):
+        limiter = MagicMock()
+        provider = RateLimitedLLMProvider(_EchoProvider(), limiter)
+        assert provider.generate_completion("x" * 400) == "x" * 400
+        limiter.acquire.assert_called_once_with(estimate_tokens("x" * 400))
+
+    def test_each_http_retry_charged(self):
+        limiter = MagicMock()
+        provider = RateLimitedLLMProvider(_RetryingProvider(429, 503), limiter)
+        assert provider.generate_completion("x" * 400) == "x" * 400
+        assert limiter.acquire.call_count == 3  # first attempt + two retries
+        assert {c.args for c in limiter.acquire.call_args_list} == {(estimate_tokens("x" * 400),)}
+
+    async def test_each_async_http_retry_charged(self):
+        limiter = MagicMock(aacquire=AsyncMock())
+        provider = AsyncRateLimitedLLMProvider(_AsyncRetryingProvider(429), limiter)
+        assert await provider.generate_completion("x") == "x"
+        assert limiter.aacquire.await_count == 2
+
+    def test_keys_use_bare_model_id(self):
+        class _Named(_EchoProvider):
+            @property
+            def model_name(self) -> str:
+                return "openai:gpt-4o-mini"
+
+        limiter = RateLimitedLLMProvider(_Named())._limiter
+        assert limiter._keys == [
+            "llm:ratelimit:openai:gpt-4o-mini:req",
+            "llm:ratelimit:openai:gpt-4o-mini:tok",
+        ]
+
+    def test_hook_is_noop_outside_a_call(self):
+        provider = _RetryingProvider(503)
+        assert provider.generate_completion("x") == "x"
+
+    def test_estimate_counts_prompt_dicts(self):
+        small = estimate_tokens({"system_prompt": "", "user_prompt": ""})
+        large = estimate_tokens({"system_prompt": "a" * 4000, "user_prompt": "b" * 4000})
+        assert large - small == 2000
+
+
+class TestMetricsRegistry:
+    def test_counter_labels(self):
+        counter = Counter("c", "")
+        counter.inc(provider="openai")
+        counter.inc(2, provider="openai")
+        counter.inc(provider="gemini")
+        assert counter.value(provider="openai") == 3
+        assert counter.snapshot() == {"provider=openai": 3, "provider=gemini": 1}
+
+    def test_histogram_quantiles(self):
+        hist = Histogram("h", "", buckets=(1.0, 2.0, 5.0, 10.0))
+        for value in [0.5] * 90 + [8.0] * 10:
+            hist.observe(value)
+        assert hist.quantile(0.5) <= 1.0
+        assert 5.0 < hist.quantile(0.95) <= 8.0
+        snap = hist.snapshot()["_"]
+        assert snap["count"] == 100
+        assert snap["max"] == 8.0
+
+    def test_registry_get_or_create(self):
+        registry = MetricsRegistry()
+        assert registry.histogram("x") is registry.histogram("x")
+        registry.counter("y").inc()
+        assert registry.snapshot()["counters"] == {"y": {"_": 1}}
@@ -0,0 +1,137 @@
+"""
+Unit tests for the process-wide LLM provider registry.
+
+Verifies:
+- The same provider instance is returned on repeated calls
+- Providers inherited from another PID are dropped (fork safety)
+- close / aclose forward to the providers' connection pools
+- Fallback composites forward close to both children
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any
+from unittest.mock import patch
+
+os.environ.setdefault("SECRET_KEY", "a" * 64)
+
+from app.domain.interfaces.llm_provider import IAsyncLLMProvider, ILLMProvider
+from app.infrastructure.llm.factory import AsyncLLMProviderWithFallback, LLMProviderWithFallback
+from app.infrastructure.llm.registry import LLMProviderRegistry
+
+
+class _ClosableProvider(ILLMProvider):
+    def __init__(self) -> None:
+        self.closed = False
+
+    @property
+    def provider_name(self) -> str:
+        return "Closable"
+
+    def generate_questions(self, prompts: dict[str, str]) -> list[str]:
+        return []
+
+    def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        return {}
+
+    def generate_completion(self, prompt: str) -> str:
+        return ""
+
+    def parse_resume(self, text: str) -> dict[str, Any]:
+        return {}
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _AsyncClosableProvider(IAsyncLLMProvider):
+    def __init__(self) -> None:
+        self.closed = False
+
+    @property
+    def provider_name(self) -> str:
+        return "AsyncClosable"
+
+    async def generate_questions(self, prompts: dict[str, str]) -> list[str]:
+        return []
+
+    async def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        return {}
+
+    async def generate_completion(self, prompt: str) -> str:
+        return ""
+
+    async def parse_resume(self, text: str) -> dict[str, Any]:
+        return {}
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+_FACTORY = "app.infrastructure.llm.registry.get_llm_provider"
+_ASYNC_FACTORY = "app.infrastructure.llm.registry.get_async_llm_provider"
+
+
+class TestLLMProviderRegistry:
+    def test_provider_built_once(self):
+        registry = LLMProviderRegistry()
+        with patch(_FACTORY, side_effect=_ClosableProvider) as factory:
+            first = registry.get_provider()
+            second = registry.get_provider()
+        assert first is second
+        assert factory.call_count == 1
+
+    def test_async_provider_built_once(self):
+        registry = LLMProviderRegistry()
+        with patch(_ASYNC_FACTORY, side_effect=_AsyncClosableProvider) as factory:
+            assert registry.get_async_provider() is registry.get_async_provider()
+        assert factory.call_count == 1
+
+    def test_pid_change_rebuilds_without_closing(self):
+        registry = LLMProviderRegistry()
+        with patch(_FACTORY, side_effect=_ClosableProvider):
+            inherited = registry.get_provider()
+            with patch("app.infrastructure.llm.registry.os.getpid", return_value=-1):
+                fresh = registry.get_provider()
+        assert fresh is not inherited
+        assert inherited.closed is False
+
+    def test_reset_drops_providers(self):
+        registry = LLMProviderRegistry()
+        with patch(_FACTORY, side_effect=_ClosableProvider):
+            before = registry.get_provider()
+            registry.reset()
+            assert registry.get_provider() is not before
+        assert before.closed is False
+
+    def test_close_closes_sync_provider(self):
+        registry = LLMProviderRegistry()
+        with patch(_FACTORY, side_effect=_ClosableProvider):
+            provider = registry.get_provider()
+        registry.close()
+        assert provider.closed is True
+
+    async def test_aclose_closes_both(self):
+        registry = LLMProviderRegistry()
+        with (
+            patch(_FACTORY, side_effect=_ClosableProvider),
+            patch(_ASYNC_FACTORY, side_effect=_AsyncClosableProvider),
+        ):
+            sync_provider = registry.get_provider()
+            async_provider = registry.get_async_provider()
+        await registry.aclose()
+        assert sync_provider.closed is True
+        assert async_provider.closed is True
+
+
+class TestFallbackClose:
+    def test_sync_composite_closes_children(self):
+        primary, fallback = _ClosableProvider(), _ClosableProvider()
+        LLMProviderWithFallback(primary, fallback).close()
+        assert primary.closed and fallback.closed
+
+    async def test_async_composite_closes_children(self):
+        primary, fallback = _AsyncClosableProvider(), _AsyncClosableProvider()
+        await AsyncLLMProviderWithFallback(primary, fallback).aclose()
+        assert primary.closed and fallback.closed
@@ -0,0 +1,240 @@
+"""
+Unit tests for latency-aware routing over an N-provider chain.
+
+Verifies:
+- The scoreboard ranks unmeasured candidates first, then by EWMA latency
+  plus the error-rate penalty; exploration moves another candidate first
+- The router sends calls to the best candidate and falls back in rank order
+- Failures raise a candidate's error rate until it drops behind the others
+- Small cheap calls go to the fast candidates first, large ones do not
+- Streams fall back only before their first item
+- ``LLM_ROUTING_ENABLED`` makes the factory build a router over ``LLM_PROVIDERS``
+"""
+
+from __future__ import annotations
+
+import os
+import random
+from typing import Any
+
+import pytest
+
+os.environ.setdefault("SECRET_KEY", "a" * 64)
+
+from app.core.config import settings
+from app.domain.exceptions import LLMProviderError
+from app.domain.interfaces.llm_provider import IAsyncLLMProvider, ILLMProvider
+from app.infrastructure.llm.factory import get_async_llm_provider, get_llm_provider
+from app.infrastructure.llm.routing import (
+    AsyncRoutedLLMProvider,
+    ProviderScoreboard,
+    RoutedLLMProvider,
+    routed_total,
+)
+
+
+class _Model(ILLMProvider):
+    """Answers with its own name; fails while ``failing`` is set."""
+
+    def __init__(self, name: str, failing: bool = False) -> None:
+        self.name, self.failing, self.calls = name, failing, 0
+
+    @property
+    def provider_name(self) -> str:
+        return self.name
+
+    @property
+    def model_name(self) -> str:
+        return f"test:{self.name}"
+
+    def _answer(self) -> str:
+        self.calls += 1
+        if self.failing:
+            raise LLMProviderError(f"{self.name} down")
+        return self.name
+
+    def generate_questions(self, prompts: dict[str, str]) -> list[str]:
+        return [self._answer()]
+
+    def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        return {"by": self._answer()}
+
+    def generate_completion(self, prompt: str) -> str:
+        return self._answer()
+
+    def parse_resume(self, text: str) -> dict[str, Any]:
+        return {"by": self._answer()}
+
+    def stream_questions(self, prompts: dict[str, str]):
+        yield self._answer()
+        if self.name == "breaks-midway":
+            raise LLMProviderError("stream broke")
+
+
+class _AsyncModel(IAsyncLLMProvider):
+    def __init__(self, name: str, failing: bool = False) -> None:
+        self._sync = _Model(name, failing)
+
+    @property
+    def provider_name(self) -> str:
+        return self._sync.provider_name
+
+    @property
+    def model_name(self) -> str:
+        return self._sync.model_name
+
+    async def generate_questions(self, prompts: dict[str, str]) -> list[str]:
+        return self._sync.generate_questions(prompts)
+
+    async def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        return self._sync.generate_feedback(prompts)
+
+    async def generate_completion(self, prompt: str) -> str:
+        return self._sync.generate_completion(prompt)
+
+    async def parse_resume(self, text: str) -> dict[str, Any]:
+        return self._sync.parse_resume(text)
+
+
+def _board(**kwargs: Any) -> ProviderScoreboard:
+    return ProviderScoreboard(**{"min_samples": 1, "explore_rate": 0.0, **kwargs})
+
+
+class TestScoreboard:
+    def test_unmeasured_first_then_fastest(self):
+        board = _board(min_samples=2)
+        for seconds in (3.0, 3.0):
+            board.observe("slow", "m", seconds, ok=True)
+        for seconds in (1.0, 1.0):
+            board.observe("fast", "m", seconds, ok=True)
+        assert board.rank(["slow", "fast", "new"], "m") == ["new", "fast", "slow"]
+        assert board.score("new", "m") is None
+
+    def test_errors_are_penalized(self):
+        board = _board(alpha=0.5, error_penalty=10.0)
+        board.observe("flaky", "m", 1.0, ok=True)
+        board.observe("flaky", "m", 0.1, ok=False)
+        board.observe("steady", "m", 4.0, ok=True)
+        assert board.score("flaky", "m") == pytest.approx(1.0 + 10.0 * 0.5)
+        assert board.rank(["flaky", "steady"], "m") == ["steady", "flaky"]
+
+    def test_scores_are_per_method(self):
+        board = _board()
+        board.observe("a", "parse_resume", 9.0, ok=True)
+        board.observe("b", "parse_resume", 1.0, ok=True)
+        board.observe("a", "generate_completion", 1.0, ok=True)
+        board.observe("b", "generate_completion", 9.0, ok=True)
+        assert board.rank(["a", "b"], "parse_resume") == ["b", "a"]
+        assert board.rank(["a", "b"], "generate_completion") == ["a", "b"]
+
+    def test_exploration_moves_another_candidate_first(self):
+        board = _board(explore_rate=1.0, rng=random.Random(0))
+        board.observe("a", "m", 1.0, ok=True)
+        board.observe("b", "m", 9.0, ok=True)
+        assert board.rank(["a", "b"], "m") == ["b", "a"]
+
+
+class TestRoutedProvider:
+    def test_routes_to_best_and_falls_back_in_order(self):
+        a, b, c = _Model("a", failing=True), _Model("b"), _Model("c")
+        board = _board()
+        router = RoutedLLMProvider([a, b, c], board)
+        before = routed_total.value(method="generate_completion", provider="test:a")
+
+        assert router.generate_completion("hi") == "b"  # a failed, b next in order
+        assert routed_total.value(method="generate_completion", provider="test:a") == before + 1
+        assert router.generate_completion("hi") == "c"  # c still unmeasured
+        # now a is penalized; b and c are measured and healthy
+        assert router.generate_completion("hi") in ("b", "c")
+        assert a.calls == 1
+
+    def test_recovers_from_slow_provider(self):
+        a, b = _Model("a"), _Model("b")
+        board = _board()
+        board.observe("test:a", "generate_questions", 8.0, ok=True)
+        board.observe("test:b", "generate_questions", 2.0, ok=True)
+        router = RoutedLLMProvider([a, b], board)
+        assert router.generate_questions({}) == ["b"]
+        assert a.calls == 0
+
+    def test_all_fail_raises(self):
+        router = RoutedLLMProvider([_Model("a", True), _Model("b", True)], _board())
+        with pytest.raises(LLMProviderError, match="b down"):
+            router.parse_resume("text")
+
+    def test_small_completion_goes_to_fast_model(self):
+        big, mini = _Model("big"), _Model("mini")
+        router = RoutedLLMProvider(
+            [big],
+            _board(),
+            fast=[mini],
+            fast_methods=["generate_completion"],
+            fast_max_prompt_chars=100,
+        )
+        assert router.generate_completion("short prompt") == "mini"
+        assert router.generate_completion("x" * 500) == "big"
+        assert router.parse_resume("short") == {"by": "big"}
+
+    def test_fast_model_failure_falls_back_to_regular(self):
+        router = RoutedLLMProvider(
+            [_Model("big")],
+            _board(),
+            fast=[_Model("mini", failing=True)],
+            fast_methods=["generate_completion"],
+            fast_max_prompt_chars=100,
+        )
+        assert router.generate_completion("short") == "big"
+
+    def test_stream_falls_back_only_before_first_item(self):
+        router = RoutedLLMProvider([_Model("a", failing=True), _Model("b")], _board())
+        assert list(router.stream_questions({})) == ["b"]
+
+        broken = RoutedLLMProvider([_Model("breaks-midway"), _Model("b")], _board())
+        stream = broken.stream_questions({})
+        assert next(stream) == "breaks-midway"
+        with pytest.raises(LLMProviderError, match="stream broke"):
+            next(stream)
+
+    async def test_async_router(self):
+        router = AsyncRoutedLLMProvider(
+            [_AsyncModel("a", failing=True), _AsyncModel("b")], _board()
+        )
+        assert await router.generate_completion("hi") == "b"
+        assert router.scoreboard.score("test:a", "generate_completion") is not None
+
+
+class TestFactoryRouting:
+    @pytest.fixture(autouse=True)
+    def _routing(self, monkeypatch):
+        monkeypatch.setattr(settings, "LLM_ROUTING_ENABLED", True)
+        monkeypatch.setattr(settings, "LLM_SINGLE_FLIGHT_ENABLED", False)
+        monkeypatch.setattr(settings, "LLM_PROVIDER_MODE", "fake")
+        monkeypatch.setattr(settings, "LLM_BREAKER_ENABLED", False)
+        monkeypatch.setattr(settings, "LLM_RATE_LIMIT_ENABLED", False)
+        monkeypatch.setattr(
+            settings, "LLM_PROVIDERS", ["openai:big", "gemini:flash", "openai:other"]
+        )
+        monkeypatch.setattr(settings, "LLM_ROUTER_FAST_PROVIDERS", ["openai:mini"])
+        monkeypatch.setattr(
+            settings,
+            "LLM_FAKE_PROFILES",
+            {
+                spec: {"latency_median": 0}
+                for spec in ("openai:big", "gemini:flash", "openai:other", "openai:mini")
+            },
+        )
+
+    def test_builds_router_over_specs(self):
+        provider = get_llm_provider()
+        assert isinstance(provider, RoutedLLMProvider)
+        assert provider.model_name == "fake:openai:big+fake:gemini:flash+fake:openai:other"
+        assert provider.generate_completion("hi").startswith("Synthetic completion")
+        assert "fake:openai:mini generate_completion" in provider.scoreboard.snapshot()
+
+    def test_async_router(self):
+        assert isinstance(get_async_llm_provider(), AsyncRoutedLLMProvider)
+
+    def test_invalid_spec(self, monkeypatch):
+        monkeypatch.setattr(settings, "LLM_PROVIDERS", ["anthropic"])
+        with pytest.raises(LLMProviderError, match="Invalid LLM provider spec"):
+            get_llm_provider()
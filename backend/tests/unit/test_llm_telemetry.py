@@ -0,0 +1,190 @@
+"""
+Unit tests for per-call LLM telemetry.
+
+Verifies:
+- Every call lands in the duration histogram and ``llm_calls_total``
+- Token usage reported by the provider is aggregated and priced
+- Failures are counted by root-cause class
+- httpx event hooks count retries and stamp TTFB inside a call
+- The async wrapper records the same stats
+- The async OpenAI provider built by the factory carries the async hooks
+- The fallback composite counts calls served by the fallback provider
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any
+
+import httpx
+import pytest
+
+os.environ.setdefault("SECRET_KEY", "a" * 64)
+
+from app.domain.exceptions import LLMProviderError
+from app.domain.interfaces.llm_provider import IAsyncLLMProvider, ILLMProvider
+from app.infrastructure.llm.factory import LLMProviderWithFallback, _try_build_async_openai
+from app.infrastructure.llm.telemetry import (
+    AsyncTelemetryLLMProvider,
+    TelemetryLLMProvider,
+    async_http_event_hooks,
+    call_duration,
+    call_errors,
+    call_ttfb,
+    calls_total,
+    cost_total,
+    current_call,
+    estimate_cost,
+    fallback_total,
+    http_event_hooks,
+    note_usage,
+    retries_total,
+    tokens_total,
+)
+
+
+class _UsageProvider(ILLMProvider):
+    """Reports fixed token usage, optionally failing like an SDK timeout."""
+
+    def __init__(self, model: str, fail: bool = False, name: str = "OpenAI") -> None:
+        self._model = model
+        self._name = name
+        self.fail = fail
+
+    @property
+    def provider_name(self) -> str:
+        return self._name
+
+    @property
+    def model_name(self) -> str:
+        return f"{self._name.lower()}:{self._model}"
+
+    def generate_questions(self, prompts: dict[str, str]) -> list[str]:
+        return []
+
+    def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        return {}
+
+    def generate_completion(self, prompt: str) -> str:
+        if self.fail:
+            raise LLMProviderError("timed out") from TimeoutError("read timeout")
+        note_usage(1_000_000, 100_000, 200)
+        return "ok"
+
+    def parse_resume(self, text: str) -> dict[str, Any]:
+        return {}
+
+
+class _AsyncUsageProvider(IAsyncLLMProvider):
+    @property
+    def provider_name(self) -> str:
+        return "Gemini"
+
+    @property
+    def model_name(self) -> str:
+        return "gemini:m-async"
+
+    async def generate_questions(self, prompts: dict[str, str]) -> list[str]:
+        note_usage(10, 5)
+        return ["q"]
+
+    async def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        return {}
+
+    async def generate_completion(self, prompt: str) -> str:
+        return ""
+
+    async def parse_resume(self, text: str) -> dict[str, Any]:
+        return {}
+
+
+class TestTelemetryProvider:
+    def test_records_call_and_usage(self, monkeypatch):
+        from app.core.config import settings
+
+        monkeypatch.setitem(settings.LLM_PRICING_PER_1M_TOKENS, "m-usage", [2.0, 10.0])
+        provider = TelemetryLLMProvider(_UsageProvider("m-usage"))
+        assert provider.generate_completion("x") == "ok"
+
+        labels = {"provider": "openai", "model": "openai:m-usage", "method": "generate_completion"}
+        assert calls_total.value(outcome="ok", **labels) == 1
+        assert call_duration.quantile(0.5, outcome="ok", **labels) is not None
+        assert tokens_total.value(kind="prompt", **labels) == 1_000_000
+        assert tokens_total.value(kind="completion", **labels) == 100_000
+        assert tokens_total.value(kind="cached", **labels) == 200
+        assert cost_total.value(**labels) == pytest.approx(3.0)
+
+    def test_failure_counted_by_root_cause(self):
+        provider = TelemetryLLMProvider(_UsageProvider("m-fail", fail=True))
+        with pytest.raises(LLMProviderError):
+            provider.generate_completion("x")
+        labels = {"provider": "openai", "model": "openai:m-fail", "method": "generate_completion"}
+        assert calls_total.value(outcome="error", **labels) == 1
+        assert call_errors.value(error="TimeoutError", **labels) == 1
+
+    def test_http_hooks_count_retries_and_ttfb(self):
+        attempts = iter([503, 503, 200])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(next(attempts))
+
+        client = httpx.Client(
+            transport=httpx.MockTransport(handler), event_hooks=http_event_hooks()
+        )
+
+        class _HttpProvider(_UsageProvider):
+            def generate_completion(self, prompt: str) -> str:
+                while client.get("https://llm.test/v1").status_code != 200:
+                    pass
+                assert current_call().attempts == 3
+                return "ok"
+
+        TelemetryLLMProvider(_HttpProvider("m-http")).generate_completion("x")
+        labels = {"provider": "openai", "model": "openai:m-http", "method": "generate_completion"}
+        assert retries_total.value(**labels) == 2
+        assert call_ttfb.quantile(0.5, **labels) is not None
+
+    def test_hooks_and_usage_are_noops_outside_a_call(self):
+        assert current_call() is None
+        note_usage(10, 10)
+        client = httpx.Client(
+            transport=httpx.MockTransport(lambda r: httpx.Response(200)),
+            event_hooks=http_event_hooks(),
+        )
+        assert client.get("https://llm.test/").status_code == 200
+
+    def test_unpriced_model_costs_nothing(self):
+        assert estimate_cost("openai:unknown-model", 1000, 1000) == 0.0
+
+    async def test_async_wrapper(self):
+        provider = AsyncTelemetryLLMProvider(_AsyncUsageProvider())
+        assert await provider.generate_questions({}) == ["q"]
+        labels = {"provider": "gemini", "model": "gemini:m-async", "method": "generate_questions"}
+        assert calls_total.value(outcome="ok", **labels) == 1
+        assert tokens_total.value(kind="prompt", **labels) == 10
+
+    async def test_factory_async_openai_client_has_hooks(self, monkeypatch):
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "OPENAI_API_KEY", "sk-test")
+        provider = _try_build_async_openai("m-factory")
+        http_client = provider._client._client
+        for event, hooks in async_http_event_hooks().items():
+            assert http_client.event_hooks[event][: len(hooks)] == hooks
+        await provider.aclose()
+
+
+class TestFallbackCounter:
+    def test_fallback_counted(self):
+        composite = LLMProviderWithFallback(
+            _UsageProvider("m-primary", fail=True),
+            _UsageProvider("m-backup", name="Gemini"),
+        )
+        before = fallback_total.value(
+            method="generate_completion", fallback="Gemini", reason="error"
+        )
+        assert composite.generate_completion("x") == "ok"
+        after = fallback_total.value(
+            method="generate_completion", fallback="Gemini", reason="error"
+        )
+        assert after == before + 1
@@ -0,0 +1,152 @@
+"""
+Unit tests for the versioned prompt template registry.
+
+Verifies:
+- Every template renders static text first and the per-call data last,
+  tagged with its version id
+- Question and evaluation prompts for different candidates share the whole
+  static prefix (provider prefix caching)
+- The question pool keys on the question template's version
+- Telemetry reports prompt and cached tokens per template version
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any
+
+import pytest
+
+os.environ.setdefault("SECRET_KEY", "a" * 64)
+
+from app.application.use_cases.interview import StartInterviewUseCase
+from app.application.use_cases.interview.evaluation import (
+    build_answer_prompt,
+    build_batch_prompt,
+    build_summary_prompt,
+    build_transcript_prompt,
+)
+from app.application.use_cases.interview.prompts import (
+    INPUT_MARKER,
+    PROMPTS,
+    QUESTIONS,
+    PromptTemplate,
+    register,
+)
+from app.domain.entities.interview import InterviewQuestionEntity
+from app.domain.interfaces.llm_provider import ILLMProvider
+from app.infrastructure.cache import question_pool
+from app.infrastructure.llm.telemetry import TelemetryLLMProvider, note_usage, prompt_tokens_total
+
+
+def _static_prefix(prompt: dict[str, str]) -> str:
+    head, marker, _ = prompt["user_prompt"].partition(INPUT_MARKER)
+    assert marker, "rendered prompt has no INPUT marker"
+    return prompt["system_prompt"] + head
+
+
+def _questions(answer: str) -> list[InterviewQuestionEntity]:
+    return [
+        InterviewQuestionEntity(
+            question_text="What is Redis?",
+            answer_text=answer,
+            category="technical",
+            evaluation_score=0.5,
+            feedback_comment="ok",
+        )
+    ]
+
+
+class TestRegistry:
+    def test_render_puts_data_last(self):
+        for template in PROMPTS.values():
+            prompt = template.render("DATA")
+            assert prompt["system_prompt"] == template.system
+            assert prompt["user_prompt"].startswith(template.instructions)
+            assert prompt["user_prompt"].endswith(f"{INPUT_MARKER}\nDATA")
+            assert prompt["prompt_version"] == f"{template.name}-v{template.version}"
+
+    def test_names_are_unique(self):
+        with pytest.raises(ValueError):
+            register(PromptTemplate("questions", 99, "s", "i"))
+        assert PROMPTS["questions"] is QUESTIONS
+
+    def test_question_prompts_share_static_prefix(self):
+        a = StartInterviewUseCase.build_prompt(
+            {"skills": ["Python"], "inferred_role": "Backend Engineer"}, question_count=5
+        )
+        b = StartInterviewUseCase.build_prompt(
+            {"skills": ["Go", "Kafka"], "projects": [{"description": "Payments"}]},
+            question_count=12,
+            difficulty="hard",
+            focus_areas=["system design"],
+        )
+        assert _static_prefix(a) == _static_prefix(b)
+        assert a["prompt_version"] == b["prompt_version"] == QUESTIONS.version_id
+        data = b["user_prompt"].partition(INPUT_MARKER)[2]
+        for variable in ("Go, Kafka", "Payments", "**hard**", "system design", "questions: 12"):
+            assert variable in data
+
+    @pytest.mark.parametrize(
+        "build",
+        [
+            lambda q: build_answer_prompt(q[0].question_text, q[0].answer_text, q[0].category),
+            build_batch_prompt,
+            build_summary_prompt,
+            build_transcript_prompt,
+        ],
+    )
+    def test_evaluation_prompts_share_static_prefix(self, build):
+        a, b = build(_questions("Short.")), build(_questions("A much longer answer."))
+        assert _static_prefix(a) == _static_prefix(b)
+
+    def test_question_pool_keys_on_template_version(self):
+        ctx = {"skills": ["Go"]}
+        current = question_pool.pool_key("r", "mixed", ctx, QUESTIONS.version_id)
+        assert current != question_pool.pool_key("r", "mixed", ctx, "questions@0000")
+
+
+class _CachingProvider(ILLMProvider):
+    """Reports 1000 prompt tokens of which 768 were served from the provider cache."""
+
+    @property
+    def provider_name(self) -> str:
+        return "OpenAI"
+
+    @property
+    def model_name(self) -> str:
+        return "openai:m-prompt-cache"
+
+    def generate_questions(self, prompts: dict[str, str]) -> list[str]:
+        note_usage(1000, 50, 768)
+        return ["q"]
+
+    def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        note_usage(1000, 50, 0)
+        return {}
+
+    def generate_completion(self, prompt: str) -> str:
+        return ""
+
+    def parse_resume(self, text: str) -> dict[str, Any]:
+        return {}
+
+
+class TestPromptTokenTelemetry:
+    def test_tokens_recorded_per_template_version(self):
+        provider = TelemetryLLMProvider(_CachingProvider())
+        version = QUESTIONS.version_id
+        labels = {"prompt_version": version, "provider": "openai"}
+        before_prompt = prompt_tokens_total.value(kind="prompt", **labels)
+        before_cached = prompt_tokens_total.value(kind="cached", **labels)
+
+        provider.generate_questions(StartInterviewUseCase.build_prompt({}, question_count=3))
+
+        assert prompt_tokens_total.value(kind="prompt", **labels) == before_prompt + 1000
+        assert prompt_tokens_total.value(kind="cached", **labels) == before_cached + 768
+
+    def test_untagged_prompts_not_attributed(self):
+        provider = TelemetryLLMProvider(_CachingProvider())
+        before = prompt_tokens_total.snapshot()
+        provider.generate_feedback({"system_prompt": "s", "user_prompt": "u"})
+        assert prompt_tokens_total.snapshot() == before
@@ -0,0 +1,293 @@
+"""
+Unit tests for pre-generated interview question pools.
+
+Verifies:
+- Start draws questions from the pool without an LLM call on a hit
+- Start falls back to live generation on a miss, and both schedule a refill
+  of the drawn preset, passing the prompt for one pooled set
+- Interviews with focus areas bypass the pool
+- The Redis pool pops one set per draw, keyed by resume context and
+  prompt version
+- Requests larger than a pooled set miss without consuming it
+- The refill task tops the preset up to QUESTION_POOL_SIZE from the given
+  prompt, once
+- A refill overlapping an identical live start is not coalesced with it:
+  the pool never receives the set the candidate was just served
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import uuid
+from collections import defaultdict
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+os.environ.setdefault("SECRET_KEY", "a" * 64)
+
+from app.application.dto.interview import StartInterviewInput
+from app.application.use_cases.interview import StartInterviewUseCase
+from app.application.use_cases.interview.prompts import QUESTIONS
+from app.core.config import settings
+from app.domain.entities.interview import InterviewSessionEntity
+from app.domain.entities.resume import ResumeEntity
+from app.domain.interfaces.llm_provider import IAsyncLLMProvider, ILLMProvider
+from app.domain.interfaces.question_pool import IQuestionPool
+from app.domain.value_objects.enums import ResumeStatus
+from app.infrastructure.cache.question_pool import RedisQuestionPool, pool_key
+from app.infrastructure.llm.single_flight import SingleFlightLLMProvider
+
+_SYNC_REDIS = "app.infrastructure.cache.question_pool.get_sync_redis"
+_ASYNC_REDIS = "app.infrastructure.cache.question_pool.get_redis"
+
+USER_ID = uuid.uuid4()
+_V = QUESTIONS.version_id
+
+
+class _ListRedis:
+    """In-memory stand-in for the Redis list / string commands the pool uses."""
+
+    def __init__(self) -> None:
+        self.lists: dict[str, list[str]] = defaultdict(list)
+        self.strings: dict[str, str] = {}
+
+    def rpush(self, key: str, value: str) -> int:
+        self.lists[key].append(value)
+        return len(self.lists[key])
+
+    def lpop(self, key: str) -> str | None:
+        return self.lists[key].pop(0) if self.lists.get(key) else None
+
+    def llen(self, key: str) -> int:
+        return len(self.lists.get(key, []))
+
+    def expire(self, key: str, seconds: int) -> None:
+        pass
+
+    def set(self, key: str, value: str, nx: bool = False, ex: int | None = None) -> bool:
+        if nx and key in self.strings:
+            return False
+        self.strings[key] = value
+        return True
+
+    def delete(self, key: str) -> None:
+        self.strings.pop(key, None)
+
+
+class _AsyncListRedis:
+    def __init__(self, inner: _ListRedis) -> None:
+        self._inner = inner
+
+    async def lpop(self, key: str) -> str | None:
+        return self._inner.lpop(key)
+
+
+class _FakePool(IQuestionPool):
+    def __init__(self, questions: list[Any] | None) -> None:
+        self.questions = questions
+        self.refills: list[tuple[uuid.UUID, str]] = []
+        self.prompts: list[dict[str, str]] = []
+
+    @property
+    def set_size(self) -> int:
+        return 12
+
+    async def draw(self, resume_id, difficulty, resume_context, prompt_version, count):
+        return self.questions[:count] if self.questions else None
+
+    def request_refill(self, resume_id, difficulty, resume_context, prompt_version, prompts):
+        assert prompt_version == QUESTIONS.version_id
+        self.refills.append((resume_id, difficulty))
+        self.prompts.append(prompts)
+
+
+class _CountingLLM(IAsyncLLMProvider):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @property
+    def provider_name(self) -> str:
+        return "MockAsyncLLM"
+
+    async def generate_questions(self, prompts: dict[str, str]) -> list[Any]:
+        self.calls += 1
+        return [{"question": "Live question?", "type": "technical", "difficulty": "medium"}]
+
+    async def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        return {}
+
+    async def generate_completion(self, prompt: str) -> str:
+        return ""
+
+    async def parse_resume(self, text: str) -> dict[str, Any]:
+        return {}
+
+
+def _resume() -> ResumeEntity:
+    return ResumeEntity(
+        user_id=USER_ID,
+        status=ResumeStatus.ANALYZED,
+        inferred_role="Backend Engineer",
+        years_of_experience=5,
+        skills=["Python", "PostgreSQL"],
+        analysis={"experience": [{"description": "Built payment APIs."}]},
+    )
+
+
+def _start_use_case(resume: ResumeEntity, pool: IQuestionPool | None, llm: IAsyncLLMProvider):
+    interview_repo = MagicMock()
+    interview_repo.create_session = AsyncMock(side_effect=lambda entity: entity)
+    interview_repo.add_questions_batch = AsyncMock()
+    interview_repo.get_session_by_id = AsyncMock(return_value=InterviewSessionEntity())
+    resume_repo = MagicMock()
+    resume_repo.get_latest_by_user_id = AsyncMock(return_value=resume)
+    return StartInterviewUseCase(interview_repo, resume_repo, llm, pool), interview_repo
+
+
+class TestStartWithPool:
+    async def test_hit_skips_llm(self):
+        pooled = [{"question": f"Pooled {i}?", "type": "project"} for i in range(12)]
+        pool, llm, resume = _FakePool(pooled), _CountingLLM(), _resume()
+        use_case, repo = _start_use_case(resume, pool, llm)
+        await use_case.execute(StartInterviewInput(user_id=USER_ID, question_count=5))
+
+        assert llm.calls == 0
+        saved = repo.add_questions_batch.call_args.args[0]
+        assert [q.question_text for q in saved] == [f"Pooled {i}?" for i in range(5)]
+        assert pool.refills == [(resume.id, "mixed")]
+        assert "Total questions: 12" in pool.prompts[0]["user_prompt"]  # a full pooled set
+
+    async def test_miss_generates_live_and_refills(self):
+        pool, llm, resume = _FakePool(None), _CountingLLM(), _resume()
+        use_case, _ = _start_use_case(resume, pool, llm)
+        await use_case.execute(StartInterviewInput(user_id=USER_ID, difficulty="hard"))
+        assert llm.calls == 1
+        assert pool.refills == [(resume.id, "hard")]
+
+    async def test_focus_areas_bypass_pool(self):
+        pool, llm = _FakePool([{"question": "Pooled?"}] * 12), _CountingLLM()
+        use_case, _ = _start_use_case(_resume(), pool, llm)
+        await use_case.execute(StartInterviewInput(user_id=USER_ID, focus_areas=["sql"]))
+        assert llm.calls == 1
+        assert pool.refills == []
+
+
+class TestRedisQuestionPool:
+    async def test_draw_pops_one_set(self):
+        redis, pool, ctx = _ListRedis(), RedisQuestionPool(), {"skills": ["Go"]}
+        resume_id = uuid.uuid4()
+        with patch(_SYNC_REDIS, return_value=redis):
+            pool.add(resume_id, "mixed", ctx, _V, ["a", "b", "c"])
+            pool.add(resume_id, "mixed", ctx, _V, ["d", "e", "f"])
+        with patch(_ASYNC_REDIS, AsyncMock(return_value=_AsyncListRedis(redis))):
+            assert await pool.draw(resume_id, "mixed", ctx, _V, 2) == ["a", "b"]
+            assert await pool.draw(resume_id, "mixed", {"skills": ["Rust"]}, _V, 2) is None
+            assert await pool.draw(resume_id, "mixed", ctx, "questions@old", 2) is None
+            assert await pool.draw(resume_id, "mixed", ctx, _V, 2) == ["d", "e"]
+            assert await pool.draw(resume_id, "mixed", ctx, _V, 2) is None
+
+    async def test_oversized_request_keeps_set(self):
+        redis, pool, ctx = _ListRedis(), RedisQuestionPool(), {}
+        resume_id = uuid.uuid4()
+        with patch(_SYNC_REDIS, return_value=redis):
+            pool.add(resume_id, "easy", ctx, _V, ["q"] * settings.QUESTION_POOL_SET_SIZE)
+        with patch(_ASYNC_REDIS, AsyncMock(return_value=_AsyncListRedis(redis))):
+            assert (
+                await pool.draw(resume_id, "easy", ctx, _V, settings.QUESTION_POOL_SET_SIZE + 1)
+                is None
+            )
+        assert redis.llen(pool_key(resume_id, "easy", ctx, _V)) == 1
+
+    async def test_redis_outage_is_a_miss(self):
+        with patch(_ASYNC_REDIS, AsyncMock(side_effect=ConnectionError("redis down"))):
+            assert await RedisQuestionPool().draw(uuid.uuid4(), "mixed", {}, _V, 5) is None
+
+
+class _SyncQuestionLLM(ILLMProvider):
+    def __init__(self) -> None:
+        self.prompts: list[dict[str, str]] = []
+
+    @property
+    def provider_name(self) -> str:
+        return "MockLLM"
+
+    def generate_questions(self, prompts: dict[str, str]) -> list[Any]:
+        self.prompts.append(prompts)
+        return [{"question": f"Q{i}?"} for i in range(settings.QUESTION_POOL_SET_SIZE)]
+
+    def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        return {}
+
+    def generate_completion(self, prompt: str) -> str:
+        return ""
+
+    def parse_resume(self, text: str) -> dict[str, Any]:
+        return {}
+
+
+class TestRefillTask:
+    def test_fills_preset_once(self):
+        from app.infrastructure.tasks.interview_tasks import refill_question_pool_task
+
+        resume = _resume()
+        ctx = StartInterviewUseCase.build_resume_context(resume)
+        prompts = StartInterviewUseCase.build_prompt(ctx, difficulty="hard")
+        redis, llm = _ListRedis(), _SyncQuestionLLM()
+        with (
+            patch("app.infrastructure.llm.registry.get_shared_llm_provider", return_value=llm),
+            patch(_SYNC_REDIS, return_value=redis),
+        ):
+            first = refill_question_pool_task.run(str(resume.id), "hard", ctx, _V, prompts)
+            second = refill_question_pool_task.run(str(resume.id), "hard", ctx, _V, prompts)
+
+        assert first["generated"] == settings.QUESTION_POOL_SIZE
+        assert second["generated"] == 0
+        assert llm.prompts == [prompts] * settings.QUESTION_POOL_SIZE
+        assert redis.llen(pool_key(resume.id, "hard", ctx, _V)) == settings.QUESTION_POOL_SIZE
+
+    def test_refill_not_coalesced_with_live_start(self):
+        from app.infrastructure.tasks.interview_tasks import refill_question_pool_task
+
+        class _SlowLLM(_SyncQuestionLLM):
+            def generate_questions(self, prompts: dict[str, str]) -> list[Any]:
+                n = len(self.prompts)
+                self.prompts.append(prompts)
+                time.sleep(0.1)
+                return [
+                    {"question": f"set {n} Q{i}?"} for i in range(settings.QUESTION_POOL_SET_SIZE)
+                ]
+
+        resume = _resume()
+        ctx = StartInterviewUseCase.build_resume_context(resume)
+        live_prompt = StartInterviewUseCase.build_prompt(ctx, difficulty="mixed")
+        refill_prompt = StartInterviewUseCase.build_prompt(
+            ctx, question_count=settings.QUESTION_POOL_SET_SIZE, difficulty="mixed"
+        )
+        assert live_prompt == refill_prompt  # the defaults make them identical
+
+        redis, inner = _ListRedis(), _SlowLLM()
+        shared = SingleFlightLLMProvider(inner)
+        served: list[Any] = []
+        with (
+            patch("app.infrastructure.llm.registry.get_shared_llm_provider", return_value=shared),
+            patch(_SYNC_REDIS, return_value=redis),
+            patch(
+                "app.infrastructure.llm.single_flight.get_sync_redis",
+                side_effect=ConnectionError("in-process coalescing only"),
+            ),
+            patch.object(settings, "QUESTION_POOL_SIZE", 1),
+        ):
+            live = threading.Thread(
+                target=lambda: served.extend(shared.generate_questions(live_prompt))
+            )
+            live.start()
+            time.sleep(0.02)  # the live call is in flight
+            refill_question_pool_task.run(str(resume.id), "mixed", ctx, _V, refill_prompt)
+            live.join()
+
+        assert len(inner.prompts) == 2
+        pooled = json.loads(redis.lists[pool_key(resume.id, "mixed", ctx, _V)][0])
+        assert pooled != served
@@ -0,0 +1,203 @@
+"""
+Unit tests for request deadlines and cancellation of LLM work.
+
+Verifies:
+- Deadline scopes nest (inner scopes only tighten) and are visible to the
+  work's task
+- A client disconnect cancels the outstanding provider call (499); the
+  call is counted as cancelled with the provider time it reclaimed
+- An expired deadline cancels the work (504)
+- With ``cancel_on_disconnect=False`` the work finishes regardless
+- The OpenAI provider caps each attempt's timeout to the time left and
+  skips a retry whose back-off would overrun the deadline
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import httpx
+import pytest
+from fastapi import HTTPException
+from openai import APITimeoutError
+
+os.environ.setdefault("SECRET_KEY", "a" * 64)
+
+from app.api import cancellation
+from app.api.cancellation import requests_cancelled, run_cancellable
+from app.core import deadline
+from app.domain.exceptions import LLMProviderError
+from app.domain.interfaces.llm_provider import IAsyncLLMProvider
+from app.infrastructure.llm.openai_provider import OpenAIProvider
+from app.infrastructure.llm.telemetry import (
+    AsyncTelemetryLLMProvider,
+    call_duration,
+    cancelled_total,
+    reclaimed_seconds,
+)
+
+
+class _Request:
+    """Stand-in for ``fastapi.Request``; disconnects after *after* seconds."""
+
+    def __init__(self, after: float | None = None) -> None:
+        self._at = None if after is None else time.monotonic() + after
+
+    async def is_disconnected(self) -> bool:
+        return self._at is not None and time.monotonic() >= self._at
+
+
+class _SlowLLM(IAsyncLLMProvider):
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.finished = False
+        self.seen_remaining: float | None = None
+
+    @property
+    def provider_name(self) -> str:
+        return "Slow"
+
+    @property
+    def model_name(self) -> str:
+        return "slow-cancel-model"
+
+    async def generate_questions(self, prompts: dict[str, str]) -> list[str]:
+        self.seen_remaining = deadline.remaining()
+        await asyncio.sleep(self.delay)
+        self.finished = True
+        return ["q"]
+
+    async def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        return {}
+
+    async def generate_completion(self, prompt: str) -> str:
+        return ""
+
+    async def parse_resume(self, text: str) -> dict[str, Any]:
+        return {}
+
+
+_LABELS = {"provider": "slow", "model": "slow-cancel-model", "method": "generate_questions"}
+
+
+@pytest.fixture(autouse=True)
+def _fast_disconnect_poll(monkeypatch):
+    monkeypatch.setattr(cancellation, "_DISCONNECT_POLL_INTERVAL", 0.01)
+
+
+class TestDeadlineScope:
+    def test_nested_scopes_only_tighten(self):
+        assert deadline.remaining() is None
+        with deadline.deadline_scope(10):
+            with deadline.deadline_scope(60):
+                assert deadline.remaining() <= 10
+            with deadline.deadline_scope(1):
+                assert deadline.remaining() <= 1
+                assert deadline.allows(0.5)
+                assert not deadline.allows(5)
+                assert deadline.cap_timeout(180) <= 1
+        assert deadline.remaining() is None
+        assert deadline.cap_timeout(180) == 180
+
+    def test_zero_means_no_deadline(self):
+        with deadline.deadline_scope(0):
+            assert deadline.remaining() is None
+
+
+class TestRunCancellable:
+    async def test_result_and_deadline_visible_to_work(self):
+        llm = _SlowLLM(0)
+        result = await run_cancellable(
+            _Request(), lambda: llm.generate_questions({}), endpoint="test", timeout=30
+        )
+        assert result == ["q"]
+        assert 0 < llm.seen_remaining <= 30
+
+    async def test_disconnect_cancels_provider_call(self):
+        llm = _SlowLLM(5)
+        provider = AsyncTelemetryLLMProvider(llm)
+        call_duration.observe(2.0, outcome="ok", **_LABELS)  # a typical call takes ~2s
+        before = cancelled_total.value(reason=deadline.DISCONNECT, **_LABELS)
+        reclaimed_before = reclaimed_seconds.value(reason=deadline.DISCONNECT, **_LABELS)
+        requests_before = requests_cancelled.value(endpoint="test", reason=deadline.DISCONNECT)
+
+        started = time.monotonic()
+        with pytest.raises(HTTPException) as exc:
+            await run_cancellable(
+                _Request(after=0.05),
+                lambda: provider.generate_questions({}),
+                endpoint="test",
+                timeout=30,
+            )
+        assert exc.value.status_code == 499
+        assert time.monotonic() - started < 1
+        assert not llm.finished
+        assert cancelled_total.value(reason=deadline.DISCONNECT, **_LABELS) == before + 1
+        assert reclaimed_seconds.value(reason=deadline.DISCONNECT, **_LABELS) > reclaimed_before
+        assert (
+            requests_cancelled.value(endpoint="test", reason=deadline.DISCONNECT)
+            == requests_before + 1
+        )
+
+    async def test_deadline_cancels_work(self):
+        llm = _SlowLLM(5)
+        provider = AsyncTelemetryLLMProvider(llm)
+        before = cancelled_total.value(reason=deadline.DEADLINE, **_LABELS)
+        with pytest.raises(HTTPException) as exc:
+            await run_cancellable(
+                _Request(), lambda: provider.generate_questions({}), endpoint="test", timeout=0.05
+            )
+        assert exc.value.status_code == 504
+        assert cancelled_total.value(reason=deadline.DEADLINE, **_LABELS) == before + 1
+
+    async def test_disconnect_ignored_when_retry_expected(self):
+        llm = _SlowLLM(0.1)
+        result = await run_cancellable(
+            _Request(after=0),
+            lambda: llm.generate_questions({}),
+            endpoint="test",
+            cancel_on_disconnect=False,
+            timeout=30,
+        )
+        assert result == ["q"] and llm.finished
+
+
+def _timeout_error() -> APITimeoutError:
+    return APITimeoutError(request=httpx.Request("POST", "https://api.openai.com/v1"))
+
+
+class TestProviderDeadline:
+    def _provider(self, create) -> OpenAIProvider:
+        provider = OpenAIProvider(api_key="test-key", model="m", timeout=180)
+        provider._client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        )
+        return provider
+
+    def test_attempt_timeout_capped_to_deadline(self):
+        seen: list[float] = []
+
+        def create(**kwargs):
+            seen.append(kwargs["timeout"])
+            message = SimpleNamespace(content="hello")
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+        with deadline.deadline_scope(20):
+            assert self._provider(create).generate_completion("hi") == "hello"
+        assert 0 < seen[0] <= 20
+
+    def test_no_retry_past_deadline(self):
+        calls = 0
+
+        def create(**kwargs):
+            nonlocal calls
+            calls += 1
+            raise _timeout_error()
+
+        with deadline.deadline_scope(2), pytest.raises(LLMProviderError):
+            self._provider(create).generate_completion("hi")
+        assert calls == 1  # the 5s back-off would overrun the 2s deadline
@@ -0,0 +1,130 @@
+"""
+Unit tests for resume text compaction.
+
+Verifies:
+- Whitespace runs and blank-line runs collapse
+- Headers / footers repeated on every page are kept once; page numbers drop
+- Boilerplate lines and duplicated sections / bullets are removed
+- The token budget trims the longest section first and keeps every heading
+- Token counts before / after land in ``resume_compaction_tokens_total``
+- ``parse_resume_text`` sends the compacted text to the provider
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+os.environ.setdefault("SECRET_KEY", "a" * 64)
+
+from app.domain.interfaces.llm_provider import ILLMProvider
+from app.services.resume_compaction import (
+    PAGE_BREAK,
+    compact_resume_text,
+    compaction_tokens,
+    estimate_tokens,
+)
+
+HEADER = "Jane Doe  |  jane@example.com  |  +1 555 0100"
+
+
+def _page(n: int, body: str) -> str:
+    return f"{HEADER}\n{body}\nPage {n} of 3\n"
+
+
+RESUME = PAGE_BREAK.join(
+    [
+        _page(1, "SUMMARY\nBackend   engineer\t with 6 years   of Python.\n\n\n\nEXPERIENCE"),
+        _page(
+            2,
+            "Acme Corp — Senior Engineer\n- Built the payments ledger in Python and Postgres\n"
+            "- Built the payments ledger in Python and Postgres",
+        ),
+        _page(
+            3,
+            "SKILLS\nPython, FastAPI, Postgres\nSKILLS\nPython, FastAPI, Postgres\n"
+            "References available upon request",
+        ),
+    ]
+)
+
+
+class TestCompaction:
+    def test_whitespace_and_page_furniture(self):
+        text = compact_resume_text(RESUME, token_budget=0).text
+        assert "Backend engineer with 6 years of Python." in text
+        assert text.count(HEADER.split("  ")[0]) == 1
+        assert "Page" not in text
+        assert "\n\n\n" not in text
+
+    def test_boilerplate_and_duplicates_removed(self):
+        text = compact_resume_text(RESUME, token_budget=0).text
+        assert "References available" not in text
+        assert text.count("Built the payments ledger") == 1
+        assert text.count("SKILLS") == 1
+
+    def test_token_counts_recorded(self):
+        before = compaction_tokens.value(stage="before")
+        result = compact_resume_text(RESUME, token_budget=0)
+        assert result.tokens_after < result.tokens_before
+        assert result.saved_ratio > 0
+        assert compaction_tokens.value(stage="before") == before + result.tokens_before
+
+    def test_budget_trims_longest_section_keeping_headings(self):
+        long_experience = "\n".join(
+            f"- Shipped feature number {i} to production" for i in range(200)
+        )
+        text = f"EXPERIENCE\n{long_experience}\nEDUCATION\nBSc Computer Science\nSKILLS\nPython"
+        result = compact_resume_text(text, token_budget=300)
+        assert result.truncated
+        assert result.tokens_after <= 300
+        for heading in ("EXPERIENCE", "EDUCATION", "BSc Computer Science", "SKILLS", "Python"):
+            assert heading in result.text
+        assert "feature number 0 " in result.text
+
+    def test_within_budget_not_truncated(self):
+        result = compact_resume_text("SKILLS\nPython, Go", token_budget=1000)
+        assert not result.truncated
+        assert result.text == "SKILLS\nPython, Go"
+
+    def test_estimate_tokens(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("Python, Go") == 3
+        assert estimate_tokens("internationalization 2024") == 4 + 2
+
+
+class _RecordingProvider(ILLMProvider):
+    def __init__(self) -> None:
+        self.texts: list[str] = []
+
+    @property
+    def provider_name(self) -> str:
+        return "MockLLM"
+
+    def generate_questions(self, prompts: dict[str, str]) -> list[str]:
+        return []
+
+    def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        return {}
+
+    def generate_completion(self, prompt: str) -> str:
+        return ""
+
+    def parse_resume(self, text: str) -> dict[str, Any]:
+        self.texts.append(text)
+        return {}
+
+
+class TestParseIntegration:
+    def test_provider_receives_compacted_text(self):
+        from app.core.config import settings
+        from app.services.resume_parser import parse_resume_text
+
+        provider = _RecordingProvider()
+        with (
+            patch.object(settings, "RESUME_PARSE_CACHE_ENABLED", False),
+            patch.object(settings, "RESUME_FASTPATH_ENABLED", False),
+        ):
+            parse_resume_text(provider, RESUME, MagicMock())
+        assert provider.texts[0] == compact_resume_text(RESUME).text
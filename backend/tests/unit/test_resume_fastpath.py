@@ -0,0 +1,208 @@
+"""
+Unit tests for the local resume fast path.
+
+Verifies:
+- The Aho-Corasick automaton finds every (overlapping) pattern occurrence
+- Dictionary skills are found on word boundaries, aliases map to canonical
+  names, the longest match wins and ambiguous words need their capitals
+- Contact details and the skills section are extracted and their lines
+  removed from the LLM's text; prose and other sections stay
+- Local fields merge into the LLM parse (regex email / phone, LLM name,
+  union of skills); the cache stores only the LLM's part
+- Benchmark on a fixed resume: prompt tokens sent to the provider and the
+  output tokens of its parse
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+os.environ.setdefault("SECRET_KEY", "a" * 64)
+
+from app.core.config import settings
+from app.domain.interfaces.llm_provider import ILLMProvider
+from app.services.resume_compaction import estimate_tokens
+from app.services.resume_fastpath import (
+    AhoCorasick,
+    extract_fast_fields,
+    find_skills,
+    merge_fast_fields,
+)
+from app.services.resume_parser import parse_resume_text
+
+RESUME = """JANE DOE | jane.doe@example.com | +1 (555) 010-0200 | linkedin.com/in/janedoe
+San Francisco, CA
+SUMMARY
+Backend engineer with 6 years of Python and Go; led R&D on the payments platform.
+EXPERIENCE
+Acme Corp — Senior Engineer (2018 - 2024)
+- Built the ledger service in Python, PostgreSQL and Kafka; moved deploys to k8s
+- We go live every week; the rest of the team ships React front ends
+Initech — Software Engineer (2016 - 2018)
+- Wrote ETL jobs with Airflow and Pandas feeding the reporting warehouse
+TECHNICAL SKILLS
+Languages: Python, Go, C++, SQL, Bash
+Frameworks: FastAPI, Django (DRF), Flask, SQLAlchemy, Celery, React.js
+Data: PostgreSQL, Redis, Kafka, Elasticsearch, Airflow, Pandas, NumPy
+Cloud & DevOps: AWS (EC2, S3, Lambda), Docker, Kubernetes, Terraform, Helm
+Practices: Microservices, CI/CD, TDD, Observability, Domain-Driven Design
+EDUCATION
+BSc Computer Science, State University, 2012 - 2016"""
+
+
+class TestAhoCorasick:
+    def test_finds_overlapping_occurrences(self):
+        automaton = AhoCorasick(["he", "she", "his", "hers"])
+        assert sorted(automaton.find("ushers")) == [(1, "she"), (2, "he"), (2, "hers")]
+
+    def test_matches_naive_search(self):
+        patterns = ["java", "javascript", "script", "c", "c++"]
+        text = "javascript, java and c++ scripts"
+        naive = sorted((i, p) for p in patterns for i in range(len(text)) if text.startswith(p, i))
+        assert sorted(AhoCorasick(patterns).find(text)) == naive
+
+
+class TestFindSkills:
+    def test_aliases_and_longest_match(self):
+        text = "k8s, Postgres, C++ and C#, Ruby on Rails, golang, JavaScript"
+        assert find_skills(text) == [
+            "Kubernetes", "PostgreSQL", "C++", "C#", "Ruby on Rails", "Go", "JavaScript",
+        ]  # fmt: skip
+
+    def test_word_boundaries_and_ambiguous_words(self):
+        text = "We go live; the rest of R&D uses Javanese. Skills: Go, REST, R"
+        assert find_skills(text) == ["Go", "REST", "R"]
+
+
+class TestExtraction:
+    def test_contact_and_skills(self):
+        fields = extract_fast_fields(RESUME).fields
+        assert fields["name"] == "Jane Doe"
+        assert fields["email"] == "jane.doe@example.com"
+        assert fields["phone"] == "+1 (555) 010-0200"
+        skills = fields["skills"]
+        for skill in ("Python", "C++", "React", "DRF", "EC2", "TDD", "Domain-Driven Design"):
+            assert skill in skills  # section items, dictionary or not
+        assert "Kubernetes" in skills and "Go" in skills
+        assert len(skills) == len({s.lower() for s in skills})
+
+    def test_consumed_lines_removed(self):
+        text = extract_fast_fields(RESUME).text
+        assert "jane.doe@example.com" not in text
+        assert "TECHNICAL SKILLS" not in text and "Languages:" not in text
+        for kept in ("San Francisco, CA", "EXPERIENCE", "moved deploys to k8s", "EDUCATION"):
+            assert kept in text
+
+    def test_prose_skills_section_kept(self):
+        text = "Skills:\nI enjoy building reliable distributed systems for payments\nEDUCATION"
+        result = extract_fast_fields(text)
+        assert result.text == text
+        assert "skills" not in result.fields
+
+    def test_merge(self):
+        fields = {"email": "a@b.co", "name": "Local Name", "skills": ["Python", "Kafka"]}
+        parsed = {"email": None, "name": "Ada Lovelace", "skills": ["python", "Go"]}
+        assert merge_fast_fields(fields, parsed) == {
+            "email": "a@b.co",
+            "name": "Ada Lovelace",
+            "skills": ["python", "Go", "Kafka"],
+        }
+
+
+_LLM_PARSE = {
+    "summary": "Backend engineer.",
+    "inferred_role": "Backend Engineer",
+    "education": [{"degree": "BSc Computer Science", "university": "State University"}],
+    "experience": [
+        {"job_title": "Senior Engineer", "company": "Acme Corp", "start_date": "2018"},
+        {"job_title": "Software Engineer", "company": "Initech", "start_date": "2016"},
+    ],
+    "job_titles": ["Senior Engineer", "Software Engineer"],
+    "years_of_experience": 6.0,
+}
+
+
+class _TokenCountingProvider(ILLMProvider):
+    """Parses what it is sent; counts the tokens in and out."""
+
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+    @property
+    def provider_name(self) -> str:
+        return "TokenCounting"
+
+    def generate_questions(self, prompts: dict[str, str]) -> list[str]:
+        return []
+
+    def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        return {}
+
+    def generate_completion(self, prompt: str) -> str:
+        return ""
+
+    def parse_resume(self, text: str) -> dict[str, Any]:
+        self.sent.append(text)
+        parsed = dict(_LLM_PARSE)
+        fields = extract_fast_fields(text).fields  # what the model could read
+        parsed.update(
+            name="Jane Doe" if "JANE DOE" in text else None,
+            email=fields.get("email"),
+            phone=fields.get("phone"),
+            skills=fields.get("skills", []),
+        )
+        self.input_tokens = estimate_tokens(text)
+        self.output_tokens = estimate_tokens(json.dumps(parsed))
+        return parsed
+
+
+def _parse(enabled: bool) -> tuple[dict[str, Any], _TokenCountingProvider]:
+    provider = _TokenCountingProvider()
+    with (
+        patch.object(settings, "RESUME_PARSE_CACHE_ENABLED", False),
+        patch.object(settings, "RESUME_FASTPATH_ENABLED", enabled),
+    ):
+        parsed = parse_resume_text(provider, RESUME, MagicMock())
+    return parsed, provider
+
+
+class TestParseIntegration:
+    def test_llm_gets_remaining_text_and_result_is_merged(self):
+        parsed, provider = _parse(enabled=True)
+        assert "jane.doe@example.com" not in provider.sent[0]
+        assert parsed["email"] == "jane.doe@example.com"
+        assert parsed["name"] == "Jane Doe"
+        assert "DRF" in parsed["skills"] and "Python" in parsed["skills"]
+
+    def test_cache_stores_llm_part_only(self):
+        stored: dict[str, Any] = {}
+        cache = MagicMock()
+        cache.get.side_effect = lambda db, key: stored.get(key)
+        cache.set.side_effect = lambda db, key, value, model: stored.setdefault(key, value)
+        provider = _TokenCountingProvider()
+        other = RESUME.replace("jane.doe@example.com", "j.doe@example.org")
+        with patch("app.services.resume_parser.resume_parse_cache", cache):
+            first = parse_resume_text(provider, RESUME, MagicMock())
+            second = parse_resume_text(provider, other, MagicMock())
+        assert len(provider.sent) == 1  # same text left for the LLM → cache hit
+        assert first["email"] == "jane.doe@example.com"
+        assert second["email"] == "j.doe@example.org"
+        assert not next(iter(stored.values())).get("email")
+
+
+class TestBenchmark:
+    def test_fast_path_saves_tokens(self):
+        result = extract_fast_fields(RESUME)
+        full, full_provider = _parse(enabled=False)
+        fast, fast_provider = _parse(enabled=True)
+
+        assert set(fast["skills"]) >= set(full["skills"])
+        # Measured: input 262 → 129 tokens, output 367 → 231 tokens.
+        assert result.tokens_after <= result.tokens_before * 0.6
+        assert fast_provider.input_tokens <= full_provider.input_tokens * 0.6
+        assert fast_provider.output_tokens <= full_provider.output_tokens * 0.75
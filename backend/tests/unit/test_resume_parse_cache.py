@@ -0,0 +1,178 @@
+"""
+Unit tests for the content-addressed resume parse cache.
+
+Verifies:
+- Cache keys ignore whitespace noise but change with model / prompt version
+- Redis tier hit, Postgres fallback hit (with Redis back-fill), miss counters
+- Redis outage degrades to the Postgres tier
+- Postgres reads and writes run in a savepoint, so a failed statement
+  leaves the caller's transaction usable; rows record the prompt version
+- ``parse_resume_text`` calls the LLM once per distinct text and never
+  caches incomplete parses
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+os.environ.setdefault("SECRET_KEY", "a" * 64)
+
+from app.domain.interfaces.llm_provider import ILLMProvider
+from app.infrastructure.cache.resume_parse_cache import ResumeParseCache, cache_key
+from app.infrastructure.persistence.models.cache import ResumeParseCacheEntry
+from app.services.resume_parser import parse_resume_text
+
+_REDIS = "app.infrastructure.cache.resume_parse_cache.get_sync_redis"
+_PARSED = {"name": "Ada", "experience": ["x"], "education": ["y"], "skills": ["python"]}
+
+
+class _DictRedis:
+    """Minimal in-memory stand-in for the handful of Redis calls the cache makes."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+
+    def get(self, key: str) -> Any:
+        return self.data.get(key)
+
+    def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self.data[key] = value
+
+    def hincrby(self, key: str, field: str, amount: int) -> None:
+        bucket = self.data.setdefault(key, {})
+        bucket[field] = str(int(bucket.get(field, 0)) + amount)
+
+    def hgetall(self, key: str) -> dict[str, str]:
+        return dict(self.data.get(key, {}))
+
+
+class _CountingProvider(ILLMProvider):
+    def __init__(self, result: dict[str, Any]) -> None:
+        self.result = result
+        self.calls = 0
+
+    @property
+    def provider_name(self) -> str:
+        return "Counting"
+
+    def generate_questions(self, prompts: dict[str, str]) -> list[str]:
+        return []
+
+    def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        return {}
+
+    def generate_completion(self, prompt: str) -> str:
+        return ""
+
+    def parse_resume(self, text: str) -> dict[str, Any]:
+        self.calls += 1
+        return dict(self.result)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    ResumeParseCacheEntry.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+class TestCacheKey:
+    def test_whitespace_insensitive(self):
+        assert cache_key("Ada  Lovelace\n\nPython", "m") == cache_key("Ada Lovelace Python ", "m")
+
+    def test_model_and_prompt_version_change_key(self):
+        base = cache_key("text", "openai:gpt")
+        assert cache_key("text", "gemini:flash") != base
+        assert cache_key("text", "openai:gpt", prompt_version="resume-v1") != base
+
+
+class TestResumeParseCache:
+    def test_redis_hit_counts(self, db):
+        redis = _DictRedis()
+        cache = ResumeParseCache(ttl=60)
+        with patch(_REDIS, return_value=redis):
+            assert cache.get(db, "k") is None
+            cache.set(db, "k", _PARSED, "m")
+            assert cache.get(db, "k") == _PARSED
+            stats = cache.stats()
+        assert stats["misses"] == 1
+        assert stats["hits_redis"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_postgres_fallback_backfills_redis(self, db):
+        cache = ResumeParseCache(ttl=60)
+        with patch(_REDIS, return_value=_DictRedis()):
+            cache.set(db, "k", _PARSED, "m")
+        db.commit()
+
+        cold_redis = _DictRedis()
+        with patch(_REDIS, return_value=cold_redis):
+            assert cache.get(db, "k") == _PARSED
+            assert cache.stats()["hits_postgres"] == 1
+        assert "resume:parse:k" in cold_redis.data
+
+    def test_redis_outage_uses_postgres(self, db):
+        cache = ResumeParseCache(ttl=60)
+        with patch(_REDIS, side_effect=ConnectionError("redis down")):
+            cache.set(db, "k", _PARSED, "m")
+            assert cache.get(db, "k") == _PARSED
+            assert cache.get(db, "other") is None
+            assert cache.stats()["hits"] == 0
+
+    def test_duplicate_set_is_harmless(self, db):
+        cache = ResumeParseCache(ttl=60)
+        with patch(_REDIS, return_value=_DictRedis()):
+            cache.set(db, "k", _PARSED, "m")
+            cache.set(db, "k", _PARSED, "m")
+        db.commit()
+        assert db.query(ResumeParseCacheEntry).count() == 1
+
+    def test_db_read_error_rolled_back_to_savepoint(self, db):
+        db.add(ResumeParseCacheEntry(content_hash="mine", model="m", prompt_version="v", result={}))
+
+        def _failing_get(*args: Any) -> None:
+            assert db.in_nested_transaction()
+            raise OperationalError("SELECT", {}, Exception("connection reset"))
+
+        cache = ResumeParseCache(ttl=60)
+        with (
+            patch(_REDIS, side_effect=ConnectionError("redis down")),
+            patch.object(db, "get", side_effect=_failing_get),
+        ):
+            assert cache.get(db, "k") is None
+        assert not db.in_nested_transaction()
+        db.commit()  # the caller's own work still commits
+        assert db.query(ResumeParseCacheEntry).count() == 1
+
+    def test_row_records_prompt_version(self, db):
+        with patch(_REDIS, return_value=_DictRedis()):
+            ResumeParseCache(ttl=60).set(db, "k", _PARSED, "m", prompt_version="resume-section-v1")
+        db.commit()
+        assert db.get(ResumeParseCacheEntry, "k").prompt_version == "resume-section-v1"
+
+
+class TestParseResumeText:
+    def test_second_parse_served_from_cache(self, db):
+        provider = _CountingProvider(_PARSED)
+        with patch(_REDIS, return_value=_DictRedis()):
+            first = parse_resume_text(provider, "Ada Lovelace\nPython", db)
+            second = parse_resume_text(provider, "Ada Lovelace\n  Python ", db)
+        assert first == second == _PARSED
+        assert provider.calls == 1
+
+    def test_incomplete_parse_not_cached(self, db):
+        provider = _CountingProvider({"name": "Ada", "skills": []})
+        with patch(_REDIS, return_value=_DictRedis()):
+            parse_resume_text(provider, "text", db)
+            parse_resume_text(provider, "text", db)
+        assert provider.calls == 2
@@ -0,0 +1,272 @@
+"""
+Unit tests for per-section resume parsing.
+
+Verifies:
+- Sections are found at known headings (qualified, capitalized, with a
+  colon or a second noun); job titles and prose are not headings; text
+  before the first heading is the summary; heading-only sections are dropped
+- Per-section parses merge into the ``ParsedResume`` shape: each field from
+  the section trusted with it, skills unioned, lowest confidence
+- Long resumes get one focused call per section, all in flight at once
+  (the fake provider holds every call at a barrier); short ones keep the
+  single call
+- Each section is cached on its own: a failed section is retried alone and,
+  when it still fails, the next attempt only repeats that section
+- The async variant parses sections concurrently too
+- Benchmark: tokens of the largest section call (which sets the latency of
+  the concurrent parse) vs the single monolithic call
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+os.environ.setdefault("SECRET_KEY", "a" * 64)
+
+from app.core.config import settings
+from app.domain.interfaces.llm_provider import ILLMProvider
+from app.infrastructure.llm.structured_output import ParsedResume
+from app.services.resume_compaction import estimate_tokens
+from app.services.resume_parser import aparse_resume_text, parse_resume_text
+from app.services.resume_sections import merge_sections, split_sections
+
+_ROLE = "Acme Corp — {title} ({start} - {end})\n" + "\n".join(
+    f"- Delivered the {{title}} milestone {i} on the payments platform with a small team"
+    for i in range(8)
+)
+
+RESUME = "\n".join(
+    [
+        "JANE DOE | jane.doe@example.com",
+        "Professional Summary",
+        "Backend engineer who builds payment systems.",
+        "Work Experience",
+        *(_ROLE.format(title=f"Engineer {n}", start=2000 + n, end=2001 + n) for n in range(12)),
+        "Project Manager",  # a job title, not the "Projects" heading
+        "- Ran the ledger migration",
+        "EDUCATION & CERTIFICATIONS",
+        "BSc Computer Science, State University, 1996 - 2000",
+        "Skills:",
+        "Distributed systems design and reliable payments engineering",
+        "Awards",
+        "Engineer of the year 2010",
+    ]
+)
+
+
+class TestSplitSections:
+    def test_headings(self):
+        sections = {s.kind: s.text for s in split_sections(RESUME)}
+        assert list(sections) == ["summary", "experience", "education", "skills"]
+        assert sections["summary"].startswith("JANE DOE")
+        assert "Engineer of the year" in sections["summary"]
+        assert "Project Manager\n- Ran the ledger migration" in sections["experience"]
+        assert sections["education"].startswith("EDUCATION & CERTIFICATIONS\nBSc")
+
+    def test_not_headings(self):
+        text = "Summary\nexperience with Python tools\nSkills in this area were limited."
+        assert [s.kind for s in split_sections(text)] == ["summary"]
+
+    def test_heading_only_sections_dropped(self):
+        text = "Jane Doe\nTECHNICAL SKILLS\nEducation\nBSc Physics"
+        assert [s.kind for s in split_sections(text)] == ["summary", "education"]
+
+
+class TestMergeSections:
+    def test_fields_from_trusted_sections(self):
+        merged = merge_sections(
+            {
+                "summary": {"name": "Jane", "summary": "Engineer.", "skills": ["Python"],
+                            "confidence_score": 0.9, "education": [{"degree": "guess"}]},
+                "experience": {"experience": [{"company": "Acme"}], "job_titles": ["Eng"],
+                               "inferred_role": "Backend Engineer", "skills": ["python", "Go"],
+                               "confidence_score": 0.7, "processing_time": 2.0},
+                "education": {"education": [{"degree": "BSc"}], "processing_time": 1.0},
+            }
+        )  # fmt: skip
+        assert set(merged) == set(ParsedResume().model_dump())
+        assert merged["education"] == [{"degree": "BSc"}]
+        assert merged["inferred_role"] == "Backend Engineer"  # no trusted section gave one
+        assert merged["skills"] == ["Python", "Go"]
+        assert (merged["confidence_score"], merged["processing_time"]) == (0.7, 2.0)
+
+
+class _SectionProvider(ILLMProvider):
+    """Answers each section with its fields; records calls and peak concurrency.
+
+    With *parties*, every call waits until that many calls are in flight at once.
+    """
+
+    def __init__(self, parties: int = 0, fail: dict[str, int] | None = None) -> None:
+        self._barrier = threading.Barrier(parties) if parties else None
+        self.fail = dict(fail or {})  # section → number of calls that raise
+        self.calls: list[str] = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    @property
+    def provider_name(self) -> str:
+        return "Sections"
+
+    def generate_questions(self, prompts: dict[str, str]) -> list[str]:
+        return []
+
+    def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        return {}
+
+    def generate_completion(self, prompt: str) -> str:
+        return ""
+
+    def parse_resume(self, text: str) -> dict[str, Any]:
+        kind = text[1 : text.index(" ")].lower() if text.startswith("[") else "whole"
+        with self._lock:
+            self.calls.append(kind)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            if self._barrier:
+                self._barrier.wait(timeout=10)
+            if self.fail.get(kind):
+                self.fail[kind] -= 1
+                raise RuntimeError(f"{kind} failed")
+            return _ANSWERS.get(kind, _WHOLE)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+_ANSWERS: dict[str, dict[str, Any]] = {
+    "summary": {"name": "Jane Doe", "summary": "Backend engineer.", "confidence_score": 0.9},
+    "experience": {"experience": [{"company": "Acme Corp"}], "years_of_experience": 12.0},
+    "education": {"education": [{"degree": "BSc Computer Science"}]},
+    "skills": {"skills": ["Distributed Systems"]},
+}
+_WHOLE = {k: v for answer in _ANSWERS.values() for k, v in answer.items()}
+
+
+def _settings(**overrides: Any):
+    values = {
+        "RESUME_FASTPATH_ENABLED": False,
+        "RESUME_SECTION_PARSE_MIN_TOKENS": 300,
+        "RESUME_PARSE_CACHE_ENABLED": False,
+        **overrides,
+    }
+    return patch.multiple(settings, **values)
+
+
+def _cache() -> tuple[MagicMock, dict[str, Any]]:
+    stored: dict[str, Any] = {}
+    cache = MagicMock()
+    cache.get.side_effect = lambda db, key: stored.get(key)
+    cache.set.side_effect = lambda db, key, value, model, *_: stored.setdefault(key, value)
+    return cache, stored
+
+
+class TestParseSections:
+    def test_long_resume_parsed_per_section_concurrently(self):
+        provider = _SectionProvider(parties=4)
+        with _settings():
+            parsed = parse_resume_text(provider, RESUME, MagicMock())
+        assert sorted(provider.calls) == ["education", "experience", "skills", "summary"]
+        assert provider.peak == 4
+        assert parsed["name"] == "Jane Doe"
+        assert parsed["experience"] == [{"company": "Acme Corp"}]
+        assert parsed["education"] == [{"degree": "BSc Computer Science"}]
+        assert parsed["skills"] == ["Distributed Systems"]
+
+    def test_short_resume_single_call(self):
+        provider = _SectionProvider()
+        with _settings(RESUME_SECTION_PARSE_MIN_TOKENS=100_000):
+            parse_resume_text(provider, RESUME, MagicMock())
+        assert provider.calls == ["whole"]
+
+    def test_failed_section_retried_alone(self):
+        provider = _SectionProvider(fail={"education": 1})
+        with _settings(RESUME_SECTION_PARSE_RETRIES=1):
+            parsed = parse_resume_text(provider, RESUME, MagicMock())
+        assert sorted(provider.calls) == ["education", "education", "experience", "skills",
+                                          "summary"]  # fmt: skip
+        assert parsed["education"]
+
+    def test_next_attempt_repeats_only_the_failed_section(self):
+        cache, stored = _cache()
+        provider = _SectionProvider(fail={"experience": 2})
+        with (
+            _settings(RESUME_PARSE_CACHE_ENABLED=True, RESUME_SECTION_PARSE_RETRIES=1),
+            patch("app.services.resume_parser.resume_parse_cache", cache),
+        ):
+            with pytest.raises(RuntimeError, match="experience failed"):
+                parse_resume_text(provider, RESUME, MagicMock())
+            assert len(stored) == 3
+
+            provider.calls.clear()
+            parsed = parse_resume_text(provider, RESUME, MagicMock())
+        assert provider.calls == ["experience"]
+        assert parsed["experience"] and parsed["education"] and parsed["name"]
+
+
+class _AsyncSectionProvider:
+    model_name = "async-sections"
+
+    def __init__(self) -> None:
+        self.sync = _SectionProvider(parties=4)
+
+    async def parse_resume(self, text: str) -> dict[str, Any]:
+        return await asyncio.to_thread(self.sync.parse_resume, text)
+
+
+class TestAsyncParseSections:
+    async def test_sections_gathered(self):
+        provider = _AsyncSectionProvider()
+        with _settings():
+            parsed = await aparse_resume_text(provider, RESUME, MagicMock())
+        assert provider.sync.peak == 4
+        assert parsed["education"] and parsed["experience"] and parsed["name"]
+
+
+class _TokenCountingProvider(_SectionProvider):
+    """Section answers sized like real output; records the tokens of each call."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.tokens: list[int] = []  # input + output tokens per call
+
+    def parse_resume(self, text: str) -> dict[str, Any]:
+        kind = text[1 : text.index(" ")].lower() if text.startswith("[") else "whole"
+        body = text.split("\n\n", 1)[-1] if kind != "whole" else text
+        answer = {"summary": body[:300]} if kind in ("summary", "whole") else {}
+        if kind in ("experience", "whole"):
+            answer["experience"] = [line for line in body.split("\n") if line.startswith("Acme")]
+        if kind in ("education", "whole"):
+            answer["education"] = [{"degree": "BSc Computer Science"}]
+        if kind in ("skills", "whole"):
+            answer["skills"] = ["Distributed Systems"]
+        with self._lock:
+            self.calls.append(kind)
+            self.tokens.append(estimate_tokens(text) + estimate_tokens(json.dumps(answer)))
+        return answer
+
+
+class TestBenchmark:
+    def test_largest_section_smaller_than_whole(self):
+        def _tokens(min_tokens: int) -> list[int]:
+            provider = _TokenCountingProvider()
+            with _settings(RESUME_SECTION_PARSE_MIN_TOKENS=min_tokens):
+                parse_resume_text(provider, RESUME, MagicMock())
+            return provider.tokens
+
+        (whole,), sections = _tokens(100_000), _tokens(300)
+        # The sections run concurrently, so the largest one bounds the parse.
+        # Measured on this ~2150-token resume: 2527 tokens in + out for the
+        # single call, 2370 for the experience section (-6%); the other
+        # sections are 130 tokens or fewer each.
+        assert len(sections) == 4
+        assert max(sections) < whole * 0.95
@@ -0,0 +1,304 @@
+"""
+Unit tests for single-flight coalescing of identical LLM calls.
+
+Verifies:
+- Identical overlapping calls in one process reach the provider once and
+  all get the result (or the leader's exception)
+- Sequential or different calls are not coalesced
+- A call whose lock is held by another process waits for that process's
+  published result; if the other leader fails, the caller takes over
+- A result left by an earlier flight is never handed to a caller waiting on
+  a later one
+- The leader publishes its result under its flight token and releases the lock
+- Async: identical concurrent calls share one request; a cancelled leader
+  hands over to the next waiter
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+import time
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+os.environ.setdefault("SECRET_KEY", "a" * 64)
+
+from app.domain.exceptions import LLMProviderError
+from app.domain.interfaces.llm_provider import IAsyncLLMProvider, ILLMProvider
+from app.infrastructure.llm.single_flight import (
+    AsyncSingleFlightLLMProvider,
+    SingleFlightLLMProvider,
+    flight_key,
+    single_flight_total,
+)
+
+_MODULE = "app.infrastructure.llm.single_flight"
+
+
+class _DictRedis:
+    """In-memory stand-in for the sync Redis client (no expiry)."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+
+    def set(self, key: str, value: str, nx: bool = False, ex: int | None = None) -> bool:
+        if nx and key in self.store:
+            return False
+        self.store[key] = value
+        return True
+
+    def get(self, key: str) -> str | None:
+        return self.store.get(key)
+
+    def exists(self, key: str) -> int:
+        return int(key in self.store)
+
+    def delete(self, key: str) -> int:
+        return int(self.store.pop(key, None) is not None)
+
+
+class _AsyncDictRedis(_DictRedis):
+    async def set(self, key: str, value: str, nx: bool = False, ex: int | None = None) -> bool:
+        return _DictRedis.set(self, key, value, nx, ex)
+
+    async def get(self, key: str) -> str | None:
+        return _DictRedis.get(self, key)
+
+    async def exists(self, key: str) -> int:
+        return _DictRedis.exists(self, key)
+
+    async def delete(self, key: str) -> int:
+        return _DictRedis.delete(self, key)
+
+
+class _SlowLLM(ILLMProvider):
+    """Counts calls; each takes ``delay`` seconds."""
+
+    def __init__(self, delay: float = 0.1, failing: bool = False) -> None:
+        self.delay, self.failing, self.calls = delay, failing, 0
+        self._lock = threading.Lock()
+
+    @property
+    def provider_name(self) -> str:
+        return "Slow"
+
+    @property
+    def model_name(self) -> str:
+        return "slow-model"
+
+    def _answer(self, value: Any) -> Any:
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        if self.failing:
+            raise LLMProviderError("provider down")
+        return value
+
+    def generate_questions(self, prompts: dict[str, str]) -> list[str]:
+        return self._answer([prompts.get("user_prompt", "")])
+
+    def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        return self._answer({"overall_score": 7})
+
+    def generate_completion(self, prompt: str) -> str:
+        return self._answer(f"echo {prompt}")
+
+    def parse_resume(self, text: str) -> dict[str, Any]:
+        return self._answer({"skills": [text]})
+
+
+class _AsyncSlowLLM(IAsyncLLMProvider):
+    def __init__(self, delay: float = 0.05) -> None:
+        self.delay, self.calls = delay, 0
+
+    @property
+    def provider_name(self) -> str:
+        return "Slow"
+
+    @property
+    def model_name(self) -> str:
+        return "slow-model"
+
+    async def _answer(self, value: Any) -> Any:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return value
+
+    async def generate_questions(self, prompts: dict[str, str]) -> list[str]:
+        return await self._answer(["q"])
+
+    async def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        return await self._answer({"overall_score": 7})
+
+    async def generate_completion(self, prompt: str) -> str:
+        return await self._answer(f"echo {prompt}")
+
+    async def parse_resume(self, text: str) -> dict[str, Any]:
+        return await self._answer({"skills": [text]})
+
+
+def _run_threads(fn, n: int) -> list[Any]:
+    results: list[Any] = [None] * n
+
+    def worker(i: int) -> None:
+        try:
+            results[i] = fn()
+        except Exception as exc:
+            results[i] = exc
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+@pytest.fixture
+def redis() -> _DictRedis:
+    r = _DictRedis()
+    with patch(f"{_MODULE}.get_sync_redis", return_value=r):
+        yield r
+
+
+class TestSingleFlight:
+    def test_concurrent_identical_calls_share_one_request(self, redis):
+        inner = _SlowLLM()
+        provider = SingleFlightLLMProvider(inner, poll_interval=0.01)
+        before = single_flight_total.value(method="parse_resume", role="local")
+
+        results = _run_threads(lambda: provider.parse_resume("cv"), 5)
+
+        assert inner.calls == 1
+        assert results == [{"skills": ["cv"]}] * 5
+        assert results[0] is not results[1]  # followers get their own copy
+        assert single_flight_total.value(method="parse_resume", role="local") == before + 4
+
+    def test_sequential_and_different_calls_are_not_coalesced(self, redis):
+        inner = _SlowLLM(delay=0)
+        provider = SingleFlightLLMProvider(inner)
+        provider.generate_completion("a")
+        provider.generate_completion("a")
+        provider.generate_completion("b")
+        assert inner.calls == 3
+
+    def test_leader_error_is_shared(self, redis):
+        inner = _SlowLLM(failing=True)
+        provider = SingleFlightLLMProvider(inner, poll_interval=0.01)
+        results = _run_threads(lambda: provider.generate_completion("x"), 3)
+        assert inner.calls == 1
+        assert all(isinstance(r, LLMProviderError) for r in results)
+
+    def test_leader_publishes_result_and_releases_lock(self, redis):
+        provider = SingleFlightLLMProvider(_SlowLLM(delay=0), result_ttl=5)
+        provider.generate_completion("hi")
+        key = flight_key("slow-model", "generate_completion", "hi")
+        assert f"llm:flight:{key}" not in redis.store
+        (result_key,) = redis.store
+        assert result_key.startswith(f"llm:flight:{key}:result:")
+        assert json.loads(redis.store[result_key]) == "echo hi"
+
+    def test_waits_for_other_process_result(self, redis):
+        inner = _SlowLLM(delay=0)
+        provider = SingleFlightLLMProvider(inner, poll_interval=0.01)
+        key = flight_key("slow-model", "generate_completion", "hi")
+        redis.store[f"llm:flight:{key}"] = "other"  # another worker is leading
+        before = single_flight_total.value(method="generate_completion", role="remote")
+
+        def other_worker_finishes() -> None:
+            time.sleep(0.05)
+            redis.store[f"llm:flight:{key}:result:other"] = json.dumps("from elsewhere")
+            del redis.store[f"llm:flight:{key}"]
+
+        threading.Thread(target=other_worker_finishes).start()
+        assert provider.generate_completion("hi") == "from elsewhere"
+        assert inner.calls == 0
+        assert single_flight_total.value(method="generate_completion", role="remote") == before + 1
+
+    def test_earlier_flight_result_not_shared(self, redis):
+        inner = _SlowLLM(delay=0)
+        provider = SingleFlightLLMProvider(inner, poll_interval=0.01)
+        key = flight_key("slow-model", "generate_completion", "hi")
+        redis.store[f"llm:flight:{key}:result:first"] = json.dumps("stale")
+        redis.store[f"llm:flight:{key}"] = "second"  # a later flight is leading
+
+        def second_flight_finishes() -> None:
+            time.sleep(0.05)
+            redis.store[f"llm:flight:{key}:result:second"] = json.dumps("fresh")
+            del redis.store[f"llm:flight:{key}"]
+
+        threading.Thread(target=second_flight_finishes).start()
+        assert provider.generate_completion("hi") == "fresh"
+        assert inner.calls == 0
+
+    def test_takes_over_when_other_process_fails(self, redis):
+        inner = _SlowLLM(delay=0)
+        provider = SingleFlightLLMProvider(inner, poll_interval=0.01)
+        key = flight_key("slow-model", "generate_completion", "hi")
+        redis.store[f"llm:flight:{key}"] = "1"
+
+        def other_worker_fails() -> None:
+            time.sleep(0.05)
+            del redis.store[f"llm:flight:{key}"]  # lock released, no result
+
+        threading.Thread(target=other_worker_fails).start()
+        assert provider.generate_completion("hi") == "echo hi"
+        assert inner.calls == 1
+
+    def test_works_without_redis(self):
+        inner = _SlowLLM()
+        provider = SingleFlightLLMProvider(inner)
+        with patch(f"{_MODULE}.get_sync_redis", side_effect=ConnectionError("down")):
+            results = _run_threads(lambda: provider.generate_completion("x"), 3)
+        assert inner.calls == 1
+        assert results == ["echo x"] * 3
+
+
+class TestAsyncSingleFlight:
+    @pytest.fixture(autouse=True)
+    def _redis(self):
+        r = _AsyncDictRedis()
+
+        async def get_redis() -> _AsyncDictRedis:
+            return r
+
+        with patch(f"{_MODULE}.get_redis", get_redis):
+            yield r
+
+    async def test_concurrent_identical_calls_share_one_request(self):
+        inner = _AsyncSlowLLM()
+        provider = AsyncSingleFlightLLMProvider(inner)
+        results = await asyncio.gather(*(provider.generate_feedback({}) for _ in range(4)))
+        assert inner.calls == 1
+        assert results == [{"overall_score": 7}] * 4
+
+    async def test_earlier_flight_result_not_shared(self, _redis):
+        inner = _AsyncSlowLLM(delay=0)
+        provider = AsyncSingleFlightLLMProvider(inner, poll_interval=0.01)
+        key = flight_key("slow-model", "generate_completion", "x")
+        _redis.store[f"llm:flight:{key}:result:first"] = json.dumps("stale")
+        _redis.store[f"llm:flight:{key}"] = "second"
+
+        async def second_flight_fails() -> None:
+            await asyncio.sleep(0.05)
+            del _redis.store[f"llm:flight:{key}"]  # no result: the caller takes over
+
+        asyncio.create_task(second_flight_fails())
+        assert await provider.generate_completion("x") == "echo x"
+        assert inner.calls == 1
+
+    async def test_cancelled_leader_hands_over(self):
+        inner = _AsyncSlowLLM(delay=0.05)
+        provider = AsyncSingleFlightLLMProvider(inner)
+        leader = asyncio.create_task(provider.generate_completion("x"))
+        await asyncio.sleep(0.01)
+        follower = asyncio.create_task(provider.generate_completion("x"))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        assert await follower == "echo x"
+        assert inner.calls == 2
@@ -0,0 +1,178 @@
+"""
+Unit tests for incremental JSON parsing of streamed LLM output.
+
+Verifies:
+- Items are returned the moment their closing brace arrives, even when
+  strings contain brackets, quotes and escapes
+- Markdown fences / prose before the document and garbage after it are ignored
+- A truncated document keeps its complete part; no JSON at all raises
+- The OpenAI provider yields the first question before the stream ends
+- The fallback chain switches providers only before the first streamed item
+- Streaming calls are recorded by telemetry with their time-to-first-item
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+os.environ.setdefault("SECRET_KEY", "a" * 64)
+
+from app.domain.exceptions import LLMProviderError
+from app.domain.interfaces.llm_provider import ILLMProvider
+from app.infrastructure.llm.factory import LLMProviderWithFallback
+from app.infrastructure.llm.openai_provider import OpenAIProvider
+from app.infrastructure.llm.streaming_json import (
+    JSONItemStream,
+    iter_json_items,
+    loads_lenient,
+    question_items,
+)
+from app.infrastructure.llm.telemetry import TelemetryLLMProvider, calls_total, stream_first_item
+
+QUESTIONS = (
+    '```json\n{"questions": ['
+    '{"type": "coding", "question": "Escape \\"quotes\\" and {braces] here?"}, '
+    '{"type": "technical", "question": "Second?", "tags": [1, 2]}'
+    "]}\n```\nHope this helps!"
+)
+
+
+class TestJSONItemStream:
+    def test_items_close_incrementally(self):
+        stream = JSONItemStream("questions")
+        emitted_at: list[int] = []
+        items: list[Any] = []
+        for i, ch in enumerate(QUESTIONS):
+            new = stream.feed(ch)
+            emitted_at += [i] * len(new)
+            items += new
+        assert [q["question"] for q in items] == [
+            'Escape "quotes" and {braces] here?',
+            "Second?",
+        ]
+        assert emitted_at[0] == QUESTIONS.index("}, ")
+        assert stream.done
+        assert stream.finish() == {"questions": items}
+
+    def test_only_the_keyed_array_yields(self):
+        stream = JSONItemStream("questions_feedback")
+        items = stream.feed(
+            '{"summary": "x [", "other": [{"z": 1}], '
+            '"questions_feedback": [{"question_id": "a"}, {"question_id": "b"}]}'
+        )
+        assert items == [{"question_id": "a"}, {"question_id": "b"}]
+
+    def test_top_level_array(self):
+        assert JSONItemStream().feed('Sure: [{"a": 1}, {"b": 2}] ]]') == [{"a": 1}, {"b": 2}]
+
+    def test_truncated_document_keeps_complete_part(self):
+        cut = QUESTIONS[: QUESTIONS.index('"Second?"')]
+        assert loads_lenient(cut) == {
+            "questions": [{"type": "coding", "question": 'Escape "quotes" and {braces] here?'}]
+        }
+
+    def test_no_json_raises(self):
+        with pytest.raises(json.JSONDecodeError):
+            loads_lenient("I cannot help with that.")
+        with pytest.raises(json.JSONDecodeError):
+            loads_lenient('{"questions": [1, 2')
+
+    def test_string_items_extracted_at_end(self):
+        chunks = ['["Plain question one?", ', '"Plain question two?"]']
+        assert list(iter_json_items(chunks, "questions", question_items)) == [
+            "Plain question one?",
+            "Plain question two?",
+        ]
+
+
+def _chunk(content: str | None, usage: Any = None) -> SimpleNamespace:
+    choices = [] if content is None else [SimpleNamespace(delta=SimpleNamespace(content=content))]
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+class _FakeStream:
+    def __init__(self, chunks: list[SimpleNamespace]) -> None:
+        self.chunks = chunks
+        self.consumed = 0
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            self.consumed += 1
+            yield chunk
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        pass
+
+
+class TestOpenAIStreaming:
+    def test_first_question_before_stream_ends(self):
+        provider = OpenAIProvider(api_key="test-key", model="m")
+        stream = _FakeStream([_chunk(QUESTIONS[i : i + 8]) for i in range(0, len(QUESTIONS), 8)])
+        provider._client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=lambda **kw: stream))
+        )
+        questions = provider.stream_questions({"system_prompt": "s", "user_prompt": "u"})
+        first = next(questions)
+        assert first["type"] == "coding"
+        assert stream.consumed < len(stream.chunks)
+        assert [q["question"] for q in questions] == ["Second?"]
+
+
+class _StreamLLM(ILLMProvider):
+    def __init__(self, name: str, items: list[Any], fail_after: int | None = None) -> None:
+        self.name, self.items, self.fail_after = name, items, fail_after
+
+    @property
+    def provider_name(self) -> str:
+        return self.name
+
+    def stream_questions(self, prompts: dict[str, str]):
+        for i, item in enumerate(self.items):
+            if i == self.fail_after:
+                raise LLMProviderError("stream broke")
+            yield item
+
+    def generate_questions(self, prompts: dict[str, str]) -> list[str]:
+        return list(self.items)
+
+    def generate_feedback(self, prompts: dict[str, str]) -> dict[str, Any]:
+        return {}
+
+    def generate_completion(self, prompt: str) -> str:
+        return ""
+
+    def parse_resume(self, text: str) -> dict[str, Any]:
+        return {}
+
+
+class TestStreamingFallback:
+    def test_falls_back_before_first_item(self):
+        chain = LLMProviderWithFallback(
+            _StreamLLM("P", ["p"], fail_after=0), _StreamLLM("F", ["f"])
+        )
+        assert list(chain.stream_questions({})) == ["f"]
+
+    def test_breaks_after_first_item(self):
+        chain = LLMProviderWithFallback(
+            _StreamLLM("P", ["p1", "p2"], fail_after=1), _StreamLLM("F", ["f"])
+        )
+        stream = chain.stream_questions({})
+        assert next(stream) == "p1"
+        with pytest.raises(LLMProviderError):
+            next(stream)
+
+    def test_telemetry_records_stream(self):
+        provider = TelemetryLLMProvider(_StreamLLM("Streamy", ["a", "b"]))
+        labels = {"provider": "streamy", "model": "Streamy", "method": "stream_questions"}
+        before = calls_total.value(outcome="ok", **labels)
+        assert list(provider.stream_questions({})) == ["a", "b"]
+        assert calls_total.value(outcome="ok", **labels) == before + 1
+        assert stream_first_item.quantile(0.5, **labels) is not None
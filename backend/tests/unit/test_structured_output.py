@@ -0,0 +1,180 @@
+"""
+Unit tests for structured LLM output: local JSON repair and validation.
+
+Verifies:
+- Common defects (fences, trailing commas, single quotes, Python literals,
+  truncation) are repaired locally; hopeless text still raises
+- Payloads are validated and near-misses coerced (numeric strings, top-level
+  question arrays, null lists); junk question items are dropped
+- ``llm_json_parse_total`` counts clean / repaired / invalid payloads
+- OpenAI / Gemini request schema-constrained output for fixed shapes and
+  plain JSON mode otherwise (or nothing, when disabled)
+- A malformed provider response is repaired instead of raising
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+os.environ.setdefault("SECRET_KEY", "a" * 64)
+
+from app.core.config import settings
+from app.domain.exceptions import LLMProviderError
+from app.infrastructure.llm.gemini_provider import GeminiProvider
+from app.infrastructure.llm.openai_provider import OpenAIProvider
+from app.infrastructure.llm.structured_output import (
+    FeedbackPayload,
+    ParsedResume,
+    QuestionsPayload,
+    decode_json,
+    json_parse_total,
+    repair_json,
+)
+
+
+class TestRepair:
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            '```json\n{"a": [1, 2], "b": "x"}\n```',
+            'Here\'s the JSON: {"a": [1, 2,], "b": "x",} Hope it helps!',
+            "{'a': [1, 2], 'b': 'x'}",
+            '{"a": [1, 2], "b": "x", "c": [3], "d": "unfinish',
+        ],
+    )
+    def test_defects_repaired(self, raw: str):
+        result = repair_json(raw)
+        assert result["a"] == [1, 2] and result["b"] == "x"
+
+    def test_python_literals_and_quotes_inside_strings(self):
+        raw = """{'ok': True, 'none': None, 'quote': 'say "hi"', "kept": "it's, ]"}"""
+        assert repair_json(raw) == {
+            "ok": True,
+            "none": None,
+            "quote": 'say "hi"',
+            "kept": "it's, ]",
+        }
+
+    def test_hopeless_text_raises(self):
+        with pytest.raises(json.JSONDecodeError):
+            repair_json("I cannot answer that.")
+
+
+class TestDecode:
+    def _decode(self, raw: str, model, method: str = "m") -> Any:
+        return decode_json(raw, model, provider="test", method=method)
+
+    def test_outcomes_counted(self):
+        labels = {"provider": "test", "method": "counted"}
+        self._decode('{"summary": "ok"}', FeedbackPayload, "counted")
+        self._decode("{'summary': 'ok',}", FeedbackPayload, "counted")
+        with pytest.raises(ValueError):
+            self._decode("no json here", FeedbackPayload, "counted")
+        with pytest.raises(ValueError):
+            self._decode('{"questions": "none"}', QuestionsPayload, "counted")
+        assert json_parse_total.value(outcome="clean", **labels) == 1
+        assert json_parse_total.value(outcome="repaired", **labels) == 1
+        assert json_parse_total.value(outcome="invalid", **labels) == 2
+
+    def test_feedback_coerced_and_unknown_keys_kept(self):
+        result = self._decode(
+            '{"questions_feedback": [{"question_id": 3, "evaluation_score": "0.8", '
+            '"feedback_comment": "Good"}], "confidence_score": "0.7", "extra": 1}',
+            FeedbackPayload,
+        )
+        assert result == {
+            "questions_feedback": [
+                {"question_id": "3", "evaluation_score": 0.8, "feedback_comment": "Good"}
+            ],
+            "confidence_score": 0.7,
+            "extra": 1,
+        }
+
+    def test_questions_array_and_junk_items(self):
+        result = self._decode(
+            '[{"question": "Why?", "type": "technical"}, "Plain?", {"text": "junk"}]',
+            QuestionsPayload,
+        )
+        assert result == {
+            "questions": [{"question": "Why?", "type": "technical"}, {"question": "Plain?"}]
+        }
+
+    def test_resume_near_misses(self):
+        result = self._decode(
+            '{"name": "Jane", "years_of_experience": "5+ years", "skills": null, '
+            '"education": [{"degree": "BSc", "cgpa": 3.6}]}',
+            ParsedResume,
+        )
+        assert result["years_of_experience"] == 5.0
+        assert result["skills"] == []
+        assert result["education"] == [{"degree": "BSc", "cgpa": "3.6"}]
+        assert "experience" not in result  # only what the model sent
+
+
+def _openai(content: str, seen: list[dict[str, Any]]) -> OpenAIProvider:
+    def create(**kwargs):
+        seen.append(kwargs)
+        message = SimpleNamespace(content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+    provider = OpenAIProvider(api_key="test-key", model="m")
+    provider._client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+    )
+    return provider
+
+
+def _gemini(text: str, seen: list[dict[str, Any]]) -> GeminiProvider:
+    def generate_content(**kwargs):
+        seen.append(kwargs)
+        return SimpleNamespace(text=text, usage_metadata=None)
+
+    provider = GeminiProvider(api_key="test-key", model="m")
+    provider._client = SimpleNamespace(models=SimpleNamespace(generate_content=generate_content))
+    return provider
+
+
+_PROMPTS = {"system_prompt": "s", "user_prompt": "u"}
+
+
+class TestProviders:
+    def test_openai_schema_for_fixed_shapes(self):
+        seen: list[dict[str, Any]] = []
+        provider = _openai('{"questions": [{"question": "Why?"}]}', seen)
+        assert provider.generate_questions(_PROMPTS) == [{"question": "Why?"}]
+        provider.generate_feedback(_PROMPTS)
+        questions_format, feedback_format = (kw["response_format"] for kw in seen)
+        assert questions_format["type"] == "json_schema"
+        assert questions_format["json_schema"]["name"] == "QuestionsPayload"
+        assert "questions" in questions_format["json_schema"]["schema"]["properties"]
+        assert feedback_format == {"type": "json_object"}
+
+    def test_openai_json_mode_when_disabled(self, monkeypatch):
+        monkeypatch.setattr(settings, "LLM_STRUCTURED_OUTPUT_ENABLED", False)
+        seen: list[dict[str, Any]] = []
+        _openai('{"name": "Jane"}', seen).parse_resume("resume")
+        assert seen[0]["response_format"] == {"type": "json_object"}
+
+    def test_gemini_json_config(self):
+        seen: list[dict[str, Any]] = []
+        provider = _gemini('{"name": "Jane", "skills": ["Go"]}', seen)
+        assert provider.parse_resume("resume") == {"name": "Jane", "skills": ["Go"]}
+        provider.generate_feedback(_PROMPTS)
+        resume_config, feedback_config = (kw["config"] for kw in seen)
+        assert resume_config.response_mime_type == "application/json"
+        assert "skills" in resume_config.response_json_schema["properties"]
+        assert feedback_config.response_json_schema is None
+
+    def test_malformed_feedback_repaired_not_raised(self):
+        raw = "```json\n{'evaluation_score': 0.75, 'feedback_comment': 'Solid',}\n```"
+        result = _gemini(raw, []).generate_feedback(_PROMPTS)
+        assert result == {"evaluation_score": 0.75, "feedback_comment": "Solid"}
+
+    def test_unusable_response_still_raises(self):
+        with pytest.raises(LLMProviderError):
+            _openai("Sorry, I can't help with that.", []).generate_feedback(_PROMPTS)